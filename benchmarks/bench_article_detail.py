@@ -0,0 +1,126 @@
+"""
+文章详情 (单击预览) 延迟基准测试
+
+临时数据库中写入 N 篇带较长 HTML 正文的文章，用真实的 AppService 比较单击一篇文章到预览排版完成的耗时:
+  - cold:            未缓存。界面线程查询数据库、转换、生成 HTML、排版 QTextDocument (旧代码每次单击都是这样)
+  - html_cached:     已由 AppService.prefetch_article_details 在后台预取 (正文和预览 HTML 已缓存)，单击时只需排版
+  - document_cached: 预取完成后 NewsListPanel 已在空闲时排版好 QTextDocument (或回到最近看过的文章)，
+                     单击时只取缓存的文档
+
+另外报告后台预取 K 篇所需的时间 (不占用界面线程) 和详情缓存的统计。
+
+用法:
+    python benchmarks/bench_article_detail.py [--count 2000] [--clicks 200] [--content-kb 20] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PySide6.QtGui import QGuiApplication, QTextDocument
+
+from src.core.app_service import AppService
+from src.core.source_manager import SourceLookup
+from src.models import NewsListRow
+from src.storage.news_storage import NewsStorage
+from src.ui.viewmodels.news_list_viewmodel import PREVIEW_HTML, render_news_preview_html
+
+
+def make_content(i, kilobytes):
+    paragraph = f"<p style='margin:4px'>第 {i} 篇新闻的正文段落，<a href='https://example.com/{i}'>相关链接</a>。</p>"
+    blocks = [paragraph] * max(1, kilobytes * 1024 // len(paragraph.encode('utf-8')))
+    return "<div>" + "".join(blocks) + "<script>track()</script></div>"
+
+
+def layout(html):
+    doc = QTextDocument()
+    doc.setHtml(html)
+    doc.setTextWidth(600)
+    doc.size()  # 触发排版
+    return doc
+
+
+def summarize_ms(values):
+    return {'median': round(statistics.median(values) * 1000, 3), 'max': round(max(values) * 1000, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--clicks', type=int, default=200, help="模拟单击的文章数")
+    parser.add_argument('--content-kb', type=int, default=20, help="每篇正文的大约大小 (KB)")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = NewsStorage(data_dir=data_dir, db_name="bench_article_detail.db")
+        storage.upsert_articles_batch([
+            {'title': f"新闻 {i}", 'link': f"https://example.com/a/{i}", 'source_name': '来源',
+             'content': make_content(i, args.content_kb), 'publish_time': '2024-01-02T03:04:05+00:00'}
+            for i in range(args.count)
+        ])
+        source_manager = MagicMock()
+        source_manager.get_lookup.return_value = SourceLookup([])
+        deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'llm_service',
+                                                'news_update_service', 'analysis_service', 'history_service')}
+        service = AppService(storage=storage, source_manager=source_manager, **deps)
+        rows = [NewsListRow.from_storage_dict(item) for item in storage.get_article_headlines(args.count)]
+        clicked = rows[:args.clicks]
+
+        cold = []
+        for row in clicked:
+            started = time.perf_counter()
+            article = service._convert_dict_to_article(storage.get_article_by_id(row.id))
+            layout(render_news_preview_html(article))
+            cold.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        service.prefetch_article_details([row.id for row in clicked], {PREVIEW_HTML: render_news_preview_html})
+        service.wait_for_prefetch()
+        prefetch_seconds = time.perf_counter() - started
+        app.processEvents()
+
+        html_cached, documents = [], {}
+        for row in clicked:
+            started = time.perf_counter()
+            article = service.get_full_article(row)
+            documents[row.id] = layout(service.detail_cache.get_html(article.id, PREVIEW_HTML))
+            html_cached.append(time.perf_counter() - started)
+
+        document_cached = []
+        for row in clicked:
+            started = time.perf_counter()
+            service.get_full_article(row)
+            documents[row.id].size()
+            document_cached.append(time.perf_counter() - started)
+
+        results = {
+            'count': args.count, 'clicks': len(clicked), 'content_kb': args.content_kb,
+            'click_ms': {'cold': summarize_ms(cold), 'html_cached': summarize_ms(html_cached),
+                         'document_cached': summarize_ms(document_cached)},
+            'background_prefetch_ms_per_article': round(prefetch_seconds / len(clicked) * 1000, 3),
+            'cache': service.detail_cache.stats(),
+        }
+        results['speedup_document_cached'] = round(results['click_ms']['cold']['median']
+                                                   / results['click_ms']['document_cached']['median'], 1)
+        service.shutdown()
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
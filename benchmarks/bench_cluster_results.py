@@ -0,0 +1,68 @@
+"""
+多特征聚类结果缓存 (EnhancedNewsClusterer 的 result_store，见 src/core/cluster_results.py) 的耗时对比
+
+用 clustering_suite.make_corpus 合成按发布时间排序的新闻，在临时目录的 ClusterResultStore 上依次运行:
+  - cold:     第一次聚类 (无缓存，写入结果)
+  - reopen:   同一批文章、同一组参数再次聚类 (直接读出上次的结果)
+  - arrivals: 再加入 --new 篇时间更晚的新文章 (只重新聚类新文章和与其时间相近的旧事件)
+  - full:     对 arrivals 的全部文章不使用缓存重新聚类，作为对比
+报告各步耗时、arrivals 与 full 的 ARI (1 为分组完全相同) 以及两者与真实事件编号的 ARI。
+
+用法:
+    python benchmarks/bench_cluster_results.py [--size 5000] [--new 100] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from clustering_suite import group_labels, make_corpus, score
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=5000)
+    parser.add_argument('--new', type=int, default=100, help="arrivals 步加入的新文章数")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    from sklearn.metrics import adjusted_rand_score
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+    from src.storage.cluster_result_store import ClusterResultStore
+    logging.disable(logging.CRITICAL)
+
+    news_list = make_corpus(args.size + args.new, seed=args.seed)
+    old = news_list[:args.size]
+    results = {'size': args.size, 'new': args.new, 'steps': {}}
+    groups = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = ClusterResultStore(data_dir)
+        for step, articles, result_store in (('cold', old, store), ('reopen', old, store),
+                                             ('arrivals', news_list, store), ('full', news_list, None)):
+            started = time.perf_counter()
+            events = EnhancedNewsClusterer(result_store=result_store).cluster(articles)
+            results['steps'][step] = round(time.perf_counter() - started, 3)
+            groups[step] = group_labels([[report['id'] for report in event['reports']] for event in events], articles)
+        store.close()
+
+    results['arrivals_vs_full_ari'] = round(float(adjusted_rand_score(groups['full'], groups['arrivals'])), 4)
+    results['arrivals_quality'] = score(news_list, groups['arrivals'])
+    results['full_quality'] = score(news_list, groups['full'])
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+新闻分组/聚类实现的速度与质量对比 (clustering_suite.CLUSTERERS)
+
+用 clustering_suite.make_corpus 合成带真实事件编号的中英文混合新闻 (含转载、时间分布在 30 天内)，
+每种实现在每个规模下在独立子进程中运行一次，报告:
+  - seconds:            分组耗时
+  - peak_rss_mb:        子进程的峰值内存；extra_rss_mb 为其中分组新增的部分 (不含导入和生成语料)
+  - groups:             多于一篇的组数
+  - ari / nmi:          与真实事件编号的调整兰德指数 / 归一化互信息 (1 为完全一致)
+  - duplicates_grouped: 转载与原报道分在同一组的比例
+  - time_exponent / memory_exponent: 耗时、新增内存随规模增长的指数 (log-log 最小二乘斜率，1 为线性)
+
+稠密模式 (enhanced_dense) 的内存为 O(n²)，超过 --dense-max 篇时跳过。
+
+--update-baseline 同时在 --regression-size 规模下 (进程内) 重新计算各实现的 ARI / NMI，
+写入 benchmarks/baselines/clustering_quality.json；tests/core/test_clustering_quality.py 以此检查质量回退。
+
+用法:
+    python benchmarks/bench_clustering_quality.py [--sizes 1000 2000 5000 10000] [--clusterers news_clusterer ...]
+                                                  [--dense-max 5000] [--output results.json] [--update-baseline]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from clustering_suite import CLUSTERERS, DENSE_CLUSTERERS, group_labels, make_corpus, score
+
+try:
+    import resource
+except ImportError:  # Windows: 不报告内存
+    resource = None
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'clustering_quality.json')
+
+
+def peak_rss_mb():
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) if resource else None
+
+
+def run_child(name, n_samples, args):
+    """在子进程中运行：分组一次，输出耗时、峰值内存和分组结果。"""
+    logging.disable(logging.CRITICAL)
+    news_list = make_corpus(n_samples, args.per_event, args.duplicate_rate, seed=args.seed)
+    run = CLUSTERERS[name]
+    run(news_list[:20])  # 先完成导入，不计入耗时和新增内存
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    groups = run(news_list)
+    seconds = time.perf_counter() - started
+    peak = peak_rss_mb()
+    print('@@' + json.dumps({
+        'seconds': round(seconds, 3),
+        'peak_rss_mb': peak,
+        'extra_rss_mb': round(peak - baseline, 1) if peak is not None else None,
+        'groups': sum(len(group) > 1 for group in groups),
+        'assigned': group_labels(groups, news_list),
+    }))
+
+
+def spawn(name, n_samples, args):
+    proc = subprocess.run([sys.executable, __file__, '--child', name, str(n_samples), '--per-event', str(args.per_event),
+                           '--duplicate-rate', str(args.duplicate_rate), '--seed', str(args.seed)],
+                          cwd=REPO_ROOT, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith('@@'):
+            return json.loads(line[2:])
+    return {'error': proc.stderr[-500:]}
+
+
+def scaling_exponent(points):
+    """(规模, 数值) 的 log-log 最小二乘斜率；数值不为正的点忽略，少于两个点时为 None。"""
+    points = [(math.log(size), math.log(value)) for size, value in points if value and value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / spread, 2) if spread else None
+
+
+def regression_scores(names, args):
+    """--regression-size 规模下各实现的 ARI / NMI (进程内计算，与回归测试相同)。"""
+    logging.disable(logging.CRITICAL)
+    news_list = make_corpus(args.regression_size, args.per_event, args.duplicate_rate, seed=args.seed)
+    scores = {}
+    for name in names:
+        quality = score(news_list, group_labels(CLUSTERERS[name](news_list), news_list))
+        scores[name] = {'ari': quality['ari'], 'nmi': quality['nmi']}
+    logging.disable(logging.NOTSET)
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 5000, 10000])
+    parser.add_argument('--clusterers', nargs='+', choices=sorted(CLUSTERERS), default=list(CLUSTERERS))
+    parser.add_argument('--per-event', type=int, default=5)
+    parser.add_argument('--duplicate-rate', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dense-max', type=int, default=5000, help="稠密模式运行的最大规模")
+    parser.add_argument('--regression-size', type=int, default=600, help="回归基线使用的规模")
+    parser.add_argument('--tolerance', type=float, default=0.02, help="回归测试允许的 ARI / NMI 下降")
+    parser.add_argument('--update-baseline', action='store_true', help=f"把结果写入 {BASELINE_PATH}")
+    parser.add_argument('--child', nargs=2, metavar=('CLUSTERER', 'N'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]), args)
+        return 0
+
+    results = {'corpus': {'per_event': args.per_event, 'duplicate_rate': args.duplicate_rate, 'seed': args.seed},
+               'cpu_count': os.cpu_count(), 'clusterers': {}}
+    for name in args.clusterers:
+        runs = []
+        for n_samples in args.sizes:
+            if name in DENSE_CLUSTERERS and n_samples > args.dense_max:
+                runs.append({'size': n_samples, 'skipped': f"n > --dense-max ({args.dense_max})"})
+                continue
+            run = spawn(name, n_samples, args)
+            if 'assigned' in run:
+                news_list = make_corpus(n_samples, args.per_event, args.duplicate_rate, seed=args.seed)
+                run.update(score(news_list, run.pop('assigned')))
+            runs.append(dict(size=n_samples, **run))
+        measured = [run for run in runs if 'seconds' in run]
+        results['clusterers'][name] = {
+            'runs': runs,
+            'time_exponent': scaling_exponent([(run['size'], run['seconds']) for run in measured]),
+            'memory_exponent': scaling_exponent([(run['size'], run['extra_rss_mb']) for run in measured]),
+        }
+
+    if args.update_baseline:
+        results['regression'] = {'size': args.regression_size, 'tolerance': args.tolerance,
+                                 'scores': regression_scores(args.clusterers, args)}
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    outputs = [args.output] if args.output else []
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        outputs.append(BASELINE_PATH)
+    for path in outputs:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+文章特征缓存 (ArticleFeatureStore) 对 EnhancedNewsClusterer 聚类耗时的影响
+
+合成带真实事件标签的中英文新闻 (与 bench_incremental_clustering.py 相同)，每种场景在独立子进程中聚类一次 (稀疏模式):
+  - no_store:    不使用特征存储，每次都重新计算全部特征 (原来的行为)
+  - first_run:   特征存储为空，计算全部特征并写入
+  - reopen:      新进程，特征存储已有全部文章 (冷启动)
+  - new_1pct:    新进程，在已缓存的文章之外新增 1% 的文章
+
+每个场景报告:
+  - seconds:          cluster() 的总耗时
+  - feature_seconds:  其中提取 TF-IDF / 实体 / 主题特征的耗时
+  - ari:              与真实事件标签的调整兰德指数
+
+用法:
+    python benchmarks/bench_feature_store.py [--size 20000] [--per-event 5] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from bench_incremental_clustering import make_stream
+
+SCENARIOS = ('no_store', 'first_run', 'reopen', 'new_1pct')
+
+
+def run_child(scenario, n_samples, per_event, data_dir):
+    """在子进程中运行：聚类一次，输出耗时和每篇新闻的事件组编号。"""
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+    from src.storage.article_feature_store import ArticleFeatureStore
+    logging.disable(logging.CRITICAL)
+
+    news_list = make_stream(n_samples, per_event)
+    if scenario != 'new_1pct':
+        # 前 99% 的文章先缓存，new_1pct 场景再加入其余 1%
+        news_list = news_list[:n_samples - n_samples // 100]
+    store = None if scenario == 'no_store' else ArticleFeatureStore(data_dir)
+    clusterer = EnhancedNewsClusterer(feature_store=store)
+    clusterer.set_clustering_params(mode='sparse')
+
+    feature_seconds = []
+    extract = clusterer._extract_base_features
+
+    def timed_extract(batch):
+        started = time.perf_counter()
+        result = extract(batch)
+        feature_seconds.append(time.perf_counter() - started)
+        return result
+
+    clusterer._extract_base_features = timed_extract
+    started = time.perf_counter()
+    events = clusterer.cluster(news_list)
+    seconds = time.perf_counter() - started
+    event_of = {report['id']: k for k, event in enumerate(events) for report in event['reports']}
+    print('@@' + json.dumps({
+        'articles': len(news_list),
+        'seconds': round(seconds, 2),
+        'feature_seconds': round(sum(feature_seconds), 2),
+        'events': len(events),
+        'labels': [event_of[news['id']] for news in news_list],
+        'truth': [news['event'] for news in news_list],
+    }))
+
+
+def spawn(scenario, args, data_dir):
+    proc = subprocess.run([sys.executable, __file__, '--child', scenario, data_dir, '--size', str(args.size),
+                           '--per-event', str(args.per_event)], cwd=REPO_ROOT, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith('@@'):
+            return json.loads(line[2:])
+    return {'error': proc.stderr[-500:]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=20000)
+    parser.add_argument('--per-event', type=int, default=5)
+    parser.add_argument('--child', nargs=2, metavar=('SCENARIO', 'DATA_DIR'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.size, args.per_event, args.child[1])
+        return 0
+
+    from sklearn.metrics import adjusted_rand_score
+    results = {'size': args.size, 'per_event': args.per_event, 'scenarios': {}}
+    with tempfile.TemporaryDirectory() as data_dir:
+        for scenario in SCENARIOS:
+            run = spawn(scenario, args, data_dir)
+            if 'labels' in run:
+                run['ari'] = round(adjusted_rand_score(run.pop('truth'), run.pop('labels')), 4)
+            results['scenarios'][scenario] = run
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+并行细分组 (EnhancedNewsClusterer 的 fine_workers / fine_backend) 的耗时对比
+
+合成带真实事件标签的中英文新闻 (与 bench_incremental_clustering.py 相同)，先构建一次融合相似度
+(--mode sparse 为稀疏近邻图，dense 为 n×n 矩阵) 和粗分类，再对同一组粗分类簇分别用
+顺序执行、线程池、进程池 (只读内存映射共享相似度) 细分组。报告:
+  - coarse_clusters / largest_cluster:  多于一篇新闻的粗分类簇数和最大簇的文章数
+  - seconds:        _fine_cluster_results() 的总耗时 (进程池包含启动子进程和写出内存映射文件)
+  - cluster_seconds_sum / cluster_seconds_max:  各簇耗时之和与最慢一个簇的耗时
+  - same_as_sequential:  结果 (标签与代表新闻) 是否与顺序执行完全相同
+
+用法:
+    python benchmarks/bench_fine_clustering.py [--size 20000] [--mode sparse] [--workers 2 4] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from bench_incremental_clustering import make_stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=20000)
+    parser.add_argument('--per-event', type=int, default=5)
+    parser.add_argument('--mode', choices=('sparse', 'dense'), default='sparse')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+    logging.disable(logging.CRITICAL)
+
+    clusterer = EnhancedNewsClusterer()
+    processed = clusterer._preprocess_news(make_stream(args.size, args.per_event))
+    started = time.perf_counter()
+    if args.mode == 'sparse':
+        similarity = clusterer._build_similarity_graph(clusterer._extract_sparse_features(processed))
+        coarse_clusters = clusterer._coarse_clustering_sparse(similarity)
+    else:
+        similarity = clusterer._fuse_features(clusterer._extract_features(processed))
+        coarse_clusters = clusterer._coarse_clustering(similarity)
+    multi = [cluster for cluster in coarse_clusters if len(cluster) > 1]
+    results = {'size': args.size, 'mode': args.mode, 'cpu_count': os.cpu_count(),
+               'similarity_seconds': round(time.perf_counter() - started, 2),
+               'coarse_clusters': len(multi), 'largest_cluster': max(map(len, multi), default=0), 'runs': []}
+
+    baseline = None
+    for backend, workers in [('sequential', 1)] + [(backend, workers) for backend in ('thread', 'process')
+                                                    for workers in args.workers]:
+        clusterer.set_clustering_params(fine_workers=workers, fine_backend=None if backend == 'sequential' else backend)
+        started = time.perf_counter()
+        fine = clusterer._fine_cluster_results(coarse_clusters, similarity)
+        seconds = time.perf_counter() - started
+        timings = [result[2] for result in fine if result is not None]
+        outcome = [result[:2] for result in fine if result is not None]
+        baseline = outcome if baseline is None else baseline
+        results['runs'].append({'backend': backend, 'workers': workers, 'seconds': round(seconds, 3),
+                                'cluster_seconds_sum': round(sum(timings), 3),
+                                'cluster_seconds_max': round(max(timings, default=0.0), 3),
+                                'same_as_sequential': outcome == baseline})
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+无界面刷新模式启动开销基准测试
+
+在全新子进程中多次执行 `headless_refresh.py startup`，报告：
+  - wall:    子进程总耗时 (含解释器启动)
+  - startup: 入口脚本自报的启动耗时 (模块导入 + 打开数据库 + 读取源)
+  - rss:     子进程峰值内存 (MB)
+并与导入 GUI 依赖链 (PySide6.QtWidgets + src.containers) 的开销对比。
+若无界面模式意外加载了 PySide6，脚本以非零状态退出，可用于 CI 跟踪该指标。
+
+用法:
+    python benchmarks/bench_headless_startup.py [--repeat 5] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+GUI_IMPORT_PROBE = (
+    "import resource, sys, time\n"
+    "started = time.perf_counter()\n"
+    "import PySide6.QtWidgets\n"
+    "import src.containers\n"
+    "peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "print('{\"startup_seconds\": %.3f, \"peak_rss_mb\": %.1f}' % ("
+    "time.perf_counter() - started, peak / (1048576 if sys.platform == 'darwin' else 1024)))\n"
+)
+
+
+def run_json(cmd, env=None):
+    started = time.perf_counter()
+    result = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, env=env)
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} 失败:\n{result.stderr}")
+    # 日志也输出到 stdout，指标是最后一行 JSON
+    metrics = json.loads(result.stdout.strip().splitlines()[-1])
+    metrics['wall_seconds'] = round(wall, 3)
+    return metrics
+
+
+def summarize(samples):
+    return {
+        key: round(statistics.median(s[key] for s in samples), 3)
+        for key in ('wall_seconds', 'startup_seconds', 'peak_rss_mb')
+        if all(s.get(key) is not None for s in samples)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    parser.add_argument('--skip-gui', action='store_true', help="不测量 GUI 依赖链")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        headless_cmd = [sys.executable, os.path.join(REPO_ROOT, 'headless_refresh.py'), 'startup', '--data-dir', data_dir]
+        run_json(headless_cmd)  # 首次运行创建数据库，不计入
+        headless = [run_json(headless_cmd) for _ in range(args.repeat)]
+
+    results = {'headless': summarize(headless), 'qt_loaded': any(s['qt_loaded'] for s in headless)}
+    if not args.skip_gui:
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+        gui = [run_json([sys.executable, '-c', GUI_IMPORT_PROBE], env=env) for _ in range(args.repeat)]
+        results['gui_imports'] = summarize(gui)
+
+    for label in ('headless', 'gui_imports'):
+        if label in results:
+            print(f"[{label}] " + ", ".join(f"{k}={v}" for k, v in results[label].items()))
+    print(f"[headless] qt_loaded={results['qt_loaded']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if results['qt_loaded']:
+        sys.exit("无界面模式加载了 PySide6")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+增量事件聚类 (IncrementalEventClusterer) 与从头聚类 (EnhancedNewsClusterer 稀疏模式) 的对比基准
+
+合成带真实事件标签的中英文新闻 (每个事件 --per-event 篇，共享几个关键词，发布时间相近，事件分布在 30 天内)，
+按发布时间顺序每次刷新到达 --batch 篇，模拟每次刷新后的聚类。报告:
+  - incremental.ms_per_refresh:  每次刷新 add_articles() 的平均耗时
+  - incremental.ms_per_article:  每篇文章的平均耗时
+  - incremental.consolidate_ms:  全部到达后 consolidate() 的耗时
+  - incremental.reopen_ms:       从 event_clusters.db 恢复状态并得到事件列表的耗时 (打开分类面板)
+  - incremental.candidates_per_article: 每篇文章计算相似度的候选事件数
+  - from_scratch.seconds:        对全部文章从头聚类一次的耗时 (每次刷新原来都要付出这一代价)
+  - ari:                         与真实事件标签的调整兰德指数 (1 为完全一致)
+
+用法:
+    python benchmarks/bench_incremental_clustering.py [--sizes 2000 10000] [--per-event 5] [--batch 30]
+                                                      [--scratch-max 10000] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from clustering_suite import make_vocabulary
+
+
+def make_stream(n_samples, per_event, seed=0):
+    """按发布时间排序的合成新闻，每篇带 'id' 和 'event' (真实事件编号)。"""
+    rng = random.Random(seed)
+    vocabularies = {True: make_vocabulary(rng, 3000, True), False: make_vocabulary(rng, 3000, False)}
+    base = datetime(2024, 1, 1)
+    news_list = []
+    for event in range((n_samples + per_event - 1) // per_event):
+        chinese = rng.random() < 0.5
+        vocabulary, separator = vocabularies[chinese], "" if chinese else " "
+        words = rng.sample(vocabulary, 6)
+        started = base + timedelta(minutes=rng.randint(0, 30 * 24 * 60))
+        for report in range(per_event):
+            title = separator.join(rng.sample(words, 4) + [rng.choice(vocabulary)])
+            body = [rng.choice(words) if rng.random() < 0.4 else rng.choice(vocabulary) for _ in range(60)]
+            news_list.append({'title': title, 'content': separator.join(body), 'source_name': f"来源{report}",
+                              'link': f"https://example.com/{event}/{report}",
+                              'publish_time': started + timedelta(minutes=rng.randint(0, 360)), 'event': event})
+    news_list.sort(key=lambda news: news['publish_time'])
+    news_list = news_list[:n_samples]
+    for article_id, news in enumerate(news_list):
+        news['id'] = article_id
+    return news_list
+
+
+def run_incremental(news_list, batch):
+    from src.core.incremental_clusterer import IncrementalEventClusterer
+    from src.storage.event_cluster_store import EventClusterStore
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = EventClusterStore(data_dir)
+        clusterer = IncrementalEventClusterer(store=store)
+        refresh_ms = []
+        for start in range(0, len(news_list), batch):
+            started = time.perf_counter()
+            clusterer.add_articles(news_list[start:start + batch])
+            refresh_ms.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        consolidated = clusterer.consolidate()
+        consolidate_ms = (time.perf_counter() - started) * 1000
+        event_of = {article_id: article.event_id for article_id, article in clusterer.assignments.items()}
+        store.close()
+
+        started = time.perf_counter()
+        reopened = IncrementalEventClusterer(store=EventClusterStore(data_dir))
+        events = reopened.event_dicts()
+        reopen_ms = (time.perf_counter() - started) * 1000
+        reopened.store.close()
+
+    return {
+        'ms_per_refresh': round(sum(refresh_ms) / len(refresh_ms), 2),
+        'max_refresh_ms': round(max(refresh_ms), 2),
+        'ms_per_article': round(sum(refresh_ms) / len(news_list), 3),
+        'consolidate_ms': round(consolidate_ms, 1),
+        'reopen_ms': round(reopen_ms, 1),
+        'candidates_per_article': round(clusterer.candidates_scored / len(news_list), 2),
+        'events': len(events),
+        'consolidated': consolidated,
+    }, [event_of[news['id']] for news in news_list]
+
+
+def run_from_scratch(news_list):
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+
+    clusterer = EnhancedNewsClusterer()
+    clusterer.set_clustering_params(mode='sparse')
+    started = time.perf_counter()
+    events = clusterer.cluster(news_list)
+    seconds = time.perf_counter() - started
+    # 事件中的报道是预处理后的副本，按 (标题, 发布时间) 对应回原列表
+    event_of = {(report['title'], report['publish_time']): k for k, event in enumerate(events)
+                for report in event['reports']}
+    return {'seconds': round(seconds, 2), 'events': len(events)}, \
+        [event_of.get((news['title'], news['publish_time']), -1) for news in news_list]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000])
+    parser.add_argument('--per-event', type=int, default=5)
+    parser.add_argument('--batch', type=int, default=30, help="每次刷新到达的文章数")
+    parser.add_argument('--scratch-max', type=int, default=10000, help="从头聚类运行的最大规模")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    from sklearn.metrics import adjusted_rand_score
+    logging.disable(logging.CRITICAL)
+    results = {'per_event': args.per_event, 'batch': args.batch, 'sizes': {}}
+    for n_samples in args.sizes:
+        news_list = make_stream(n_samples, args.per_event)
+        truth = [news['event'] for news in news_list]
+        entry = {}
+        entry['incremental'], labels = run_incremental(news_list, args.batch)
+        entry['incremental']['ari'] = round(adjusted_rand_score(truth, labels), 4)
+        if n_samples <= args.scratch_max:
+            entry['from_scratch'], labels = run_from_scratch(news_list)
+            entry['from_scratch']['ari'] = round(adjusted_rand_score(truth, labels), 4)
+        else:
+            entry['from_scratch'] = {'skipped': f"n > --scratch-max ({args.scratch_max})"}
+        results['sizes'][str(n_samples)] = entry
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+初始新闻加载基准测试 (首行出现时间)
+
+在临时数据库中写入 N 篇合成新闻 (默认 100k)，把 AppService 与 NewsListViewModel 连接起来，比较:
+  - blocking:    AppService._load_initial_news，全部加载并转换后才通知列表
+  - progressive: AppService.load_initial_news_progressive，先同步加载最新一页，其余在后台分页合并
+
+报告:
+  - time_to_first_row_ms: 从开始加载到列表模型中出现第一行的耗时
+  - total_seconds:        全部文章进入列表的耗时
+  - max_ui_stall_ms:      加载期间主线程事件循环的最长停顿 (10ms 定时器的最大间隔，只对渐进模式有意义)
+
+用法:
+    python benchmarks/bench_initial_load.py [--count 100000] [--first-page 500] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from bench_news_cache_memory import populate
+from src.core.app_service import AppService
+from src.core.history_service import HistoryService
+from src.core.source_manager import SourceLookup
+from src.storage.news_storage import NewsStorage
+from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel
+
+
+def make_app_service(storage):
+    deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'source_manager', 'llm_service',
+                                            'news_update_service', 'analysis_service')}
+    deps['source_manager'].get_lookup.return_value = SourceLookup([])
+    return AppService(storage=storage, history_service=HistoryService(storage), **deps)
+
+
+def run(storage, progressive, first_page):
+    app_service = make_app_service(storage)
+    view_model = NewsListViewModel(app_service=app_service)
+    model = view_model.get_model()
+    marks = {}
+    started = time.perf_counter()
+
+    def on_rows_changed(*_):
+        if model.rowCount() and 'first_row' not in marks:
+            marks['first_row'] = time.perf_counter() - started
+
+    model.modelReset.connect(on_rows_changed)
+    model.rowsInserted.connect(on_rows_changed)
+
+    stalls = [0.0]
+    last_tick = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        stalls[0] = max(stalls[0], now - last_tick[0])
+        last_tick[0] = now
+
+    timer = QTimer()
+    timer.setInterval(10)
+    timer.timeout.connect(tick)
+
+    if progressive:
+        loop = QEventLoop()
+        app_service.initial_load_finished.connect(lambda metrics: loop.quit())
+        timer.start()
+        last_tick[0] = time.perf_counter()
+        metrics = app_service.load_initial_news_progressive(first_page=first_page)
+        if app_service._initial_load_cancel is not None:
+            loop.exec()
+        timer.stop()
+    else:
+        app_service._load_initial_news()
+        metrics = {}
+    total = time.perf_counter() - started
+
+    result = {
+        'time_to_first_row_ms': round(marks.get('first_row', total) * 1000, 1),
+        'total_seconds': round(total, 2),
+        'rows': model.rowCount(),
+    }
+    if progressive:
+        result['reported_time_to_first_row_ms'] = metrics.get('time_to_first_row_ms')
+        result['max_ui_stall_ms'] = round(stalls[0] * 1000, 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--first-page', type=int, default=AppService.INITIAL_FIRST_PAGE)
+    parser.add_argument('--content-chars', type=int, default=1500)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = NewsStorage(data_dir=data_dir, db_name="bench_initial_load.db")
+        populate(storage, args.count, args.content_chars)
+        results = {
+            'count': args.count,
+            'first_page': args.first_page,
+            'blocking': run(storage, progressive=False, first_page=args.first_page),
+            'progressive': run(storage, progressive=True, first_page=args.first_page),
+        }
+        storage.close()
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if results['progressive']['rows'] == results['blocking']['rows'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
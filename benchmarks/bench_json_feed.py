@@ -0,0 +1,75 @@
+"""
+JSON Feed 解码基准测试
+
+对比三种解码方式在不同大小 Feed 上的耗时：
+  - stdlib:      旧实现，response.json() 等价于 json.loads(bytes.decode())
+  - orjson:      一次性 orjson.loads 完整文档
+  - incremental: iter_json_feed_items 逐条解析，只取前 max_items 条
+
+用法:
+    python benchmarks/bench_json_feed.py [--sizes 1000 10000 50000] [--max-items 500] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import orjson  # noqa: E402
+
+from src.collectors.json_feed_collector import iter_json_feed_items  # noqa: E402
+
+
+def build_feed(item_count: int) -> bytes:
+    items = [
+        {
+            "id": f"item-{i}",
+            "url": f"https://example.org/item-{i}",
+            "title": f"标题 {i}: JSON Feed benchmark item",
+            "content_html": f"<p>{'内容 content ' * 40}{i}</p>",
+            "summary": f"Summary for item {i}",
+            "date_published": "2023-10-26T10:00:00+00:00",
+            "tags": ["news", "bench"],
+        }
+        for i in range(item_count)
+    ]
+    return json.dumps({
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": "Benchmark Feed",
+        "items": items,
+    }, ensure_ascii=False).encode('utf-8')
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--max-items', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'MiB':>7} {'stdlib ms':>10} {'orjson ms':>10} {'incr ms':>10} {'incr-all ms':>12}")
+    for size in args.sizes:
+        payload = build_feed(size)
+        stdlib_ms = best_of(args.repeat, lambda: json.loads(payload.decode('utf-8'))['items'][:args.max_items])
+        orjson_ms = best_of(args.repeat, lambda: orjson.loads(payload)['items'][:args.max_items])
+        incremental_ms = best_of(args.repeat, lambda: list(islice(iter_json_feed_items(payload), args.max_items)))
+        incremental_all_ms = best_of(args.repeat, lambda: list(iter_json_feed_items(payload)))
+        print(f"{size:>8} {len(payload) / 1048576:>7.2f} {stdlib_ms:>10.1f} {orjson_ms:>10.1f} "
+              f"{incremental_ms:>10.1f} {incremental_all_ms:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
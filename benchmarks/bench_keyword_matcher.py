@@ -0,0 +1,111 @@
+"""
+关键词分类 (src/core/keyword_matcher.py) 与原来逐个关键词 `in` 查找的耗时对比
+
+用 clustering_suite.make_corpus 合成中英文混合新闻，按 --keyword-rate 的比例把正文和标题中的词替换为分类关键词，
+对三组关键词表 (NewsClusterer、EnhancedNewsClusterer 的类别关键词，按标题分组使用的 TITLE_TOPIC_KEYWORDS)
+分别用原来的规则和 KeywordMatcher 分类全部新闻。报告:
+  - naive_seconds / matcher_seconds:  两种实现的总耗时 (matcher 包含编译)
+  - articles_per_second:              KeywordMatcher 每秒分类的新闻数
+  - speedup:                          naive_seconds / matcher_seconds
+  - agreement:                        两种实现结果相同的比例 (应为 1.0)
+
+用法:
+    python benchmarks/bench_keyword_matcher.py [--size 100000] [--keyword-rate 0.05] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from clustering_suite import make_corpus
+
+
+def naive_categorize(category_keywords, title, content, default):
+    """原来的规则: 逐个类别、逐个关键词在拼接后的小写文本中查找，优先返回命中词出现在标题中的类别。"""
+    title, content = title or '', content or ''
+    text = (title + " " + content).lower()
+    matched = []
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in text:
+                matched.append((category, keyword))
+                break
+    for category, keyword in matched:
+        if keyword.lower() in title.lower():
+            return category
+    return matched[0][0] if matched else default
+
+
+def sprinkle(text, keywords, rate, rng):
+    """按 rate 的比例在文本中插入关键词。"""
+    pieces = []
+    for k in range(0, len(text), 8):
+        pieces.append(text[k:k + 8])
+        if rng.random() < rate:
+            pieces.append(rng.choice(keywords))
+    return "".join(pieces)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--keyword-rate', type=float, default=0.05, help="每 8 个字符后插入关键词的概率")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+    from src.core.keyword_matcher import KeywordMatcher
+    from src.core.news_clusterer import NewsClusterer
+    from src.core.news_data_processor import TITLE_TOPIC_KEYWORDS
+    logging.disable(logging.CRITICAL)
+
+    tables = {
+        'news_clusterer': NewsClusterer().category_keywords,
+        'enhanced': EnhancedNewsClusterer().category_keywords,
+        'title_topics': TITLE_TOPIC_KEYWORDS,
+    }
+    rng = random.Random(args.seed)
+    keywords = sorted({keyword for table in tables.values() for words in table.values() for keyword in words})
+    articles = [(sprinkle(news['title'], keywords, args.keyword_rate, rng),
+                 sprinkle(news['content'], keywords, args.keyword_rate, rng))
+                for news in make_corpus(args.size, seed=args.seed)]
+
+    results = {'size': args.size, 'keyword_rate': args.keyword_rate,
+               'mean_length': round(sum(len(title) + len(content) for title, content in articles) / len(articles)),
+               'tables': {}}
+    for name, table in tables.items():
+        started = time.perf_counter()
+        expected = [naive_categorize(table, title, content, 'none') for title, content in articles]
+        naive_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matcher = KeywordMatcher(table)
+        actual = [matcher.categorize(title, content, 'none') for title, content in articles]
+        matcher_seconds = time.perf_counter() - started
+
+        results['tables'][name] = {
+            'keywords': sum(map(len, table.values())),
+            'naive_seconds': round(naive_seconds, 2),
+            'matcher_seconds': round(matcher_seconds, 2),
+            'articles_per_second': round(len(articles) / matcher_seconds),
+            'speedup': round(naive_seconds / matcher_seconds, 2),
+            'agreement': sum(a == b for a, b in zip(expected, actual)) / len(articles),
+        }
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
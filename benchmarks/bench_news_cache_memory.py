@@ -0,0 +1,128 @@
+"""
+新闻内存缓存占用基准测试
+
+在临时数据库中写入 N 篇合成新闻 (默认 100k，正文/摘要长度接近真实 RSS 条目)，
+然后分别按两种方式加载为 AppService 的内存缓存，用 tracemalloc 统计保留的内存：
+  - before: 读取全部列 + _convert_dict_to_article (完整 NewsArticle，含正文、摘要、tags、raw_data)
+  - after:  AppService._load_initial_news (get_all_articles(with_content=False) -> NewsListRow)
+结果换算为每 100k 篇的 MB 数，并给出加载耗时。
+
+用法:
+    python benchmarks/bench_news_cache_memory.py [--count 100000] [--content-chars 1500] [--output results.json]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.app_service import AppService
+from src.core.source_manager import SourceLookup
+from src.storage.news_storage import NewsStorage
+
+WORDS = ["人工智能", "芯片", "市场", "央行", "比赛", "冠军", "选举", "疫苗", "高考", "电影",
+         "market", "Apple", "OpenAI", "policy", "growth", "league", "vaccine", "startup"]
+
+
+def populate(storage, count, content_chars, seed=42):
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    batch = []
+    for i in range(count):
+        content = "".join(rng.choices(WORDS, k=content_chars // 4))[:content_chars]
+        batch.append({
+            'title': " ".join(rng.choices(WORDS, k=5)) + f" {i}",
+            'link': f"https://example.com/news/{i}",
+            'source_name': f"源{i % 50}",
+            'content': content,
+            'llm_summary': content[:200],
+            'category_name': rng.choice(["科技", "财经", "体育", "国际"]),
+            'publish_time': (now - timedelta(minutes=rng.randint(0, 60 * 24 * 60))).isoformat(),
+        })
+        if len(batch) == 10_000:
+            storage.upsert_articles_batch(batch)
+            batch = []
+    if batch:
+        storage.upsert_articles_batch(batch)
+
+
+def measure(build):
+    """返回 (对象, 保留的字节数, 峰值字节数, 耗时秒)；中间的查询结果在统计前已释放。"""
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    objects = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, current - base, peak - base, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--content-chars', type=int, default=1500, help="每篇正文的字符数")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = NewsStorage(data_dir=data_dir, db_name="bench_cache.db")
+        populate(storage, args.count, args.content_chars)
+        deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'source_manager', 'llm_service',
+                                                'news_update_service', 'analysis_service')}
+        deps['source_manager'].get_lookup.return_value = SourceLookup([])
+        # 不用 MagicMock：它会记录每次调用的参数，干扰内存统计
+        deps['history_service'] = SimpleNamespace(is_read=lambda link: False)
+        app_service = AppService(storage=storage, **deps)
+
+        def load_full_articles():
+            return [app_service._convert_dict_to_article(row) for row in storage.get_all_articles()]
+
+        def load_list_rows():
+            app_service._load_initial_news()
+            return app_service.news_cache
+
+        full, before_bytes, before_peak, before_seconds = measure(load_full_articles)
+        del full
+        app_service.news_cache = []
+        app_service._cache_by_id = {}
+        rows, after_bytes, after_peak, after_seconds = measure(load_list_rows)
+        storage.close()
+
+    scale = 100_000 / args.count / (1024 * 1024)
+    results = {
+        'count': len(rows),
+        'content_chars': args.content_chars,
+        'before_mb_per_100k': round(before_bytes * scale, 1),
+        'after_mb_per_100k': round(after_bytes * scale, 1),
+        'before_peak_mb_per_100k': round(before_peak * scale, 1),
+        'after_peak_mb_per_100k': round(after_peak * scale, 1),
+        'before_bytes_per_article': round(before_bytes / args.count),
+        'after_bytes_per_article': round(after_bytes / args.count),
+        'before_load_seconds': round(before_seconds, 2),
+        'after_load_seconds': round(after_seconds, 2),
+        'reduction': round(before_bytes / after_bytes, 1) if after_bytes else None,
+    }
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+新闻列表过滤/排序基准测试
+
+在 N 篇合成新闻 (默认 100k) 上测量 NewsListViewModel 的常见交互耗时：
+  - initial:   首次加载 (含建立索引)
+  - category:  切换分类
+  - search:    搜索标题+内容 / 仅标题 (含首次生成搜索语料)
+  - days:      最近 7 天
+  - sort:      切换升序/降序
+并与逐条线性过滤 (_matches_filters) + Python 排序的参考实现对比，确认两者结果一致。
+
+用法:
+    python benchmarks/bench_news_list_filters.py [--count 100000] [--repeat 5] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PySide6.QtCore import QCoreApplication, Qt
+
+from src.models import NewsArticle
+from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel
+
+CATEGORIES = ["科技", "财经", "体育", "国际", "娱乐", "健康", "教育", "军事"]
+WORDS = ["人工智能", "芯片", "市场", "央行", "比赛", "冠军", "选举", "疫苗", "高考", "电影",
+         "market", "Apple", "OpenAI", "policy", "growth", "league", "vaccine", "startup"]
+
+
+def make_articles(count, seed=42):
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=4)) + f" {i}"
+        content = " ".join(rng.choices(WORDS, k=40))
+        articles.append(NewsArticle(
+            id=i, title=title, link=f"https://example.com/{i}", source_name=f"源{i % 50}",
+            content=content, category=rng.choice(CATEGORIES),
+            publish_time=now - timedelta(minutes=rng.randint(0, 60 * 24 * 60)),
+        ))
+    return articles
+
+
+def linear_reference(vm):
+    """旧实现：逐条过滤 + 每次比较都规范化日期的 Python 排序"""
+    date_bounds = vm._date_bounds()
+    filtered = [news for news in vm._all_news if vm._matches_filters(news, date_bounds)]
+
+    def datetime_key(news):
+        value = news.publish_time
+        if value is None:
+            return datetime.min.replace(tzinfo=timezone.utc)
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+    filtered.sort(key=datetime_key, reverse=(vm._sort_order == Qt.DescendingOrder))
+    return filtered
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    app = QCoreApplication.instance() or QCoreApplication([])
+    app_service = MagicMock()
+    app_service.history_service.is_read.return_value = False
+    vm = NewsListViewModel(app_service=app_service)
+    vm.ASYNC_SEARCH_THRESHOLD = float('inf')  # 测量查询本身的耗时，而不是后台搜索的提交
+    articles = make_articles(args.count)
+
+    started = time.perf_counter()
+    vm._handle_app_news_refreshed(articles)
+    results = {'count': args.count, 'initial_ms': round((time.perf_counter() - started) * 1000, 2)}
+
+    def first_search(term, fields):
+        vm._query_index.mark_dirty()  # 语料在重建后按字段懒生成
+        vm.search_news(term, fields)
+
+    scenarios = {
+        'category': lambda: (vm.filter_by_category("科技"), vm.filter_by_category("所有")),
+        'search_title_and_content_cold': lambda: first_search("openai", "标题和内容"),
+        'search_title_and_content': lambda: vm.search_news("芯片 market", "标题和内容"),
+        'search_title_only': lambda: vm.search_news("apple", "仅标题"),
+        'days_7': lambda: vm.filter_by_days(7),
+        'sort_toggle': lambda: (vm.sort_news('publish_time', Qt.AscendingOrder),
+                                vm.sort_news('publish_time', Qt.DescendingOrder)),
+    }
+    for name, scenario in scenarios.items():
+        vm.clear_search()
+        vm.filter_by_days(365)
+        results[f'{name}_ms'] = timed(scenario, args.repeat)
+
+    # 与线性参考实现对比 (相同条件)
+    vm.filter_by_category("科技")
+    vm.search_news("market", "标题和内容")
+    vm.filter_by_days(30)
+    indexed_ms = timed(vm._apply_filters_and_sort, args.repeat)
+    reference = []
+    linear_ms = timed(lambda: reference.__setitem__(slice(None), linear_reference(vm)), args.repeat)
+    results['combined_indexed_ms'] = indexed_ms
+    results['combined_linear_ms'] = linear_ms
+    results['combined_speedup'] = round(linear_ms / indexed_ms, 1) if indexed_ms else None
+    results['results_match'] = [n.link for n in reference] == [n.link for n in vm.newsList]
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if results['results_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+解析进程池基准测试
+
+模拟 200 个 RSS 源的刷新：8 个 I/O 线程 "下载" (sleep 模拟网络延迟) 后解析。
+对比两种模式：
+  - thread: 在 I/O 线程内直接 feedparser 解析 (与主线程争抢 GIL)
+  - pool:   解析交给 ParserPool 子进程
+
+主线程以 16ms 的节拍模拟 GUI 事件循环，统计每帧的延迟 (p50/p95/max)，
+并报告总耗时、各进程消耗的 CPU 时间。
+
+用法:
+    python benchmarks/bench_parser_pool.py [--sources 200] [--items 60] [--workers N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.collectors.parser_pool import ParserPool, parse_rss_payload  # noqa: E402
+
+FRAME_INTERVAL = 0.016
+IO_THREADS = 8
+SIMULATED_LATENCY = 0.02
+
+
+def build_payload(source_index: int, item_count: int) -> bytes:
+    items = []
+    for i in range(item_count):
+        items.append(
+            f"<item><title>Source {source_index} headline {i} 新闻标题</title>"
+            f"<link>https://example.com/{source_index}/{i}</link>"
+            f"<description>&lt;p&gt;Summary {i} for source {source_index} "
+            f"{'lorem ipsum ' * 20}&lt;/p&gt;</description>"
+            f"<pubDate>Thu, 26 Oct 2023 10:{i % 60:02d}:00 +0800</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Source {source_index}</title>{''.join(items)}</channel></rss>"
+    ).encode('utf-8')
+
+
+def run_refresh(payloads, parse_fn):
+    """在 I/O 线程池中执行刷新，同时在主线程记录帧延迟。"""
+    lateness = []
+    done = threading.Event()
+
+    def fetch_and_parse(index_payload):
+        index, payload = index_payload
+        time.sleep(SIMULATED_LATENCY)
+        return parse_fn(payload, f"Source {index}")
+
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    with ThreadPoolExecutor(max_workers=IO_THREADS) as executor:
+        futures = [executor.submit(fetch_and_parse, p) for p in enumerate(payloads)]
+
+        def _wait_all():
+            for f in futures:
+                f.result()
+            done.set()
+
+        threading.Thread(target=_wait_all, daemon=True).start()
+
+        next_tick = time.perf_counter() + FRAME_INTERVAL
+        while not done.is_set():
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            now = time.perf_counter()
+            lateness.append(max(0.0, now - next_tick) * 1000)
+            next_tick = now + FRAME_INTERVAL
+
+    return {
+        'wall_seconds': time.perf_counter() - wall_started,
+        'main_process_cpu_seconds': time.process_time() - cpu_started,
+        'frames': len(lateness),
+        'frame_late_p50_ms': statistics.median(lateness) if lateness else 0.0,
+        'frame_late_p95_ms': sorted(lateness)[int(len(lateness) * 0.95)] if lateness else 0.0,
+        'frame_late_max_ms': max(lateness) if lateness else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--items', type=int, default=60)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    payloads = [build_payload(i, args.items) for i in range(args.sources)]
+    print(f"{args.sources} 个源 x {args.items} 条目, I/O 线程: {IO_THREADS}, CPU 核心: {os.cpu_count()}")
+
+    thread_result = run_refresh(payloads, lambda payload, name: parse_rss_payload(payload, name)[0])
+
+    pool = ParserPool(max_workers=args.workers)
+    pool.parse_rss(payloads[0], "warmup", "未分类")  # 预热：启动子进程并完成模块导入
+    warm_stats = pool.stats()['cpu_seconds_by_worker']
+    pool_result = run_refresh(payloads, lambda payload, name: pool.parse_rss(payload, name, "未分类"))
+    worker_cpu = {
+        pid: seconds - warm_stats.get(pid, 0.0)
+        for pid, seconds in pool.stats()['cpu_seconds_by_worker'].items()
+    }
+    pool.shutdown()
+
+    for label, result in (("thread", thread_result), ("pool", pool_result)):
+        print(f"\n[{label}]")
+        for key, value in result.items():
+            print(f"  {key:26s} {value:.3f}" if isinstance(value, float) else f"  {key:26s} {value}")
+    print(f"\n[pool] 子进程 CPU 秒数 ({len(worker_cpu)} 个进程): "
+          + ", ".join(f"{pid}={seconds:.2f}" for pid, seconds in sorted(worker_cpu.items())))
+    if pool_result['wall_seconds'] > 0:
+        utilization = sum(worker_cpu.values()) / pool_result['wall_seconds']
+        print(f"[pool] 子进程平均占用核心数: {utilization:.2f}")
+
+
+if __name__ == '__main__':
+    main()
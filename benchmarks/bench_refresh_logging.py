@@ -0,0 +1,173 @@
+"""
+刷新吞吐量与日志开销基准测试
+
+在本地 HTTP 服务器上提供 S 个合成 RSS 源 (每个 K 条)，用真实的 RSSCollector + RefreshPipeline
+把它们写入临时数据库，并像应用中一样由 AppService._handle_articles_stored 合并进缓存。
+在不同日志配置下比较每秒处理的条目数:
+  - disabled:        logging.disable，不产生任何日志
+  - info_sync:       INFO 级别，文件/控制台在记录日志的线程中同步输出 (旧的 setup_logging)
+  - info_async:      INFO 级别，QueueHandler + 后台 QueueListener (新的默认配置)
+  - debug_sync_all:  DEBUG 级别，同步输出且不限流 (每条新闻的逐条日志全部输出)
+  - debug_async:     DEBUG 级别，异步输出 + 按调用位置限流
+
+控制台输出重定向到 os.devnull，日志文件写入临时目录。异步模式另外报告退出时写出队列剩余记录的耗时。
+抓取与解析占了大部分时间，各模式之间几个百分点以内的差异属于测量噪声。
+
+用法:
+    python benchmarks/bench_refresh_logging.py [--sources 40] [--items 100] [--rounds 3] [--output results.json]
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PySide6.QtCore import QCoreApplication
+
+from src.collectors.collector_factory import CollectorFactory
+from src.core.app_service import AppService
+from src.core.refresh_pipeline import RefreshPipeline
+from src.core.source_manager import SourceLookup
+from src.models import NewsSource
+from src.storage.news_storage import NewsStorage
+from src.utils import logger as log_setup
+
+MODES = {
+    'disabled': None,
+    'info_sync': dict(log_level=logging.INFO, use_queue=False),
+    'info_async': dict(log_level=logging.INFO, use_queue=True),
+    'debug_sync_all': dict(log_level=logging.DEBUG, use_queue=False, rate_limits={}),
+    'debug_async': dict(log_level=logging.DEBUG, use_queue=True),
+}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def write_feeds(feed_dir, sources, items):
+    for s in range(sources):
+        entries = []
+        for i in range(items):
+            entries.append(
+                f"<item><title>来源 {s} 新闻标题 {i}</title>"
+                f"<link>https://example.com/{s}/{i}</link>"
+                f"<description>&lt;p&gt;摘要 {i} {'lorem ipsum ' * 20}&lt;/p&gt;</description>"
+                f"<pubDate>Thu, 26 Oct 2023 10:{i % 60:02d}:00 +0800</pubDate></item>"
+            )
+        payload = ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                   f"<title>来源 {s}</title>{''.join(entries)}</channel></rss>")
+        with open(os.path.join(feed_dir, f"feed{s}.xml"), 'w', encoding='utf-8') as f:
+            f.write(payload)
+
+
+def make_app_service(storage, sources):
+    deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'source_manager', 'llm_service',
+                                            'news_update_service', 'analysis_service')}
+    deps['source_manager'].get_lookup.return_value = SourceLookup(sources)
+    # 每条文章都会调用的方法使用普通函数：MagicMock 会记录每次调用，干扰计时
+    deps['history_service'] = SimpleNamespace(is_read=lambda link: False)
+    return AppService(storage=storage, **deps)
+
+
+def run_mode(mode, config, data_dir, base_url, args):
+    sources = [NewsSource(name=f"来源{s}", type='rss', url=f"{base_url}/feed{s}.xml", category="科技")
+               for s in range(args.sources)]
+    log_path = os.path.join(data_dir, f"{mode}.log")
+
+    saved_stdout = sys.stdout
+    devnull = open(os.devnull, 'w', encoding='utf-8')
+    if config is None:
+        logging.disable(logging.CRITICAL)
+    else:
+        logging.disable(logging.NOTSET)
+        sys.stdout = devnull  # 控制台处理器在 setup_logging 时绑定 sys.stdout
+        log_setup.setup_logging(log_path=log_path, **config)
+    try:
+        elapsed = 0.0
+        stored = 0
+        for round_no in range(args.rounds):
+            db_name = f"bench_{mode}_{round_no}.db"
+            storage = NewsStorage(data_dir=data_dir, db_name=db_name)
+            app_service = make_app_service(storage, sources)
+            batches = []
+            pipeline = RefreshPipeline(CollectorFactory(), lambda: NewsStorage(data_dir=data_dir, db_name=db_name),
+                                       on_batch_stored=batches.append)
+            started = time.perf_counter()
+            summary = pipeline.run(sources)
+            for links in batches:
+                app_service._handle_articles_stored(links)
+            elapsed += time.perf_counter() - started
+            stored += summary['stored']
+            storage.close()
+        started = time.perf_counter()
+        log_setup.stop_logging()
+        flush_seconds = time.perf_counter() - started
+    finally:
+        root = logging.getLogger(log_setup.LOGGER_NAME)
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+            handler.close()
+        sys.stdout = saved_stdout
+        devnull.close()
+
+    return {
+        'items': stored,
+        'seconds': round(elapsed, 3),
+        'items_per_second': round(stored / elapsed) if elapsed else None,
+        'flush_seconds': round(flush_seconds, 3),
+        'log_bytes': os.path.getsize(log_path) if os.path.exists(log_path) else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=40)
+    parser.add_argument('--items', type=int, default=100, help="每个源的条目数")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    results = {'sources': args.sources, 'items_per_source': args.items, 'rounds': args.rounds}
+    with tempfile.TemporaryDirectory() as data_dir:
+        feed_dir = os.path.join(data_dir, 'feeds')
+        os.makedirs(feed_dir)
+        write_feeds(feed_dir, args.sources, args.items)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=feed_dir))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            run_mode('warmup', None, data_dir, base_url, argparse.Namespace(**{**vars(args), 'rounds': 1}))  # 预热导入与连接
+            for mode, config in MODES.items():
+                results[mode] = run_mode(mode, config, data_dir, base_url, args)
+        finally:
+            server.shutdown()
+            server.server_close()
+    logging.disable(logging.NOTSET)
+
+    baseline = results['disabled']['items_per_second']
+    for mode in MODES:
+        rate = results[mode]['items_per_second']
+        results[mode]['relative_to_disabled'] = round(rate / baseline, 2) if baseline and rate else None
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
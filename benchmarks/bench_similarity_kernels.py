@@ -0,0 +1,159 @@
+"""
+聚类特征相似度矩阵基准测试 (EnhancedNewsClusterer)
+
+对 n 篇合成的中文新闻 (默认 n = 500, 2000, 10000) 比较三类 n×n 特征矩阵的两种算法:
+  - time:   发布时间的高斯衰减接近度
+  - topic:  文档-主题分布 (Dirichlet 随机生成，省去 LDA 训练) 的余弦相似度
+  - entity: 标题/正文前 500 字的 2-4 字子串 + 数字组成的实体集合的 Jaccard 相似度 (含实体提取)
+
+legacy 为旧代码的逐对 Python 循环 (每对一次 np.exp / cosine_similarity / 集合运算)，
+vectorized 为 src/core/similarity_kernels.py。逐对循环在大 n 上要跑几十分钟，
+超过 --legacy-max 时只在前 --legacy-max 篇上测量，再按新闻对数 (n²) 外推，结果中标记 estimated。
+同时检查两种算法在测量的规模上结果一致 (max_abs_diff)。
+
+用法:
+    python benchmarks/bench_similarity_kernels.py [--sizes 500 2000 10000] [--legacy-max 500] [--output results.json]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.core.similarity_kernels import cosine_similarity_matrix, epoch_seconds, gaussian_time_similarity
+
+WORDS = ("北京", "上海", "深圳", "华为", "芯片", "发布", "会议", "经济", "增长", "政策", "市场", "股市", "科技",
+         "公司", "政府", "宣布", "台风", "地震", "救援", "比赛", "冠军", "球队", "电影", "票房", "疫苗", "医院",
+         "教育", "学校", "研究", "发现", "人工智能", "新能源", "汽车", "出口", "贸易", "谈判", "气候", "环境")
+
+
+def make_news(n, seed=0):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    news_list = []
+    for i in range(n):
+        topic = rng.sample(WORDS, 4)
+        title = "".join(topic) + f"第{rng.randint(1, 50)}次"
+        content = "，".join("".join(rng.choice(topic + list(rng.sample(WORDS, 2))) for _ in range(5))
+                           for _ in range(12)) + f"，共{rng.randint(1, 999)}人。"
+        news_list.append({'clean_title': title, 'clean_content': content,
+                          'publish_time': base + timedelta(minutes=rng.randint(0, 60 * 24 * 14))})
+    return news_list
+
+
+def legacy_time(news_list, window):
+    times = [news['publish_time'] for news in news_list]
+    n = len(times)
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i, n):
+            if i == j:
+                matrix[i, j] = 1.0
+                continue
+            diff = abs((times[i] - times[j]).total_seconds()) / (24 * 3600)
+            matrix[i, j] = matrix[j, i] = np.exp(-(diff ** 2) / (2 * window ** 2))
+    return matrix
+
+
+def legacy_topic(doc_topic):
+    n = len(doc_topic)
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i, n):
+            if i == j:
+                matrix[i, j] = 1.0
+                continue
+            matrix[i, j] = matrix[j, i] = cosine_similarity(doc_topic[i].reshape(1, -1),
+                                                            doc_topic[j].reshape(1, -1))[0, 0]
+    return matrix
+
+
+def legacy_entity(news_list):
+    news_entities = []
+    for news in news_list:
+        title, content = news['clean_title'], news['clean_content'][:500]
+        entities = []
+        for text in [title, content]:
+            for i in range(len(text)):
+                for j in range(2, 5):
+                    if i + j <= len(text):
+                        entities.append(text[i:i + j])
+        news_entities.append(entities + re.findall(r'\d+', title + content))
+    n = len(news_list)
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i, n):
+            if i == j:
+                matrix[i, j] = 1.0
+                continue
+            a, b = set(news_entities[i]), set(news_entities[j])
+            union = len(a | b)
+            matrix[i, j] = matrix[j, i] = len(a & b) / union if union else 0.0
+    return matrix
+
+
+def timed(func, *args):
+    gc.collect()
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 10000])
+    parser.add_argument('--legacy-max', type=int, default=500, help="逐对循环实际测量的最大规模")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    clusterer = EnhancedNewsClusterer()
+    window = clusterer.time_window
+    results = {'sizes': {}}
+    for n in args.sizes:
+        news_list = make_news(n)
+        doc_topic = np.random.default_rng(0).dirichlet(np.full(clusterer.n_topics, 0.1), size=n)
+        kernels = {
+            'time': (lambda: gaussian_time_similarity(epoch_seconds([x['publish_time'] for x in news_list]), window),
+                     lambda m: legacy_time(news_list[:m], window)),
+            'topic': (lambda: cosine_similarity_matrix(doc_topic), lambda m: legacy_topic(doc_topic[:m])),
+            'entity': (lambda: clusterer._extract_entity_features_simple(news_list),
+                       lambda m: legacy_entity(news_list[:m])),
+        }
+        entry = {}
+        for name, (vectorized, legacy) in kernels.items():
+            vec_seconds, matrix = timed(vectorized)
+            measured = min(n, args.legacy_max)
+            legacy_seconds, expected = timed(legacy, measured)
+            scale = (n / measured) ** 2
+            entry[name] = {
+                'vectorized_s': round(vec_seconds, 4),
+                'legacy_s': round(legacy_seconds * scale, 3),
+                'legacy_estimated': measured < n,
+                'speedup': round(legacy_seconds * scale / vec_seconds, 1),
+                'max_abs_diff': float(np.max(np.abs(matrix[:measured, :measured] - expected))),
+            }
+            del matrix, expected
+        results['sizes'][str(n)] = entry
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+逐条新闻规范化开销基准测试 (新闻源/分类查找)
+
+用真实的 SourceManager (临时数据库，S 个新闻源) 与 AppService._convert_dict_to_row，
+对 N 条合成的数据库行 (分批，每批 B 条) 比较补充分类的两种做法:
+  - legacy: 旧代码的做法。每批重建 {name: source}，每条调用 get_category_name；
+            _handle_news_refreshed 中每条还会线性查找一次 get_source_by_name
+  - cached: SourceManager.get_lookup() 的版本化查找表 (源未变化时复用)，每条只做一次字典查找
+
+报告每条的耗时 (微秒)，分别给出只算查找部分 (lookup_only) 和包含行转换的完整规范化 (normalize)。
+
+用法:
+    python benchmarks/bench_source_lookup.py [--sources 200] [--count 100000] [--batch 200] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.collectors.categories import STANDARD_CATEGORIES, get_category_name
+from src.core.app_service import AppService
+from src.core.source_manager import SourceManager
+from src.models import NewsSource
+from src.storage.news_storage import NewsStorage
+
+
+def legacy_linear_lookup(sources, name):
+    """旧的 SourceManager.get_source_by_name：遍历列表。"""
+    for source in sources:
+        if source.name == name:
+            return source
+    return None
+
+
+def legacy_batch(manager, rows, convert):
+    source_map = {source.name: source for source in manager.get_sources()}
+    for row in rows:
+        article = convert(row) if convert else None
+        source_name = row['source_name']
+        legacy_linear_lookup(manager.news_sources, source_name)
+        source_config = source_map.get(source_name)
+        category = get_category_name(source_config.category) if source_config else None
+        if article is not None:
+            article.category = category
+
+
+def cached_batch(manager, rows, convert):
+    lookup = manager.get_lookup()
+    source_categories = lookup.source_categories
+    lookup.by_name.get(rows[0]['source_name'])  # 新代码在循环外查找一次
+    for row in rows:
+        article = convert(row) if convert else None
+        category = source_categories.get(row['source_name'])
+        if article is not None:
+            article.category = category
+
+
+def time_per_item(func, manager, batches, convert):
+    started = time.perf_counter()
+    for rows in batches:
+        func(manager, rows, convert)
+    elapsed = time.perf_counter() - started
+    return round(elapsed / sum(len(rows) for rows in batches) * 1e6, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--batch', type=int, default=200, help="每批条目数 (刷新流水线的批次大小)")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    category_ids = list(STANDARD_CATEGORIES)
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = NewsStorage(data_dir=data_dir, db_name="bench_source_lookup.db")
+        with patch('src.core.source_manager.get_default_rss_sources', return_value=[]):
+            manager = SourceManager(storage)
+        for s in range(args.sources):
+            manager.add_source(NewsSource(name=f"来源{s}", type='rss', url=f"https://example.com/{s}.xml",
+                                          category=category_ids[s % len(category_ids)]))
+        names = [source.name for source in manager.get_sources()]
+        rows = [{'id': i, 'title': f"新闻 {i}", 'link': f"https://example.com/a/{i}",
+                 'source_name': names[(i // args.batch) % len(names)],
+                 'publish_time': '2024-01-02T03:04:05+00:00', 'summary': '摘要'}
+                for i in range(args.count)]
+        batches = [rows[i:i + args.batch] for i in range(0, len(rows), args.batch)]
+        deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'llm_service',
+                                                'news_update_service', 'analysis_service', 'history_service')}
+        convert = AppService(storage=storage, source_manager=manager, **deps)._convert_dict_to_row
+
+        results = {'sources': len(names), 'count': args.count, 'batch': args.batch}
+        for label, convert_func in (('lookup_only', None), ('normalize', convert)):
+            legacy = time_per_item(legacy_batch, manager, batches, convert_func)
+            cached = time_per_item(cached_batch, manager, batches, convert_func)
+            results[label] = {'legacy_us_per_item': legacy, 'cached_us_per_item': cached,
+                              'speedup': round(legacy / cached, 2) if cached else None}
+        storage.close()
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
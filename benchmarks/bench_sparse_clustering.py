@@ -0,0 +1,132 @@
+"""
+EnhancedNewsClusterer 稠密 / 稀疏聚类模式基准测试
+
+合成带真实事件标签的新闻 (每个事件 --per-event 篇，共享几个关键词、一个编号和相近的发布时间)，
+分别用稠密模式 (n×n 融合矩阵 + 层次聚类) 和稀疏模式 (top-k 近邻图 + 连通分量) 聚类，报告:
+  - seconds:     cluster() 的耗时
+  - peak_rss_mb: 子进程的峰值内存 (每次运行一个独立子进程)
+  - events:      生成的事件组数量
+  - ari:         与真实事件标签的调整兰德指数 (1 为完全一致)
+  - ari_vs_dense: 同一规模下稀疏模式与稠密模式结果的一致程度
+
+稠密模式的内存为 O(n²)，超过 --dense-max 篇时跳过。
+
+用法:
+    python benchmarks/bench_sparse_clustering.py [--sizes 2000 5000 10000] [--per-event 5] [--neighbors 15]
+                                                 [--dense-max 5000] [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+WORDS = ("北京 上海 深圳 华为 芯片 发布 会议 经济 增长 政策 市场 股市 科技 公司 政府 宣布 台风 地震 救援 比赛 "
+         "冠军 球队 电影 票房 疫苗 医院 教育 学校 研究 发现 人工智能 新能源 汽车 出口 贸易 谈判 气候 环境 银行 利率 "
+         "房价 旅游 航班 铁路 足球 篮球 演唱会 音乐 考古 文物").split()
+
+
+def make_event_news(n_samples, per_event, seed=0):
+    """合成新闻列表，每篇带 'event' (真实事件编号)。"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    news_list = []
+    for event in range((n_samples + per_event - 1) // per_event):
+        words = rng.sample(WORDS, 4)
+        started = base + timedelta(hours=rng.randint(0, 24 * 30))
+        code = str(rng.randint(100, 999))
+        for report in range(per_event):
+            title = " ".join(rng.sample(words, 3) + [rng.choice(WORDS), code])
+            content = "，".join(" ".join(rng.choice(words + [rng.choice(WORDS)]) for _ in range(4)) for _ in range(8))
+            news_list.append({'title': title, 'content': content, 'source_name': f"来源{report}",
+                              'publish_time': started + timedelta(minutes=rng.randint(0, 300)), 'event': event})
+    rng.shuffle(news_list)
+    return news_list[:n_samples]
+
+
+def run_child(mode, n_samples, per_event, neighbors):
+    """在子进程中运行：聚类一次，输出耗时、峰值内存和每篇新闻的事件组编号。"""
+    from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+    logging.disable(logging.CRITICAL)
+    news_list = make_event_news(n_samples, per_event)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    clusterer = EnhancedNewsClusterer()
+    clusterer.set_clustering_params(mode=mode, n_neighbors=neighbors)
+    started = time.perf_counter()
+    events = clusterer.cluster(news_list)
+    seconds = time.perf_counter() - started
+    # 事件中的报道是预处理后的副本，按 (标题, 发布时间) 对应回原列表
+    event_of = {(report['title'], report['publish_time']): k for k, event in enumerate(events)
+                for report in event['reports']}
+    print('@@' + json.dumps({
+        'seconds': round(seconds, 2),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'baseline_rss_mb': round(baseline_kb / 1024, 1),
+        'events': len(events),
+        'labels': [event_of[(news['title'], news['publish_time'])] for news in news_list],
+        'truth': [news['event'] for news in news_list],
+    }))
+
+
+def spawn(mode, n_samples, args):
+    proc = subprocess.run([sys.executable, __file__, '--child', mode, str(n_samples),
+                           '--per-event', str(args.per_event), '--neighbors', str(args.neighbors)],
+                          cwd=REPO_ROOT, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith('@@'):
+            return json.loads(line[2:])
+    return {'error': proc.stderr[-500:]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 5000, 10000])
+    parser.add_argument('--per-event', type=int, default=5)
+    parser.add_argument('--neighbors', type=int, default=15)
+    parser.add_argument('--dense-max', type=int, default=5000, help="稠密模式运行的最大规模")
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'N'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]), args.per_event, args.neighbors)
+        return 0
+
+    from sklearn.metrics import adjusted_rand_score
+    results = {'per_event': args.per_event, 'neighbors': args.neighbors, 'sizes': {}}
+    for n_samples in args.sizes:
+        entry = {}
+        for mode in ('dense', 'sparse'):
+            if mode == 'dense' and n_samples > args.dense_max:
+                entry[mode] = {'skipped': f"n > --dense-max ({args.dense_max})"}
+                continue
+            run = spawn(mode, n_samples, args)
+            if 'labels' in run:
+                run['ari'] = round(adjusted_rand_score(run['truth'], run['labels']), 4)
+            entry[mode] = run
+        if 'labels' in entry['dense'] and 'labels' in entry['sparse']:
+            entry['sparse']['ari_vs_dense'] = round(adjusted_rand_score(entry['dense']['labels'],
+                                                                        entry['sparse']['labels']), 4)
+        for run in entry.values():
+            run.pop('labels', None)
+            run.pop('truth', None)
+        results['sizes'][str(n_samples)] = entry
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+冷启动时间基准测试
+
+在子进程中多次运行 `main.py --exit-after-startup` (主窗口显示后立即退出)，报告:
+  - wall_seconds:   每次进程从启动到退出的耗时 (中位数/最小/最大)
+  - import_modules: 只导入 main.py 所需模块 (不创建窗口) 的耗时中位数
+  - heavy_modules:  导入 main.py 之后是否已加载 sklearn / matplotlib / selenium / numpy (应全部为 False)
+
+另外可用 --profile 运行一次 `main.py --profile-startup`，把各模块导入耗时与各服务初始化耗时的报告
+(logs/startup_profile.json) 一并写入结果。
+
+子进程默认使用 QT_QPA_PLATFORM=offscreen，第一次运行用于预热磁盘缓存，不计入结果。
+
+用法:
+    python benchmarks/bench_startup.py [--runs 5] [--profile] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+HEAVY_MODULES = ('sklearn', 'matplotlib', 'selenium', 'numpy')
+
+IMPORT_PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+sys.argv = ['main.py']
+sys.path.insert(0, {REPO_ROOT!r})
+import main
+elapsed = time.perf_counter() - started
+print('@@' + json.dumps({{'seconds': elapsed, 'heavy': {{m: m in sys.modules for m in {HEAVY_MODULES!r}}}}}))
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def time_startup(extra_args=()):
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, 'main.py', '--exit-after-startup', *extra_args], cwd=REPO_ROOT,
+                          env=child_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=300)
+    return time.perf_counter() - started, proc.returncode
+
+
+def probe_imports():
+    proc = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=REPO_ROOT, env=child_env(),
+                          capture_output=True, text=True, timeout=300)
+    for line in proc.stdout.splitlines():
+        if line.startswith('@@'):
+            return json.loads(line[2:])
+    raise RuntimeError(f"导入 main.py 失败: {proc.stderr[-2000:]}")
+
+
+def summarize(values):
+    return {'median': round(statistics.median(values), 3), 'min': round(min(values), 3), 'max': round(max(values), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--profile', action='store_true', help="额外运行一次 --profile-startup 并附上报告")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    time_startup()  # 预热
+    walls, codes = [], []
+    for _ in range(args.runs):
+        seconds, code = time_startup()
+        walls.append(seconds)
+        codes.append(code)
+    probes = [probe_imports() for _ in range(args.runs)]
+
+    results = {
+        'runs': args.runs,
+        'wall_seconds': summarize(walls),
+        'exit_codes': sorted(set(codes)),
+        'import_modules': summarize([p['seconds'] for p in probes]),
+        'heavy_modules': probes[-1]['heavy'],
+    }
+    if args.profile:
+        time_startup(['--profile-startup'])
+        profile_path = os.path.join(REPO_ROOT, 'logs', 'startup_profile.json')
+        with open(profile_path, encoding='utf-8') as f:
+            results['profile'] = json.load(f)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if not any(results['heavy_modules'].values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
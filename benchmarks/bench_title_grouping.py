@@ -0,0 +1,157 @@
+"""
+按标题自动分组 (NewsDataProcessor._auto_group_news_by_title) 基准测试
+
+合成中英文混合的标题 (每个事件 --per-event 条来自不同来源的改写标题: 打乱词序、替换或增删个别词、
+夹杂常见虚词)，比较两种候选生成方式:
+  - exhaustive: 旧做法，每个标题与其他所有标题逐一比较 (n²/2 对)。大 n 上要跑很久，
+                超过 --exhaustive-max 时只在前 --exhaustive-max 条上测量，再按 n² 外推 (标记 estimated)
+  - lsh:        src/core/title_lsh.py 的 MinHash + LSH 候选对，分组规则只在候选对上计算
+
+报告耗时、候选对数量、分组数量，以及在两者都实际运行的规模上 LSH 分组与逐一比较的分组
+是否完全相同 (same_groups) 和成对一致程度 (pair_recall / pair_precision)。
+
+用法:
+    python benchmarks/bench_title_grouping.py [--sizes 5000 50000] [--per-event 4] [--exhaustive-max 3000]
+                                              [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from src.core.news_data_processor import NewsDataProcessor
+from src.core.title_lsh import TitleLSHIndex
+
+EN_SYLLABLES = ("ba be bi bo ca co da de di do fa fe ga go ha he ja jo ka ke la le li lo ma me mi mo na ne "
+                "no pa pe po ra re ri ro sa se si so ta te ti to va ve wa we ya yo za ze").split()
+EN_STOPWORDS = "the of to in on for and with as at after over amid".split()
+ZH_CHARACTERS = ("中国美日德法英俄北京上海广州深圳华为芯片发布会议经济增长政策市场股公司宣布台风地震救援比赛冠军球队"
+                 "电影票房疫苗医院学校研究人工智能新源汽车出口贸易谈判银行利率房价航班铁路足篮演唱考古文物科技"
+                 "创业投资基金债券央行财政部长总统选举外交峰会气候环境污染能源石油天然气煤炭电力农业粮食水果")
+
+
+def make_vocabulary(rng, size, chinese):
+    """合成词表：英文词由 2-3 个音节拼成，中文词由 2-3 个常用字组成。"""
+    vocabulary = set()
+    while len(vocabulary) < size:
+        if chinese:
+            vocabulary.add("".join(rng.sample(ZH_CHARACTERS, rng.randint(2, 3))))
+        else:
+            vocabulary.add("".join(rng.choice(EN_SYLLABLES) for _ in range(rng.randint(2, 3))))
+    return sorted(vocabulary)
+
+
+def make_headlines(n_samples, per_event, seed=0):
+    """合成新闻列表，每条带 'event' (真实事件编号)；约三分之一为中文标题。"""
+    rng = random.Random(seed)
+    vocabularies = {True: make_vocabulary(rng, 3000, True), False: make_vocabulary(rng, 3000, False)}
+    news_list = []
+    for event in range((n_samples + per_event - 1) // per_event):
+        chinese = rng.random() < 0.33
+        vocabulary = vocabularies[chinese]
+        words = rng.sample(vocabulary, 6)
+        code = str(rng.randint(10, 999))
+        for report in range(per_event):
+            variant = list(words)
+            if rng.random() < 0.3:
+                rng.shuffle(variant)
+            if rng.random() < 0.5:
+                variant[rng.randrange(len(variant))] = rng.choice(vocabulary)
+            if rng.random() < 0.5:
+                variant.pop(rng.randrange(len(variant)))
+            if not chinese:
+                for _ in range(rng.randint(0, 2)):
+                    variant.insert(rng.randrange(len(variant) + 1), rng.choice(EN_STOPWORDS))
+            if rng.random() < 0.5:
+                variant.append(code)
+            news_list.append({'title': " ".join(variant).capitalize(), 'source_name': f"来源{report}",
+                              'event': event})
+    rng.shuffle(news_list)
+    return news_list[:n_samples]
+
+
+class ExhaustiveIndex:
+    """逐一比较：每个标题的候选是其他所有标题。"""
+
+    def __init__(self, titles, **kwargs):
+        self.size = len(titles)
+        self.pair_count = self.size * (self.size - 1) // 2
+
+    def candidates(self, i):
+        return np.delete(np.arange(self.size), i)
+
+
+def group_pairs(groups):
+    return {(min(a, b), max(a, b)) for group in groups for a in group for b in group if a < b}
+
+
+def run(news_list, exhaustive):
+    processor = NewsDataProcessor(MagicMock())
+    index_cls = ExhaustiveIndex if exhaustive else TitleLSHIndex
+    counted = {}
+
+    def make_index(titles):
+        counted['index'] = index_cls(titles)
+        return counted['index']
+
+    with patch('src.core.news_data_processor.TitleLSHIndex', side_effect=make_index):
+        started = time.perf_counter()
+        groups = processor._auto_group_news_by_title(news_list)
+        seconds = time.perf_counter() - started
+    positions = {id(news): k for k, news in enumerate(news_list)}
+    return seconds, counted['index'].pair_count, [[positions[id(news)] for news in group] for group in groups]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5000, 50000])
+    parser.add_argument('--per-event', type=int, default=4)
+    parser.add_argument('--exhaustive-max', type=int, default=3000, help="逐一比较实际测量的最大规模")
+    parser.add_argument('--output', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    results = {'per_event': args.per_event, 'sizes': {}}
+    for n_samples in args.sizes:
+        news_list = make_headlines(n_samples, args.per_event)
+        lsh_seconds, lsh_pairs, lsh_groups = run(news_list, exhaustive=False)
+        measured = min(n_samples, args.exhaustive_max)
+        sample = news_list[:measured]
+        ex_seconds, ex_pairs, ex_groups = run(sample, exhaustive=True)
+        scale = (n_samples / measured) ** 2
+        entry = {
+            'lsh': {'seconds': round(lsh_seconds, 3), 'candidate_pairs': lsh_pairs, 'groups': len(lsh_groups)},
+            'exhaustive': {'seconds': round(ex_seconds * scale, 2), 'estimated': measured < n_samples,
+                           'compared_pairs': n_samples * (n_samples - 1) // 2},
+        }
+        entry['speedup'] = round(ex_seconds * scale / lsh_seconds, 1)
+
+        # 在实际运行了逐一比较的前 measured 条上检查结果是否一致
+        _, _, sample_groups = run(sample, exhaustive=False) if measured < n_samples else (0, 0, lsh_groups)
+        expected, actual = group_pairs(ex_groups), group_pairs(sample_groups)
+        entry['agreement'] = {
+            'measured_on': measured,
+            'same_groups': sorted(map(sorted, ex_groups)) == sorted(map(sorted, sample_groups)),
+            'pair_recall': round(len(expected & actual) / max(len(expected), 1), 4),
+            'pair_precision': round(len(expected & actual) / max(len(actual), 1), 4),
+        }
+        results['sizes'][str(n_samples)] = entry
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+新闻分组/聚类实现的对比工具: 合成语料、统一的运行入口和评分
+
+bench_clustering_quality.py 用它做规模与质量对比，tests/core/test_clustering_quality.py 用它做质量回归测试。
+
+make_corpus() 生成带真实事件编号的中英文混合新闻:
+  - 每个事件使用同一种语言 (中文词之间没有空格)，有 6 个事件关键词、一个专名 (英文首字母大写) 和可选的编号
+  - 每个事件的报道数在 1 到 2 × per_event - 1 之间 (平均 per_event)，含只有一篇报道的事件
+  - 事件在 days 天内均匀开始，报道相对事件开始的延迟服从指数分布 (平均 6 小时，最多 3 天)
+  - 按 duplicate_rate 的比例转载同一事件已有的报道：一半原文照搬，一半改动标题并截短正文
+    (duplicate_of 为原报道的 id)
+
+CLUSTERERS 把每种实现包装为 news_list -> [[文章 id, ...], ...]，没有出现在任何组中的文章视为单独的事件。
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Sequence
+
+SYLLABLES = ("ba be bi bo ca co da de di do fa fe ga go ha he ja jo ka ke la le li lo ma me mi mo na ne no pa pe "
+             "po ra re ri ro sa se si so ta te ti to va ve wa we ya yo za ze").split()
+HANZI = ("中国美日德法英俄北京上海广州深圳华为芯片发布会议经济增长政策市场股公司宣布台风地震救援比赛冠军球队电影票房"
+         "疫苗医院学校研究人工智能新源汽车出口贸易谈判银行利率房价航班铁路足篮演唱考古文物科技创业投资基金债券央行"
+         "财政部长总统选举外交峰会气候环境污染能源石油天然气煤炭电力农业粮食水果")
+SOURCES = ("新华网 人民网 央视新闻 澎湃新闻 财新 界面新闻 Reuters BBC AP CNN Bloomberg Guardian").split()
+DUPLICATE_SUFFIXES = {True: ("（更新）", "（快讯）", "（组图）"), False: (" - update", " (live)", " | analysis")}
+
+
+def make_vocabulary(rng: random.Random, size: int, chinese: bool) -> List[str]:
+    words = set()
+    while len(words) < size:
+        if chinese:
+            words.add("".join(rng.sample(HANZI, rng.randint(2, 3))))
+        else:
+            words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))))
+    return sorted(words)
+
+
+def make_corpus(n_samples: int, per_event: int = 5, duplicate_rate: float = 0.1, days: int = 30,
+                seed: int = 0) -> List[Dict[str, Any]]:
+    """按发布时间排序的合成新闻，每篇带 'id'、'event' (真实事件编号)、'language' 和 'duplicate_of'。"""
+    rng = random.Random(seed)
+    vocabularies = {True: make_vocabulary(rng, 3000, True), False: make_vocabulary(rng, 3000, False)}
+    names = {True: make_vocabulary(rng, 500, True), False: [name.title() for name in make_vocabulary(rng, 500, False)]}
+    base = datetime(2024, 1, 1)
+    news_list: List[Dict[str, Any]] = []
+    event = 0
+    while len(news_list) < n_samples:
+        chinese = rng.random() < 0.5
+        vocabulary, separator = vocabularies[chinese], "" if chinese else " "
+        words = rng.sample(vocabulary, 6)
+        name = rng.choice(names[chinese])
+        code = [str(rng.randint(10, 9999))] if rng.random() < 0.5 else []
+        started = base + timedelta(minutes=rng.randint(0, days * 24 * 60))
+        reports: List[Dict[str, Any]] = []
+        for _ in range(rng.randint(1, 2 * per_event - 1)):
+            publish_time = started + timedelta(hours=min(rng.expovariate(1 / 6), 72))
+            source = rng.choice(SOURCES)
+            if reports and rng.random() < duplicate_rate:
+                original = rng.choice(reports)
+                title, content = original['title'], original['content']
+                if rng.random() < 0.5:
+                    title += rng.choice(DUPLICATE_SUFFIXES[chinese])
+                    content = content[:len(content) * 2 // 3]
+                duplicate_of = original
+            else:
+                title = separator.join(rng.sample(words, 3) + [name, rng.choice(vocabulary)] + code)
+                body = [rng.choice(words) if rng.random() < 0.4 else rng.choice(vocabulary) for _ in range(60)]
+                body[rng.randrange(len(body))] = name
+                content = separator.join(body)
+                duplicate_of = None
+            reports.append({'title': title, 'content': content, 'source_name': source,
+                            'link': f"https://example.com/{event}/{len(reports)}", 'publish_time': publish_time,
+                            'event': event, 'language': 'zh' if chinese else 'en', 'duplicate_of': duplicate_of})
+        news_list.extend(reports)
+        event += 1
+
+    news_list = sorted(news_list[:n_samples], key=lambda news: news['publish_time'])
+    for article_id, news in enumerate(news_list):
+        news['id'] = article_id
+    for news in news_list:
+        original = news['duplicate_of']
+        # 原报道被截在 n_samples 之外时，这篇转载不再算作重复
+        news['duplicate_of'] = original.get('id') if original is not None else None
+    return news_list
+
+
+def _report_groups(events: List[Dict[str, Any]]) -> List[List[int]]:
+    return [[report['id'] for report in event['reports']] for event in events]
+
+
+def run_news_clusterer(news_list):
+    from src.core.news_clusterer import NewsClusterer
+    return _report_groups(NewsClusterer().cluster(news_list))
+
+
+def run_enhanced(mode: str) -> Callable[[List[Dict[str, Any]]], List[List[int]]]:
+    def run(news_list):
+        from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+        clusterer = EnhancedNewsClusterer()
+        clusterer.set_clustering_params(mode=mode)
+        return _report_groups(clusterer.cluster(news_list))
+    return run
+
+
+def run_title_grouping(news_list):
+    from src.core.news_data_processor import NewsDataProcessor
+    return [[news['id'] for news in group] for group in NewsDataProcessor(None).auto_group_news(news_list)]
+
+
+def run_processor_multi_feature(news_list):
+    from src.core.news_data_processor import NewsDataProcessor
+    return _report_groups(NewsDataProcessor(None).auto_group_news(news_list, method='multi_feature'))
+
+
+def run_incremental(news_list, batch: int = 30):
+    """按发布时间顺序每次刷新到达 batch 篇，全部到达后整理一次。"""
+    from src.core.incremental_clusterer import IncrementalEventClusterer
+    clusterer = IncrementalEventClusterer()
+    for start in range(0, len(news_list), batch):
+        clusterer.add_articles(news_list[start:start + batch])
+    clusterer.consolidate()
+    return _report_groups(clusterer.event_dicts())
+
+
+CLUSTERERS: Dict[str, Callable[[List[Dict[str, Any]]], List[List[int]]]] = {
+    'news_clusterer': run_news_clusterer,
+    'enhanced_dense': run_enhanced('dense'),
+    'enhanced_sparse': run_enhanced('sparse'),
+    'title_grouping': run_title_grouping,
+    'processor_multi_feature': run_processor_multi_feature,
+    'incremental': run_incremental,
+}
+DENSE_CLUSTERERS = ('enhanced_dense',)  # 内存为 O(n²)
+
+
+def group_labels(groups: Sequence[Sequence[int]], news_list: List[Dict[str, Any]]) -> List[int]:
+    """分组结果 -> 每篇文章的组号；不在任何组中的文章各自成组 (负数)。"""
+    label_of = {article_id: k for k, group in enumerate(groups) for article_id in group}
+    return [label_of.get(news['id'], -1 - k) for k, news in enumerate(news_list)]
+
+
+def score(news_list: List[Dict[str, Any]], labels: Sequence[int]) -> Dict[str, float]:
+    """与真实事件编号对比: ARI、NMI，以及转载与原报道分在同一组的比例。"""
+    from sklearn.metrics import adjusted_rand_score, normalized_mutual_info_score
+    truth = [news['event'] for news in news_list]
+    position = {news['id']: k for k, news in enumerate(news_list)}
+    duplicates = [(k, position[news['duplicate_of']]) for k, news in enumerate(news_list)
+                  if news['duplicate_of'] is not None]
+    return {
+        'ari': round(float(adjusted_rand_score(truth, labels)), 4),
+        'nmi': round(float(normalized_mutual_info_score(truth, labels)), 4),
+        'duplicates_grouped': round(sum(labels[a] == labels[b] for a, b in duplicates) / len(duplicates), 4)
+        if duplicates else None,
+    }
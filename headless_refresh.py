@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+新闻聚合与分析系统 - 无界面刷新入口
+
+不启动 GUI、不加载 Qt，直接抓取所有启用的新闻源并写入数据库。
+GUI 进程 (main.py) 打开同一个数据库即可读取结果。
+
+用法:
+    python headless_refresh.py once [--source 名称 ...]      # 刷新一次后退出
+    python headless_refresh.py daemon --interval 30          # 每 30 分钟刷新一次，Ctrl+C / SIGTERM 退出
+    python headless_refresh.py startup                       # 只初始化并报告启动开销，不抓取
+
+通用选项:
+    --data-dir DIR        数据目录 (默认与 main.py 相同)
+    --db-name NAME        数据库文件名 (默认 NewsStorage.DB_FILE_NAME)
+    --metrics-file PATH   将启动时间/峰值内存/刷新结果以 JSON 行追加到该文件
+"""
+
+import time
+
+_PROCESS_STARTED = time.perf_counter()  # 尽早记录，启动耗时包含下面的模块导入
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+from datetime import datetime, timezone
+
+from src.core.headless_refresh import HeadlessRefreshWorker, collect_runtime_metrics
+from src.utils.logger import setup_logging, get_logger
+
+
+def _default_data_dir() -> str:
+    # 与 main.py 中的路径计算保持一致，保证两者打开同一个数据库
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(project_root, "data")
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('mode', choices=['once', 'daemon', 'startup'])
+    parser.add_argument('--interval', type=float, default=60, help="daemon 模式的刷新间隔 (分钟)")
+    parser.add_argument('--source', dest='sources', action='append', help="只刷新指定名称的源，可重复")
+    parser.add_argument('--data-dir', default=_default_data_dir())
+    parser.add_argument('--db-name', default=None)
+    parser.add_argument('--fetch-workers', type=int, default=8)
+    parser.add_argument('--metrics-file', default=None)
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+
+def _write_metrics(path: str, record: dict):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    setup_logging(log_level=logging.DEBUG if args.verbose else logging.INFO)
+    logger = get_logger("headless_entry")
+
+    worker = HeadlessRefreshWorker(
+        data_dir=args.data_dir,
+        db_name=args.db_name,
+        source_names=args.sources,
+        fetch_workers=args.fetch_workers,
+    )
+    sources = worker.load_sources()
+    startup = collect_runtime_metrics(_PROCESS_STARTED)
+    startup['enabled_sources'] = len(sources)
+    logger.info(f"无界面模式启动完成: {startup['startup_seconds']:.3f}s, 峰值内存 {startup['peak_rss_mb']} MB, "
+                f"已加载 Qt: {startup['qt_loaded']}, 启用的源: {len(sources)}")
+
+    record = {'timestamp': datetime.now(timezone.utc).isoformat(), 'mode': args.mode, 'startup': startup}
+
+    def _handle_stop(signum, frame):
+        logger.info(f"收到信号 {signum}，正在停止...")
+        worker.stop()
+
+    signal.signal(signal.SIGINT, _handle_stop)
+    signal.signal(signal.SIGTERM, _handle_stop)
+
+    exit_code = 0
+    if args.mode == 'once':
+        summary = worker.run_once()
+        record['refresh'] = {key: summary.get(key) for key in ('sources', 'collected', 'stored', 'errors', 'cancelled', 'elapsed_seconds')}
+        record['peak_rss_mb'] = collect_runtime_metrics(_PROCESS_STARTED)['peak_rss_mb']
+        exit_code = 1 if summary.get('cancelled') else 0
+    elif args.mode == 'daemon':
+        worker.run_daemon(args.interval)
+
+    if args.metrics_file:
+        _write_metrics(args.metrics_file, record)
+    if args.mode == 'startup':
+        print(json.dumps(startup, ensure_ascii=False))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,10 +11,19 @@ import sys
 import os
 import logging
 from typing import NoReturn
+
+# --profile-startup: 在导入其余模块之前安装导入计时钩子，启动完成后输出各模块导入耗时与各服务初始化耗时
+# --exit-after-startup: 主窗口显示后立即退出 (用于测量冷启动时间)
+PROFILE_STARTUP = '--profile-startup' in sys.argv
+EXIT_AFTER_STARTUP = '--exit-after-startup' in sys.argv
+sys.argv = [arg for arg in sys.argv if arg not in ('--profile-startup', '--exit-after-startup')] # 不传给 QApplication
+from src.utils import startup_profiler
+if PROFILE_STARTUP:
+    startup_profiler.enable()
+
 from logging.handlers import TimedRotatingFileHandler
-from dependency_injector.wiring import inject, Provide
 from PySide6.QtWidgets import QApplication, QWidget # Use PySide6 consistently
-from PySide6.QtCore import QSettings, QTranslator, QLibraryInfo, QLocale # Import QSettings, QTranslator, QLibraryInfo, QLocale
+from PySide6.QtCore import QSettings, QTranslator, QLibraryInfo, QLocale, QTimer # Import QSettings, QTranslator, QLibraryInfo, QLocale
 # from PyQt5.QtGui import QIcon # QIcon 可以在 MainWindow 内部设置
 # 导入依赖注入容器
 from src.containers import Container
@@ -28,16 +37,17 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path) # 将 src 目录添加到 sys.path
 
 # 导入重构后的模块
-from utils.logger import setup_logging, get_logger # 从 src/utils 导入
+# 统一使用 src. 前缀：若同时以 ui.xxx 和 src.ui.xxx 导入，同一模块会被加载两次 (类也不再是同一个对象)
+from src.utils.logger import setup_logging, get_logger, log_dir # 从 src/utils 导入
 # from ui.main_window import MainWindow           # 从 src/ui 导入 - Old path
-from ui.views.main_window import MainWindow         # 从 src/ui/views 导入 - Corrected path
-from ui.theme_manager import ThemeManager         # 导入 ThemeManager
-from ui.ui_settings_manager import UISettingsManager # 导入 UI 设置管理器
-# 导入 AppService 类以供手动实例化
-from src.core.app_service import AppService
+from src.ui.views.main_window import MainWindow         # 从 src/ui/views 导入 - Corrected path
+from src.ui.theme_manager import ThemeManager         # 导入 ThemeManager
+from src.ui.ui_settings_manager import UISettingsManager # 导入 UI 设置管理器
+# AppService 由容器创建 (见 src/containers.py)
 # --- Import SchedulerService ---
-from services.scheduler_service import SchedulerService
+from src.services.scheduler_service import SchedulerService
 # --- End Import ---
+startup_profiler.mark("导入模块")
 
 
 # 注意：确保所有被导入的模块路径相对于 src 目录是正确的
@@ -54,6 +64,7 @@ def main() -> NoReturn:
     # --- 1. 初始化日志 ---
     # 日志模块内部会确定日志路径
     setup_logging(log_level=logging.INFO)  # 使用正确的关键字参数名 log_level
+    startup_profiler.mark("初始化日志")
     logger = get_logger("main_entry") # 获取 logger
 
     # --- 定义 project_root (移到使用它之前) ---
@@ -93,6 +104,10 @@ def main() -> NoReturn:
             "data_dir": os.path.join(project_root, "data"), # 添加数据目录路径
             "config": os.path.join(project_root, "config", "settings.ini") # 示例配置文件路径
         },
+        "refresh": {
+            "process_parsing": os.environ.get("NEWS_ANALYZER_PROCESS_PARSING", "0") == "1", # 是否在子进程中解析订阅源
+            "parser_workers": None # None 表示 CPU 核心数 - 1
+        },
         # 其他配置...
     })
     # logger.warning("使用了临时默认配置注入容器，请后续完善配置加载逻辑！") # Commented out warning
@@ -109,7 +124,9 @@ def main() -> NoReturn:
         logger.debug("从容器获取 AppService 实例...")
         try:
             # --- 直接从容器获取 AppService ---
-            app_service = container.app_service() # <--- 修改点
+            startup_profiler.mark("加载配置")
+            app_service = container.app_service() # <--- 修改点 (依赖的服务在此时才导入并创建)
+            startup_profiler.mark("创建服务")
 
             # --- 调用依赖初始化 ---
             # app_service._initialize_dependencies() # 确保 AppService 内部依赖连接 # Removed this line
@@ -133,6 +150,7 @@ def main() -> NoReturn:
             else:
                 logger.warning("AppService 或其 storage 未初始化，跳过数据库清理。")
             # --- END: 一次性数据库清理 ---
+            startup_profiler.mark("数据库清理")
 
         except Exception as e:
             logger.error(f"初始化应用服务失败: {str(e)}", exc_info=True)
@@ -179,6 +197,7 @@ def main() -> NoReturn:
         settings = QSettings(app.organizationName(), app.applicationName())
         logger.info(f"QSettings initialized for {app.organizationName()}/{app.applicationName()}")
         # --- End QSettings Initialization ---
+        startup_profiler.mark("创建 QApplication")
 
         # --- Initialize SchedulerService ---
         logger.debug("Initializing SchedulerService...")
@@ -197,6 +216,7 @@ def main() -> NoReturn:
             logger.error(f"Failed to initialize SchedulerService: {e}", exc_info=True)
             # Decide how to handle this - maybe continue without scheduler?
         # --- End SchedulerService Initialization ---
+        startup_profiler.mark("创建 SchedulerService")
 
         logger.debug("创建主窗口 MainWindow...")
         try:
@@ -252,6 +272,7 @@ def main() -> NoReturn:
                 raise RuntimeError("窗口显示失败")
 
             logger.info("窗口显示验证完成，准备进入主事件循环")
+            startup_profiler.mark("创建并显示主窗口")
 
         except Exception as e:
             logger.error(f"创建/显示主窗口失败: {str(e)}", exc_info=True)
@@ -272,6 +293,7 @@ def main() -> NoReturn:
             logger.error(f"应用字体大小时出错: {e}", exc_info=True)
         logger.info("主题和字体设置已应用。")
         # --- End Theme/Font Application ---
+        startup_profiler.mark("应用主题和字体")
 
         # --- Start SchedulerService ---
         if scheduler_service:
@@ -280,6 +302,20 @@ def main() -> NoReturn:
         else:
             logger.warning("SchedulerService not initialized, cannot start.")
         # --- End SchedulerService Start ---
+        startup_profiler.mark("启动 SchedulerService")
+
+        profiler = startup_profiler.active()
+        if profiler is not None:
+            startup_profiler.disable()
+            logger.info(profiler.format_report())
+            profile_path = os.path.join(log_dir, 'startup_profile.json')
+            try:
+                profiler.write_json(profile_path)
+                logger.info(f"启动耗时分析已写入: {profile_path}")
+            except OSError as e:
+                logger.warning(f"写入启动耗时分析失败: {e}")
+        if EXIT_AFTER_STARTUP:
+            QTimer.singleShot(0, app.quit)
 
         # 4. 启动 Qt 事件循环
         logger.info("启动 Qt 事件循环...")
@@ -6,8 +6,17 @@
 
 # 从相应的模块导入类，以便可以直接从包中导入
 from .rss_collector import RSSCollector
-from .pengpai_collector import PengpaiCollector
+from .json_feed_collector import JSONFeedCollector
 from .collector_factory import CollectorFactory
 
+
+def __getattr__(name):
+    # PengpaiCollector 依赖 PySide6 和 Selenium，按需导入，使无界面刷新进程不必加载 Qt
+    if name == 'PengpaiCollector':
+        from .pengpai_collector import PengpaiCollector
+        return PengpaiCollector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # 可以选择性地定义 __all__ 来明确导出哪些名称
-__all__ = ['RSSCollector', 'PengpaiCollector', 'CollectorFactory']
+__all__ = ['RSSCollector', 'PengpaiCollector', 'JSONFeedCollector', 'CollectorFactory']
@@ -1,25 +1,29 @@
+import importlib
 import logging
 from .rss_collector import RSSCollector
-from .pengpai_collector import PengpaiCollector
-# Import other collectors like JSONFeedCollector if they exist and are needed
-# from .json_feed_collector import JSONFeedCollector
+from .json_feed_collector import JSONFeedCollector
 
 class CollectorFactory:
     """
     工厂类，用于创建和管理不同类型的新闻收集器实例。
     """
-    def __init__(self):
+    def __init__(self, parser_pool=None):
         self.logger = logging.getLogger(__name__)
+        # 可选的解析进程池，创建支持它的采集器时注入 (见 ParserPool)
+        self.parser_pool = parser_pool
         # 注册已知的收集器类型及其对应的类
         self._collectors = {
             "rss": RSSCollector,
-            "pengpai": PengpaiCollector,
-            # "json": JSONFeedCollector, # Example: Add JSONFeedCollector if it's used
+            "json": JSONFeedCollector,
             # Add other collector types here as they are implemented
         }
+        # 依赖较重 (PySide6 / Selenium) 的采集器在首次使用时才导入: 类型 -> (模块, 类名)
+        self._lazy_collectors = {
+            "pengpai": (f"{__package__}.pengpai_collector", "PengpaiCollector"),
+        }
         # Log available collectors at initialization for easier debugging
         self.logger.info(
-            f"CollectorFactory initialized. Available collector types: {list(self._collectors.keys())}"
+            f"CollectorFactory initialized. Available collector types: {list(self._collectors) + list(self._lazy_collectors)}"
         )
 
     def get_collector(self, source_type: str):
@@ -27,17 +31,20 @@ class CollectorFactory:
         根据源类型获取相应的收集器实例。
 
         Args:
-            source_type (str): 新闻源的类型 (例如, 'rss', 'pengpai').
+            source_type (str): 新闻源的类型 (例如, 'rss', 'pengpai', 'json').
 
         Returns:
             An instance of the appropriate collector, or None if no collector
             is found for the given type.
         """
-        collector_class = self._collectors.get(source_type.lower())
+        collector_class = self._collectors.get(source_type.lower()) or self._load_lazy_collector(source_type.lower())
         if collector_class:
             try:
                 self.logger.debug(f"Creating instance of {collector_class.__name__} for source type '{source_type}'.")
-                return collector_class()  # Instantiate the collector
+                collector = collector_class()  # Instantiate the collector
+                if self.parser_pool is not None and hasattr(collector, 'parser_pool'):
+                    collector.parser_pool = self.parser_pool
+                return collector
             except Exception as e:
                 self.logger.error(
                     f"Error instantiating collector {collector_class.__name__} for type '{source_type}': {e}",
@@ -48,6 +55,20 @@ class CollectorFactory:
             self.logger.warning(f"No collector registered for source type: '{source_type}'.")
             return None
 
+    def _load_lazy_collector(self, source_type: str):
+        """导入并注册延迟加载的采集器类；未知类型或导入失败时返回 None。"""
+        target = self._lazy_collectors.pop(source_type, None)
+        if target is None:
+            return None
+        module_name, class_name = target
+        try:
+            collector_class = getattr(importlib.import_module(module_name), class_name)
+        except Exception as e:
+            self.logger.error(f"Error importing collector {class_name} for type '{source_type}': {e}", exc_info=True)
+            return None
+        self._collectors[source_type] = collector_class
+        return collector_class
+
     def register_collector(self, source_type: str, collector_class):
         """
         动态注册一个新的收集器类型或覆盖现有的收集器。
@@ -63,6 +84,7 @@ class CollectorFactory:
                 f"from {self._collectors[source_type_lower].__name__} to {collector_class.__name__}."
             )
         self._collectors[source_type_lower] = collector_class
+        self._lazy_collectors.pop(source_type_lower, None)
         self.logger.info(
             f"Successfully registered collector for type '{source_type_lower}': {collector_class.__name__}."
         ) 
\ No newline at end of file
@@ -3,13 +3,19 @@ JSON Feed 新闻收集器
 
 负责从单个 JSON Feed 源获取并解析新闻数据为标准字典格式。
 参考规范: https://www.jsonfeed.org/version/1.1/
+
+响应体使用 orjson 解码；下载时按字节上限流式读取，并支持基于
+ETag / Last-Modified 的条件请求。超过字节上限而被截断的 Feed 无法整体解码，
+改为逐条解析 `items` 数组中已下载完整的条目。
 """
 
 import logging
-import json
+import re
+import threading
 import time
+import orjson
 import requests
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from src.models import NewsSource
 from datetime import datetime
 
@@ -21,25 +27,109 @@ except ImportError:
     _HAS_DATEUTIL = False
     logging.warning("dateutil not found. Date parsing will be less robust. pip install python-dateutil")
 
+# 结构扫描用的词法单元: 完整的 JSON 字符串 (整体跳过，其中的括号不计入深度) 或结构字符
+_JSON_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},:]', re.S)
+
+
+def iter_json_feed_items(payload: bytes, top_level_keys: Optional[Set[str]] = None) -> Iterator[Any]:
+    """
+    逐条解析 JSON Feed 顶层对象中 `items` 数组的元素。
+
+    只对结构字符做扫描 (字符串由正则整体跳过)，每遇到一个完整元素就用 orjson 解码并产出，
+    因此调用方可以在达到条目上限时提前停止；被截断的负载会产出截断点之前的所有完整条目。
+
+    Args:
+        payload: Feed 原始字节 (可以是被截断的前缀)。
+        top_level_keys: 可选集合，扫描过程中会把遇到的顶层键名加入其中 (用于结构校验)。
+
+    Yields:
+        `items` 中每个元素解码后的值 (通常是 dict)；无法解码的元素会被跳过。
+    """
+    depth = 0
+    expect_key = False
+    last_key: Optional[bytes] = None
+    after_colon = False
+    in_items = False
+    element_start = 0
+
+    for match in _JSON_TOKEN_RE.finditer(payload):
+        start = match.start()
+        char = payload[start]
+
+        if char == 0x22:  # '"'
+            if depth == 1 and expect_key:
+                last_key = payload[start + 1:match.end() - 1]
+                if top_level_keys is not None:
+                    top_level_keys.add(last_key.decode('utf-8', 'replace'))
+                expect_key = False
+            after_colon = False
+            continue
+
+        if char == 0x3A:  # ':'
+            after_colon = depth == 1
+            continue
+
+        if char in (0x7B, 0x5B):  # '{' '['
+            if depth == 1 and char == 0x5B and after_colon and last_key == b'items':
+                in_items = True
+                element_start = match.end()
+            depth += 1
+            if depth == 1 and char == 0x7B:
+                expect_key = True
+        elif char in (0x7D, 0x5D):  # '}' ']'
+            depth -= 1
+            if in_items and depth == 1:
+                # items 数组结束，处理最后一个元素
+                element = payload[element_start:start].strip()
+                if element:
+                    try:
+                        yield orjson.loads(element)
+                    except orjson.JSONDecodeError:
+                        pass
+                in_items = False
+        elif char == 0x2C:  # ','
+            if depth == 1:
+                expect_key = True
+            elif in_items and depth == 2:
+                element = payload[element_start:start].strip()
+                element_start = match.end()
+                if element:
+                    try:
+                        yield orjson.loads(element)
+                    except orjson.JSONDecodeError:
+                        pass
+        after_colon = False
+
+
 class JSONFeedCollector:
     """
     JSON Feed 新闻收集器类。
 
     负责从遵循 JSON Feed 规范 (https://www.jsonfeed.org/version/1.1/) 的单个新闻源
-    获取并解析新闻数据。此类是无状态的，每次调用 `collect` 方法时处理单个源。
+    获取并解析新闻数据。每次调用 `collect` 方法时处理单个源；
+    条件请求所需的验证器 (ETag / Last-Modified) 按 URL 保存在类级缓存中，
+    因此即便工厂每次刷新都创建新实例也能生效。
+
+    单个源可通过 `custom_config` 中的 `max_items` / `max_bytes` 覆盖默认上限。
 
     Attributes:
         logger: 用于记录日志的 logger 实例。
         session: 用于执行 HTTP 请求的 `requests.Session` 实例。
     """
 
+    DEFAULT_MAX_ITEMS = 500
+    DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    _validators: Dict[str, Dict[str, str]] = {}
+    _validators_lock = threading.Lock()
+
     def __init__(self):
         """
         初始化 JSONFeedCollector。
 
         创建一个 `requests.Session` 并设置用户代理。
         """
-        """初始化 JSON Feed 收集器"""
         self.logger = logging.getLogger('news_analyzer.collectors.json_feed')
         self.session = requests.Session() # Use a session for potential connection reuse
         self.session.headers.update({
@@ -47,6 +137,12 @@ class JSONFeedCollector:
         })
         self.logger.info("JSONFeedCollector initialized (stateless).")
 
+    @classmethod
+    def clear_validator_cache(cls):
+        """清空条件请求的验证器缓存 (主要用于测试)。"""
+        with cls._validators_lock:
+            cls._validators.clear()
+
     def _parse_date(self, date_str: Optional[str]) -> Optional[str]:
         """
         (内部辅助方法) 尝试将多种格式的日期时间字符串解析为 ISO 8601 格式。
@@ -61,7 +157,6 @@ class JSONFeedCollector:
             Optional[str]: 解析并格式化为 ISO 8601 的字符串，如果输入为 None 或解析失败
                            （且无 dateutil），则返回原始字符串或 None。
         """
-        """尝试解析多种格式的日期时间字符串为 ISO 8601 格式。"""
         if not date_str:
             return None
         if _HAS_DATEUTIL:
@@ -80,17 +175,62 @@ class JSONFeedCollector:
             self.logger.debug(f"dateutil 不可用，返回原始日期字符串: '{date_str}'")
             return date_str # Return original string
 
+    def _get_limits(self, source_config: NewsSource) -> Tuple[int, int]:
+        """(内部辅助方法) 返回该源的 (最大条目数, 最大字节数)。"""
+        custom = source_config.custom_config or {}
+        max_items = int(custom.get('max_items') or self.DEFAULT_MAX_ITEMS)
+        max_bytes = int(custom.get('max_bytes') or self.DEFAULT_MAX_BYTES)
+        return max_items, max_bytes
+
+    def _read_body(self, response: requests.Response, max_bytes: int) -> Tuple[bytes, bool]:
+        """
+        (内部辅助方法) 流式读取响应体，最多读取 max_bytes 字节。
+
+        Returns:
+            (响应体字节, 是否因达到上限而被截断)
+        """
+        chunks = []
+        received = 0
+        truncated = False
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            if not chunk:
+                continue
+            if received + len(chunk) > max_bytes:
+                chunks.append(chunk[:max_bytes - received])
+                truncated = True
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+        response.close()
+        return b''.join(chunks), truncated
+
+    def _remember_validators(self, url: str, response: requests.Response):
+        """(内部辅助方法) 保存响应中的 ETag / Last-Modified，供下次条件请求使用。"""
+        headers = response.headers or {}
+        validators = {}
+        if headers.get('ETag'):
+            validators['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = headers['Last-Modified']
+        with self._validators_lock:
+            if validators:
+                self._validators[url] = validators
+            else:
+                self._validators.pop(url, None)
+
     def collect(self, source_config: NewsSource, **kwargs) -> List[Dict]:
         """
         从指定的 JSON Feed 源获取并解析新闻条目。
 
-        通过 HTTP GET 请求获取 Feed 数据，解析 JSON，然后逐条解析 `items` 列表
-        中的新闻条目，将其转换为标准化的字典格式。
+        通过 HTTP GET 请求获取 Feed 数据 (带条件请求头，若之前保存过验证器)，
+        按字节上限流式读取响应体并用 orjson 解码，然后逐条解析 `items` 列表中的新闻条目，
+        将其转换为标准化的字典格式。服务器返回 304 时视为没有新内容，返回空列表。
 
         Args:
             source_config (NewsSource): 包含要获取的 Feed URL 和其他信息的配置对象。
             **kwargs: 接受额外参数，特别是 `cancel_checker` (一个 callable)，
-                      用于在耗时操作中检查是否应取消操作。
+                      用于在耗时操作中检查是否应取消操作；以及 `progress_callback`
+                      (callable(current, total))。
 
         Returns:
             List[Dict]: 包含从 Feed 中成功解析的新闻条目的字典列表。
@@ -106,34 +246,44 @@ class JSONFeedCollector:
 
         self.logger.info(f"开始从 JSON Feed 源获取: {source_config.name} ({url})")
         cancel_checker = kwargs.get('cancel_checker')
+        progress_callback = kwargs.get('progress_callback')
+        max_items, max_bytes = self._get_limits(source_config)
 
         try:
-            response = self.session.get(url, timeout=20) # Increased timeout
+            with self._validators_lock:
+                conditional_headers = dict(self._validators.get(url, {}))
+            if conditional_headers:
+                response = self.session.get(url, timeout=20, stream=True, headers=conditional_headers)
+            else:
+                response = self.session.get(url, timeout=20, stream=True)
+
+            if response.status_code == 304:
+                response.close()
+                self.logger.info(f"JSON Feed 源 '{source_config.name}' 未修改 (304)，跳过解析。")
+                if progress_callback:
+                    progress_callback(0, 0)
+                return []
             response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
 
             # Check for cancellation after request but before processing
             if cancel_checker and cancel_checker():
                 self.logger.info(f"收集操作被取消 (获取后): {source_config.name}")
+                response.close()
                 return []
 
-            # 尝试解析 JSON
-            try:
-                feed_data = response.json()
-            except json.JSONDecodeError as e:
-                self.logger.error(f"解析 JSON 失败 for {source_config.name}: {e}. Content snippet: {response.text[:500]}...")
-                return []
+            payload, truncated = self._read_body(response, max_bytes)
+            if truncated:
+                self.logger.warning(f"JSON Feed 源 '{source_config.name}' 超过字节上限 {max_bytes}，仅解析已下载部分中的完整条目。")
 
-            # 验证基本结构 (至少需要 version 和 items)
-            if not isinstance(feed_data, dict) or 'version' not in feed_data or 'items' not in feed_data:
-                self.logger.warning(f"无效的 JSON Feed 结构 for {source_config.name}. 缺少 'version' 或 'items' 键。")
+            if truncated:
+                feed_data, item_iter = self._decode_incremental(payload, source_config)
+            else:
+                feed_data, item_iter = self._decode_document(payload, source_config)
+            if item_iter is None:
                 return []
 
-            if not isinstance(feed_data.get('items'), list):
-                 self.logger.warning(f"JSON Feed 'items' 不是列表 for {source_config.name}.")
-                 return []
-
             # 解析条目
-            for item_data in feed_data.get('items', []):
+            for item_data in item_iter:
                 # Check for cancellation inside loop
                 if cancel_checker and cancel_checker():
                     self.logger.info(f"收集操作在解析 JSON item 时被取消: {source_config.name}")
@@ -146,7 +296,13 @@ class JSONFeedCollector:
                 news_item = self._parse_json_item(item_data, source_config, feed_data)
                 if news_item:
                     items.append(news_item)
+                    if len(items) >= max_items:
+                        self.logger.info(f"JSON Feed 源 '{source_config.name}' 达到条目上限 {max_items}，停止解析。")
+                        break
 
+            self._remember_validators(url, response)
+            if progress_callback:
+                progress_callback(len(items), len(items))
             self.logger.info(f"从 {source_config.name} 获取并解析了 {len(items)} 条新闻")
 
         except requests.exceptions.Timeout:
@@ -158,6 +314,43 @@ class JSONFeedCollector:
 
         return items
 
+    def _decode_document(self, payload: bytes, source_config: NewsSource) -> Tuple[Dict, Optional[Iterator[Any]]]:
+        """
+        (内部辅助方法) 用 orjson 一次性解码完整的 Feed 文档并校验结构。
+
+        Returns:
+            (顶层 Feed 字典, items 迭代器)；结构无效时迭代器为 None。
+        """
+        try:
+            feed_data = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            snippet = payload[:500].decode('utf-8', 'replace')
+            self.logger.error(f"解析 JSON 失败 for {source_config.name}: {e}. Content snippet: {snippet}...")
+            return {}, None
+
+        # 验证基本结构 (至少需要 version 和 items)
+        if not isinstance(feed_data, dict) or 'version' not in feed_data or 'items' not in feed_data:
+            self.logger.warning(f"无效的 JSON Feed 结构 for {source_config.name}. 缺少 'version' 或 'items' 键。")
+            return {}, None
+
+        if not isinstance(feed_data.get('items'), list):
+             self.logger.warning(f"JSON Feed 'items' 不是列表 for {source_config.name}.")
+             return {}, None
+
+        return feed_data, iter(feed_data['items'])
+
+    def _decode_incremental(self, payload: bytes, source_config: NewsSource) -> Tuple[Dict, Optional[Iterator[Any]]]:
+        """
+        (内部辅助方法) 为被截断的 Feed 返回逐条解析 items 的迭代器。
+
+        截断的文档不是合法 JSON，无法用 orjson 解码，也无法确认 `version` 键是否存在，
+        因此只产出截断点之前完整的条目。
+        """
+        if not payload.lstrip().startswith(b'{'):
+            self.logger.warning(f"无效的 JSON Feed 结构 for {source_config.name}. 顶层不是对象。")
+            return {}, None
+        return {'version': None}, iter_json_feed_items(payload)
+
     def _parse_json_item(self, item_data: Dict, source_config: NewsSource, feed_data: Dict) -> Optional[Dict]:
         """
         (内部辅助方法) 将单个 JSON Feed item 字典解析为标准化的新闻字典格式。
@@ -243,9 +436,11 @@ class JSONFeedCollector:
                 'content': content,
                 'summary': summary,
                 'publish_time': parsed_date_str or pub_date_str, # 优先使用解析后的，否则用原始的
+                'pub_date': parsed_date_str or pub_date_str, # AppService 对字符串日期读取 'pub_date'
                 'source_name': source_config.name,
+                'category': source_config.category or '未分类',
                 'collected_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'raw_data': json.dumps(item_data) # Store raw JSON item
+                'raw_data': orjson.dumps(item_data).decode() # Store raw JSON item
             }
             return news_item
 
@@ -0,0 +1,164 @@
+"""
+解析进程池
+
+feedparser、dateutil 等解析工作是纯 Python 的 CPU 密集计算。刷新时如果在 GUI 进程的
+线程里执行，会与 Qt 主线程争抢 GIL，导致界面卡顿。
+
+ParserPool 把这部分工作交给独立子进程 (ProcessPoolExecutor) 完成：
+I/O 线程只负责下载原始字节，子进程返回紧凑的条目元组，再由调用方还原为标准新闻字典。
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import feedparser
+
+# 子进程返回的紧凑条目: (title, link, summary, content, publish_ts, image_url)
+# publish_ts 为 UTC epoch 秒 (float) 或 None，避免跨进程传递 datetime/feedparser 对象。
+ParsedItem = Tuple[str, str, Optional[str], Optional[str], Optional[float], Optional[str]]
+
+
+def parse_rss_payload(payload: bytes, source_name: str) -> Tuple[List[ParsedItem], float, int]:
+    """
+    解析 RSS/Atom 原始字节 (在子进程中执行)。
+
+    日期与摘要的提取规则复用 RSSCollector，保证与线程内解析结果一致。
+
+    Args:
+        payload: HTTP 响应的原始字节。
+        source_name: 新闻源名称，仅用于日志。
+
+    Returns:
+        (条目元组列表, 本次解析消耗的 CPU 秒数, 执行解析的进程 PID)
+    """
+    from src.collectors.rss_collector import RSSCollector, resolve_entry_publish_time
+
+    cpu_started = time.process_time()
+    feed_data = feedparser.parse(payload)
+
+    items: List[ParsedItem] = []
+    seen_links = set()
+    for entry in feed_data.get('entries') or []:
+        link = entry.get('link')
+        if not link or link in seen_links:
+            continue
+        seen_links.add(link)
+
+        title = entry.get('title', '无标题')
+        publish_dt = resolve_entry_publish_time(entry, source_name, title)
+        summary = RSSCollector._extract_summary(entry)
+        content = entry.get('content', [{}])[0].get('value') if entry.get('content') else summary
+        items.append((
+            title,
+            link,
+            summary,
+            content,
+            publish_dt.timestamp() if publish_dt else None,
+            RSSCollector._extract_image(entry),
+        ))
+
+    return items, time.process_time() - cpu_started, os.getpid()
+
+
+class ParserPool:
+    """
+    管理解析子进程的进程池。
+
+    子进程在第一次提交任务时才会启动 (spawn 方式，避免在多线程的 Qt 进程中 fork)。
+    进程池不可用时自动回退到当前进程内解析，保证刷新不会因此失败。
+
+    Attributes:
+        enabled: 是否启用进程池解析。为 False 时 NewsUpdateService 不会把它交给采集器。
+        max_workers: 子进程数量上限。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, enabled: bool = True):
+        self.logger = logging.getLogger('news_analyzer.collectors.parser_pool')
+        self.enabled = bool(enabled)
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._cpu_seconds_by_pid: Dict[int, float] = {}
+        self._parsed_payloads = 0
+        self._fallback_count = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """(内部方法) 懒加载进程池。"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                self.logger.info(f"解析进程池已启动，最大子进程数: {self.max_workers}")
+            return self._executor
+
+    def _discard_executor(self):
+        """(内部方法) 丢弃已损坏的进程池，下次提交时重新创建。"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def parse_rss(self, payload: bytes, source_name: str, category: str) -> List[Dict[str, Any]]:
+        """
+        在子进程中解析 RSS/Atom 原始字节，并还原为标准新闻字典列表。
+
+        该方法会阻塞调用线程直到解析完成，应在 I/O 工作线程中调用。
+        """
+        try:
+            future = self._get_executor().submit(parse_rss_payload, payload, source_name)
+            parsed_items, cpu_seconds, pid = future.result()
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            self.logger.error(f"解析进程池不可用 ({e})，'{source_name}' 回退到当前进程内解析。")
+            self._discard_executor()
+            with self._stats_lock:
+                self._fallback_count += 1
+            parsed_items, cpu_seconds, pid = parse_rss_payload(payload, source_name)
+
+        with self._stats_lock:
+            self._parsed_payloads += 1
+            self._cpu_seconds_by_pid[pid] = self._cpu_seconds_by_pid.get(pid, 0.0) + cpu_seconds
+
+        return [self.item_from_tuple(parsed, source_name, category) for parsed in parsed_items]
+
+    @staticmethod
+    def item_from_tuple(parsed: ParsedItem, source_name: str, category: str) -> Dict[str, Any]:
+        """把子进程返回的紧凑元组还原为采集器约定的新闻字典格式。"""
+        title, link, summary, content, publish_ts, image_url = parsed
+        return {
+            'source_name': source_name,
+            'category': category,
+            'title': title,
+            'link': link,
+            'summary': summary,
+            'content': content,
+            'publish_time': datetime.fromtimestamp(publish_ts, tz=timezone.utc) if publish_ts is not None else None,
+            'image_url': image_url,
+            'raw_data': {},
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """返回解析统计: 已解析的负载数、回退次数、各子进程消耗的 CPU 秒数。"""
+        with self._stats_lock:
+            return {
+                'parsed_payloads': self._parsed_payloads,
+                'fallback_count': self._fallback_count,
+                'cpu_seconds_by_worker': dict(self._cpu_seconds_by_pid),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """关闭进程池，释放子进程。"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+                self.logger.info("解析进程池已关闭。")
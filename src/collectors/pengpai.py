@@ -16,32 +16,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from .base_collector import BaseCollector
 from ..models import NewsSource
 from ..utils.logger import get_logger
+from .pengpai_config import DEFAULT_PENGPAI_CONFIG  # 默认配置单独成模块，读取它不必导入 Selenium
 
 logger = get_logger(__name__)
 
-DEFAULT_PENGPAI_CONFIG = {
-    "base_url": "https://m.thepaper.cn/",
-    "content_selector": "#__next > div > main > div > div.index_wrapper__mHU4q > div.index_summary__ONV_r,#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > div.index_cententWrapBox__bh0OY > div.index_cententWrap__Jv8jK",
-    "date_selector": "#__next > div > main > div > div.index_wrapper__mHU4q > div.index_headerContent__mOJJb > span.index_nowrap__rmdw_,#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > div.index_headerContent__sASF4 > div > div.ant-space.ant-space-horizontal.ant-space-align-center > div:nth-child(1) > span",
-    "author_selector": "#__next > div > main > div > div.index_wrapper__mHU4q > div.index_headerContent__mOJJb > span:nth-child(3),#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > div.index_headerContent__sASF4 > div > div.ant-space.ant-space-horizontal.ant-space-align-center > div:nth-child(2) > div",
-    "wait_timeout": 15,
-    "webdriver_profile_base_path": "data/webdriver_profiles",
-    "headless": True,
-    "article_limit": None,
-    "max_retries": 2,
-    "retry_delay": 3,
-    "accept_insecure_certs": True,
-    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36 Edg/96.0.1054.62",
-    "proxy_server": None,
-    "disable_gpu": True,
-    "no_sandbox": True,
-    "disable_dev_shm_usage": True,
-    "page_load_strategy": "normal",
-    "image_selector": "#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > div.index_cententWrapBox__bh0OY > div.index_cententWrap__Jv8jK > img,#__next > div > main > div > div.index_wrapper__mHU4q > div.index_videoWrap__Rbzic > div > img",
-    "video_selector": "#__next > div > main > div > div.index_wrapper__mHU4q > div.index_videoWrap__Rbzic > div > video,#__next > div > main > div > div.index_wrapper__mHU4q > div.index_videoWrap__Rbzic > div > img",
-    "title_selector": "#__next > div > main > div > div.index_wrapper__mHU4q > h1,#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > h1",
-    "image_desc_selector": "#__next > div > main > div > div.index_wrapbox__VFyXe > div.index_wrapper__L_zqV > div.index_cententWrapBox__bh0OY > div.index_cententWrap__Jv8jK > p.image_desc"
-}
 
 class PengpaiCollector(BaseCollector):
     """
@@ -39,6 +39,110 @@ DEFAULT_TZINFOS = {
 }
 # +++ End tzinfos mapping +++
 
+logger = logging.getLogger('news_analyzer.collectors.rss')
+
+def resolve_entry_publish_time(entry, source_name: str, title: str) -> Optional[datetime]:
+    """
+    解析 feedparser 条目的发布时间，统一返回 UTC 时区的 datetime（无法解析时返回 None）。
+
+    独立为模块级函数，以便在解析进程池 (parser_pool) 的子进程中复用同一套规则。
+    """
+    raw_pub_date = None
+    publish_time_dt = None
+
+    # 1. 尝试 feedparser 预解析的日期字段 (time.struct_time)
+    parsed_date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
+    for field_name in parsed_date_fields:
+        if hasattr(entry, field_name) and entry[field_name]:
+            try:
+                # time.struct_time to datetime
+                # feedparser times are typically in UTC if timezone info is present in feed,
+                # or local time if not. mktime assumes local time if no tz info.
+                # For consistency, we should convert to aware datetime, preferably UTC.
+                # datetime.fromtimestamp(time.mktime(entry[field_name])) creates a naive local time.
+                # We need to make it timezone-aware, or ideally get it as UTC from feedparser directly if possible.
+                # feedparser usually returns UTC if the feed specifies it.
+                # Let's assume feedparser gives a struct_time that, when converted,
+                # should be treated as if it's UTC, or convert explicitly if it's naive.
+                # A safer approach is to use the raw string with dateutil_parser if available,
+                # as dateutil_parser handles timezones better.
+                # However, if _parsed is available, it means feedparser succeeded.
+
+                # Re-check raw string corresponding to the _parsed field for better timezone handling by dateutil
+                raw_field_name = field_name.replace('_parsed', '')
+                raw_pub_date_candidate = entry.get(raw_field_name)
+                if raw_pub_date_candidate:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 优先使用原始字符串 '{raw_pub_date_candidate}' (来自 '{raw_field_name}') 进行解析，因为找到了 '{field_name}'.")
+                    raw_pub_date = raw_pub_date_candidate
+                    break # Found a raw string associated with a parsed field, use this
+                else:
+                    # Fallback to using the struct_time if raw string isn't available
+                    dt_naive = datetime.fromtimestamp(time.mktime(entry[field_name]))
+                    # Heuristic: If original feed had timezone, feedparser often converts to UTC for _parsed.
+                    # If not, it might be naive. For safety, assume UTC if using _parsed directly.
+                    publish_time_dt = dt_naive.replace(tzinfo=timezone.utc)
+                    # MODIFIED: Changed from INFO to DEBUG as this is a fallback/direct conversion from struct_time
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 从 '{field_name}' (time_struct) 解析得到日期: {publish_time_dt}")
+                    raw_pub_date = publish_time_dt.isoformat() # Store ISO format if directly from struct_time
+                    break
+            except Exception as e_parsed_date:
+                logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 从 '{field_name}' 解析日期失败: {e_parsed_date}")
+
+    # 2. 如果上面没有通过 _parsed 字段的对应原始字符串找到 raw_pub_date, 再尝试标准原始字符串字段
+    if not raw_pub_date:
+        standard_raw_fields = ["published", "updated", "created"]
+        for field_name in standard_raw_fields:
+            candidate = entry.get(field_name)
+            if candidate:
+                raw_pub_date = candidate
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 使用标准字段 '{field_name}' 的原始日期字符串: '{raw_pub_date}'")
+                break
+
+    # 3. 如果仍未找到，尝试其他常见非标准原始字符串字段
+    if not raw_pub_date:
+        additional_raw_fields = ["pubDate", "dc:date", "date", "dcterms:created", "dcterms:modified"] # dc:date might be entry.get('dc_date') by feedparser
+        for field_name in additional_raw_fields:
+            candidate = entry.get(field_name)
+            # For "dc:date", feedparser might store it as "dc_date" or access via entry.get('terms', {}).get('created')
+            # This simplified check might not catch all namespaced tags perfectly without knowing feedparser's exact aliasing.
+            if not candidate and ":" in field_name: # Try replacing colon for common feedparser flattening
+                 candidate = entry.get(field_name.replace(":", "_"))
+
+            if candidate:
+                raw_pub_date = candidate
+                logger.info(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 使用非标准字段 '{field_name}' 的原始日期字符串: '{raw_pub_date}'")
+                break
+
+    if not raw_pub_date:
+        logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 未找到任何可识别的日期字段. Entry keys: {list(entry.keys())}")
+        logger.debug(f"Full entry data for missing date: {entry}")
+    else:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 最终选用的原始日期字符串进行解析: '{raw_pub_date}'")
+
+    # 4. 解析最终选定的 raw_pub_date (如果之前没有从 _parsed 直接获得 publish_time_dt)
+    if raw_pub_date and not publish_time_dt: # publish_time_dt is None if we came from raw strings
+        try:
+            publish_time_dt = dateutil_parser.parse(raw_pub_date, tzinfos=DEFAULT_TZINFOS)
+            # Ensure it's offset-aware, prefer UTC
+            if publish_time_dt.tzinfo is None or publish_time_dt.tzinfo.utcoffset(publish_time_dt) is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析后日期 {publish_time_dt} 是 naive, 附加 UTC 时区。")
+                publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc)
+            else:
+                publish_time_dt = publish_time_dt.astimezone(timezone.utc) # Convert to UTC
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析后日期 (UTC): {publish_time_dt}")
+        except Exception as e_date:
+            logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析日期字符串 '{raw_pub_date}' 失败: {e_date}")
+            publish_time_dt = None # Ensure it's None if parsing fails
+
+    return publish_time_dt
+
+
 class RSSCollector(BaseCollector):
     """
     RSS新闻收集器类 (Refactored - Stateless).
@@ -51,6 +155,9 @@ class RSSCollector(BaseCollector):
         """初始化RSS收集器"""
         super().__init__(config if config else {})
         self.logger = logging.getLogger('news_analyzer.collectors.rss')
+        # 可选的解析进程池 (ParserPool)。设置后 collect 只在当前线程下载原始字节，
+        # feedparser/dateutil 的解析工作交给子进程完成，避免占用 GUI 进程的 GIL。
+        self.parser_pool = self.config.get('parser_pool')
         # SSL context 可以在需要时按需创建，或者如果 feedparser 内部处理良好则可能不需要
         # self.ssl_context = ssl.create_default_context()
         # self.ssl_context.check_hostname = False
@@ -128,7 +235,7 @@ class RSSCollector(BaseCollector):
         Returns:
             一个包含新闻条目字典的列表。
         """
-        self.logger.info("RSSCOLLECTOR_COLLECT_METHOD_ENTERED") # MODIFIED: error -> info
+        self.logger.debug("RSSCOLLECTOR_COLLECT_METHOD_ENTERED") # 跟踪标记，仅在 DEBUG 级别输出
         self.logger.info(f"开始收集 RSS 源: {source.name} ({source.url})")
         news_items = []
         source_url = source.url
@@ -138,6 +245,9 @@ class RSSCollector(BaseCollector):
             self.logger.warning(f"RSS 源 '{source_name}' 没有配置 URL，跳过收集。")
             return []
 
+        if self.parser_pool is not None:
+            return self._collect_via_parser_pool(source, progress_callback, cancel_checker)
+
         try:
             self.logger.debug(f"RSSCOLLECTOR_BEFORE_FEEDPARSER_PARSE: URL={source_url}") # MODIFIED: error -> debug
             feed_data = feedparser.parse(source_url, agent=self.USER_AGENT)
@@ -147,13 +257,13 @@ class RSSCollector(BaseCollector):
             feed_bozo = feed_data.get('bozo', 1) # Default to bozo=1 (True) if not present
             num_entries = len(feed_data.entries) if hasattr(feed_data, 'entries') and feed_data.entries is not None else 0
 
-            self.logger.info(f"RSSCOLLECTOR_AFTER_FEEDPARSER_PARSE: Status={feed_status if feed_status is not None else 'N/A'}, Bozo={feed_bozo}, Entries={num_entries}") # MODIFIED: error -> info
+            self.logger.debug(f"RSSCOLLECTOR_AFTER_FEEDPARSER_PARSE: Status={feed_status if feed_status is not None else 'N/A'}, Bozo={feed_bozo}, Entries={num_entries}") # 跟踪标记，仅在 DEBUG 级别输出
 
             # Check if feed_data itself is None or empty, or if crucial attributes are missing after network error
             if not feed_data or not hasattr(feed_data, 'entries'):
                 self.logger.error(f"RSS 源 '{source_name}' ({source_url}) feed_data 为空或缺少 'entries' 属性，可能由于网络请求失败。跳过处理。")
                 if progress_callback: progress_callback(0,0)
-                self.logger.info(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_EMPTY_FEED_DATA") # MODIFIED: error -> info
+                self.logger.debug(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_EMPTY_FEED_DATA") # 跟踪标记，仅在 DEBUG 级别输出
                 return []
 
             self.logger.info(f"RSS 源 '{source_name}' ({source_url}) 原始 feed 状态: status={feed_status if feed_status is not None else '未知'}, bozo={feed_bozo}, len(entries)={num_entries}")
@@ -173,7 +283,7 @@ class RSSCollector(BaseCollector):
                 if not num_entries: # If no status AND no entries, definitely bail.
                     self.logger.error(f"RSS 源 '{source_name}' ({source_url}) 无状态码且无条目，终止处理。")
                     if progress_callback: progress_callback(0,0)
-                    self.logger.info(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_NO_STATUS_AND_NO_ENTRIES") # MODIFIED: error -> info
+                    self.logger.debug(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_NO_STATUS_AND_NO_ENTRIES") # 跟踪标记，仅在 DEBUG 级别输出
                     return []
             elif feed_status not in [200, 301, 302, 304, 307, 308]: # 304 Not Modified 也是可接受的
                  self.logger.warning(f"请求 RSS 源 '{source_name}' ({source_url}) 时收到非成功状态码: {feed_status}")
@@ -181,7 +291,7 @@ class RSSCollector(BaseCollector):
                  if not num_entries and (400 <= feed_status < 600):
                      self.logger.error(f"RSS 源 '{source_name}' ({source_url}) 返回错误状态码 {feed_status} 且无条目，终止处理。")
                      if progress_callback: progress_callback(0,0)
-                     self.logger.info(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_ERROR_STATUS_AND_NO_ENTRIES") # MODIFIED: error -> info
+                     self.logger.debug(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_DUE_TO_ERROR_STATUS_AND_NO_ENTRIES") # 跟踪标记，仅在 DEBUG 级别输出
                      return []
             
             if num_entries == 0: # Use the safe num_entries
@@ -210,99 +320,13 @@ class RSSCollector(BaseCollector):
                     continue
                 
                 if link in processed_links: # 避免在同一次收集中处理完全相同的链接
-                    self.logger.debug(f"RSS源 '{source_name}' 的条目 '{title[:50]}...' (链接: {link}) 是重复链接，在本次采集中已跳过。")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"RSS源 '{source_name}' 的条目 '{title[:50]}...' (链接: {link}) 是重复链接，在本次采集中已跳过。")
                     if progress_callback:
                         progress_callback(i + 1, total_entries)
                     continue
 
-                # 日期处理
-                raw_pub_date = None
-                publish_time_dt = None
-
-                # 1. 尝试 feedparser 预解析的日期字段 (time.struct_time)
-                parsed_date_fields = ['published_parsed', 'updated_parsed', 'created_parsed']
-                for field_name in parsed_date_fields:
-                    if hasattr(entry, field_name) and entry[field_name]:
-                        try:
-                            # time.struct_time to datetime
-                            # feedparser times are typically in UTC if timezone info is present in feed,
-                            # or local time if not. mktime assumes local time if no tz info.
-                            # For consistency, we should convert to aware datetime, preferably UTC.
-                            # datetime.fromtimestamp(time.mktime(entry[field_name])) creates a naive local time.
-                            # We need to make it timezone-aware, or ideally get it as UTC from feedparser directly if possible.
-                            # feedparser usually returns UTC if the feed specifies it.
-                            # Let's assume feedparser gives a struct_time that, when converted,
-                            # should be treated as if it's UTC, or convert explicitly if it's naive.
-                            # A safer approach is to use the raw string with dateutil_parser if available,
-                            # as dateutil_parser handles timezones better.
-                            # However, if _parsed is available, it means feedparser succeeded.
-
-                            # Re-check raw string corresponding to the _parsed field for better timezone handling by dateutil
-                            raw_field_name = field_name.replace('_parsed', '')
-                            raw_pub_date_candidate = entry.get(raw_field_name)
-                            if raw_pub_date_candidate:
-                                self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 优先使用原始字符串 '{raw_pub_date_candidate}' (来自 '{raw_field_name}') 进行解析，因为找到了 '{field_name}'.")
-                                raw_pub_date = raw_pub_date_candidate
-                                break # Found a raw string associated with a parsed field, use this
-                            else:
-                                # Fallback to using the struct_time if raw string isn't available
-                                dt_naive = datetime.fromtimestamp(time.mktime(entry[field_name]))
-                                # Heuristic: If original feed had timezone, feedparser often converts to UTC for _parsed.
-                                # If not, it might be naive. For safety, assume UTC if using _parsed directly.
-                                publish_time_dt = dt_naive.replace(tzinfo=timezone.utc)
-                                # MODIFIED: Changed from INFO to DEBUG as this is a fallback/direct conversion from struct_time
-                                self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 从 '{field_name}' (time_struct) 解析得到日期: {publish_time_dt}")
-                                raw_pub_date = publish_time_dt.isoformat() # Store ISO format if directly from struct_time
-                                break
-                        except Exception as e_parsed_date:
-                            self.logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 从 '{field_name}' 解析日期失败: {e_parsed_date}")
-                
-                # 2. 如果上面没有通过 _parsed 字段的对应原始字符串找到 raw_pub_date, 再尝试标准原始字符串字段
-                if not raw_pub_date:
-                    standard_raw_fields = ["published", "updated", "created"]
-                    for field_name in standard_raw_fields:
-                        candidate = entry.get(field_name)
-                        if candidate:
-                            raw_pub_date = candidate
-                            self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 使用标准字段 '{field_name}' 的原始日期字符串: '{raw_pub_date}'")
-                            break
-                
-                # 3. 如果仍未找到，尝试其他常见非标准原始字符串字段
-                if not raw_pub_date:
-                    additional_raw_fields = ["pubDate", "dc:date", "date", "dcterms:created", "dcterms:modified"] # dc:date might be entry.get('dc_date') by feedparser
-                    for field_name in additional_raw_fields:
-                        candidate = entry.get(field_name)
-                        # For "dc:date", feedparser might store it as "dc_date" or access via entry.get('terms', {}).get('created')
-                        # This simplified check might not catch all namespaced tags perfectly without knowing feedparser's exact aliasing.
-                        if not candidate and ":" in field_name: # Try replacing colon for common feedparser flattening
-                             candidate = entry.get(field_name.replace(":", "_"))
-
-                        if candidate:
-                            raw_pub_date = candidate
-                            self.logger.info(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 使用非标准字段 '{field_name}' 的原始日期字符串: '{raw_pub_date}'")
-                            break
-
-                if not raw_pub_date:
-                    self.logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 未找到任何可识别的日期字段. Entry keys: {list(entry.keys())}")
-                    self.logger.debug(f"Full entry data for missing date: {entry}")
-                else:
-                    self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 最终选用的原始日期字符串进行解析: '{raw_pub_date}'")
-                
-                # 4. 解析最终选定的 raw_pub_date (如果之前没有从 _parsed 直接获得 publish_time_dt)
-                if raw_pub_date and not publish_time_dt: # publish_time_dt is None if we came from raw strings
-                    try:
-                        publish_time_dt = dateutil_parser.parse(raw_pub_date, tzinfos=DEFAULT_TZINFOS)
-                        # Ensure it's offset-aware, prefer UTC
-                        if publish_time_dt.tzinfo is None or publish_time_dt.tzinfo.utcoffset(publish_time_dt) is None:
-                            self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析后日期 {publish_time_dt} 是 naive, 附加 UTC 时区。")
-                            publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc)
-                        else:
-                            publish_time_dt = publish_time_dt.astimezone(timezone.utc) # Convert to UTC
-                        self.logger.debug(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析后日期 (UTC): {publish_time_dt}")
-                    except Exception as e_date:
-                        self.logger.warning(f"RSS源 '{source_name}', 条目 '{title[:30]}...': 解析日期字符串 '{raw_pub_date}' 失败: {e_date}")
-                        publish_time_dt = None # Ensure it's None if parsing fails
-                
+                publish_time_dt = resolve_entry_publish_time(entry, source_name, title)
                 pub_date_to_store = publish_time_dt # 直接存储 datetime 对象或 None
 
                 summary = self._extract_summary(entry) # 保留原有的 summary 提取
@@ -358,10 +382,62 @@ class RSSCollector(BaseCollector):
             return [] 
 
         self.logger.info(f"完成收集 RSS 源: {source_name}, 获取了 {len(news_items)} 条有效新闻。")
-        self.logger.info(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_{'NORMALLY' if not news_items and not source.url else ('WITH_ITEMS' if news_items else 'EARLY_EXIT')}" + (f" with {len(news_items)} items" if news_items else "")) # MODIFIED: error -> info
+        self.logger.debug(f"RSSCOLLECTOR_COLLECT_METHOD_EXITING_{'NORMALLY' if not news_items and not source.url else ('WITH_ITEMS' if news_items else 'EARLY_EXIT')}" + (f" with {len(news_items)} items" if news_items else "")) # 跟踪标记，仅在 DEBUG 级别输出
+        return news_items
+
+    def _collect_via_parser_pool(self, source: NewsSource,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                                 cancel_checker: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        (内部方法) 进程池模式下的采集: 当前 I/O 线程只下载原始字节，解析在 ParserPool 子进程中完成。
+
+        返回的字典与常规模式字段一致，但不包含 feedparser 的原始结构 (raw_data 为空字典)。
+        """
+        try:
+            payload = self.fetch_payload(source, cancel_checker)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"获取 RSS 源 '{source.name}' ({source.url}) 原始数据失败: {e}")
+            if progress_callback:
+                progress_callback(0, 0)
+            return []
+        if payload is None:
+            return []
+
+        try:
+            news_items = self.parse_payload(payload, source)
+        except Exception as e:
+            self.logger.error(f"解析进程池处理 RSS 源 '{source.name}' 失败: {e}", exc_info=True)
+            news_items = []
+
+        if progress_callback:
+            progress_callback(len(news_items), len(news_items))
+        self.logger.info(f"完成收集 RSS 源 (进程池解析): {source.name}, 获取了 {len(news_items)} 条有效新闻。")
         return news_items
 
-    def _extract_summary(self, entry) -> Optional[str]:
+    def fetch_payload(self, source: NewsSource, cancel_checker: Optional[Callable[[], bool]] = None) -> Optional[bytes]:
+        """
+        只下载 RSS/Atom 的原始字节，不做解析 (刷新流水线的 fetch 阶段调用，解析交给 parse_payload)。
+
+        Returns:
+            响应体字节；下载完成后发现已取消时返回 None。
+
+        Raises:
+            requests.exceptions.RequestException: 请求失败或返回错误状态码。
+        """
+        response = requests.get(source.url, headers={'User-Agent': self.USER_AGENT}, timeout=20)
+        response.raise_for_status()
+        if cancel_checker and cancel_checker():
+            self.logger.info(f"RSS 收集 '{source.name}' 在下载完成后被取消。")
+            return None
+        return response.content
+
+    def parse_payload(self, payload: bytes, source: NewsSource) -> List[Dict[str, Any]]:
+        """在 ParserPool 子进程中解析 fetch_payload 下载的原始字节，返回标准新闻字典列表。"""
+        category = source.category if getattr(source, 'category', None) else '未分类'
+        return self.parser_pool.parse_rss(payload, source.name, category)
+
+    @staticmethod
+    def _extract_summary(entry) -> Optional[str]:
         # Prioritize content if available, otherwise use summary
         # Often 'content' provides more detail than 'summary' in RSS
         if entry.get('content') and isinstance(entry.content, list) and len(entry.content) > 0:
@@ -384,7 +460,8 @@ class RSSCollector(BaseCollector):
             
         return None
 
-    def _extract_image(self, entry) -> Optional[str]:
+    @staticmethod
+    def _extract_image(entry) -> Optional[str]:
         # Check for media:thumbnail
         if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail and isinstance(entry.media_thumbnail, list):
             if entry.media_thumbnail[0].get('url'):
@@ -1,24 +1,45 @@
 """依赖注入容器定义"""
 
+import importlib
+from typing import Callable
+
 from dependency_injector import containers, providers
 
-# --- 导入配置和服务类 ---
-# from src.config.settings_manager import SettingsManager
- # Removed import
-from src.config.llm_config_manager import LLMConfigManager
-from src.storage.news_storage import NewsStorage
-from src.llm.prompt_manager import PromptManager
-from src.utils.api_client import ApiClient
-from src.llm.llm_service import LLMService
-from src.core.source_manager import SourceManager
-from src.core.app_service import AppService
-from src.core.news_update_service import NewsUpdateService # Import NewsUpdateService
+from src.utils import startup_profiler
 from src.utils.logger import get_logger # Import get_logger instead
-from src.services.scheduler_service import SchedulerService # Correct path
-from src.core.analysis_service import AnalysisService # Import new service
-from src.core.event_analyzer import EventAnalyzer # Import EventAnalyzer
-from src.core.history_service import HistoryService # Import HistoryService
-from src.ui.viewmodels.llm_settings_viewmodel import LLMSettingsViewModel # CORRECTED IMPORT
+
+# --- 服务类按需导入 ---
+# 导入 src.containers 时不再加载各个服务模块 (以及它们依赖的 requests、LLM 提供方、PySide6 等)：
+# 每个 provider 的工厂在第一次被调用 (即服务第一次被创建) 时才导入对应的类。
+# 启用 --profile-startup 时，服务的构造耗时会记录到启动分析报告中。
+
+
+def deferred(module_name: str, class_name: str) -> Callable:
+    """返回一个工厂：第一次调用时导入 module_name.class_name，然后以相同参数实例化它。"""
+    def factory(*args, **kwargs):
+        cls = getattr(importlib.import_module(module_name), class_name)
+        with startup_profiler.span(class_name, kind='service'):
+            return cls(*args, **kwargs)
+    factory.__name__ = factory.__qualname__ = class_name
+    factory.__doc__ = f"按需导入并创建 {module_name}.{class_name}"
+    return factory
+
+
+# from src.config.settings_manager import SettingsManager # Removed import
+LLMConfigManager = deferred('src.config.llm_config_manager', 'LLMConfigManager')
+NewsStorage = deferred('src.storage.news_storage', 'NewsStorage')
+PromptManager = deferred('src.llm.prompt_manager', 'PromptManager')
+ApiClient = deferred('src.utils.api_client', 'ApiClient')
+LLMService = deferred('src.llm.llm_service', 'LLMService')
+SourceManager = deferred('src.core.source_manager', 'SourceManager')
+AppService = deferred('src.core.app_service', 'AppService')
+NewsUpdateService = deferred('src.core.news_update_service', 'NewsUpdateService')
+ParserPool = deferred('src.collectors.parser_pool', 'ParserPool')
+AnalysisService = deferred('src.core.analysis_service', 'AnalysisService')
+EventAnalyzer = deferred('src.core.event_analyzer', 'EventAnalyzer')
+HistoryService = deferred('src.core.history_service', 'HistoryService')
+LLMSettingsViewModel = deferred('src.ui.viewmodels.llm_settings_viewmodel', 'LLMSettingsViewModel')
+# SchedulerService 由 main.py 直接创建 (需要 QSettings)，不经过容器
 # from src.storage.analysis_storage_service import AnalysisStorageService # Import AnalysisStorageService # REMOVED
 # --- ADD COLLECTOR FACTORY IMPORT --- 
 # from src.collectors import CollectorFactory # --- 移除此导入 ---
@@ -71,11 +92,19 @@ class Container(containers.DeclarativeContainer):
     # --- ADD COLLECTOR FACTORY PROVIDER --- 
     # collector_factory = providers.Singleton(CollectorFactory) # --- 移除此提供者 ---
 
+    # 解析进程池: 由 config.refresh.process_parsing 开关控制，子进程在首次使用时才启动
+    parser_pool = providers.Singleton(
+        ParserPool,
+        max_workers=config.refresh.parser_workers,
+        enabled=config.refresh.process_parsing
+    )
+
     # --- 新闻更新服务: Singleton --- 
     news_update_service = providers.Singleton(
         NewsUpdateService,
         source_manager=source_manager,
-        storage=news_storage
+        storage=news_storage,
+        parser_pool=parser_pool
         # --- INJECT COLLECTOR FACTORY --- 
         # collector_factory=collector_factory # --- 移除此行 ---
     )
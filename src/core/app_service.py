@@ -8,29 +8,32 @@
 
 import logging
 import inspect
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta, timezone # MODIFIED: Added timezone
 from dateutil import parser as dateutil_parser # Keep dateutil import for now
-from PySide6.QtCore import QObject, Signal as pyqtSignal, QSettings, Qt, Slot, Property # 统一使用 PySide6
+from PySide6.QtCore import QObject, Signal as pyqtSignal, QSettings, Qt, Slot, Property, QThreadPool # 统一使用 PySide6
 import os
 import shutil
 from dependency_injector import providers # <--- 正确的导入
 import uuid
+import time
 
 # 假设的导入路径，后续需要根据实际情况调整
-from src.models import NewsSource, NewsArticle # 恢复原始导入路径
+from src.models import NewsSource, NewsArticle, NewsListRow # 恢复原始导入路径
 from src.storage.news_storage import NewsStorage
 # from src.collectors.rss_collector import RSSCollector # Moved to NewsUpdateService
 # from src.collectors.pengpai_collector import PengpaiCollector # Moved to NewsUpdateService
 from src.llm.llm_service import LLMService
 from src.core.source_manager import SourceManager # 导入 SourceManager (Use src. prefix for consistency)
 from src.config.llm_config_manager import LLMConfigManager # 修正文件名和类名
-from src.collectors.categories import get_category_name # Keep for category logic
 from src.core.news_update_service import NewsUpdateService # Import new service
 from src.core.analysis_service import AnalysisService # Import AnalysisService
 from src.core.history_service import HistoryService # Import HistoryService
+from src.core.cancellation_flag import CancellationFlag
+from src.core.initial_news_loader import InitialNewsPageLoader
+from src.core.article_detail_cache import ArticleDetailCache, ArticleDetailPrefetcher
+from src.collectors.pengpai_config import DEFAULT_PENGPAI_CONFIG # 不经过 src.collectors.pengpai，避免启动时导入 Selenium
 # from src.storage.analysis_storage_service import AnalysisStorageService # REMOVE THIS IMPORT IF NO LONGER NEEDED
-from src.collectors.pengpai import DEFAULT_PENGPAI_CONFIG # Added for Pengpai config update
 
 # --- Helper Function (Moved to NewsUpdateService) ---
 # def convert_datetime_to_iso(obj):
@@ -50,11 +53,19 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
     status_message_updated = pyqtSignal(str) # 状态栏消息更新
     selected_news_changed = pyqtSignal(object) # 发射选中的 NewsArticle 或 None
     # --- News Cache Update Signal --- (Emitted AFTER refresh completes and cache is updated)
-    news_cache_updated = pyqtSignal(list) # 发射【完整】的内存缓存列表
+    news_cache_updated = pyqtSignal(list) # 发射【完整】的内存缓存列表 (仅初始加载/整体替换时)
+    # --- News Cache Delta Signal --- 增量更新: (新增文章 ID, 更新文章 ID, 移除文章 ID)
+    # 文章对象通过 get_cached_articles(ids) 获取
+    news_cache_delta = pyqtSignal(list, list, list)
+    # --- 渐进式初始加载完成 --- 发射加载指标 (time_to_first_row_ms, first_page, total, total_seconds)
+    initial_load_finished = pyqtSignal(dict)
+    # --- 文章详情预取完成 --- 发射本次新放入详情缓存的文章 ID
+    details_prefetched = pyqtSignal(list)
     
     # --- Signals forwarded from NewsUpdateService ---
     refresh_started = pyqtSignal() 
     refresh_progress = pyqtSignal(int, int) # Emits (current_progress_percentage, 100)
+    refresh_progress_snapshot = pyqtSignal(dict) # 合并后的进度快照 (总数、各源状态、预计剩余时间)，见 ProgressAggregator.snapshot
     refresh_complete = pyqtSignal(bool, str)
     # refresh_cancelled = pyqtSignal() # Covered by refresh_complete(False, "刷新已取消")
     source_fetch_failed = pyqtSignal(str, str) # Forwarded signal
@@ -87,8 +98,22 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
 
         # --- Attributes ---
         # self.news_sources: List[NewsSource] = [] # Managed by SourceManager
-        self.news_cache: List[NewsArticle] = [] # --- 内存缓存 --- (Still maintained here)
+        # --- 内存缓存 --- 只保存精简的列表行 (不含正文)，完整文章通过 get_full_article 按需加载
+        self.news_cache: List[NewsListRow] = []
+        self._cache_by_id: Dict[Any, NewsListRow] = {} # 文章 ID -> 缓存中的文章，供增量信号的接收方按 ID 取文章
+        self._index_by_link: Dict[str, int] = {} # 链接 -> 在 news_cache 中的位置，合并增量时按链接去重
         self.selected_article: Optional[NewsArticle] = None # +++ 新增属性，存储当前选中的文章 +++
+        # --- 渐进式初始加载 ---
+        self.initial_load_metrics: Dict[str, Any] = {}
+        self._initial_load_started = 0.0
+        self._initial_load_cancel: Optional[CancellationFlag] = None
+        self._initial_load_pool = QThreadPool(self)
+        self._initial_load_pool.setMaxThreadCount(1)
+        # --- 文章详情 (正文) 缓存与后台预取 ---
+        self.detail_cache = ArticleDetailCache()
+        self._prefetch_cancel: Optional[CancellationFlag] = None
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
         # self.collectors: Dict[str, object] = {} # Moved to NewsUpdateService
 
         # --- Refresh State (Managed by NewsUpdateService) ---
@@ -144,8 +169,10 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             try:
                 self.news_update_service.refresh_started.connect(self.refresh_started)
                 self.news_update_service.source_refresh_progress.connect(self._handle_source_refresh_progress)
+                self.news_update_service.progress_snapshot.connect(self.refresh_progress_snapshot)
                 self.news_update_service.refresh_complete.connect(self.refresh_complete)
-                self.news_update_service.news_refreshed.connect(self._handle_news_refreshed, Qt.QueuedConnection)
+                # 刷新流水线已在后台完成转换与入库，这里只需按批次把新文章合并进缓存
+                self.news_update_service.articles_stored.connect(self._handle_articles_stored, Qt.QueuedConnection)
                 self.news_update_service.error_occurred.connect(self.source_fetch_failed)
                 # Connect the new signal for persisted status
                 self.news_update_service.source_status_persisted_in_db.connect(self._handle_source_status_persisted)
@@ -246,50 +273,40 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         """加载初始新闻列表并更新缓存和通知UI"""
         self.logger.debug("加载初始新闻...")
         try:
-            initial_news_data = self.storage.get_all_articles() # Use the correct method
+            # 列表只需要标题、来源、时间等字段，不读取正文
+            initial_news_data = self.storage.get_all_articles(with_content=False)
             if initial_news_data:
                 self.logger.debug(f"成功从数据库加载 {len(initial_news_data)} 条初始新闻。")
-                # --- Convert dicts to articles ---
+                # --- Convert dicts to list rows ---
                 initial_news_articles = []
                 for item_dict in initial_news_data:
-                    article = self._convert_dict_to_article(item_dict) # Use AppService's converter for now
+                    article = self._convert_dict_to_row(item_dict)
                     if article:
                         initial_news_articles.append(article)
                 self.logger.debug(f"加载并转换了 {len(initial_news_articles)} 条初始新闻")
 
                 # --- Assign categories based on source config ---
-                source_map = {source.name: source for source in self.source_manager.get_sources()}
+                source_categories = self.source_manager.get_lookup().source_categories
                 for article in initial_news_articles:
-                    source_config = source_map.get(article.source_name)
-                    if source_config:
-                        category_id = source_config.category
-                        article.category = get_category_name(category_id)
+                    category_name = source_categories.get(article.source_name)
+                    if category_name is not None:
+                        article.category = category_name
                     else:
                         article.category = None
                         self.logger.warning(f"未找到来源 '{article.source_name}' 的配置，新闻 '{article.title[:20]}...' 将由后续逻辑进行分类。")
                 
-                # --- Load read status USING HistoryService ---
-                read_count = 0
-                for article in initial_news_articles:
-                    try:
-                        if article.link:
-                            # Use HistoryService here!
-                            article.is_read = self.history_service.is_read(article.link)
-                            if article.is_read: read_count += 1
-                        else: article.is_read = False
-                    except Exception as read_e:
-                        self.logger.warning(f"检查已读状态失败 for '{article.title[:20]}...': {read_e}")
-                        article.is_read = False
+                # 已读状态直接取自文章表的 is_read 列 (与 HistoryService.is_read 查询的是同一列)，不再逐篇查询
+                read_count = sum(1 for article in initial_news_articles if article.is_read)
                 self.logger.debug(f"已加载已读状态，其中 {read_count} 条标记为已读。")
                 # --- Update Cache and Emit Signal ---
-                self.news_cache = initial_news_articles # Update internal cache
+                self._replace_cache(initial_news_articles) # Update internal cache
                 self.logger.debug(f"内存缓存已更新 (初始加载)，包含 {len(self.news_cache)} 条新闻")
                 self.logger.debug(f"_load_initial_news: Emitting news_cache_updated with {len(self.news_cache)} articles.")
                 self.news_cache_updated.emit(self.news_cache) # Emit the full cache
                 self.status_message_updated.emit(f"已加载 {len(self.news_cache)} 条历史新闻")
             else:
                 self.logger.debug("未找到历史新闻")
-                self.news_cache = [] # 确保缓存为空
+                self._replace_cache([]) # 确保缓存为空
                 self.logger.debug(f"_load_initial_news: Emitting news_cache_updated with {len(self.news_cache)} articles (empty cache).")
                 self.news_cache_updated.emit(self.news_cache) # Emit empty cache
                 self.status_message_updated.emit("未找到历史新闻，请刷新")
@@ -303,19 +320,156 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.error(f"加载初始新闻失败: {e}", exc_info=True)
             self.status_message_updated.emit("加载历史新闻失败")
 
+    INITIAL_FIRST_PAGE = 500       # 渐进式加载时同步加载的最新文章数
+    INITIAL_MAX_PAGE_SIZE = 20000  # 后台分页的页大小上限
+
+    def load_initial_news_progressive(self, first_page: Optional[int] = None,
+                                      max_page_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        渐进式加载初始新闻：同步加载最新的 first_page 篇标题 (不含正文) 并立即通知 UI，
+        其余文章在后台线程分页读取，逐页以 news_cache_delta 合并进缓存。
+
+        已读状态直接取自文章表的 is_read 列 (与 HistoryService.is_read 查询的是同一列)，
+        不再逐篇查询。内存数据库无法在其他线程读取，此时退回 _load_initial_news。
+
+        Returns:
+            dict: 加载指标，time_to_first_row_ms 为从开始到第一页交给 UI 的耗时；
+                  后台加载完成后补充 total / total_seconds 并发射 initial_load_finished。
+        """
+        if not self.storage.supports_concurrent_reads():
+            self.logger.info("数据库不支持后台读取，使用一次性加载。")
+            started = time.perf_counter()
+            self._load_initial_news()
+            self.initial_load_metrics = {
+                'time_to_first_row_ms': round((time.perf_counter() - started) * 1000, 1),
+                'first_page': len(self.news_cache), 'total': len(self.news_cache), 'progressive': False,
+            }
+            return self.initial_load_metrics
+
+        first_page = first_page or self.INITIAL_FIRST_PAGE
+        max_page_size = max_page_size or self.INITIAL_MAX_PAGE_SIZE
+        self.cancel_initial_load()
+        self._initial_load_started = time.perf_counter()
+        # 查找表构建后不再修改，可以直接交给后台加载线程读取
+        categories = self.source_manager.get_lookup().source_categories
+
+        rows = []
+        for item in self.storage.get_article_headlines(first_page):
+            row = NewsListRow.from_storage_dict(item, categories.get(item.get('source_name')))
+            if row is not None:
+                rows.append(row)
+        self._replace_cache(rows)
+        self.news_cache_updated.emit(self.news_cache)
+        time_to_first_row_ms = round((time.perf_counter() - self._initial_load_started) * 1000, 1)
+        self.initial_load_metrics = {'time_to_first_row_ms': time_to_first_row_ms, 'first_page': len(rows),
+                                     'total': len(rows), 'progressive': True}
+        self.logger.info(f"首屏新闻已加载: {len(rows)} 条, 耗时 {time_to_first_row_ms} ms")
+
+        if len(rows) < first_page:
+            self._finish_initial_load(None, 0, 0.0)  # 数据库中的文章不足一页，已全部加载
+            return self.initial_load_metrics
+
+        self.status_message_updated.emit(f"已加载最新 {len(rows)} 条新闻，正在后台加载更早的新闻...")
+        self._initial_load_cancel = CancellationFlag()
+        loader = InitialNewsPageLoader(self.storage, len(rows), categories, first_page, max_page_size,
+                                       self._initial_load_cancel)
+        loader.signals.page_loaded.connect(self._handle_initial_page_loaded)
+        loader.signals.finished.connect(self._finish_initial_load)
+        self._initial_load_pool.start(loader)
+        return self.initial_load_metrics
+
+    def cancel_initial_load(self):
+        """停止仍在进行的后台初始加载 (已合并的页保留在缓存中)。"""
+        if self._initial_load_cancel is not None:
+            self._initial_load_cancel.set()
+            self._initial_load_cancel = None
+
+    def wait_for_initial_load(self, msecs: int = -1) -> bool:
+        """等待后台初始加载线程结束 (测试和退出时使用)。"""
+        return self._initial_load_pool.waitForDone(msecs)
+
+    @Slot(object, list)
+    def _handle_initial_page_loaded(self, cancel_flag: CancellationFlag, rows: List[NewsListRow]):
+        """后台加载的一页旧文章：合并进缓存并通知 UI (刷新期间已写入的文章按链接去重)。"""
+        if cancel_flag.is_set():
+            return  # 本次加载已被取消或被新的加载取代
+        added_ids, updated_ids = self._merge_articles_into_cache(rows, "初始加载")
+        self.initial_load_metrics['total'] = len(self.news_cache)
+        self._emit_news_cache_delta("初始加载", added_ids, updated_ids)
+
+    @Slot(object, int, float)
+    def _finish_initial_load(self, cancel_flag: Optional[CancellationFlag], loaded: int, seconds: float):
+        if cancel_flag is not None and cancel_flag.is_set():
+            return
+        metrics = self.initial_load_metrics
+        metrics['total'] = len(self.news_cache)
+        metrics['total_seconds'] = round(time.perf_counter() - self._initial_load_started, 3)
+        self._initial_load_cancel = None
+        self.logger.info(f"初始新闻加载完成: 共 {metrics['total']} 条, 首屏 {metrics['time_to_first_row_ms']} ms, "
+                         f"总耗时 {metrics['total_seconds']} s")
+        self.status_message_updated.emit(f"已加载 {metrics['total']} 条历史新闻")
+        self.initial_load_finished.emit(dict(metrics))
+
+    def prefetch_article_details(self, article_ids: List[Any], renderers: Optional[Dict[str, Any]] = None,
+                                 replace: bool = True) -> bool:
+        """
+        在后台线程中把文章正文读入 detail_cache，并用 renderers (HTML 类型 -> 纯函数) 预先生成 HTML。
+
+        Args:
+            article_ids: 要预取的文章 ID，按优先级排列。
+            renderers: 见 ArticleDetailPrefetcher。
+            replace: 为 True 时取消尚未完成的上一次预取 (例如选中项已经变化)。
+
+        Returns:
+            bool: 是否启动了预取 (没有 ID 或数据库不支持后台读取时为 False)。
+        """
+        article_ids = list(dict.fromkeys(article_id for article_id in article_ids if article_id is not None))
+        if not article_ids or not self.storage.supports_concurrent_reads():
+            return False
+        if replace:
+            self.cancel_prefetch()
+        cancel_flag = CancellationFlag()
+        self._prefetch_cancel = cancel_flag
+        prefetcher = ArticleDetailPrefetcher(self.storage, article_ids, self._convert_dict_to_article,
+                                             self.detail_cache, renderers, cancel_flag)
+        prefetcher.signals.finished.connect(self._handle_details_prefetched)
+        self._prefetch_pool.start(prefetcher)
+        return True
+
+    def cancel_prefetch(self):
+        """跳过尚未完成的预取中剩余的文章 (已放入缓存的保留)。"""
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+    def wait_for_prefetch(self, msecs: int = -1) -> bool:
+        """等待后台预取线程结束 (测试和退出时使用)。"""
+        return self._prefetch_pool.waitForDone(msecs)
+
+    @Slot(object, list, float)
+    def _handle_details_prefetched(self, cancel_flag: CancellationFlag, article_ids: List[Any], seconds: float):
+        if cancel_flag is self._prefetch_cancel:
+            self._prefetch_cancel = None
+        if article_ids:
+            self.logger.debug(f"已预取 {len(article_ids)} 篇文章详情, 耗时 {seconds * 1000:.1f} ms")
+            self.details_prefetched.emit(article_ids)
+
     def _handle_news_refreshed(self, source_name: str, news_items: List[Dict[str, Any]]):
         """处理从 NewsUpdateService.news_refreshed 信号传来的单个源的新闻条目。"""
-        self.logger.info(f"--- AppService: _handle_news_refreshed 被调用！来源: '{source_name}', 条目数: {len(news_items)} ---") # +++ 新增日志 +++
         if not news_items:
             self.logger.info(f"来源 '{source_name}' 没有返回新的新闻条目，不处理。")
-            self._emit_news_cache_updated_signal(source_name, 0) # 即使没有新文章也通知，以便UI可以结束加载状态
+            self._emit_news_cache_delta(source_name) # 即使没有新文章也通知，以便UI可以结束加载状态
             return
 
         self.logger.info(f"AppService: 从 '{source_name}' 接收到 {len(news_items)} 条新闻条目。准备处理...")
+        # 逐条目的日志只在 DEBUG 级别输出；先判断一次，避免在 INFO 级别下为每条新闻格式化消息
+        log_items = self.logger.isEnabledFor(logging.DEBUG)
 
-        # +++ ADDED: Get source map for category lookup +++
-        source_map = {source.name: source for source in self.source_manager.get_sources()}
-        # +++ END ADDED +++
+        # 同一批条目来自同一个来源：分类在循环外查找一次
+        lookup = self.source_manager.get_lookup()
+        if source_name not in lookup.by_name:
+            self.logger.error(f"AppService [{source_name}]: Source object not found in SourceManager. Articles cannot be properly categorized.")
+        article_category_for_db = lookup.category_id_for(source_name)
 
         # 1. 转换原始字典为 NewsArticle 对象 (不含数据库 ID)
         articles_without_ids = []
@@ -324,55 +478,35 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 # Ensure publish_time is correctly parsed to datetime if it's a string
                 # MODIFICATION START: Prioritize 'publish_time' (datetime object), then 'pub_date' (string)
                 publish_time_dt: Optional[datetime] = None
-                article_title_for_log = item_dict.get('title', 'N/A')[:50]
-                article_link_for_log = item_dict.get('link', 'N/A')
-
                 datetime_from_collector = item_dict.get('publish_time') # Expected to be a datetime object or None
                 date_str_from_collector = item_dict.get('pub_date')     # Expected to be a date string or None
 
-                self.logger.info(f"AppService [{source_name}]: Processing item '{article_title_for_log}...'. Link: {article_link_for_log}. Collector provided 'publish_time' (datetime): {datetime_from_collector} (type: {type(datetime_from_collector)}), 'pub_date' (str): {date_str_from_collector} (type: {type(date_str_from_collector)})")
-
                 if isinstance(datetime_from_collector, datetime):
                     publish_time_dt = datetime_from_collector
-                    self.logger.info(f"AppService [{source_name}]: Using 'publish_time' (datetime object): {publish_time_dt} (tzinfo: {publish_time_dt.tzinfo}) for article '{article_title_for_log}...'")
                     if publish_time_dt.tzinfo is None: # Ensure it's timezone-aware
                         publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc)
-                        self.logger.info(f"AppService [{source_name}]: Localized naive datetime object from 'publish_time' to UTC: {publish_time_dt} for '{article_title_for_log}...'")
                 
                 elif isinstance(date_str_from_collector, str) and date_str_from_collector.strip():
-                    self.logger.info(f"AppService [{source_name}]: 'publish_time' was not a datetime. Attempting to parse 'pub_date' string '{date_str_from_collector}' for article '{article_title_for_log}...'")
                     try:
                         # Use dateutil_parser for robust parsing of various string formats
                         publish_time_dt = dateutil_parser.parse(date_str_from_collector, fuzzy=True) # fuzzy might help with slight variations
-                        self.logger.info(f"AppService [{source_name}]: Successfully parsed 'pub_date' string '{date_str_from_collector}' to datetime: {publish_time_dt} (type: {type(publish_time_dt)}) for '{article_title_for_log}...'")
-
                         if publish_time_dt and publish_time_dt.tzinfo is None:
                             publish_time_dt = publish_time_dt.replace(tzinfo=timezone.utc) # Assume UTC if naive
-                            self.logger.info(f"AppService [{source_name}]: Localized naive datetime from 'pub_date' string to UTC: {publish_time_dt} for '{article_title_for_log}...'")
 
                     except (ValueError, TypeError, OverflowError) as e_date_str_parse:
-                        self.logger.warning(f"AppService [{source_name}]: Parsing 'pub_date' string '{date_str_from_collector}' FAILED for article '{article_title_for_log}...'. Error: {e_date_str_parse}. Setting publish_time_dt to None.")
+                        self.logger.warning(f"AppService [{source_name}]: Parsing 'pub_date' string '{date_str_from_collector}' FAILED for article '{item_dict.get('title', 'N/A')[:50]}...'. Error: {e_date_str_parse}. Setting publish_time_dt to None.")
                         publish_time_dt = None
                     except Exception as e_date_str_unknown:
-                        self.logger.error(f"AppService [{source_name}]: Unknown error while parsing 'pub_date' string '{date_str_from_collector}' for article '{article_title_for_log}...'. Error: {e_date_str_unknown}", exc_info=True)
+                        self.logger.error(f"AppService [{source_name}]: Unknown error while parsing 'pub_date' string '{date_str_from_collector}' for article '{item_dict.get('title', 'N/A')[:50]}...'. Error: {e_date_str_unknown}", exc_info=True)
                         publish_time_dt = None
-                else:
-                    self.logger.warning(f"AppService [{source_name}]: Neither 'publish_time' (datetime) nor 'pub_date' (str) provided or valid for article '{article_title_for_log}...'. publish_time_dt remains None.")
+                elif log_items:
+                    self.logger.debug(f"AppService [{source_name}]: Neither 'publish_time' (datetime) nor 'pub_date' (str) provided or valid for article '{item_dict.get('title', 'N/A')[:50]}...'. publish_time_dt remains None.")
                 # MODIFICATION END
 
-                # 在创建 NewsArticle 对象前记录最终的 publish_time_dt
-                self.logger.info(f"AppService [{source_name}]: For article '{article_title_for_log}...', final publish_time_dt to be used for NewsArticle: {publish_time_dt} (type: {type(publish_time_dt)})")
-                
-                source_obj = self.source_manager.get_source_by_name(source_name)
-                
-                if not source_obj:
-                    self.logger.error(f"AppService [{source_name}]: Source object not found in SourceManager. Articles cannot be properly categorized.")
-                    # Fallback category if source_obj is None, though this case should ideally not happen
-                    # if sources are managed correctly.
-                    article_category_for_db = "uncategorized"
-                else:
-                    article_category_for_db = source_obj.category if source_obj.category and isinstance(source_obj.category, str) and source_obj.category.strip() else "uncategorized"
-                
+                if log_items:
+                    self.logger.debug(f"AppService [{source_name}]: Processing item '{item_dict.get('title', 'N/A')[:50]}...'. Link: {item_dict.get('link', 'N/A')}. "
+                                      f"publish_time={datetime_from_collector!r}, pub_date={date_str_from_collector!r} -> {publish_time_dt}")
+
                 # Convert to NewsArticle for cache and potential immediate use (though primarily we'll fetch from DB after this)
                 # The category used here is for the NewsArticle object instantiation.
                 # It might differ from item_dict.get('category') if the collector's source object was out of sync.
@@ -396,7 +530,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         
         if not articles_without_ids:
             self.logger.info(f"来源 '{source_name}' 的所有条目转换后为空或无效，不继续处理。")
-            self._emit_news_cache_updated_signal(source_name, 0)
+            self._emit_news_cache_delta(source_name)
             return
 
         # Convert NewsArticle objects to dictionaries for storage
@@ -419,22 +553,22 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             self.logger.info(f"AppService: 为来源 '{source_name}' 批量更新/插入了 {len(articles_to_store_as_dicts)} 条文章到数据库。")
         except Exception as e_db_upsert:
             self.logger.error(f"AppService: 数据库批量更新/插入文章失败 for '{source_name}': {e_db_upsert}", exc_info=True)
-            self._emit_news_cache_updated_signal(source_name, 0, error_message=str(e_db_upsert))
+            self._emit_news_cache_delta(source_name, error_message=str(e_db_upsert))
             return
 
         # 3. 从数据库根据链接重新获取这些文章，确保它们现在拥有数据库ID
         #    并过滤掉那些可能因为某种原因未成功插入或更新的文章
         links_of_processed_articles = [art.link for art in articles_without_ids if art.link]
-        articles_with_ids: List[NewsArticle] = []
+        articles_with_ids: List[NewsListRow] = []
         if links_of_processed_articles:
             try:
                 # NEW: Fetch as dicts then convert
                 articles_as_dicts_from_db = self.storage.get_articles_by_links(links_of_processed_articles)
                 self.logger.info(f"AppService: 从数据库为来源 '{source_name}' 重新获取了 {len(articles_as_dicts_from_db)} 条文章 (字典格式)。")
 
-                converted_articles_with_ids: List[NewsArticle] = []
+                converted_articles_with_ids: List[NewsListRow] = []
                 for db_dict in articles_as_dicts_from_db:
-                    article_obj = self._convert_dict_to_article(db_dict) # Use existing helper
+                    article_obj = self._convert_dict_to_row(db_dict)
                     if article_obj:
                         converted_articles_with_ids.append(article_obj)
                     else:
@@ -457,53 +591,131 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 articles_with_ids = [] # Fallback to empty to prevent further errors down the line if critical
         
         # 4. 更新内部缓存，并仅保留真正唯一的、带有ID的文章
-        unique_new_articles_with_ids_count = 0
+        added_ids, updated_ids = [], []
         if articles_with_ids:
-            current_cache_size = len(self.news_cache)
-            # --- MODIFICATION START: Improved cache update logic ---
-            # Create a map of existing article links to their index in the cache for efficient lookup
-            cache_link_to_index_map = {cached_article.link: i for i, cached_article in enumerate(self.news_cache)}
-
-            for article_with_id in articles_with_ids:
-                if not article_with_id.link: # Should not happen if filtered earlier, but as a safeguard
-                    self.logger.warning(f"AppService: Article with ID {article_with_id.id} has no link, cannot process for cache update.")
-                    continue
-
-                if article_with_id.link in cache_link_to_index_map:
-                    # Article already exists in cache, replace it with the potentially updated version
-                    existing_article_index = cache_link_to_index_map[article_with_id.link]
-                    self.news_cache[existing_article_index] = article_with_id
-                    # self.logger.debug(f"AppService: Updated existing article in cache: {article_with_id.link}")
-                    # Not counted as "new" for the purpose of the signal count, but it is an update.
-                else:
-                    # New article, add to cache
-                    self.news_cache.append(article_with_id)
-                    cache_link_to_index_map[article_with_id.link] = len(self.news_cache) - 1 # Update map for newly added item
-                    unique_new_articles_with_ids_count += 1
-            # --- MODIFICATION END ---
-            
-            self.logger.info(f"AppService: 为 '{source_name}' 将 {unique_new_articles_with_ids_count} 条唯一新文章（带ID）合并到缓存。缓存大小从 {current_cache_size} 变为 {len(self.news_cache)}.")
+            added_ids, updated_ids = self._merge_articles_into_cache(articles_with_ids, source_name)
         else:
             self.logger.warning(f"AppService: 没有从数据库获取到带有ID的文章 for '{source_name}'，缓存未更新新条目。")
 
-        # 5. 发射信号，通知UI新闻列表已更新
-        #    传递的是成功从数据库获取并加入缓存的文章数量
-        self._emit_news_cache_updated_signal(source_name, unique_new_articles_with_ids_count)
-        self.logger.info(f"AppService: 已为来源 '{source_name}' 发射 news_cache_updated 信号，新增文章数: {unique_new_articles_with_ids_count}")
+        # 5. 发射增量信号，通知UI新增/更新了哪些文章
+        self._emit_news_cache_delta(source_name, added_ids, updated_ids)
+
+    def _replace_cache(self, articles: List[NewsListRow]):
+        """整体替换内存缓存并重建 ID 与链接索引 (只在初始加载时调用，之后的变化都通过 _merge_articles_into_cache 增量维护)。"""
+        self.news_cache = articles
+        self._cache_by_id = {article.id: article for article in articles if article.id is not None}
+        self._index_by_link = {article.link: index for index, article in enumerate(articles) if article.link}
+
+    def _merge_articles_into_cache(self, articles_with_ids: List[NewsListRow], source_label: str) -> Tuple[List[Any], List[Any]]:
+        """按链接把带数据库 ID 的文章合并进内存缓存 (已存在则替换)，返回 (新增文章 ID, 更新文章 ID)。"""
+        current_cache_size = len(self.news_cache)
+        added_ids: List[Any] = []
+        updated_ids: List[Any] = []
+        index_by_link = self._index_by_link
+
+        for article_with_id in articles_with_ids:
+            if not article_with_id.link: # Should not happen if filtered earlier, but as a safeguard
+                self.logger.warning(f"AppService: Article with ID {article_with_id.id} has no link, cannot process for cache update.")
+                continue
+
+            index = index_by_link.get(article_with_id.link)
+            if index is not None:
+                # Article already exists in cache, replace it with the potentially updated version
+                previous = self.news_cache[index]
+                self.news_cache[index] = article_with_id
+                if previous.id is not None and previous.id != article_with_id.id:
+                    self._cache_by_id.pop(previous.id, None)
+                ids = updated_ids
+            else:
+                # New article, add to cache
+                self.news_cache.append(article_with_id)
+                index_by_link[article_with_id.link] = len(self.news_cache) - 1
+                ids = added_ids
+            if article_with_id.id is not None:
+                self._cache_by_id[article_with_id.id] = article_with_id
+                ids.append(article_with_id.id)
+
+        if updated_ids:
+            self.detail_cache.discard(updated_ids) # 内容可能已被刷新更新，下次查看时重新读取
+        self.logger.info(f"AppService: 为 '{source_label}' 将 {len(added_ids)} 条唯一新文章（带ID）合并到缓存，更新 {len(updated_ids)} 条。缓存大小从 {current_cache_size} 变为 {len(self.news_cache)}.")
+        return added_ids, updated_ids
+
+    def get_cached_articles(self, article_ids: List[Any]) -> List[NewsListRow]:
+        """按 ID 返回缓存中的文章 (保持传入顺序，跳过不存在的 ID)。"""
+        return [self._cache_by_id[article_id] for article_id in article_ids if article_id in self._cache_by_id]
+
+    def get_full_article(self, article: Optional[Any]) -> Optional[NewsArticle]:
+        """
+        返回列表行对应的完整 NewsArticle (含正文)，优先取自 detail_cache，否则从数据库加载并放入缓存。
+
+        传入的已经是 NewsArticle 时原样返回。分类和已读状态沿用列表行上的值；
+        数据库中找不到该文章时返回只含列表字段的 NewsArticle。
+        """
+        if article is None or not isinstance(article, NewsListRow):
+            return article
+        selected = self.selected_article
+        if isinstance(selected, NewsArticle) and selected.id is not None and selected.id == article.id:
+            return selected # 刚选中的文章已加载过，避免单击/预览/双击重复查询
+        full_article = self.detail_cache.get(article.id) if article.id is not None else None
+        if full_article is None and article.id is not None:
+            try:
+                row = self.storage.get_article_by_id(article.id)
+                full_article = self._convert_dict_to_article(row) if row else None
+                self.detail_cache.put(full_article)
+            except Exception as e:
+                self.logger.error(f"加载文章 {article.id} 的完整内容失败: {e}", exc_info=True)
+        if full_article is None:
+            self.logger.warning(f"数据库中未找到文章 {article.id} ('{article.title[:20]}...')，使用列表字段。")
+            return article.to_article()
+        full_article.category = article.category
+        full_article.is_read = article.is_read
+        return full_article
+
+    def search_stored_articles(self, term: str, fields: Tuple[str, ...]) -> set:
+        """在数据库中搜索列表行不携带的字段 (如正文)，返回匹配的文章 ID 集合。可在后台线程调用。"""
+        return self.storage.search_article_ids(term, list(fields))
+
+    @Slot(list)
+    def _handle_articles_stored(self, links: List[str]):
+        """
+        处理刷新流水线写入数据库的一个批次 (可能包含多个来源的文章)。
+
+        从数据库按链接取回带 ID 的文章 (已读状态取自同一查询返回的 is_read 列)，
+        补充分类后合并进缓存，每个批次只通知 UI 一次。
+        """
+        if not links:
+            return
+        try:
+            rows = self.storage.get_articles_by_links(links)
+        except Exception as e:
+            self.logger.error(f"AppService: 从数据库根据链接批量获取文章失败: {e}", exc_info=True)
+            self._emit_news_cache_delta("刷新批次", error_message=str(e))
+            return
 
-    def _emit_news_cache_updated_signal(self, source_name: str, count: int, error_message: Optional[str] = None):
-        """Helper method to emit news_cache_updated signal and log relevant info."""
+        source_categories = self.source_manager.get_lookup().source_categories
+        articles = []
+        for row in rows:
+            article = self._convert_dict_to_row(row)
+            if not article:
+                continue
+            category_name = source_categories.get(article.source_name)
+            if category_name is not None:
+                article.category = category_name
+            articles.append(article)
+
+        added_ids, updated_ids = self._merge_articles_into_cache(articles, "刷新批次")
+        self._emit_news_cache_delta("刷新批次", added_ids, updated_ids)
+
+    def _emit_news_cache_delta(self, source_name: str, added_ids: Optional[List[Any]] = None,
+                               updated_ids: Optional[List[Any]] = None, removed_ids: Optional[List[Any]] = None,
+                               error_message: Optional[str] = None):
+        """发射 news_cache_delta 增量信号 (只含变化文章的 ID，而不是整个缓存) 并记录日志。"""
+        added_ids, updated_ids, removed_ids = list(added_ids or []), list(updated_ids or []), list(removed_ids or [])
         if error_message:
-            self.logger.error(f"Error during news processing for source '{source_name}': {error_message}. Emitting empty update.")
-            # In case of error, we might still want to emit the current cache, 
-            # or an empty list depending on desired behavior for partial updates.
-            # For now, let's assume we emit the current (potentially partially updated) cache.
-            # Or, if count is 0 due to error, it correctly reflects no *new* articles from this source.
+            self.logger.error(f"Error during news processing for source '{source_name}': {error_message}. Emitting empty delta.")
         else:
-            self.logger.info(f"Emitting news_cache_updated for source '{source_name}'. New/updated articles from this source: {count}. Total cache size: {len(self.news_cache)}")
-        
-        # The news_cache_updated signal is defined to emit the ENTIRE cache list.
-        self.news_cache_updated.emit(list(self.news_cache)) # Ensure a copy is emitted
+            self.logger.info(f"Emitting news_cache_delta for source '{source_name}': +{len(added_ids)} ~{len(updated_ids)} -{len(removed_ids)}. Total cache size: {len(self.news_cache)}")
+        self.news_cache_delta.emit(added_ids, updated_ids, removed_ids)
 
     # --- News Refresh Methods (Delegated to NewsUpdateService) ---
     def refresh_all_sources(self):
@@ -534,7 +746,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         source_name = item_dict.get('source_name', '未知来源')
         
         raw_publish_time_from_dict = item_dict.get('publish_time')
-        self.logger.debug(f"_convert_dict_to_article (来源: {source_name}, 标题: {title[:30]}...): 从字典获取的原始 'publish_time' 字段: '{raw_publish_time_from_dict}' (类型: {type(raw_publish_time_from_dict)})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"_convert_dict_to_article (来源: {source_name}, 标题: {title[:30]}...): 从字典获取的原始 'publish_time' 字段: '{raw_publish_time_from_dict}' (类型: {type(raw_publish_time_from_dict)})")
 
         parsed_datetime = self._parse_datetime(raw_publish_time_from_dict) # 传递原始值给 _parse_datetime
 
@@ -584,16 +797,32 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 created_at=created_at,
                 updated_at=updated_at
             )
-            self.logger.debug(f"AppService [_convert_dict_to_article]: Successfully converted dict to NewsArticle: '{article.title[:50]}...', final publish_time: {article.publish_time}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"AppService [_convert_dict_to_article]: Successfully converted dict to NewsArticle: '{article.title[:50]}...', final publish_time: {article.publish_time}")
             return article
         except Exception as e:
             self.logger.error(f"在 _convert_dict_to_article 中创建 NewsArticle 对象失败: {e}. 字典: {item_dict}", exc_info=True)
             return None
 
+    def _convert_dict_to_row(self, item_dict: Dict[str, Any]) -> Optional[NewsListRow]:
+        """将数据库字典转换为内存缓存使用的 NewsListRow (只取列表字段，时间规范化规则与 _convert_dict_to_article 相同)。"""
+        if not item_dict or not isinstance(item_dict, dict):
+            return None
+        row = NewsListRow.from_storage_dict(item_dict)
+        if row is None:
+            self.logger.warning(f"创建 NewsListRow 失败: 链接为空。ID: {item_dict.get('id')}")
+            return None
+        raw_publish_time = item_dict.get('publish_time')
+        if row.publish_ts is None and raw_publish_time:
+            # 非 ISO 格式的时间字符串交给更宽松的解析器
+            row.publish_ts = NewsListRow.timestamp_from_datetime(self._parse_datetime(raw_publish_time))
+        return row
+
     def _parse_datetime(self, date_input: Optional[Any]) -> Optional[datetime]: # MODIFIED: Changed param name from date_string to date_input and type to Any
         # MODIFIED: Handle cases where date_input is already a datetime object
         if isinstance(date_input, datetime):
-            self.logger.debug(f"_parse_datetime: 输入已经是 datetime 对象: {date_input} (时区: {date_input.tzinfo})。准备进行时区标准化。")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"_parse_datetime: 输入已经是 datetime 对象: {date_input} (时区: {date_input.tzinfo})。准备进行时区标准化。")
             dt_aware = date_input
             # 标准化为 UTC 时间
             if dt_aware.tzinfo is None or dt_aware.tzinfo.utcoffset(dt_aware) is None:
@@ -602,7 +831,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 try:
                     local_tz = datetime.now().astimezone().tzinfo
                     dt_aware_localized = dt_aware.replace(tzinfo=local_tz)
-                    self.logger.debug(f"_parse_datetime (datetime input): naive datetime {dt_aware} 被赋予本地时区 {local_tz} -> {dt_aware_localized}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"_parse_datetime (datetime input): naive datetime {dt_aware} 被赋予本地时区 {local_tz} -> {dt_aware_localized}")
                 except Exception as e_tz_local:
                     self.logger.warning(f"_parse_datetime (datetime input): 为 naive datetime {dt_aware} 附加本地时区失败 ({e_tz_local})，将直接赋予 UTC。")
                     dt_aware_localized = dt_aware.replace(tzinfo=timezone.utc) # 假设 naive datetime 是 UTC
@@ -610,21 +840,25 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             else:
                 dt_utc = dt_aware.astimezone(timezone.utc) # 已经是 aware, 统一转 UTC
             
-            self.logger.debug(f"_parse_datetime: datetime 输入 '{date_input}' 成功标准化为 UTC: {dt_utc}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"_parse_datetime: datetime 输入 '{date_input}' 成功标准化为 UTC: {dt_utc}")
             return dt_utc
 
         # Original logic for string inputs
         if not date_input or not isinstance(date_input, str) or date_input.lower() == 'none':
-            self.logger.debug(f"_parse_datetime: 输入日期值为空、非字符串/datetime 或为 'none'。Value: '{date_input}' (Type: {type(date_input)}). 返回 None。")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"_parse_datetime: 输入日期值为空、非字符串/datetime 或为 'none'。Value: '{date_input}' (Type: {type(date_input)}). 返回 None。")
             return None
 
         # Rename date_input to date_string for the rest of the string parsing logic for clarity
         date_string = date_input 
-        self.logger.debug(f"_parse_datetime: 开始解析日期字符串: '{date_string}' (类型: {type(date_string)})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"_parse_datetime: 开始解析日期字符串: '{date_string}' (类型: {type(date_string)})")
         try:
             # 尝试使用 dateutil.parser 进行智能解析 (优先)
             dt = dateutil_parser.parse(date_string)
-            self.logger.debug(f"_parse_datetime: dateutil_parser.parse 成功，原始解析结果 dt: {dt} (时区: {dt.tzinfo})")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"_parse_datetime: dateutil_parser.parse 成功，原始解析结果 dt: {dt} (时区: {dt.tzinfo})")
 
             # 标准化为 UTC 时间
             if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
@@ -635,7 +869,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 try:
                     local_tz = datetime.now().astimezone().tzinfo
                     dt_aware = dt.replace(tzinfo=local_tz)
-                    self.logger.debug(f"_parse_datetime: naive datetime {dt} 被赋予本地时区 {local_tz} -> {dt_aware}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"_parse_datetime: naive datetime {dt} 被赋予本地时区 {local_tz} -> {dt_aware}")
                 except Exception as e_tz_local:
                     self.logger.warning(f"_parse_datetime: 为 naive datetime {dt} 附加本地时区失败 ({e_tz_local})，将直接赋予 UTC。")
                     dt_aware = dt.replace(tzinfo=timezone.utc) # 假设 naive datetime 是 UTC
@@ -643,7 +878,8 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
                 dt_aware = dt # 已经是 aware
 
             dt_utc = dt_aware.astimezone(timezone.utc)
-            self.logger.debug(f"_parse_datetime: 日期字符串 '{date_string}' 成功解析并转换为 UTC: {dt_utc}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"_parse_datetime: 日期字符串 '{date_string}' 成功解析并转换为 UTC: {dt_utc}")
             return dt_utc
 
         except (ValueError, TypeError) as e_dateutil:
@@ -659,20 +895,24 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
             for fmt in common_formats:
                 try:
                     dt = datetime.strptime(date_string, fmt)
-                    self.logger.debug(f"_parse_datetime: strptime 使用格式 '{fmt}' 成功解析了 '{date_string}' 得到: {dt} (时区: {dt.tzinfo})")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"_parse_datetime: strptime 使用格式 '{fmt}' 成功解析了 '{date_string}' 得到: {dt} (时区: {dt.tzinfo})")
                      # 标准化为 UTC 时间 (同上)
                     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
                         try:
                             local_tz = datetime.now().astimezone().tzinfo
                             dt_aware = dt.replace(tzinfo=local_tz)
-                            self.logger.debug(f"_parse_datetime (strptime path): naive datetime {dt} 被赋予本地时区 {local_tz} -> {dt_aware}")
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug(f"_parse_datetime (strptime path): naive datetime {dt} 被赋予本地时区 {local_tz} -> {dt_aware}")
                         except Exception:
                             dt_aware = dt.replace(tzinfo=timezone.utc)
-                            self.logger.debug(f"_parse_datetime (strptime path): 为 naive datetime {dt} 附加本地时区失败，已直接赋予 UTC -> {dt_aware}")
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug(f"_parse_datetime (strptime path): 为 naive datetime {dt} 附加本地时区失败，已直接赋予 UTC -> {dt_aware}")
                     else:
                         dt_aware = dt
                     dt_utc = dt_aware.astimezone(timezone.utc)
-                    self.logger.debug(f"_parse_datetime: 日期字符串 '{date_string}' (使用 strptime fmt '{fmt}') 成功解析并转换为 UTC: {dt_utc}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"_parse_datetime: 日期字符串 '{date_string}' (使用 strptime fmt '{fmt}') 成功解析并转换为 UTC: {dt_utc}")
                     return dt_utc
                 except ValueError:
                     continue # 尝试下一个格式
@@ -717,7 +957,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
 
     # --- End LLM Analysis Data Management ---
 
-    def get_all_articles(self) -> List[NewsArticle]: # This method wasn't in the outline but seems to be used by storage.
+    def get_all_articles(self) -> List[NewsListRow]: # This method wasn't in the outline but seems to be used by storage.
         """返回当前新闻缓存中的所有文章。"""
         self.logger.info(f"get_all_articles: Returning {len(self.news_cache)} cached articles.")
         return self.news_cache
@@ -728,6 +968,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         设置当前选中的新闻文章，并发出信号。
         如果 article 为 None，表示取消选择。
         """
+        article = self.get_full_article(article) # 列表行 -> 含正文的完整文章
         current_title = self.selected_article.title if self.selected_article else "None"
         new_title = article.title if article else "None"
         self.logger.info(f"AppService.set_selected_news: Changing from '{current_title[:50]}...' to '{new_title[:50]}...'")
@@ -743,7 +984,7 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
     @Slot(str, int, int, int)
     def _handle_source_refresh_progress(self, source_name: str, progress_percent: int, total_sources: int, processed_sources: int):
         # +++ 日志：记录接收到的参数和即将发射的信号 +++
-        self.logger.info(f"AppService._handle_source_refresh_progress: 收到源 '{source_name}' 进度 {progress_percent}%. 已处理 {processed_sources}/{total_sources} 个源。准备发射 AppService.refresh_progress({processed_sources}, {total_sources}).")
+        self.logger.debug(f"AppService._handle_source_refresh_progress: 收到源 '{source_name}' 进度 {progress_percent}%. 已处理 {processed_sources}/{total_sources} 个源。准备发射 AppService.refresh_progress({processed_sources}, {total_sources}).")
         # AppService的refresh_progress信号期望 (current_value, total_value)
         # NewsUpdateService的source_refresh_progress信号提供 (source_name, progress_percent, total_sources, processed_sources)
         # 我们需要将 "已处理的源数量" 和 "总源数量" 传递给UI的进度条
@@ -756,6 +997,10 @@ class AppService(QObject): # 继承 QObject 以便使用信号槽
         """
         self.logger.info("AppService.shutdown() 开始执行清理...")
         try:
+            self.cancel_initial_load()
+            self._initial_load_pool.waitForDone(2000)
+            self.cancel_prefetch()
+            self._prefetch_pool.waitForDone(2000)
             if self.news_update_service and hasattr(self.news_update_service, 'shutdown'):
                 self.logger.info("正在关闭 NewsUpdateService...")
                 self.news_update_service.shutdown()
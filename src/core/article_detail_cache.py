@@ -0,0 +1,215 @@
+"""
+核心服务 - 文章详情缓存与后台预取
+
+内存中的新闻缓存只保存不含正文的 NewsListRow。单击/双击新闻时需要完整文章 (正文、摘要)，
+原先每次都在界面线程查询数据库，较长的正文还要在界面线程生成预览 HTML。
+
+ArticleDetailCache 按文章 ID 缓存完整的 NewsArticle 以及为它生成的 HTML (例如列表预览)，
+按估算的内存字节数做 LRU 淘汰。ArticleDetailPrefetcher 在后台线程中为即将查看的文章
+(当前选中项附近的文章、刷新后列表顶部的文章) 读取正文并预先生成 HTML，
+用户切换到这些文章时可以直接从缓存取得。
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal as pyqtSignal, Slot as pyqtSlot
+
+from src.core.cancellation_flag import CancellationFlag
+from src.models import NewsArticle
+
+# 每个缓存条目除文本外的固定开销 (NewsArticle 对象、日期、字典项等) 的粗略估计
+_ENTRY_OVERHEAD_BYTES = 1024
+
+
+def _text_bytes(value: Optional[str]) -> int:
+    return sys.getsizeof(value) if isinstance(value, str) else 0
+
+
+def estimate_article_bytes(article: NewsArticle) -> int:
+    """估算完整文章在内存中占用的字节数 (只计入文本字段，其余按固定开销计)。"""
+    return (_ENTRY_OVERHEAD_BYTES + _text_bytes(article.title) + _text_bytes(article.link)
+            + _text_bytes(article.content) + _text_bytes(article.summary))
+
+
+class _DetailEntry:
+    __slots__ = ('article', 'html', 'size')
+
+    def __init__(self, article: NewsArticle):
+        self.article = article
+        self.html: Dict[str, str] = {}
+        self.size = estimate_article_bytes(article)
+
+
+class ArticleDetailCache:
+    """
+    按文章 ID 缓存完整 NewsArticle 及其 HTML 的 LRU 缓存，总大小不超过 max_bytes。
+
+    可以在多个线程中同时使用 (后台预取写入，界面线程读取)。
+
+    Args:
+        max_bytes: 缓存的文章与 HTML 估算大小之和的上限，超出时淘汰最久未使用的文章。
+    """
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, _DetailEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, article_id: Any) -> bool:
+        return article_id in self._entries
+
+    def get(self, article_id: Any) -> Optional[NewsArticle]:
+        """返回缓存的完整文章并标记为最近使用；未缓存时返回 None。"""
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(article_id)
+            self.hits += 1
+            return entry.article
+
+    def put(self, article: NewsArticle):
+        """缓存一篇完整文章 (替换同一 ID 的旧条目及其 HTML)。没有 ID 的文章不缓存。"""
+        if article is None or article.id is None:
+            return
+        entry = _DetailEntry(article)
+        with self._lock:
+            previous = self._entries.pop(article.id, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self._entries[article.id] = entry
+            self.total_bytes += entry.size
+            self._evict()
+
+    def peek(self, article_id: Any) -> Optional[NewsArticle]:
+        """返回缓存的完整文章，不改变 LRU 次序和命中统计。"""
+        entry = self._entries.get(article_id)
+        return entry.article if entry is not None else None
+
+    def get_html(self, article_id: Any, kind: str) -> Optional[str]:
+        """返回为文章生成的某种 HTML (例如 'preview')；未生成时返回 None。"""
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(article_id)
+            return entry.html.get(kind)
+
+    def put_html(self, article_id: Any, kind: str, html: str):
+        """保存为文章生成的 HTML。文章本身未缓存 (或已被淘汰) 时忽略。"""
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is None:
+                return
+            size = _text_bytes(html) - _text_bytes(entry.html.get(kind))
+            entry.html[kind] = html
+            entry.size += size
+            self.total_bytes += size
+            self._evict()
+
+    def has_html(self, article_id: Any, kinds: Iterable[str]) -> bool:
+        """文章是否已缓存且各种 HTML 都已生成 (不影响 LRU 次序和命中统计)。"""
+        entry = self._entries.get(article_id)
+        return entry is not None and all(kind in entry.html for kind in kinds)
+
+    def discard(self, article_ids: Iterable[Any]) -> int:
+        """移除指定文章 (例如内容已被刷新更新或文章已删除)，返回实际移除的数量。"""
+        removed = 0
+        with self._lock:
+            for article_id in article_ids:
+                entry = self._entries.pop(article_id, None)
+                if entry is not None:
+                    self.total_bytes -= entry.size
+                    removed += 1
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'bytes': self.total_bytes, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def _evict(self):
+        # 调用方持有锁；至少保留最新的一篇，即使它单独超过上限
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+
+
+class ArticleDetailPrefetcher(QRunnable):
+    """
+    在后台线程中读取一组文章的正文，转换为 NewsArticle 放入 ArticleDetailCache，
+    并用 renderers 预先生成 HTML。已缓存且 HTML 齐全的文章会被跳过。
+
+    Args:
+        storage: 文件数据库的 NewsStorage (后台线程使用独立的只读连接)。
+        article_ids: 要预取的文章 ID，按优先级排列。
+        convert: 数据库字典 -> NewsArticle 的转换函数 (必须可以在后台线程调用)。
+        cache: 结果写入的缓存。
+        renderers: HTML 类型 -> 生成函数 (NewsArticle -> str)，必须是不依赖界面对象的纯函数。
+        cancel_flag: 设置后跳过尚未处理的文章 (例如选中项又发生了变化)。
+    """
+
+    class WorkerSignals(QObject):
+        # 第一个参数为本次预取的取消标志，接收方据此忽略已被新的预取取代的结果
+        finished = pyqtSignal(object, list, float)  # cancel_flag, 新缓存的文章 ID, 耗时 (秒)
+
+    def __init__(self, storage, article_ids: List[Any], convert: Callable[[Dict[str, Any]], Optional[NewsArticle]],
+                 cache: ArticleDetailCache, renderers: Optional[Dict[str, Callable[[NewsArticle], str]]] = None,
+                 cancel_flag: Optional[CancellationFlag] = None):
+        super().__init__()
+        self.logger = logging.getLogger('news_analyzer.core.article_detail_cache')
+        self.signals = ArticleDetailPrefetcher.WorkerSignals()
+        self.storage = storage
+        self.article_ids = list(article_ids)
+        self.convert = convert
+        self.cache = cache
+        self.renderers = dict(renderers or {})
+        self.cancel_flag = cancel_flag or CancellationFlag()
+
+    @pyqtSlot()
+    def run(self):
+        started = time.perf_counter()
+        prefetched = []
+        try:
+            kinds = list(self.renderers)
+            pending = [article_id for article_id in self.article_ids
+                       if article_id is not None and not self.cache.has_html(article_id, kinds)]
+            missing = [article_id for article_id in pending if article_id not in self.cache]
+            rows = self.storage.get_articles_by_ids(missing) if missing else []
+            rows_by_id = {row.get('id'): row for row in rows}
+            for article_id in pending:
+                if self.cancel_flag.is_set():
+                    break
+                article = self.cache.peek(article_id) # 已缓存但缺少某种 HTML 时只补生成 HTML
+                if article is None:
+                    row = rows_by_id.get(article_id)
+                    article = self.convert(row) if row is not None else None
+                    if article is None:
+                        continue
+                    self.cache.put(article)
+                for kind, render in self.renderers.items():
+                    self.cache.put_html(article_id, kind, render(article))
+                prefetched.append(article_id)
+        except Exception as e:
+            self.logger.error(f"预取文章详情失败: {e}", exc_info=True)
+        self.signals.finished.emit(self.cancel_flag, prefetched, time.perf_counter() - started)
@@ -0,0 +1,209 @@
+"""
+核心服务 - 可持久化的文章聚类特征
+
+EnhancedNewsClusterer 原来每次聚类都要对全部文章重新拟合标题/内容 TF-IDF、LDA 主题模型并提取实体。
+ArticleFeatureCache 把每篇文章的特征按文章 ID 保存在 ArticleFeatureStore 中，只为新增或内容变化的文章计算:
+
+  - 标题/内容词频: text_tokenizer.hashing_vectorizer 把词直接哈希到固定的 TERM_FEATURES 维，无需拟合词表，
+    不同次聚类得到的列含义相同。保存原始词频，聚类时按当前文章集合选出最常见的词并计算 IDF (只是按列求和，很快)
+  - 主题分布: LDA 模型训练一次后保存，新文章只需 transform；文章数增长到训练时的 2 倍以上时重新训练，
+    模型编号加一，旧模型算出的主题分布随之失效
+  - 实体集合: 按提取方式 ('simple' / 'llm') 保存，LLM 识别的实体跨进程复用
+
+特征行以内容哈希 (标题 + 正文) 校验，文章内容变化后自动重新计算；分词或哈希方式变化时提高 FEATURE_VERSION，
+旧特征全部失效 (中文分词方式 bigram / jieba 变化时同样失效)。没有整数 ID 的文章每次都重新计算，不写入存储。
+"""
+
+from __future__ import annotations  # np.ndarray 注解不在定义时求值，避免提前导入 numpy
+
+import hashlib
+import json
+import logging
+import pickle
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.core.text_tokenizer import hashing_vectorizer, resolve_segmenter
+from src.storage.article_feature_store import ArticleFeatureStore
+from src.utils.lazy_import import lazy_attr, lazy_module
+
+np = lazy_module('numpy')
+sparse = lazy_module('scipy.sparse')
+LatentDirichletAllocation = lazy_attr('sklearn.decomposition', 'LatentDirichletAllocation')
+
+FEATURE_VERSION = 2  # 词频的分词或哈希方式变化时加一
+TERM_FEATURES = 2 ** 20  # 标题/内容词频的维数 (稀疏，维数大只是减少哈希冲突)
+TOPIC_FEATURES = 2 ** 12  # LDA 输入词频的维数 (LDA 的参数量与维数成正比)
+TOPIC_MODEL_NAME = 'lda'
+TOPIC_FIT_SAMPLES = 5000  # 训练主题模型最多使用的文章数
+TOPIC_REFIT_GROWTH = 2  # 文章数超过训练时的这个倍数后重新训练
+
+
+def news_texts(news: Dict[str, Any]) -> tuple:
+    """聚类使用的 (标题, 正文)：优先取预处理后的 clean_title / clean_content。"""
+    return news.get('clean_title', news.get('title')) or '', news.get('clean_content', news.get('content')) or ''
+
+
+def content_hash(news: Dict[str, Any]) -> str:
+    title, content = news_texts(news)
+    return hashlib.blake2b(f"{title}\0{content}".encode('utf-8'), digest_size=16).hexdigest()
+
+
+def encode_sparse_row(indices: np.ndarray, values: np.ndarray) -> bytes:
+    """稀疏行 -> 字节串 (int32 列号在前，float32 值在后)。"""
+    return np.asarray(indices, dtype=np.int32).tobytes() + np.asarray(values, dtype=np.float32).tobytes()
+
+
+def decode_sparse_rows(blobs: Sequence[bytes], n_features: int) -> sparse.csr_matrix:
+    """encode_sparse_row 编码的若干行 -> CSR 矩阵 (float64)。"""
+    lengths = np.array([len(blob) // 8 for blob in blobs], dtype=np.int64)
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    indices = np.empty(int(indptr[-1]), dtype=np.int32)
+    data = np.empty(int(indptr[-1]), dtype=np.float32)
+    for row, blob in enumerate(blobs):
+        start, stop = indptr[row], indptr[row + 1]
+        if stop > start:
+            indices[start:stop] = np.frombuffer(blob, dtype=np.int32, count=stop - start)
+            data[start:stop] = np.frombuffer(blob, dtype=np.float32, offset=(stop - start) * 4)
+    return sparse.csr_matrix((data.astype(np.float64), indices, indptr), shape=(len(blobs), n_features))
+
+
+def _csr_row_blobs(matrix: sparse.csr_matrix) -> List[bytes]:
+    return [encode_sparse_row(matrix.indices[start:stop], matrix.data[start:stop])
+            for start, stop in zip(matrix.indptr[:-1], matrix.indptr[1:])]
+
+
+@dataclass
+class ArticleFeatures:
+    """一组文章的特征 (行顺序与输入一致)。"""
+    title_counts: Any  # CSR (n × TERM_FEATURES)，原始词频
+    content_counts: Any  # CSR (n × TERM_FEATURES)，原始词频
+    topics: Any  # ndarray (n × n_topics)，文档-主题分布
+    entities: List[List[str]]
+    computed: int = 0  # 本次重新计算了词频的文章数
+
+
+class ArticleFeatureCache:
+    """
+    按文章 ID 缓存聚类特征。
+
+    用法:
+        cache = ArticleFeatureCache(ArticleFeatureStore(storage.data_dir))
+        features = cache.features(processed_news, entity_sets=extract, entity_method='simple')
+    """
+
+    def __init__(self, store: ArticleFeatureStore, n_topics: int = 20, random_state: int = 42):
+        self.logger = logging.getLogger('news_analyzer.core.article_features')
+        self.store = store
+        self.n_topics = n_topics
+        self.random_state = random_state
+        self.topic_model = None
+        self.topic_model_id = 0
+        self._topic_doc_count = 0
+        signature = [FEATURE_VERSION, resolve_segmenter()]
+        if store.get_meta('feature_version') != signature:
+            store.clear()
+            store.set_meta('feature_version', signature)
+
+    def features(self, news_list: List[Dict[str, Any]], entity_sets: Callable[[List[Dict[str, Any]]], List[Any]],
+                 entity_method: str) -> ArticleFeatures:
+        """
+        返回 news_list 的特征，只为缓存中没有或已失效的文章计算，并把新结果写回存储。
+
+        Args:
+            news_list: 新闻列表 (通常是 EnhancedNewsClusterer 预处理后的)。
+            entity_sets: 为一组新闻提取实体集合的函数。
+            entity_method: 实体提取方式的名称，缓存的实体只在方式相同时复用。
+        """
+        started = time.perf_counter()
+        n_samples = len(news_list)
+        hashes = [content_hash(news) for news in news_list]
+        ids = [news.get('id') if self._cacheable(news.get('id')) else None for news in news_list]
+        stored = self.store.load_features([article_id for article_id in ids if article_id is not None])
+        rows: List[Optional[Dict[str, Any]]] = []
+        for article_id, digest in zip(ids, hashes):
+            row = stored.get(article_id) if article_id is not None else None
+            rows.append(row if row is not None and row['content_hash'] == digest else None)
+
+        # 1. 标题/内容词频
+        stale = [i for i, row in enumerate(rows) if row is None]
+        if stale:
+            texts = [news_texts(news_list[i]) for i in stale]
+            vectorizer = hashing_vectorizer(TERM_FEATURES)
+            title_blobs = _csr_row_blobs(vectorizer.transform([title for title, _ in texts]).tocsr())
+            content_blobs = _csr_row_blobs(vectorizer.transform([content for _, content in texts]).tocsr())
+            for k, i in enumerate(stale):
+                rows[i] = {'article_id': ids[i], 'content_hash': hashes[i], 'title_terms': title_blobs[k],
+                           'content_terms': content_blobs[k]}
+        changed = set(stale)
+
+        # 2. 主题分布 (主题模型重新训练后全部重算)
+        self._ensure_topic_model(news_list)
+        stale_topics = [i for i, row in enumerate(rows)
+                        if row.get('topic') is None or row.get('topic_model') != self.topic_model_id]
+        if stale_topics:
+            distribution = self.topic_model.transform(self._topic_counts([news_list[i] for i in stale_topics]))
+            for k, i in enumerate(stale_topics):
+                rows[i]['topic'] = distribution[k].astype(np.float32).tobytes()
+                rows[i]['topic_model'] = self.topic_model_id
+            changed.update(stale_topics)
+
+        # 3. 实体集合
+        stale_entities = [i for i, row in enumerate(rows)
+                          if row.get('entities') is None or row.get('entity_method') != entity_method]
+        if stale_entities:
+            extracted = entity_sets([news_list[i] for i in stale_entities])
+            for i, entities in zip(stale_entities, extracted):
+                rows[i]['entities'] = json.dumps(sorted(set(entities)), ensure_ascii=False)
+                rows[i]['entity_method'] = entity_method
+            changed.update(stale_entities)
+
+        self.store.save_features([rows[i] for i in sorted(changed) if ids[i] is not None])
+        features = ArticleFeatures(
+            title_counts=decode_sparse_rows([row['title_terms'] for row in rows], TERM_FEATURES),
+            content_counts=decode_sparse_rows([row['content_terms'] for row in rows], TERM_FEATURES),
+            topics=np.array([np.frombuffer(row['topic'], dtype=np.float32) for row in rows],
+                            dtype=np.float64).reshape(n_samples, self.n_topics),
+            entities=[json.loads(row['entities']) for row in rows],
+            computed=len(stale))
+        self.logger.info(f"文章特征: {n_samples} 篇，重新计算词频 {len(stale)} 篇、主题 {len(stale_topics)} 篇、"
+                         f"实体 {len(stale_entities)} 篇，耗时 {(time.perf_counter() - started) * 1000:.0f} ms")
+        return features
+
+    @staticmethod
+    def _cacheable(article_id: Any) -> bool:
+        return isinstance(article_id, int) and not isinstance(article_id, bool)
+
+    @staticmethod
+    def _topic_counts(news_list: List[Dict[str, Any]]) -> sparse.csr_matrix:
+        return hashing_vectorizer(TOPIC_FEATURES).transform([" ".join(news_texts(news)) for news in news_list])
+
+    def _ensure_topic_model(self, news_list: List[Dict[str, Any]]):
+        """加载已保存的主题模型；没有模型或文章数已增长到训练时的 TOPIC_REFIT_GROWTH 倍以上时重新训练。"""
+        if self.topic_model is None:
+            saved = self.store.load_model(TOPIC_MODEL_NAME)
+            if saved is not None:
+                try:
+                    self.topic_model = pickle.loads(saved['blob'])
+                    self.topic_model_id, self._topic_doc_count = saved['model_id'], saved['doc_count']
+                except Exception as e:  # sklearn 版本变化等，重新训练即可
+                    self.logger.warning(f"无法加载保存的主题模型，将重新训练: {e}")
+                    self.topic_model_id = saved['model_id']
+        if self.topic_model is not None and len(news_list) <= TOPIC_REFIT_GROWTH * self._topic_doc_count:
+            return
+
+        started = time.perf_counter()
+        sample = news_list
+        if len(news_list) > TOPIC_FIT_SAMPLES:
+            sample = random.Random(self.random_state).sample(news_list, TOPIC_FIT_SAMPLES)
+        model = LatentDirichletAllocation(n_components=self.n_topics, max_iter=10, learning_method='online',
+                                          random_state=self.random_state)
+        model.fit(self._topic_counts(sample))
+        self.topic_model = model
+        self.topic_model_id += 1
+        self._topic_doc_count = len(news_list)
+        self.store.save_model(TOPIC_MODEL_NAME, self.topic_model_id, self._topic_doc_count, pickle.dumps(model))
+        self.logger.info(f"主题模型已训练 (第 {self.topic_model_id} 版，{len(sample)} 篇样本)，"
+                         f"耗时 {(time.perf_counter() - started) * 1000:.0f} ms")
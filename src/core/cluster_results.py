@@ -0,0 +1,108 @@
+"""
+核心服务 - 可持久化的多特征聚类结果
+
+分组面板每次打开或重新加载都对同一批文章重新运行 EnhancedNewsClusterer.cluster()，即使文章和参数都没有变化。
+ClusterResultCache 把聚类得到的事件保存在 ClusterResultStore 中，键由两部分组成:
+
+  - 参数指纹: EnhancedNewsClusterer._result_params() (聚类参数、特征权重、分类关键词、是否使用 LLM)，
+    加上 RESULT_VERSION、FEATURE_VERSION 和中文分词方式；fine_workers / fine_backend 不影响结果，不计入
+  - 输入指纹: 按 ID 排序的 (文章 ID, 文章指纹)，文章指纹为标题、正文、发布时间和来源的哈希
+
+参数和输入都相同时直接返回保存的事件，报道仍取本次输入的预处理结果。
+输入是某次已保存聚类的超集时 (新文章到达)，previous() 返回那次的事件，由聚类器只重新聚类新文章及与其时间相近的旧事件。
+
+文章缺少整数 ID 或 ID 重复时不缓存。
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.core.article_features import FEATURE_VERSION, news_texts
+from src.core.text_tokenizer import resolve_segmenter
+from src.storage.cluster_result_store import ClusterResultStore
+
+RESULT_VERSION = 1  # 事件的编码或聚类流程变化时加一
+MAX_RUNS = 8  # 保存最近的聚类次数
+EVENT_FIELDS = ('event_id', 'title', 'summary', 'keywords', 'category', 'sources')  # 报道只保存文章 ID
+
+
+def article_fingerprint(news: Dict[str, Any]) -> str:
+    """标题、正文、发布时间和来源的哈希：任何一项变化都会改变聚类结果。"""
+    title, content = news_texts(news)
+    publish_time = news.get('publish_time')
+    payload = [title, content, str(publish_time) if publish_time else None, news.get('source_name', news.get('source'))]
+    return hashlib.blake2b(json.dumps(payload, ensure_ascii=False).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _digest(value: Any) -> str:
+    return hashlib.blake2b(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+@dataclass
+class ClusterKey:
+    """一次聚类的缓存键。"""
+    params_key: str
+    input_key: str
+    articles: Dict[int, str]  # 文章 ID -> 文章指纹
+
+
+class ClusterResultCache:
+    """
+    按输入和参数缓存 EnhancedNewsClusterer 的聚类结果。
+
+    用法:
+        cache = ClusterResultCache(ClusterResultStore(storage.data_dir))
+        key = cache.key(news_list, clusterer._result_params())   # None 表示这批文章不能缓存
+        events = cache.exact(key, processed_by_id)               # 没有保存过时为 None
+        cache.save(key, events)
+    """
+
+    def __init__(self, store: ClusterResultStore, max_runs: int = MAX_RUNS):
+        self.logger = logging.getLogger('news_analyzer.core.cluster_results')
+        self.store = store
+        self.max_runs = max_runs
+
+    def key(self, news_list: List[Dict[str, Any]], params: Dict[str, Any]) -> Optional[ClusterKey]:
+        ids = [news.get('id') for news in news_list]
+        if not all(isinstance(article_id, int) and not isinstance(article_id, bool) for article_id in ids) \
+                or len(set(ids)) != len(ids):
+            return None
+        articles = {article_id: article_fingerprint(news) for article_id, news in zip(ids, news_list)}
+        return ClusterKey(params_key=_digest([RESULT_VERSION, FEATURE_VERSION, resolve_segmenter(), params]),
+                          input_key=_digest(sorted(articles.items())), articles=articles)
+
+    def exact(self, key: ClusterKey, news_by_id: Dict[int, Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """参数和输入都相同的上次结果 (报道取自 news_by_id)，没有时返回 None。"""
+        run = self.store.find_run(key.params_key, key.input_key)
+        return self._decode(run['events'], news_by_id) if run else None
+
+    def previous(self, key: ClusterKey, news_by_id: Dict[int, Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        参数相同、文章是本次输入子集 (且这些文章没有变化) 的最大一次聚类结果，没有时返回 None。
+        """
+        for run in self.store.smaller_runs(key.params_key, len(key.articles)):
+            if all(key.articles.get(article_id) == digest for article_id, digest in run['articles'].items()):
+                return self._decode(run['events'], news_by_id)
+        return None
+
+    def save(self, key: ClusterKey, events: List[Dict[str, Any]]):
+        encoded = [dict({field: event.get(field) for field in EVENT_FIELDS},
+                        report_ids=[report['id'] for report in event['reports']]) for event in events]
+        try:
+            self.store.save_run(key.params_key, key.input_key, key.articles, encoded, self.max_runs)
+        except Exception as e:  # 缓存写入失败不影响聚类结果
+            self.logger.warning(f"无法保存聚类结果: {e}")
+
+    @staticmethod
+    def _decode(encoded: List[Dict[str, Any]], news_by_id: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        events = []
+        for item in encoded:
+            reports = [news_by_id[article_id] for article_id in item['report_ids']]
+            event = {field: item.get(field) for field in EVENT_FIELDS}
+            event.update(reports=reports, publish_time=min(news['publish_time'] for news in reports))
+            events.append(event)
+        return events
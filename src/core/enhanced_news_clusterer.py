@@ -7,34 +7,70 @@
 提供更精确的新闻分类和聚类功能。
 """
 
+from __future__ import annotations  # np.ndarray 注解不在定义时求值，避免提前导入 numpy
+
 import logging
+import multiprocessing
 import re
 import os
 import json
-import numpy as np
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Tuple, Set, Optional, Any
 from datetime import datetime, timedelta
 from collections import Counter
 
-# 基础NLP工具
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.decomposition import LatentDirichletAllocation
-
 # 导入项目模块
 from src.collectors.categories import STANDARD_CATEGORIES
 from src.llm.llm_service import LLMService
+from src.core.article_features import ArticleFeatureCache
+from src.core.cluster_results import ClusterKey, ClusterResultCache
+from src.core.fine_clustering import (CHUNK_ARTICLES, FINE_BACKENDS, FineResult, SharedSimilarity, chunk_clusters,
+                                      fine_cluster_chunk, representative_index)
+from src.core.keyword_matcher import keyword_matcher
+from src.core.news_query_index import datetime_to_epoch_us
+from src.core.text_tokenizer import (hashing_vectorizer, keywords as title_keywords, most_frequent_columns,
+                                     tfidf_from_counts, tokenize)
+from src.storage.article_feature_store import ArticleFeatureStore
+from src.storage.cluster_result_store import ClusterResultStore
+from src.utils.lazy_import import lazy_attr, lazy_module
+from src.core.similarity_kernels import (cosine_rows, cosine_similarity_matrix, epoch_seconds,
+                                         gaussian_time_similarity, incidence_matrix, jaccard_rows,
+                                         jaccard_similarity_matrix, paired_cosine, paired_gaussian_time,
+                                         paired_jaccard, top_k_neighbours, unique_pairs)
+
+# 基础NLP工具: numpy / scikit-learn 导入约需 1 秒，首次聚类时才加载
+np = lazy_module('numpy')
+cosine_similarity = lazy_attr('sklearn.metrics.pairwise', 'cosine_similarity')
+AgglomerativeClustering = lazy_attr('sklearn.cluster', 'AgglomerativeClustering')
+LatentDirichletAllocation = lazy_attr('sklearn.decomposition', 'LatentDirichletAllocation')
+normalize = lazy_attr('sklearn.preprocessing', 'normalize')
+sparse = lazy_module('scipy.sparse')
+connected_components = lazy_attr('scipy.sparse.csgraph', 'connected_components')
+
+# 出现任意一个时 _categorize_news 直接归为文化类别 (均在 culture 的关键词列表中)
+CULTURE_PRIORITY_KEYWORDS = ("architect", "建筑师", "gaudí", "教皇", "pope", "sainthood", "圣人")
+
+# 加入新文章时需要重新聚类的文章超过全部文章的这个比例，就全部重新聚类
+PARTIAL_RECLUSTER_SHARE = 0.5
 
 
 class EnhancedNewsClusterer:
     """增强型新闻聚类器，使用多特征融合方法实现更精确的新闻分类和聚类"""
     
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(self, llm_service: Optional[LLMService] = None,
+                 feature_store: Optional[ArticleFeatureStore] = None,
+                 result_store: Optional[ClusterResultStore] = None):
         """初始化增强型新闻聚类器
         
         Args:
             llm_service: LLM服务实例，用于语义分析和实体识别
+            feature_store: 文章特征存储；提供时词频、主题分布和实体按文章缓存，
+                只为新增或内容变化的文章计算 (见 ArticleFeatureCache)
+            result_store: 聚类结果存储；提供时文章和参数都没有变化的聚类直接返回上次的事件，
+                新增文章时只重新聚类与其时间相近的部分 (见 ClusterResultCache)
         """
         self.logger = logging.getLogger('news_analyzer.core.enhanced_news_clusterer')
         self.llm_service = llm_service
@@ -44,6 +80,17 @@ class EnhancedNewsClusterer:
         self.min_samples = 2  # DBSCAN的最小样本数参数
         self.similarity_threshold = 0.5  # 相似度阈值，调高以提高精度
         self.time_window = 3  # 时间窗口（天），同一事件的新闻时间应该接近
+        self.coarse_distance_threshold = 0.5  # 粗分类的距离阈值 (1 - 融合相似度)
+        
+        # 稀疏模式: n×n 相似度矩阵在 1 万篇新闻时约 800 MB。文章数达到 sparse_min_samples 时
+        # ('auto')，每种特征只保留每篇新闻最相似的 n_neighbors 篇，在稀疏近邻图上聚类，内存为 O(n·k)
+        self.clustering_mode = 'auto'  # 'dense' / 'sparse' / 'auto'
+        self.sparse_min_samples = 2000
+        self.n_neighbors = 15
+        
+        # 细分组: 各粗分类簇相互独立，fine_workers > 1 时交给线程池或进程池并行 (见 fine_clustering.py)
+        self.fine_workers = 1
+        self.fine_backend = 'thread'  # 'thread' / 'process'
         
         # 特征权重
         self.weights = {
@@ -150,6 +197,8 @@ class EnhancedNewsClusterer:
         # 缓存
         self.entity_cache = {}  # 实体识别缓存
         self.topic_cache = {}  # 主题分析缓存
+        self.feature_cache = ArticleFeatureCache(feature_store, n_topics=self.n_topics) if feature_store else None
+        self.result_cache = ClusterResultCache(result_store) if result_store else None
     
     def cluster(self, news_list: List[Dict]) -> List[Dict]:
         """将新闻列表聚类为事件组，使用多特征融合方法
@@ -169,14 +218,12 @@ class EnhancedNewsClusterer:
         # 1. 预处理新闻数据
         processed_news = self._preprocess_news(news_list)
         
-        # 2. 提取多维特征
-        features = self._extract_features(processed_news)
-        
-        # 3. 使用层次聚类进行粗分类
-        coarse_clusters = self._coarse_clustering(features, processed_news)
-        
-        # 4. 对每个粗分类簇进行细分组
-        events = self._fine_clustering(coarse_clusters, features, processed_news)
+        # 2-4. 特征、粗分类、细分组；有聚类结果存储时先查找上次的结果
+        key = self.result_cache.key(news_list, self._result_params()) if self.result_cache else None
+        if key is None:
+            events = self._cluster_events(processed_news)
+        else:
+            events = self._cached_cluster_events(key, processed_news)
         
         # 5. 整理聚类结果
         sorted_events = sorted(events, key=lambda x: len(x["reports"]), reverse=True)
@@ -184,6 +231,78 @@ class EnhancedNewsClusterer:
         self.logger.info(f"聚类完成，共生成 {len(sorted_events)} 个事件组")
         return sorted_events
     
+    def _cluster_events(self, processed_news: List[Dict]) -> List[Dict]:
+        """对预处理后的新闻提取特征、粗分类并细分组，返回事件列表 (未排序)"""
+        # 提取多维特征并融合为相似度 (稠密矩阵或稀疏近邻图)
+        # 粗分类：稠密模式用层次聚类，稀疏模式取近邻图的连通分量
+        if self._use_sparse_mode(len(processed_news)):
+            similarity = self._build_similarity_graph(self._extract_sparse_features(processed_news))
+            coarse_clusters = self._coarse_clustering_sparse(similarity)
+        else:
+            similarity = self._fuse_features(self._extract_features(processed_news))
+            coarse_clusters = self._coarse_clustering(similarity)
+        
+        # 对每个粗分类簇进行细分组
+        return self._fine_clustering(coarse_clusters, similarity, processed_news)
+    
+    def _cached_cluster_events(self, key: ClusterKey, processed_news: List[Dict]) -> List[Dict]:
+        """文章和参数都没有变化时返回上次的事件；输入是上次的超集时在上次的事件上加入新文章；结果写回存储"""
+        news_by_id = {news['id']: news for news in processed_news}
+        events = self.result_cache.exact(key, news_by_id)
+        if events is not None:
+            self.logger.info(f"文章和聚类参数未变化，使用保存的 {len(events)} 个事件")
+            return events
+        
+        previous = self.result_cache.previous(key, news_by_id)
+        events = self._extend_events(previous, processed_news) if previous is not None else None
+        if events is None:
+            events = self._cluster_events(processed_news)
+        self.result_cache.save(key, events)
+        return events
+    
+    def _extend_events(self, previous: List[Dict], processed_news: List[Dict]) -> Optional[List[Dict]]:
+        """在上次的事件上加入新文章
+        
+        只重新聚类新文章，以及时间范围与新文章相距不超过 time_window 的旧事件中的文章；其余旧事件原样保留。
+        与全部重新聚类相比，TF-IDF 的文档频率等只在重新聚类的文章上统计，结果可能略有不同。
+        
+        Returns:
+            事件列表 (未排序)；需要重新聚类的文章超过 PARTIAL_RECLUSTER_SHARE 时返回 None (应全部重新聚类)
+        """
+        known = {report['id'] for event in previous for report in event['reports']}
+        new_times = [datetime_to_epoch_us(news['publish_time']) for news in processed_news if news['id'] not in known]
+        window = int(self.time_window * 86400 * 1e6)
+        earliest, latest = min(new_times) - window, max(new_times) + window
+        
+        kept, reopened = [], set()
+        for event in previous:
+            times = [datetime_to_epoch_us(report['publish_time']) for report in event['reports']]
+            if max(times) < earliest or min(times) > latest:
+                kept.append(event)
+            else:
+                reopened.update(report['id'] for report in event['reports'])
+        recluster = [news for news in processed_news if news['id'] not in known or news['id'] in reopened]
+        if len(recluster) > PARTIAL_RECLUSTER_SHARE * len(processed_news):
+            return None
+        
+        self.logger.info(f"在上次的 {len(previous)} 个事件上加入 {len(new_times)} 篇新文章: "
+                         f"保留 {len(kept)} 个事件，重新聚类 {len(recluster)} 篇")
+        events = kept + self._cluster_events(recluster)
+        for k, event in enumerate(events):
+            event["event_id"] = f"event_{k}"
+        return events
+    
+    def _result_params(self) -> Dict[str, Any]:
+        """影响聚类结果的参数 (聚类结果缓存的参数指纹)"""
+        return {
+            'eps': self.eps, 'min_samples': self.min_samples, 'similarity_threshold': self.similarity_threshold,
+            'time_window': self.time_window, 'coarse_distance_threshold': self.coarse_distance_threshold,
+            'mode': self.clustering_mode, 'sparse_min_samples': self.sparse_min_samples,
+            'n_neighbors': self.n_neighbors, 'n_topics': self.n_topics, 'weights': self.weights,
+            'category_keywords': self.category_keywords,
+            'llm': bool(self.llm_service and self.llm_service.is_configured()),
+        }
+    
     def _preprocess_news(self, news_list: List[Dict]) -> List[Dict]:
         """预处理新闻数据，包括文本清洗、时间标准化等
         
@@ -232,23 +351,8 @@ class EnhancedNewsClusterer:
         Returns:
             特征字典，包含不同类型的特征矩阵
         """
-        # 提取文本
-        titles = [news.get('clean_title', '') for news in news_list]
-        contents = [news.get('clean_content', '') for news in news_list]
-        combined_texts = [f"{t} {c}" for t, c in zip(titles, contents)]
-        
-        # 1. 提取TF-IDF特征
-        title_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-        title_tfidf = title_vectorizer.fit_transform(titles)
-        
-        content_vectorizer = TfidfVectorizer(max_features=2000, stop_words='english')
-        content_tfidf = content_vectorizer.fit_transform(contents)
-        
-        # 2. 提取命名实体特征
-        entity_features = self._extract_entity_features(news_list)
-        
-        # 3. 提取主题模型特征
-        topic_features = self._extract_topic_features(combined_texts)
+        # 1-3. TF-IDF、命名实体和主题分布
+        title_tfidf, content_tfidf, entity_sets, topic_distribution = self._extract_base_features(news_list)
         
         # 4. 提取时间接近度特征
         time_features = self._extract_time_features(news_list)
@@ -256,11 +360,69 @@ class EnhancedNewsClusterer:
         return {
             'title_tfidf': title_tfidf,
             'content_tfidf': content_tfidf,
-            'entity': entity_features,
-            'topic': topic_features,
+            'entity': jaccard_similarity_matrix(entity_sets),
+            'topic': cosine_similarity_matrix(topic_distribution),
             'time': time_features
         }
     
+    def _extract_sparse_features(self, news_list: List[Dict]) -> Dict[str, Any]:
+        """提取稀疏模式使用的特征表示 (不含 n×n 矩阵)
+        
+        Args:
+            news_list: 预处理后的新闻列表
+            
+        Returns:
+            特征字典: 行归一化的标题/内容 TF-IDF (稀疏)、实体 0/1 关联矩阵 (稀疏)、
+            行归一化的文档-主题分布、发布时间 (秒)
+        """
+        title_tfidf, content_tfidf, entity_sets, topic_distribution = self._extract_base_features(news_list)
+        return {
+            'title_tfidf': normalize(title_tfidf),
+            'content_tfidf': normalize(content_tfidf),
+            'entity': incidence_matrix(entity_sets),
+            'topic': normalize(topic_distribution),
+            'time': epoch_seconds([news.get('publish_time', datetime.now()) for news in news_list])
+        }
+    
+    def _extract_base_features(self, news_list: List[Dict]) -> Tuple[Any, Any, List[Any], np.ndarray]:
+        """标题/内容 TF-IDF、实体集合和文档-主题分布
+        
+        配置了特征存储时从缓存读取 (只为新文章计算)，与 _extract_tfidf_features 一样只保留
+        本次文章集合中最常见的词，IDF 也按本次的文章集合计算；否则全部重新拟合。
+        """
+        if self.feature_cache is None:
+            title_tfidf, content_tfidf = self._extract_tfidf_features(news_list)
+            return (title_tfidf, content_tfidf, self._extract_entity_sets(news_list),
+                    self._extract_topic_distribution(self._combined_texts(news_list)))
+        
+        entity_method = 'llm' if self.llm_service and self.llm_service.is_configured() else 'simple'
+        features = self.feature_cache.features(news_list, self._extract_entity_sets, entity_method)
+        self.lda_model = self.feature_cache.topic_model
+        return (tfidf_from_counts(features.title_counts, max_features=1000),
+                tfidf_from_counts(features.content_counts, max_features=2000),
+                features.entities, features.topics)
+    
+    def _extract_tfidf_features(self, news_list: List[Dict]) -> Tuple[Any, Any]:
+        """标题与内容的 TF-IDF 稀疏矩阵"""
+        titles = [news.get('clean_title', '') for news in news_list]
+        contents = [news.get('clean_content', '') for news in news_list]
+        
+        # 中英文统一分词后哈希为词频，只保留最常见的词再计算 TF-IDF
+        vectorizer = hashing_vectorizer()
+        title_tfidf = tfidf_from_counts(vectorizer.transform(titles), max_features=1000)
+        content_tfidf = tfidf_from_counts(vectorizer.transform(contents), max_features=2000)
+        return title_tfidf, content_tfidf
+    
+    @staticmethod
+    def _combined_texts(news_list: List[Dict]) -> List[str]:
+        return [f"{news.get('clean_title', '')} {news.get('clean_content', '')}" for news in news_list]
+    
+    def _extract_entity_sets(self, news_list: List[Dict]) -> List[Any]:
+        """每篇新闻的实体集合：配置了 LLM 服务时由 LLM 识别，否则使用简单规则"""
+        if self.llm_service and self.llm_service.is_configured():
+            return self._extract_entity_sets_with_llm(news_list)
+        return [self._simple_entities(news) for news in news_list]
+    
     def _extract_entity_features(self, news_list: List[Dict]) -> np.ndarray:
         """提取命名实体特征
         
@@ -286,14 +448,15 @@ class EnhancedNewsClusterer:
         Returns:
             实体特征矩阵
         """
-        # 实体特征矩阵初始化
-        n_samples = len(news_list)
-        entity_features = np.zeros((n_samples, n_samples))
-        
+        # 计算实体相似度矩阵 (实体文本小写后的 Jaccard 相似度)
+        return jaccard_similarity_matrix(self._extract_entity_sets_with_llm(news_list))
+    
+    def _extract_entity_sets_with_llm(self, news_list: List[Dict]) -> List[List[str]]:
+        """使用LLM识别每篇新闻的实体，返回小写后的实体文本列表"""
         # 提取每篇新闻的实体
         news_entities = []
         
-        for i, news in enumerate(news_list):
+        for news in news_list:
             # 检查缓存
             news_id = news.get('id', '')
             if news_id and news_id in self.entity_cache:
@@ -326,34 +489,7 @@ class EnhancedNewsClusterer:
             
             news_entities.append(entities)
         
-        # 计算实体相似度矩阵
-        for i in range(n_samples):
-            for j in range(i, n_samples):
-                if i == j:
-                    entity_features[i, j] = 1.0
-                    continue
-                
-                entities_i = news_entities[i]
-                entities_j = news_entities[j]
-                
-                # 计算实体重叠度
-                if not entities_i or not entities_j:
-                    similarity = 0.0
-                else:
-                    # 提取实体文本
-                    texts_i = [e.get('text', '').lower() for e in entities_i]
-                    texts_j = [e.get('text', '').lower() for e in entities_j]
-                    
-                    # 计算Jaccard相似度
-                    intersection = len(set(texts_i) & set(texts_j))
-                    union = len(set(texts_i) | set(texts_j))
-                    
-                    similarity = intersection / union if union > 0 else 0.0
-                
-                entity_features[i, j] = similarity
-                entity_features[j, i] = similarity
-        
-        return entity_features
+        return [[e.get('text', '').lower() for e in entities] for entities in news_entities]
     
     def _extract_entity_features_simple(self, news_list: List[Dict]) -> np.ndarray:
         """使用简单规则提取实体特征
@@ -364,62 +500,24 @@ class EnhancedNewsClusterer:
         Returns:
             实体特征矩阵
         """
-        # 实体特征矩阵初始化
-        n_samples = len(news_list)
-        entity_features = np.zeros((n_samples, n_samples))
-        
-        # 提取每篇新闻的实体
-        news_entities = []
-        
-        for news in news_list:
-            title = news.get('clean_title', '')
-            content = news.get('clean_content', '')[:500]  # 只使用前500个字符
-            
-            # 提取大写开头的词（可能是人名、地名、组织名等）
-            title_words = title.split()
-            content_words = content.split()
-            
-            # 英文文本：提取大写开头的词
-            if re.search(r'[a-zA-Z]', title + content):
-                entities = [word for word in title_words + content_words 
-                           if word and word[0].isupper()]
-            # 中文文本：提取2-4个字的词
-            else:
-                # 简单分词
-                entities = []
-                for text in [title, content]:
-                    for i in range(len(text)):
-                        for j in range(2, 5):  # 提取2-4个字的词
-                            if i + j <= len(text):
-                                entities.append(text[i:i+j])
-            
-            # 提取数字（可能是日期、数量等）
-            numbers = re.findall(r'\d+', title + content)
-            
-            # 合并实体
-            all_entities = entities + numbers
-            news_entities.append(all_entities)
-        
-        # 计算实体相似度矩阵
-        for i in range(n_samples):
-            for j in range(i, n_samples):
-                if i == j:
-                    entity_features[i, j] = 1.0
-                    continue
-                
-                entities_i = set(news_entities[i])
-                entities_j = set(news_entities[j])
-                
-                # 计算Jaccard相似度
-                intersection = len(entities_i & entities_j)
-                union = len(entities_i | entities_j)
-                
-                similarity = intersection / union if union > 0 else 0.0
-                
-                entity_features[i, j] = similarity
-                entity_features[j, i] = similarity
-        
-        return entity_features
+        news_entities = [self._simple_entities(news) for news in news_list]
+        # 计算实体相似度矩阵 (Jaccard 相似度，稀疏关联矩阵相乘)
+        return jaccard_similarity_matrix(news_entities)
+
+    @staticmethod
+    def _simple_entities(news: Dict) -> Set[str]:
+        """简单规则提取的实体集合：英文取大写开头的词，中文取标题与正文前 500 字的分词结果，另加数字。"""
+        title = news.get('clean_title', '')
+        content = news.get('clean_content', '')[:500]  # 只使用前500个字符
+        
+        # 英文：提取大写开头的词（可能是人名、地名、组织名等）
+        entities = {word for word in title.split() + content.split() if word[0].isupper()}
+        # 中文：词典分词或相邻两字 (见 text_tokenizer)，原来枚举全部 2-4 字子串
+        entities.update(token for token in tokenize(f"{title} {content}") if token[0] >= '㐀')
+        
+        # 提取数字（可能是日期、数量等）
+        entities.update(re.findall(r'\d+', title + content))
+        return entities
     
     def _extract_topic_features(self, texts: List[str]) -> np.ndarray:
         """提取主题模型特征
@@ -430,9 +528,13 @@ class EnhancedNewsClusterer:
         Returns:
             主题特征矩阵
         """
-        # 使用CountVectorizer进行词频统计
-        vectorizer = CountVectorizer(max_features=1000, stop_words='english')
-        X = vectorizer.fit_transform(texts)
+        # 计算主题相似度矩阵 (文档-主题分布的余弦相似度)
+        return cosine_similarity_matrix(self._extract_topic_distribution(texts))
+    
+    def _extract_topic_distribution(self, texts: List[str]) -> np.ndarray:
+        """训练 LDA 模型并返回文档-主题分布 (n × n_topics)"""
+        # 词频统计 (中英文统一分词，只保留最常见的 1000 个词)
+        X = most_frequent_columns(hashing_vectorizer().transform(texts), 1000)
         
         # 训练LDA模型
         self.lda_model = LatentDirichletAllocation(
@@ -443,28 +545,7 @@ class EnhancedNewsClusterer:
         )
         
         # 获取文档-主题分布
-        doc_topic_dist = self.lda_model.fit_transform(X)
-        
-        # 计算主题相似度矩阵
-        n_samples = len(texts)
-        topic_features = np.zeros((n_samples, n_samples))
-        
-        for i in range(n_samples):
-            for j in range(i, n_samples):
-                if i == j:
-                    topic_features[i, j] = 1.0
-                    continue
-                
-                # 计算余弦相似度
-                similarity = cosine_similarity(
-                    doc_topic_dist[i].reshape(1, -1),
-                    doc_topic_dist[j].reshape(1, -1)
-                )[0, 0]
-                
-                topic_features[i, j] = similarity
-                topic_features[j, i] = similarity
-        
-        return topic_features
+        return self.lda_model.fit_transform(X)
     
     def _extract_time_features(self, news_list: List[Dict]) -> np.ndarray:
         """提取时间接近度特征
@@ -478,84 +559,83 @@ class EnhancedNewsClusterer:
         # 获取发布时间
         times = [news.get('publish_time', datetime.now()) for news in news_list]
         
-        # 计算时间接近度矩阵
-        n_samples = len(news_list)
-        time_features = np.zeros((n_samples, n_samples))
-        
-        for i in range(n_samples):
-            for j in range(i, n_samples):
-                if i == j:
-                    time_features[i, j] = 1.0
-                    continue
-                
-                # 计算时间差（天）
-                time_diff = abs((times[i] - times[j]).total_seconds()) / (24 * 3600)
-                
-                # 使用高斯衰减函数计算时间接近度
-                # 时间差越小，接近度越高；超过时间窗口，接近度接近0
-                similarity = np.exp(-(time_diff ** 2) / (2 * self.time_window ** 2))
-                
-                time_features[i, j] = similarity
-                time_features[j, i] = similarity
-        
-        return time_features
+        # 使用高斯衰减函数计算时间接近度
+        # 时间差越小，接近度越高；超过时间窗口，接近度接近0
+        return gaussian_time_similarity(epoch_seconds(times), self.time_window)
     
-    def _coarse_clustering(self, features: Dict[str, np.ndarray], news_list: List[Dict]) -> List[List[int]]:
+    def _use_sparse_mode(self, n_samples: int) -> bool:
+        if self.clustering_mode == 'auto':
+            return n_samples >= self.sparse_min_samples
+        return self.clustering_mode == 'sparse'
+    
+    def _coarse_clustering(self, similarity_matrix: np.ndarray) -> List[List[int]]:
         """使用层次聚类进行粗分类
         
         Args:
-            features: 特征字典
-            news_list: 预处理后的新闻列表
+            similarity_matrix: 融合后的相似度矩阵
             
         Returns:
             粗分类结果，每个元素是一个索引列表
         """
-        # 融合多维特征
-        similarity_matrix = self._fuse_features(features)
-        
-        # 将相似度矩阵转换为距离矩阵
-        distance_matrix = 1 - similarity_matrix
+        # 将相似度矩阵转换为距离矩阵 (浮点误差可能使对角线略小于 0)
+        distance_matrix = np.clip(1 - similarity_matrix, 0.0, None)
         
         # 使用层次聚类
         clustering = AgglomerativeClustering(
             n_clusters=None,
-            distance_threshold=0.5,  # 距离阈值
-            affinity='precomputed',
+            distance_threshold=self.coarse_distance_threshold,  # 距离阈值
+            metric='precomputed',
             linkage='average'
         )
         
         # 执行聚类
         labels = clustering.fit_predict(distance_matrix)
+        return self._group_labels(labels)
+    
+    def _coarse_clustering_sparse(self, similarity_graph) -> List[List[int]]:
+        """稀疏模式的粗分类：只保留距离不超过阈值的边，取连通分量
+        
+        与稠密模式的平均链接层次聚类相比，连通分量相当于单链接，粗分类可能更大，
+        由细分组 (DBSCAN) 再拆开。
         
-        # 整理聚类结果
+        Args:
+            similarity_graph: 稀疏的融合相似度图 (见 _build_similarity_graph)
+            
+        Returns:
+            粗分类结果，每个元素是一个索引列表
+        """
+        edges = similarity_graph.copy()
+        edges.data = (edges.data >= 1 - self.coarse_distance_threshold).astype(np.float64)
+        edges.eliminate_zeros()
+        _, labels = connected_components(edges, directed=False)
+        return self._group_labels(labels)
+    
+    @staticmethod
+    def _group_labels(labels) -> List[List[int]]:
+        # 整理聚类结果 (按标签首次出现的顺序)
         clusters = {}
         for i, label in enumerate(labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(i)
-        
+            clusters.setdefault(label, []).append(i)
         return list(clusters.values())
     
-    def _fine_clustering(self, coarse_clusters: List[List[int]], features: Dict[str, np.ndarray], news_list: List[Dict]) -> List[Dict]:
+    def _fine_clustering(self, coarse_clusters: List[List[int]], similarity_matrix, news_list: List[Dict]) -> List[Dict]:
         """对粗分类结果进行细分组
         
         Args:
             coarse_clusters: 粗分类结果
-            features: 特征字典
+            similarity_matrix: 融合后的相似度 (稠密矩阵或稀疏近邻图)
             news_list: 预处理后的新闻列表
             
         Returns:
             事件组列表
         """
         events = []
-        
-        # 融合特征
-        similarity_matrix = self._fuse_features(features)
+        results = self._fine_cluster_results(coarse_clusters, similarity_matrix)
         
         # 对每个粗分类簇进行细分组
-        for cluster_indices in coarse_clusters:
+        for cluster_indices, result in zip(coarse_clusters, results):
             # 如果簇只有一个元素，直接创建事件
-            if len(cluster_indices) == 1:
+            if result is None:
                 idx = cluster_indices[0]
                 news = news_list[idx]
                 
@@ -573,15 +653,8 @@ class EnhancedNewsClusterer:
                 events.append(event)
                 continue
             
-            # 提取子矩阵
-            sub_matrix = np.zeros((len(cluster_indices), len(cluster_indices)))
-            for i, idx_i in enumerate(cluster_indices):
-                for j, idx_j in enumerate(cluster_indices):
-                    sub_matrix[i, j] = similarity_matrix[idx_i, idx_j]
-            
-            # 使用DBSCAN进行细分组
-            clustering = DBSCAN(eps=self.eps, min_samples=self.min_samples, metric='precomputed')
-            labels = clustering.fit_predict(1 - sub_matrix)  # 转换为距离矩阵
+            # DBSCAN 细分组的标签和各细分组的代表新闻 (见 fine_clustering.py)
+            labels, representatives, _ = result
             
             # 整理细分组结果
             sub_clusters = {}
@@ -609,14 +682,13 @@ class EnhancedNewsClusterer:
                     sub_clusters[label].append(cluster_indices[i])
             
             # 为每个细分组创建事件
-            for sub_cluster in sub_clusters.values():
+            for label, sub_cluster in sub_clusters.items():
                 # 收集新闻报道
                 reports = [news_list[idx] for idx in sub_cluster]
                 sources = set(news.get('source_name', '未知来源') for news in reports)
                 
                 # 选择代表性新闻作为事件标题和摘要
-                representative_idx = self._find_representative_news(sub_cluster, similarity_matrix)
-                representative_news = news_list[representative_idx]
+                representative_news = news_list[representatives[label]]
                 
                 # 创建事件
                 event = {
@@ -634,6 +706,59 @@ class EnhancedNewsClusterer:
         
         return events
     
+    def _fine_cluster_results(self, coarse_clusters: List[List[int]], similarity_matrix) -> List[Optional[FineResult]]:
+        """对每个多于一篇新闻的粗分类簇运行 DBSCAN 并选出代表新闻 (单篇的簇为 None)
+        
+        fine_workers > 1 时按簇分批交给线程池或进程池 (fine_backend)；结果与顺序执行相同。
+        进程池不可用时回退到顺序执行。
+        """
+        started = time.perf_counter()
+        results: List[Optional[FineResult]] = [None] * len(coarse_clusters)
+        positions = [k for k, indices in enumerate(coarse_clusters) if len(indices) > 1]
+        clusters = [coarse_clusters[k] for k in positions]
+        # 每个线程/进程约分到 4 批，大簇耗时不均时也能保持负载均衡
+        chunks = chunk_clusters(clusters, min(CHUNK_ARTICLES, -(-sum(map(len, clusters)) // (4 * self.fine_workers))))
+        workers = min(self.fine_workers, len(chunks))
+        backend = self.fine_backend if workers > 1 else 'sequential'
+        
+        def collect(chunk, chunk_results):
+            for k, result in zip(chunk, chunk_results):
+                results[positions[k]] = result
+        
+        if backend == 'sequential':
+            collect(range(len(clusters)), fine_cluster_chunk(similarity_matrix, clusters, self.eps, self.min_samples))
+        elif backend == 'thread':
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fine-clustering') as executor:
+                for chunk, chunk_results in zip(chunks, executor.map(
+                        lambda chunk: fine_cluster_chunk(similarity_matrix, [clusters[k] for k in chunk],
+                                                         self.eps, self.min_samples), chunks)):
+                    collect(chunk, chunk_results)
+        else:
+            try:
+                with tempfile.TemporaryDirectory(prefix='fine-clustering-') as directory:
+                    shared = SharedSimilarity.dump(similarity_matrix, directory)
+                    with ProcessPoolExecutor(max_workers=workers,
+                                             mp_context=multiprocessing.get_context('spawn')) as executor:
+                        futures = [executor.submit(fine_cluster_chunk, shared, [clusters[k] for k in chunk],
+                                                   self.eps, self.min_samples) for chunk in chunks]
+                        for chunk, future in zip(chunks, futures):
+                            collect(chunk, future.result())
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.error(f"细分组进程池不可用 ({e})，回退到顺序执行")
+                backend = 'sequential'
+                collect(range(len(clusters)), fine_cluster_chunk(similarity_matrix, clusters, self.eps, self.min_samples))
+        
+        # 各簇耗时: 逐簇记录在 DEBUG 级别，INFO 级别汇总并列出最慢的几个簇
+        timings = sorted(((results[k][2], len(coarse_clusters[k]), k) for k in positions), reverse=True)
+        for seconds, size, k in timings:
+            self.logger.debug(f"细分组: 粗分类簇 {k} ({size} 篇) 耗时 {seconds * 1000:.1f} ms")
+        slowest = ", ".join(f"#{k} {size} 篇 {seconds * 1000:.0f} ms" for seconds, size, k in timings[:3])
+        self.logger.info(f"细分组: {len(clusters)} 个粗分类簇 ({sum(map(len, clusters))} 篇)，{backend}"
+                         f"{f' × {workers}' if backend != 'sequential' else ''}，"
+                         f"簇内耗时合计 {sum(t[0] for t in timings) * 1000:.0f} ms，"
+                         f"总耗时 {(time.perf_counter() - started) * 1000:.0f} ms；最慢: {slowest or '无'}")
+        return results
+    
     def _fuse_features(self, features: Dict[str, np.ndarray]) -> np.ndarray:
         """融合多维特征
         
@@ -668,31 +793,53 @@ class EnhancedNewsClusterer:
         
         return fused_matrix
     
-    def _find_representative_news(self, cluster_indices: List[int], similarity_matrix: np.ndarray) -> int:
+    def _build_similarity_graph(self, features: Dict[str, Any]):
+        """构建稀疏的融合相似度图
+        
+        候选边为标题、内容、实体、主题四种特征下各自的 top-k 近邻的并集；
+        对每条候选边按 _fuse_features 的权重精确计算五种特征的融合相似度。
+        不在任何近邻列表中的新闻对视为相似度 0。
+        
+        Args:
+            features: _extract_sparse_features 返回的特征
+            
+        Returns:
+            对称的稀疏相似度矩阵 (scipy CSR)，不含对角线
+        """
+        n_samples = len(features['time'])
+        candidates = [
+            top_k_neighbours(cosine_rows(features['title_tfidf']), n_samples, self.n_neighbors),
+            top_k_neighbours(cosine_rows(features['content_tfidf']), n_samples, self.n_neighbors),
+            top_k_neighbours(jaccard_rows(features['entity']), n_samples, self.n_neighbors),
+            top_k_neighbours(cosine_rows(features['topic']), n_samples, self.n_neighbors),
+        ]
+        left, right = unique_pairs(np.concatenate([c[0] for c in candidates]),
+                                   np.concatenate([c[1] for c in candidates]), n_samples)
+        
+        weights = self.weights
+        fused = (weights['title_tfidf'] * paired_cosine(features['title_tfidf'], left, right)
+                 + weights['content_tfidf'] * paired_cosine(features['content_tfidf'], left, right)
+                 + weights['entity'] * paired_jaccard(features['entity'], left, right)
+                 + weights['topic'] * paired_cosine(features['topic'], left, right)
+                 + weights['time_proximity'] * paired_gaussian_time(features['time'], left, right, self.time_window))
+        
+        self.logger.info(f"稀疏相似度图: {n_samples} 篇新闻, {len(left)} 条边 (k={self.n_neighbors})")
+        return sparse.coo_matrix((np.concatenate([fused, fused]),
+                                  (np.concatenate([left, right]), np.concatenate([right, left]))),
+                                 shape=(n_samples, n_samples)).tocsr()
+    
+    def _find_representative_news(self, cluster_indices: List[int], similarity_matrix) -> int:
         """找到簇中最具代表性的新闻
         
         Args:
             cluster_indices: 簇中新闻的索引列表
-            similarity_matrix: 相似度矩阵
+            similarity_matrix: 相似度 (稠密矩阵或稀疏近邻图)
             
         Returns:
             代表性新闻的索引
         """
-        # 计算每个新闻与簇中其他新闻的平均相似度
-        avg_similarities = []
-        
-        for i, idx_i in enumerate(cluster_indices):
-            total_sim = 0.0
-            for j, idx_j in enumerate(cluster_indices):
-                if i != j:
-                    total_sim += similarity_matrix[idx_i, idx_j]
-            
-            avg_sim = total_sim / (len(cluster_indices) - 1) if len(cluster_indices) > 1 else 0.0
-            avg_similarities.append((idx_i, avg_sim))
-        
-        # 选择平均相似度最高的新闻
-        representative_idx = max(avg_similarities, key=lambda x: x[1])[0]
-        return representative_idx
+        # 选择与簇中其他新闻平均相似度最高的新闻 (并列时取第一个)
+        return representative_index(cluster_indices, similarity_matrix)
     
     def _generate_summary(self, news: Dict) -> str:
         """为新闻生成摘要
@@ -767,21 +914,8 @@ class EnhancedNewsClusterer:
             except Exception as e:
                 self.logger.error(f"提取关键词出错: {e}")
         
-        # 简单实现：提取标题中的名词和动词作为关键词
-        title = news.get('title', '')
-        if not title:
-            return []
-            
-        # 移除标点符号
-        title = re.sub(r'[^\w\s]', '', title)
-        
-        # 分词并过滤停用词
-        words = title.split()
-        stop_words = {'的', '了', '在', '是', '和', '与', '或', '有', '被', '将', '把', '从', '到', '对', '为'}
-        keywords = [w for w in words if w not in stop_words and len(w) > 1]
-        
-        # 限制关键词数量
-        return keywords[:5]
+        # 简单实现：标题分词 (中英文统一规则，去掉停用词) 后的前 5 个词
+        return title_keywords(news.get('title', ''))
     
     def _extract_keywords_from_cluster(self, news_list: List[Dict]) -> List[str]:
         """从新闻簇中提取关键词
@@ -844,39 +978,15 @@ class EnhancedNewsClusterer:
                 self.logger.error(f"分类新闻出错: {e}")
         
         # 使用关键词匹配进行分类
-        title = news.get('title', '') or ''
-        content = news.get('content', '') or ''
-        text = (title + " " + content).lower()
+        matcher = keyword_matcher(self.category_keywords)
+        in_title, in_body = matcher.find(news.get('title'), news.get('content'))
         
-        # 特殊处理：检查是否包含建筑师相关关键词，如果有，优先归类为文化类别
-        if "architect" in text.lower() or "建筑师" in text.lower() or "gaudí" in text.lower() or "教皇" in text.lower() or "pope" in text.lower() or "sainthood" in text.lower() or "圣人" in text.lower():
-            matched_categories = [("culture", "建筑师")]
-        else:
-            # 匹配关键词
-            matched_categories = []
-            for category_id, keywords in self.category_keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text:
-                        matched_categories.append((category_id, keyword))
-                        break
-        
-        # 如果有匹配的类别
-        if matched_categories:
-            # 优先考虑标题中出现的关键词
-            title_matches = []
-            for cat_id, keyword in matched_categories:
-                if keyword.lower() in title.lower():
-                    title_matches.append(cat_id)
-            
-            if title_matches:
-                # 使用标题中的第一个匹配类别
-                return title_matches[0]
-            else:
-                # 使用内容中的第一个匹配类别
-                return matched_categories[0][0]
+        # 特殊处理：包含建筑师相关关键词时，优先归类为文化类别
+        if any(keyword in in_title or keyword in in_body for keyword in CULTURE_PRIORITY_KEYWORDS):
+            return "culture"
         
-        # 如果没有匹配到任何类别，返回未分类
-        return "general"
+        # 每个类别取列表中最靠前的命中词，优先返回该词出现在标题中的类别，没有命中时返回 general
+        return matcher.best_category((in_title, in_body), "general")
     
     def _categorize_cluster(self, news_list: List[Dict]) -> str:
         """对新闻簇进行分类
@@ -916,7 +1026,9 @@ class EnhancedNewsClusterer:
             return STANDARD_CATEGORIES.get(category_id, {}).get("name", "未分类")
     
     def set_clustering_params(self, eps: Optional[float] = None, min_samples: Optional[int] = None, 
-                             similarity_threshold: Optional[float] = None, time_window: Optional[int] = None) -> None:
+                             similarity_threshold: Optional[float] = None, time_window: Optional[int] = None,
+                             mode: Optional[str] = None, n_neighbors: Optional[int] = None,
+                             fine_workers: Optional[int] = None, fine_backend: Optional[str] = None) -> None:
         """设置聚类参数
         
         Args:
@@ -924,7 +1036,23 @@ class EnhancedNewsClusterer:
             min_samples: DBSCAN的最小样本数参数
             similarity_threshold: 相似度阈值
             time_window: 时间窗口（天）
+            mode: 'dense' / 'sparse' / 'auto' (文章数达到 sparse_min_samples 时使用稀疏近邻图)
+            n_neighbors: 稀疏模式下每种特征保留的近邻数
+            fine_workers: 并行细分组的线程/进程数 (1 为顺序执行)
+            fine_backend: 'thread' / 'process' (进程通过只读内存映射共享相似度)
         """
+        if mode is not None:
+            if mode not in ('dense', 'sparse', 'auto'):
+                raise ValueError(f"未知的聚类模式: {mode}")
+            self.clustering_mode = mode
+        if n_neighbors is not None:
+            self.n_neighbors = n_neighbors
+        if fine_backend is not None:
+            if fine_backend not in FINE_BACKENDS:
+                raise ValueError(f"未知的细分组执行方式: {fine_backend}")
+            self.fine_backend = fine_backend
+        if fine_workers is not None:
+            self.fine_workers = max(1, int(fine_workers))
         if eps is not None:
             self.eps = eps
         if min_samples is not None:
@@ -934,7 +1062,7 @@ class EnhancedNewsClusterer:
         if time_window is not None:
             self.time_window = time_window
         
-        self.logger.info(f"聚类参数已更新: eps={self.eps}, min_samples={self.min_samples}, similarity_threshold={self.similarity_threshold}, time_window={self.time_window}")
+        self.logger.info(f"聚类参数已更新: eps={self.eps}, min_samples={self.min_samples}, similarity_threshold={self.similarity_threshold}, time_window={self.time_window}, mode={self.clustering_mode}, n_neighbors={self.n_neighbors}, fine_workers={self.fine_workers}, fine_backend={self.fine_backend}")
     
     def set_feature_weights(self, weights: Dict[str, float]) -> None:
         """设置特征权重
@@ -0,0 +1,120 @@
+"""
+核心服务 - 粗分类簇的细分组 (可并行)
+
+EnhancedNewsClusterer 的粗分类簇彼此独立：每个簇在融合相似度的子矩阵上运行 DBSCAN，
+再为每个细分组选出代表新闻。这里把这部分计算做成模块级函数，既可以在当前进程中顺序执行，
+也可以按簇分批交给线程池或进程池:
+
+  - 'thread': 线程直接共享同一个相似度矩阵 (DBSCAN、NumPy 的大部分计算不持有 GIL)
+  - 'process': 相似度 (稠密矩阵，或稀疏近邻图的 data / indices / indptr) 先写入临时目录的 .npy 文件，
+    子进程以只读内存映射打开 (SharedSimilarity)，不经过 pickle 复制；每个子进程只打开一次
+
+子矩阵用 NumPy 花式索引一次取出。结果 (标签、代表新闻、耗时) 与顺序执行完全相同。
+"""
+
+from __future__ import annotations  # np.ndarray 注解不在定义时求值，避免提前导入 numpy
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.lazy_import import lazy_attr, lazy_module
+
+np = lazy_module('numpy')
+sparse = lazy_module('scipy.sparse')
+DBSCAN = lazy_attr('sklearn.cluster', 'DBSCAN')
+
+FINE_BACKENDS = ('thread', 'process')
+CHUNK_ARTICLES = 2000  # 小簇合并成一批提交，每批的文章数上限 (超过上限的大簇单独一批)
+
+# 一个粗分类簇的细分组结果: (各新闻的 DBSCAN 标签, {标签: 代表新闻的全局索引}, 耗时秒数)
+FineResult = Tuple[List[int], Dict[int, int], float]
+
+
+def fine_labels(indices: Sequence[int], similarity, eps: float, min_samples: int) -> np.ndarray:
+    """对一个粗分类簇运行 DBSCAN，返回簇内各新闻的标签 (-1 为噪声点)。"""
+    indices = np.asarray(indices)
+    if sparse.issparse(similarity):
+        # 近邻图中不存在的边视为不相邻；DBSCAN 只看显式存储的距离 (包括为 0 的)
+        distance = similarity[indices][:, indices].tocsr()
+        distance.data = np.clip(1 - distance.data, 0.0, None)
+    else:
+        distance = np.clip(1 - similarity[np.ix_(indices, indices)], 0.0, None)  # 转换为距离矩阵
+    return DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed').fit_predict(distance)
+
+
+def representative_index(indices: Sequence[int], similarity) -> int:
+    """与簇中其他新闻相似度之和最高的新闻 (并列时取第一个)，返回全局索引。"""
+    positions = np.asarray(indices)
+    if sparse.issparse(similarity):
+        sub_matrix = similarity[positions][:, positions]  # CSR 先取行再取列
+    else:
+        sub_matrix = similarity[np.ix_(positions, positions)]  # 直接取 m×m 子矩阵，不复制 m 个整行
+    totals = np.asarray(sub_matrix.sum(axis=1)).ravel() - sub_matrix.diagonal()
+    return indices[int(np.argmax(totals))]
+
+
+def fine_cluster(indices: Sequence[int], similarity, eps: float, min_samples: int) -> FineResult:
+    """细分组一个粗分类簇 (至少两篇新闻)。"""
+    started = time.perf_counter()
+    labels = fine_labels(indices, similarity, eps, min_samples)
+    members: Dict[int, List[int]] = {}
+    for index, label in zip(indices, labels):
+        if label != -1:
+            members.setdefault(int(label), []).append(index)
+    representatives = {label: representative_index(group, similarity) for label, group in members.items()}
+    return [int(label) for label in labels], representatives, time.perf_counter() - started
+
+
+@dataclass(frozen=True)
+class SharedSimilarity:
+    """写入磁盘的相似度矩阵，子进程以只读内存映射打开。"""
+    directory: str
+    shape: Tuple[int, int]
+    is_sparse: bool
+
+    @classmethod
+    def dump(cls, similarity, directory: str) -> 'SharedSimilarity':
+        if sparse.issparse(similarity):
+            similarity = similarity.tocsr()
+            for name in ('data', 'indices', 'indptr'):
+                np.save(os.path.join(directory, f'{name}.npy'), getattr(similarity, name))
+        else:
+            np.save(os.path.join(directory, 'dense.npy'), np.ascontiguousarray(similarity))
+        return cls(directory, tuple(similarity.shape), sparse.issparse(similarity))
+
+    def load(self):
+        def mapped(name):
+            return np.load(os.path.join(self.directory, f'{name}.npy'), mmap_mode='r')
+
+        if self.is_sparse:
+            return sparse.csr_matrix((mapped('data'), mapped('indices'), mapped('indptr')), shape=self.shape, copy=False)
+        return mapped('dense')
+
+
+_mapped: Dict[str, Any] = {}  # 子进程中已打开的 SharedSimilarity (按目录)
+
+
+def fine_cluster_chunk(similarity, chunk: List[Sequence[int]], eps: float, min_samples: int) -> List[FineResult]:
+    """细分组一批粗分类簇 (线程池/进程池的任务)；similarity 可以是 SharedSimilarity。"""
+    if isinstance(similarity, SharedSimilarity):
+        if similarity.directory not in _mapped:
+            _mapped.clear()  # 上一次聚类的临时目录已删除
+            _mapped[similarity.directory] = similarity.load()
+        similarity = _mapped[similarity.directory]
+    return [fine_cluster(indices, similarity, eps, min_samples) for indices in chunk]
+
+
+def chunk_clusters(clusters: List[Sequence[int]], max_articles: int = CHUNK_ARTICLES) -> List[List[int]]:
+    """把簇 (按在 clusters 中的位置) 分批：从大到小依次放入，每批文章数不超过 max_articles。"""
+    order = sorted(range(len(clusters)), key=lambda k: len(clusters[k]), reverse=True)
+    chunks: List[List[int]] = []
+    size: Optional[int] = None
+    for k in order:
+        if size is None or size + len(clusters[k]) > max_articles:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(k)
+        size += len(clusters[k])
+    return chunks
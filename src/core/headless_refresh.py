@@ -0,0 +1,197 @@
+"""
+核心服务 - 无界面刷新工作器
+
+在没有 GUI 的服务器上保持数据库新鲜：直接从数据库读取启用的新闻源，
+驱动 RefreshPipeline 抓取并写库，并可用 APScheduler 按固定间隔循环执行。
+
+本模块及其导入链不依赖 Qt (PySide6)。GUI 进程只需打开同一个数据库文件
+作为读取方即可看到结果 (NewsStorage 以 WAL 模式打开，读写可以并发)。
+"""
+
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from src.collectors.collector_factory import CollectorFactory
+from src.core.cancellation_flag import CancellationFlag
+from src.core.progress_aggregator import ProgressAggregator
+from src.core.refresh_pipeline import RefreshPipeline
+from src.models import NewsSource
+from src.storage.news_storage import NewsStorage
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块
+    resource = None
+
+
+def collect_runtime_metrics(started_at: float) -> Dict[str, Any]:
+    """
+    汇总无界面模式的启动开销指标。
+
+    Args:
+        started_at: 进程入口处记录的 time.perf_counter() 值。
+
+    Returns:
+        dict: startup_seconds, peak_rss_mb (平台不支持时为 None), qt_loaded (是否意外加载了 PySide6)。
+    """
+    peak_rss_mb = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux 上单位为 KiB，macOS 上为字节
+        peak_rss_mb = round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    return {
+        'startup_seconds': round(time.perf_counter() - started_at, 3),
+        'peak_rss_mb': peak_rss_mb,
+        'qt_loaded': any(name == 'PySide6' or name.startswith('PySide6.') for name in sys.modules),
+    }
+
+
+class HeadlessRefreshWorker:
+    """
+    不依赖 Qt 的刷新工作器：一次性刷新 (run_once) 或按间隔循环刷新 (run_daemon)。
+
+    Args:
+        data_dir: 数据目录，与 GUI 使用的相同 (NewsStorage 的 data_dir)。
+        db_name: 数据库文件名，None 表示 NewsStorage 的默认文件名。
+        collector_factory: 可选的 CollectorFactory，默认新建一个 (不启用解析进程池)。
+        source_names: 只刷新这些名称的源；None 表示所有启用的源。
+        fetch_workers: fetch 阶段的最大线程数。
+    """
+
+    def __init__(self, data_dir: str, db_name: Optional[str] = None,
+                 collector_factory: Optional[CollectorFactory] = None,
+                 source_names: Optional[Iterable[str]] = None,
+                 fetch_workers: int = 8):
+        self.logger = logging.getLogger('news_analyzer.core.headless_refresh')
+        self.data_dir = data_dir
+        self.db_name = db_name
+        self.collector_factory = collector_factory or CollectorFactory()
+        self.source_names = set(source_names) if source_names else None
+        self.fetch_workers = fetch_workers
+        self.progress = ProgressAggregator()
+        self._cancel_flag = CancellationFlag()
+        self._scheduler: Optional[BlockingScheduler] = None
+        self._run_lock = threading.Lock()
+
+    def _open_storage(self) -> NewsStorage:
+        return NewsStorage(data_dir=self.data_dir, db_name=self.db_name)
+
+    def load_sources(self) -> List[NewsSource]:
+        """从数据库读取需要刷新的源 (启用且符合 source_names 过滤条件)。"""
+        storage = self._open_storage()
+        try:
+            rows = storage.get_all_news_sources()
+        finally:
+            storage.close()
+
+        sources = []
+        for row in rows:
+            source = NewsSource.from_storage_dict(row)
+            if source is None or not source.enabled:
+                continue
+            if self.source_names is not None and source.name not in self.source_names:
+                continue
+            sources.append(source)
+        if self.source_names is not None:
+            missing = self.source_names - {source.name for source in sources}
+            if missing:
+                self.logger.warning(f"以下源不存在或未启用，已跳过: {sorted(missing)}")
+        return sources
+
+    def _on_source_done(self, source: NewsSource, item_count: int, error_message: Optional[str]):
+        if error_message:
+            self.logger.warning(f"源 '{source.name}' 刷新失败: {error_message}")
+        else:
+            self.logger.debug(f"源 '{source.name}' 获取 {item_count} 条")
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        执行一次完整刷新。
+
+        Returns:
+            dict: RefreshPipeline.run 的汇总结果，另加 sources (本次刷新的源数量)。
+                  若上一次刷新仍在进行 (daemon 模式下任务重叠)，返回 {'skipped': True}。
+        """
+        if not self._run_lock.acquire(blocking=False):
+            self.logger.warning("上一次刷新仍在进行，跳过本次触发。")
+            return {'skipped': True}
+        try:
+            self._cancel_flag.clear()
+            sources = self.load_sources()
+            if not sources:
+                self.logger.info("没有需要刷新的新闻源。")
+                return {'sources': 0, 'collected': 0, 'stored': 0, 'batches': 0, 'errors': [],
+                        'cancelled': False, 'elapsed_seconds': 0.0, 'stages': {}}
+
+            self.logger.info(f"开始无界面刷新: {len(sources)} 个源")
+            self.progress.start([source.name for source in sources], 'refresh')
+            pipeline = RefreshPipeline(
+                collector_factory=self.collector_factory,
+                storage_factory=self._open_storage,
+                fetch_workers=min(len(sources), self.fetch_workers),
+                cancel_checker=self._cancel_flag.is_set,
+                on_source_done=self._on_source_done,
+                progress=self.progress,
+            )
+            try:
+                summary = pipeline.run(sources)
+            finally:
+                self.progress.finish()
+            summary['sources'] = len(sources)
+
+            snapshot = self.progress.snapshot()
+            self.logger.info(
+                f"无界面刷新结束: {summary['stored']} 条写入, {snapshot['failed_sources']}/{len(sources)} 个源失败, "
+                f"耗时 {summary['elapsed_seconds']:.1f}s" + (" (已取消)" if summary['cancelled'] else "")
+            )
+            return summary
+        finally:
+            self._run_lock.release()
+
+    def run_daemon(self, interval_minutes: float, run_immediately: bool = True):
+        """
+        按固定间隔循环刷新，阻塞直到 stop() 被调用 (例如由信号处理函数调用)。
+
+        Args:
+            interval_minutes: 刷新间隔 (分钟)。
+            run_immediately: 启动时是否立即执行一次刷新。
+        """
+        if interval_minutes <= 0:
+            raise ValueError(f"刷新间隔必须为正数: {interval_minutes}")
+
+        self._scheduler = BlockingScheduler()
+        # max_instances=1 + coalesce: 刷新耗时超过间隔时不重叠执行，错过的触发只补一次
+        self._scheduler.add_job(
+            self._run_scheduled,
+            trigger=IntervalTrigger(minutes=interval_minutes),
+            id='headless_refresh_job',
+            max_instances=1,
+            coalesce=True,
+        )
+        self.logger.info(f"无界面刷新守护进程启动，间隔 {interval_minutes} 分钟。")
+        if run_immediately:
+            self._run_scheduled()
+        if self._cancel_flag.is_set():
+            return
+        self._scheduler.start()
+        self.logger.info("无界面刷新守护进程已停止。")
+
+    def _run_scheduled(self):
+        try:
+            self.run_once()
+        except Exception as e:
+            # 单次失败不应终止守护进程
+            self.logger.error(f"定时刷新失败: {e}", exc_info=True)
+
+    def stop(self):
+        """取消正在进行的刷新并停止调度器。可在信号处理函数中调用。"""
+        self._cancel_flag.set()
+        if self._scheduler is not None and self._scheduler.running:
+            self._scheduler.shutdown(wait=False)
+
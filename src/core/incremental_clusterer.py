@@ -0,0 +1,510 @@
+"""
+核心服务 - 增量事件聚类
+
+NewsClusterer / EnhancedNewsClusterer 每次都对全部新闻从头拟合 TF-IDF、LDA 和 DBSCAN/层次聚类，
+一次刷新只新增几十篇新闻也要重算全部。IncrementalEventClusterer 保留上次的结果:
+
+  - 词表与文档频率 (在线更新的 IDF)，每篇文章表示为 L2 归一化的 TF-IDF 稀疏向量 (dict)
+  - 每个事件一个质心 (成员向量之和，只保留权重最高的 MAX_CENTROID_TERMS 个词) 及其范数
+  - 倒排索引: 词 -> 以该词为质心主要词的活跃事件
+
+新文章只与倒排索引中和它的主要词相同、且发布时间在时间窗口内的 k 个候选事件计算余弦相似度，
+超过阈值则并入最相似的事件 (质心和范数增量更新)，否则新建事件，每篇 O(k)。
+在线分配会受到文章到达顺序和 IDF 变化的影响，consolidate() 定期 (通常在后台线程) 用最新的 IDF
+重算质心、合并相似的事件、更新事件标题，并把超出时间窗口的事件移出倒排索引 (归档，不再接收新文章)。
+
+状态通过 EventClusterStore 持久化，重新打开时直接恢复事件与分配，无需重新聚类。
+EventClusteringWorker 在后台线程中为尚未分配的文章执行聚类。
+"""
+
+import heapq
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, Signal as pyqtSignal, Slot as pyqtSlot
+
+from src.core.news_query_index import MIN_EPOCH_US, publish_time_epoch_us
+from src.core.text_tokenizer import tokenize
+from src.storage.event_cluster_store import EventClusterStore
+
+US_PER_DAY = 24 * 3600 * 1_000_000
+MAX_CENTROID_TERMS = 200  # 质心保留的词数，使每次更新和比较的代价与事件大小无关
+CONTENT_CHARS = 300  # 参与聚类的正文前缀长度
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def cluster_terms(text: str) -> List[str]:
+    """聚类用的词 (与其他聚类器相同的中英文分词，见 text_tokenizer)。"""
+    return tokenize(text)
+
+
+def article_term_counts(news: Dict[str, Any]) -> Dict[str, int]:
+    """文章的词频 (标题计两次，正文只取前 CONTENT_CHARS 个字符)。"""
+    title = news.get('title') or ''
+    content = (news.get('content') or '')[:CONTENT_CHARS]
+    return dict(Counter(cluster_terms(title) * 2 + cluster_terms(content)))
+
+
+def epoch_us_to_datetime(value: Optional[int]) -> Optional[datetime]:
+    if value is None or value <= MIN_EPOCH_US:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+@dataclass
+class EventCluster:
+    """一个事件：质心 (成员向量之和) 及其范数平方、成员文章 ID 和时间范围 (UTC 微秒)。"""
+    event_id: str
+    title: str
+    summary: str = ''
+    category: str = 'uncategorized'
+    first_time: Optional[int] = None
+    last_time: Optional[int] = None
+    centroid: Dict[str, float] = field(default_factory=dict)
+    norm_sq: float = 0.0
+    members: List[int] = field(default_factory=list)
+
+    def top_terms(self, count: int) -> List[str]:
+        return heapq.nlargest(count, self.centroid, key=self.centroid.get)
+
+    def covers(self, when: Optional[int], window_us: int) -> bool:
+        """when 是否落在 [first_time - window, last_time + window] 内 (时间未知时视为是)。"""
+        if when is None or self.first_time is None:
+            return True
+        return self.first_time - window_us <= when <= self.last_time + window_us
+
+    def overlaps(self, other: 'EventCluster', window_us: int) -> bool:
+        """两个事件的时间范围 (各自向外扩展 window 后) 是否相交。"""
+        if self.first_time is None or other.first_time is None:
+            return True
+        return other.first_time <= self.last_time + window_us and other.last_time >= self.first_time - window_us
+
+
+@dataclass
+class AssignedArticle:
+    """已分配的文章: 所属事件、列表显示字段和词频 (重算质心时使用)。"""
+    article_id: int
+    event_id: str
+    title: str
+    source_name: str
+    link: str
+    publish_time: Optional[int]
+    terms: Dict[str, int]
+
+
+class IncrementalEventClusterer:
+    """
+    增量事件聚类器。
+
+    用法:
+        clusterer = IncrementalEventClusterer(EventClusterStore(storage.data_dir))
+        clusterer.add_articles(new_articles)     # 每篇 O(k)，结果写入存储
+        if clusterer.needs_consolidation():
+            clusterer.consolidate()
+        events = clusterer.event_dicts()         # 与 NewsClusterer.cluster 的返回格式相同
+
+    可以在后台线程中调用，所有方法由同一把锁串行化。
+    """
+
+    def __init__(self, store: Optional[EventClusterStore] = None, similarity_threshold: float = 0.35,
+                 merge_threshold: float = 0.8, window_days: float = 2.0, probe_terms: int = 8,
+                 index_terms: int = 20, consolidate_every: int = 500,
+                 categorize: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 summarize: Optional[Callable[[Dict[str, Any]], str]] = None):
+        """
+        Args:
+            store: 持久化存储；为 None 时只在内存中保存。
+            similarity_threshold: 文章并入事件所需的最低余弦相似度。
+            merge_threshold: consolidate() 合并两个事件所需的质心余弦相似度。
+            window_days: 事件的时间窗口 (天)，超出窗口的文章不会并入该事件，事件也会被归档。
+            probe_terms: 新文章用权重最高的多少个词在倒排索引中查找候选事件。
+            index_terms: 每个事件把质心中权重最高的多少个词放入倒排索引。
+            consolidate_every: 新分配多少篇文章后 needs_consolidation() 返回 True。
+            categorize: 事件新建时对首篇文章分类的函数，默认 'uncategorized'。
+            summarize: 事件新建时为首篇文章生成摘要的函数，默认取正文前 200 字。
+        """
+        self.logger = logging.getLogger('news_analyzer.core.incremental_clusterer')
+        self.lock = threading.RLock()
+        self.store = store
+        self.similarity_threshold = similarity_threshold
+        self.merge_threshold = merge_threshold
+        self.window_us = int(window_days * US_PER_DAY)
+        self.probe_terms = probe_terms
+        self.index_terms = index_terms
+        self.consolidate_every = consolidate_every
+        self.categorize = categorize or (lambda news: 'uncategorized')
+        self.summarize = summarize or (lambda news: (news.get('content') or news.get('title') or '')[:200])
+
+        self.doc_count = 0
+        self.document_frequency: Dict[str, int] = {}
+        self.events: Dict[str, EventCluster] = {}
+        self.assignments: Dict[int, AssignedArticle] = {}
+        self.latest_time: Optional[int] = None
+        self.candidates_scored = 0  # 累计计算过相似度的 (文章, 候选事件) 对数
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._indexed: Dict[str, List[str]] = {}  # 事件 -> 当前放入倒排索引的词
+        self._since_consolidation = 0
+        self._dirty_terms: Set[str] = set()
+        self._dirty_events: Set[str] = set()
+        self._dirty_assignments: Set[int] = set()
+        self._removed_events: Set[str] = set()
+        self._removed_articles: Set[int] = set()
+        if store is not None:
+            self._load()
+
+    # --- 在线分配 ---
+
+    def add_articles(self, news_items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        把新文章分配到已有事件或新建事件 (已分配过的文章 ID 跳过)，并写入存储。
+
+        Returns:
+            dict: {'assigned': 并入已有事件的篇数, 'created': 新建的事件数, 'skipped': 跳过的篇数}
+        """
+        stats = {'assigned': 0, 'created': 0, 'skipped': 0}
+        started = time.perf_counter()
+        with self.lock:
+            for news in news_items:
+                article_id = news.get('id')
+                if article_id is None or article_id in self.assignments:
+                    stats['skipped'] += 1
+                    continue
+                created = self._add_article(news)
+                stats['created' if created else 'assigned'] += 1
+            self._since_consolidation += stats['assigned'] + stats['created']
+            self.flush()
+        added = stats['assigned'] + stats['created']
+        if added:
+            self.logger.info(f"增量聚类: {added} 篇新文章，新建 {stats['created']} 个事件，"
+                             f"耗时 {(time.perf_counter() - started) * 1000:.1f} ms，共 {len(self.events)} 个事件")
+        return stats
+
+    def _add_article(self, news: Dict[str, Any]) -> bool:
+        article_id = news['id']
+        terms = article_term_counts(news)
+        for term in terms:
+            self.document_frequency[term] = self.document_frequency.get(term, 0) + 1
+        self._dirty_terms.update(terms)
+        self.doc_count += 1
+        vector = self._vector(terms)
+        when = publish_time_epoch_us(news.get('publish_time'))
+        when = None if when is None or when <= MIN_EPOCH_US else when
+        if when is not None and (self.latest_time is None or when > self.latest_time):
+            self.latest_time = when
+
+        best, best_score = None, self.similarity_threshold
+        for event_id in self._candidate_events(vector):
+            event = self.events[event_id]
+            if not event.covers(when, self.window_us):
+                continue
+            self.candidates_scored += 1
+            score = self._cosine(vector, event)
+            if score >= best_score:
+                best, best_score = event, score
+
+        created = best is None
+        if created:
+            best = EventCluster(event_id=f"event_{uuid.uuid4().hex[:12]}", title=news.get('title') or '无标题',
+                                summary=self.summarize(news), category=self.categorize(news))
+            self.events[best.event_id] = best
+        self._add_vector(best, vector)
+        best.members.append(article_id)
+        if when is not None:
+            best.first_time = when if best.first_time is None else min(best.first_time, when)
+            best.last_time = when if best.last_time is None else max(best.last_time, when)
+        self._reindex(best)
+        self._dirty_events.add(best.event_id)
+
+        self.assignments[article_id] = AssignedArticle(
+            article_id=article_id, event_id=best.event_id, title=news.get('title') or '',
+            source_name=news.get('source_name') or '未知来源', link=news.get('link') or '',
+            publish_time=when, terms=terms)
+        self._dirty_assignments.add(article_id)
+        return created
+
+    def _idf(self, term: str) -> float:
+        return math.log((1 + self.doc_count) / (1 + self.document_frequency.get(term, 0))) + 1.0
+
+    def _vector(self, terms: Dict[str, int]) -> Dict[str, float]:
+        vector = {term: count * self._idf(term) for term, count in terms.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+    def _candidate_events(self, vector: Dict[str, float]) -> Set[str]:
+        candidates: Set[str] = set()
+        for term in heapq.nlargest(self.probe_terms, vector, key=vector.get):
+            candidates.update(self._postings.get(term, ()))
+        return candidates
+
+    @staticmethod
+    def _cosine(vector: Dict[str, float], event: EventCluster) -> float:
+        if event.norm_sq <= 0:
+            return 0.0
+        centroid = event.centroid
+        return sum(weight * centroid.get(term, 0.0) for term, weight in vector.items()) / math.sqrt(event.norm_sq)
+
+    @staticmethod
+    def _add_vector(event: EventCluster, vector: Dict[str, float]):
+        centroid = event.centroid
+        for term, weight in vector.items():
+            centroid[term] = centroid.get(term, 0.0) + weight
+        if len(centroid) > MAX_CENTROID_TERMS:
+            keep = heapq.nlargest(MAX_CENTROID_TERMS, centroid.items(), key=lambda item: item[1])
+            event.centroid = centroid = dict(keep)
+        event.norm_sq = sum(weight * weight for weight in centroid.values())
+
+    def _reindex(self, event: EventCluster):
+        self._unindex(event.event_id)
+        terms = event.top_terms(self.index_terms)
+        for term in terms:
+            self._postings[term].add(event.event_id)
+        self._indexed[event.event_id] = terms
+
+    def _unindex(self, event_id: str):
+        for term in self._indexed.pop(event_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._postings[term]
+
+    # --- 定期整理 ---
+
+    def needs_consolidation(self) -> bool:
+        return self._since_consolidation >= self.consolidate_every
+
+    def consolidate(self) -> Dict[str, int]:
+        """
+        用当前的 IDF 重算活跃事件的质心，合并质心相似度不低于 merge_threshold 且时间范围相交的事件，
+        把每个事件的标题更新为最接近质心的文章标题，并归档超出时间窗口的事件。
+
+        Returns:
+            dict: {'merged': 被合并掉的事件数, 'archived': 移出倒排索引的事件数, 'active': 活跃事件数}
+        """
+        started = time.perf_counter()
+        with self.lock:
+            active = [event for event in self.events.values() if event.event_id in self._indexed]
+            vectors: Dict[int, Dict[str, float]] = {}
+            for event in active:
+                event.centroid, event.norm_sq = {}, 0.0
+                for article_id in event.members:
+                    vectors[article_id] = self._vector(self.assignments[article_id].terms)
+                    self._add_vector(event, vectors[article_id])
+                self._reindex(event)
+                self._dirty_events.add(event.event_id)
+
+            merged = 0
+            for event in sorted(active, key=lambda e: len(e.members), reverse=True):
+                if event.event_id not in self.events:
+                    continue
+                for other_id in sorted(self._candidate_events(event.centroid)):
+                    other = self.events.get(other_id)
+                    if other is None or other is event or len(other.members) > len(event.members):
+                        continue
+                    if not event.overlaps(other, self.window_us):
+                        continue
+                    norm = math.sqrt(event.norm_sq * other.norm_sq)
+                    dot = sum(weight * event.centroid.get(term, 0.0) for term, weight in other.centroid.items())
+                    if norm and dot / norm >= self.merge_threshold:
+                        self._merge(event, other)
+                        merged += 1
+
+            for event in active:
+                if event.event_id in self.events and event.members:
+                    representative = max(event.members, key=lambda article_id: self._cosine(
+                        vectors.get(article_id) or self._vector(self.assignments[article_id].terms), event))
+                    event.title = self.assignments[representative].title or event.title
+
+            archived = 0
+            if self.latest_time is not None:
+                for event in list(active):
+                    if event.event_id in self.events and event.last_time is not None and \
+                            event.last_time < self.latest_time - self.window_us:
+                        self._unindex(event.event_id)
+                        archived += 1
+            self._since_consolidation = 0
+            self.flush()
+            stats = {'merged': merged, 'archived': archived, 'active': len(self._indexed)}
+        self.logger.info(f"增量聚类整理完成: 合并 {merged} 个事件，归档 {archived} 个，"
+                         f"活跃 {stats['active']} 个，耗时 {(time.perf_counter() - started) * 1000:.1f} ms")
+        return stats
+
+    def _merge(self, target: EventCluster, other: EventCluster):
+        for article_id in other.members:
+            self.assignments[article_id].event_id = target.event_id
+            self._dirty_assignments.add(article_id)
+        target.members.extend(other.members)
+        for term, weight in other.centroid.items():
+            target.centroid[term] = target.centroid.get(term, 0.0) + weight
+        self._add_vector(target, {})  # 裁剪质心并重算范数
+        if other.first_time is not None:
+            target.first_time = other.first_time if target.first_time is None else min(target.first_time, other.first_time)
+            target.last_time = other.last_time if target.last_time is None else max(target.last_time, other.last_time)
+        self._unindex(other.event_id)
+        self._reindex(target)
+        del self.events[other.event_id]
+        self._dirty_events.discard(other.event_id)
+        self._removed_events.add(other.event_id)
+
+    # --- 结果 ---
+
+    def event_dicts(self) -> List[Dict[str, Any]]:
+        """
+        事件列表，格式与 NewsClusterer.cluster 的返回值相同，按报道数量倒序 (相同时较新的在前)。
+
+        reports 中只有列表显示所需的字段 (id, title, source_name, link, publish_time)，
+        正文需要时由调用方按 id 从数据库读取。
+        """
+        with self.lock:
+            events = []
+            ordered = sorted(self.events.values(), reverse=True,
+                             key=lambda e: (len(e.members), e.last_time or MIN_EPOCH_US, e.event_id))
+            for event in ordered:
+                reports = []
+                for article_id in event.members:
+                    article = self.assignments[article_id]
+                    reports.append({'id': article_id, 'title': article.title, 'source_name': article.source_name,
+                                    'link': article.link, 'publish_time': epoch_us_to_datetime(article.publish_time)})
+                events.append({
+                    'event_id': event.event_id,
+                    'title': event.title,
+                    'summary': event.summary,
+                    'keywords': event.top_terms(5),
+                    'category': event.category,
+                    'reports': reports,
+                    'sources': list(dict.fromkeys(report['source_name'] for report in reports)),
+                    'publish_time': epoch_us_to_datetime(event.first_time),
+                })
+        return events
+
+    def remove_articles(self, article_ids: Iterable[int]):
+        """把已删除的文章从所属事件中移除 (事件变空时删除事件)，质心在下次 consolidate() 时重算。"""
+        with self.lock:
+            for article_id in article_ids:
+                article = self.assignments.pop(article_id, None)
+                if article is None:
+                    continue
+                self._removed_articles.add(article_id)
+                self._dirty_assignments.discard(article_id)
+                event = self.events.get(article.event_id)
+                if event is None:
+                    continue
+                event.members.remove(article_id)
+                if event.members:
+                    self._dirty_events.add(event.event_id)
+                else:
+                    self._unindex(event.event_id)
+                    del self.events[event.event_id]
+                    self._dirty_events.discard(event.event_id)
+                    self._removed_events.add(event.event_id)
+            self.flush()
+
+    # --- 持久化 ---
+
+    def flush(self):
+        """把变化的部分写入存储。"""
+        with self.lock:
+            if self.store is None or not (self._dirty_terms or self._dirty_events or self._dirty_assignments
+                                          or self._removed_events or self._removed_articles):
+                self._clear_dirty()
+                return
+            self.store.save(
+                meta={'doc_count': self.doc_count, 'latest_time': self.latest_time},
+                terms={term: self.document_frequency[term] for term in self._dirty_terms},
+                events=[self._event_row(self.events[event_id]) for event_id in self._dirty_events
+                        if event_id in self.events],
+                assignments=[vars(self.assignments[article_id]) for article_id in self._dirty_assignments],
+                removed_event_ids=list(self._removed_events),
+                removed_article_ids=list(self._removed_articles))
+            self._clear_dirty()
+
+    def _clear_dirty(self):
+        for changed in (self._dirty_terms, self._dirty_events, self._dirty_assignments,
+                        self._removed_events, self._removed_articles):
+            changed.clear()
+
+    def _event_row(self, event: EventCluster) -> Dict[str, Any]:
+        return {'event_id': event.event_id, 'title': event.title, 'summary': event.summary,
+                'category': event.category, 'first_time': event.first_time, 'last_time': event.last_time,
+                'centroid': event.centroid}
+
+    def _load(self):
+        state = self.store.load()
+        self.doc_count = state['meta'].get('doc_count', 0)
+        self.latest_time = state['meta'].get('latest_time')
+        self.document_frequency = state['terms']
+        for row in state['events']:
+            event = EventCluster(event_id=row['event_id'], title=row['title'] or '无标题',
+                                 summary=row['summary'] or '', category=row['category'] or 'uncategorized',
+                                 first_time=row['first_time'], last_time=row['last_time'],
+                                 centroid=row['centroid'])
+            event.norm_sq = sum(weight * weight for weight in event.centroid.values())
+            self.events[event.event_id] = event
+        for row in state['assignments']:
+            event = self.events.get(row['event_id'])
+            if event is None:
+                continue
+            event.members.append(row['article_id'])
+            self.assignments[row['article_id']] = AssignedArticle(**row)
+        for event in self.events.values():
+            if self.latest_time is None or event.last_time is None or \
+                    event.last_time >= self.latest_time - self.window_us:
+                self._reindex(event)
+        if self.events:
+            self.logger.info(f"已恢复增量聚类状态: {len(self.events)} 个事件，{len(self.assignments)} 篇文章")
+
+
+class EventClusteringWorker(QRunnable):
+    """
+    在后台线程中为数据库里尚未分配的文章执行增量聚类，必要时再整理一次。
+
+    article_ids 为 None 时检查全部文章 (按发布时间倒序读取 ID，只对未分配的读取正文)；
+    否则只处理给定的文章 (例如刷新后新增的文章)。
+    """
+
+    BATCH_SIZE = 500
+
+    class WorkerSignals(QObject):
+        # (事件列表, 统计信息)
+        finished = pyqtSignal(list, dict)
+        error = pyqtSignal(str)
+
+    def __init__(self, storage, clusterer: IncrementalEventClusterer, article_ids: Optional[List[int]] = None):
+        super().__init__()
+        self.storage = storage
+        self.clusterer = clusterer
+        self.article_ids = article_ids
+        self.signals = self.WorkerSignals()
+        self.logger = logging.getLogger('news_analyzer.core.incremental_clusterer')
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            stats = {'assigned': 0, 'created': 0, 'skipped': 0}
+            assigned = self.clusterer.assignments
+            if self.article_ids is None:
+                pending = [row['id'] for page in self.storage.iter_article_headlines()
+                           for row in page if row and row.get('id') not in assigned]
+            else:
+                pending = [article_id for article_id in self.article_ids if article_id not in assigned]
+            # 旧文章先聚类，使在线分配的顺序接近发布顺序
+            pending.reverse()
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                articles = self.storage.get_articles_by_ids(pending[start:start + self.BATCH_SIZE])
+                articles.sort(key=lambda news: publish_time_epoch_us(news.get('publish_time')) or MIN_EPOCH_US)
+                for key, value in self.clusterer.add_articles(articles).items():
+                    stats[key] += value
+            if self.clusterer.needs_consolidation():
+                stats.update(self.clusterer.consolidate())
+            self.signals.finished.emit(self.clusterer.event_dicts(), stats)
+        except Exception as e:
+            self.logger.error(f"后台增量聚类失败: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
@@ -0,0 +1,84 @@
+"""
+核心服务 - 渐进式初始新闻加载
+
+启动时 AppService 只同步加载最新的一页标题 (不含正文) 并立即交给界面，
+其余较旧的文章由 InitialNewsPageLoader 在后台线程中分页读取并转换为 NewsListRow，
+每读完一页通过信号交回主线程合并进缓存 (news_cache_delta)，界面在此期间保持可操作。
+
+页的大小逐页翻倍 (直到 max_page_size)：前几页很快出现在列表中，
+而合并次数只随文章总数对数增长。
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal as pyqtSignal, Slot as pyqtSlot
+
+from src.core.cancellation_flag import CancellationFlag
+from src.models import NewsListRow
+from src.storage.news_storage import NewsStorage
+
+
+def growing_page_sizes(first_page: int, max_page_size: int) -> List[int]:
+    """从 2 * first_page 开始逐页翻倍、直到 max_page_size 的页大小序列。"""
+    sizes = []
+    size = max(first_page, 1) * 2
+    while size < max_page_size:
+        sizes.append(size)
+        size *= 2
+    return sizes
+
+
+class InitialNewsPageLoader(QRunnable):
+    """
+    在后台线程中分页读取 offset 之后的全部文章标题并转换为 NewsListRow。
+
+    Args:
+        storage: 文件数据库的 NewsStorage (后台线程使用独立的只读连接)。
+        offset: 已经同步加载的文章数。
+        categories: 来源名称 -> 分类名称；不在其中的来源分类为 "未分类"。
+        first_page: 同步加载的页大小，后台页从它的两倍开始逐页翻倍。
+        max_page_size: 后台页的上限。
+        cancel_flag: 设置后在下一页之前停止 (例如应用退出)。
+    """
+
+    class WorkerSignals(QObject):
+        # 第一个参数均为本次加载的取消标志，接收方据此丢弃已被取消 (或被新的加载取代) 的结果
+        page_loaded = pyqtSignal(object, list)          # cancel_flag, 一页 NewsListRow
+        finished = pyqtSignal(object, int, float)       # cancel_flag, 后台加载的文章总数, 耗时 (秒)
+        failed = pyqtSignal(object, str)
+
+    def __init__(self, storage: NewsStorage, offset: int, categories: Dict[str, Optional[str]],
+                 first_page: int, max_page_size: int = 20000, cancel_flag: Optional[CancellationFlag] = None):
+        super().__init__()
+        self.logger = logging.getLogger('news_analyzer.core.initial_news_loader')
+        self.signals = InitialNewsPageLoader.WorkerSignals()
+        self.storage = storage
+        self.offset = offset
+        self.categories = categories
+        self.page_sizes = growing_page_sizes(first_page, max_page_size)
+        self.max_page_size = max_page_size
+        self.cancel_flag = cancel_flag or CancellationFlag()
+
+    @pyqtSlot()
+    def run(self):
+        started = time.perf_counter()
+        loaded = 0
+        try:
+            categories = self.categories
+            for page in self.storage.iter_article_headlines(self.offset, self.page_sizes, self.max_page_size):
+                if self.cancel_flag.is_set():
+                    self.logger.info(f"后台加载已取消，已加载 {loaded} 篇。")
+                    break
+                rows = []
+                for item in page:
+                    row = NewsListRow.from_storage_dict(item, categories.get(item.get('source_name')))
+                    if row is not None:
+                        rows.append(row)
+                loaded += len(rows)
+                self.signals.page_loaded.emit(self.cancel_flag, rows)
+        except Exception as e:
+            self.logger.error(f"后台加载历史新闻失败: {e}", exc_info=True)
+            self.signals.failed.emit(self.cancel_flag, str(e))
+        self.signals.finished.emit(self.cancel_flag, loaded, time.perf_counter() - started)
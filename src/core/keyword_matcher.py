@@ -0,0 +1,170 @@
+"""
+核心服务 - 分类关键词匹配
+
+NewsDataProcessor、NewsClusterer、EnhancedNewsClusterer 原来对每篇新闻逐个类别、逐个关键词执行
+`keyword in text`，每篇新闻的代价为 O(类别数 × 关键词数 × 文本长度)，标题还要再查一遍。
+
+KeywordMatcher 把全部关键词编译成一个按字符前缀树组织的正则表达式 (相同前缀的关键词共享分支)，
+对标题和正文各扫描一遍，得到每个类别命中的关键词及其在标题、正文中的位置:
+
+  - 正则以关键词首字符的字符集开头，re 在 C 代码中跳过不可能匹配的位置，只在命中处回到 Python；
+    首字符分桶后再分支，候选位置上的比较次数从关键词首字符数降到其平方根量级
+  - 每个位置匹配最长的关键词，作为其前缀的较短关键词 (如 "经济" 之于 "经济增长") 由预先计算的前缀表补齐；
+    下一次搜索从命中位置的下一个字符开始，重叠的关键词不会遗漏，结果与逐个 `in` 判断相同
+  - 关键词与文本都转为小写后匹配；标题和正文分别扫描 (原来的拼接文本中，不含空格的关键词不会跨越两者)
+
+categorize() 保持原来的规则：每个类别取关键词列表中最靠前的命中词，优先返回该词出现在标题中的第一个类别，
+否则返回第一个命中的类别。CategoryHits.score 给出按标题/正文加权的命中数，供需要打分的调用方使用。
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+TITLE_WEIGHT = 2.0  # CategoryHits.score 中标题命中相对正文命中的权重
+
+# find() 的结果: ({关键词: 在标题中的位置}, {关键词: 在正文中的位置})
+Found = Tuple[Dict[str, List[int]], Dict[str, List[int]]]
+
+
+@dataclass
+class KeywordHit:
+    """一个关键词在一篇新闻中的全部出现位置。"""
+    keyword: str  # 小写
+    rank: int  # 在所属类别关键词列表中的序号
+    title_positions: List[int] = field(default_factory=list)
+    body_positions: List[int] = field(default_factory=list)
+
+
+@dataclass
+class CategoryHits:
+    """一个类别在一篇新闻中的命中，hits 按关键词在列表中的顺序排列。"""
+    category: str
+    hits: List[KeywordHit]
+
+    @property
+    def score(self) -> float:
+        return sum(TITLE_WEIGHT * len(hit.title_positions) + len(hit.body_positions) for hit in self.hits)
+
+    @property
+    def in_title(self) -> bool:
+        return any(hit.title_positions for hit in self.hits)
+
+
+def _trie_pattern(keywords: Sequence[str]) -> str:
+    """
+    关键词 -> 前缀树形状的正则 (每个位置匹配最长的关键词)。
+
+    re 对分支逐个尝试，首字符有几百种时每个候选位置都要比较几百次；这里把首字符按 √n 个一组分桶，
+    先用字符集选中桶，再在桶内用后顾断言选中首字符的分支，每个位置约比较 2√n 次。
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    def charset(chars: Sequence[str]) -> str:
+        return '[' + ''.join(re.escape(char) for char in chars) + ']'
+
+    first_chars = sorted(char for char in trie if char)
+    size = math.isqrt(len(first_chars) - 1) + 1 if first_chars else 1
+    buckets = []
+    for start in range(0, len(first_chars), size):
+        chars = first_chars[start:start + size]
+        branches = '|'.join(f'(?<={re.escape(char)}){build(trie[char])}' for char in chars)
+        buckets.append(f'{charset(chars)}(?:{branches})')
+    # 开头的字符集让 re 在 C 代码中跳过不可能匹配的位置
+    return f'(?={charset(first_chars)})(?:' + '|'.join(buckets) + ')'
+
+
+class KeywordMatcher:
+    """
+    一组类别关键词的编译结果。
+
+    用法:
+        matcher = keyword_matcher(self.category_keywords)
+        category = matcher.categorize(news.get('title'), news.get('content'), default='uncategorized')
+        hits = matcher.scan(title, content)      # {类别: CategoryHits}，按类别顺序
+        in_title, in_body = matcher.find(title, content)   # {关键词: 位置}
+    """
+
+    def __init__(self, category_keywords: Mapping[str, Sequence[str]]):
+        self.categories = list(category_keywords)
+        # 小写关键词 -> [(类别序号, 在该类别中的序号)]；同一类别重复的关键词只记第一次
+        self._owners: Dict[str, List[Tuple[int, int]]] = {}
+        for index, keywords in enumerate(category_keywords.values()):
+            for rank, keyword in enumerate(keywords):
+                owners = self._owners.setdefault(keyword.lower(), [])
+                if keyword and all(owner != index for owner, _ in owners):
+                    owners.append((index, rank))
+        self._owners.pop('', None)
+        # 匹配到的最长关键词 -> 同一位置必然同时出现的关键词 (它本身及作为其前缀的关键词)
+        self._prefixes = {keyword: [keyword[:end] for end in range(1, len(keyword) + 1) if keyword[:end] in self._owners]
+                          for keyword in self._owners}
+        self._search = re.compile(_trie_pattern(list(self._owners))).search if self._owners else None
+
+    def _positions(self, text: str) -> Dict[str, List[int]]:
+        found: Dict[str, List[int]] = {}
+        if self._search is None:
+            return found
+        position = 0
+        while True:
+            match = self._search(text, position)
+            if match is None:
+                return found
+            start = match.start()
+            for keyword in self._prefixes[match.group()]:
+                found.setdefault(keyword, []).append(start)
+            position = start + 1
+
+    def find(self, title: Optional[str], content: Optional[str] = None) -> Found:
+        """标题、正文各扫描一遍：({关键词: 在小写标题中的位置}, {关键词: 在小写正文中的位置})。"""
+        return self._positions((title or '').lower()), self._positions((content or '').lower())
+
+    def scan(self, title: Optional[str], content: Optional[str] = None) -> Dict[str, CategoryHits]:
+        """有命中的类别 (按类别顺序) 及各关键词在标题、正文中的位置。"""
+        in_title, in_body = self.find(title, content)
+        by_category: Dict[int, List[KeywordHit]] = {}
+        for keyword in in_title.keys() | in_body.keys():
+            for index, rank in self._owners[keyword]:
+                by_category.setdefault(index, []).append(
+                    KeywordHit(keyword, rank, in_title.get(keyword, []), in_body.get(keyword, [])))
+        return {self.categories[index]: CategoryHits(self.categories[index], sorted(hits, key=lambda hit: hit.rank))
+                for index, hits in sorted(by_category.items())}
+
+    def best_category(self, found: Found, default: str) -> str:
+        """每个类别取列表中最靠前的命中词；该词出现在标题中的类别优先，否则取第一个命中的类别。"""
+        in_title, in_body = found
+        best: Dict[int, Tuple[int, str]] = {}  # 类别序号 -> (最小序号, 关键词)
+        for keyword in in_title.keys() | in_body.keys():
+            for index, rank in self._owners[keyword]:
+                if index not in best or rank < best[index][0]:
+                    best[index] = (rank, keyword)
+        for index in sorted(best):
+            if best[index][1] in in_title:
+                return self.categories[index]
+        return self.categories[min(best)] if best else default
+
+    def categorize(self, title: Optional[str], content: Optional[str] = None, default: str = 'uncategorized') -> str:
+        return self.best_category(self.find(title, content), default)
+
+
+@lru_cache(maxsize=32)
+def _compiled(key: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    return KeywordMatcher(dict(key))
+
+
+def keyword_matcher(category_keywords: Mapping[str, Sequence[str]]) -> KeywordMatcher:
+    """category_keywords 对应的 KeywordMatcher；相同内容的关键词表只编译一次 (之后修改关键词表会重新编译)。"""
+    return _compiled(tuple((category, tuple(keywords)) for category, keywords in category_keywords.items()))
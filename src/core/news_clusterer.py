@@ -7,15 +7,15 @@
 """
 
 import logging
-import re
 from typing import List, Dict, Tuple, Set, Optional
 from datetime import datetime
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import DBSCAN
 import numpy as np
 
 from src.collectors.categories import STANDARD_CATEGORIES
+from src.core.keyword_matcher import keyword_matcher
+from src.core.text_tokenizer import hashing_vectorizer, keywords as title_keywords, tfidf_from_counts
 
 
 class NewsClusterer:
@@ -62,10 +62,9 @@ class NewsClusterer:
         # 提取文本特征
         texts = [f"{n.get('title', '')} {n.get('content', '')}" for n in news_list]
         
-        # 使用TF-IDF向量化文本
+        # 使用TF-IDF向量化文本 (中英文统一分词后哈希为词频，只保留最常见的 5000 个词)
         try:
-            vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
-            tfidf_matrix = vectorizer.fit_transform(texts)
+            tfidf_matrix = tfidf_from_counts(hashing_vectorizer().transform(texts), max_features=5000)
             
             # 使用DBSCAN进行聚类
             clustering = DBSCAN(eps=self.eps, min_samples=self.min_samples, metric='cosine').fit(tfidf_matrix)
@@ -166,21 +165,8 @@ class NewsClusterer:
         Returns:
             关键词列表
         """
-        # 简单实现：提取标题中的名词和动词作为关键词
-        title = news.get('title', '')
-        if not title:
-            return []
-            
-        # 移除标点符号
-        title = re.sub(r'[^\w\s]', '', title)
-        
-        # 分词并过滤停用词
-        words = title.split()
-        stop_words = {'的', '了', '在', '是', '和', '与', '或', '有', '被', '将', '把', '从', '到', '对', '为'}
-        keywords = [w for w in words if w not in stop_words and len(w) > 1]
-        
-        # 限制关键词数量
-        return keywords[:5]
+        # 简单实现：标题分词 (中英文统一规则，去掉停用词) 后的前 5 个词
+        return title_keywords(news.get('title', ''))
     
     def _categorize_news(self, news: Dict) -> str:
         """对新闻进行分类
@@ -191,35 +177,9 @@ class NewsClusterer:
         Returns:
             分类ID
         """
-        title = news.get('title', '') or ''
-        content = news.get('content', '') or ''
-        text = (title + " " + content).lower()
-        
-        # 匹配关键词
-        matched_categories = []
-        for category_id, keywords in self.category_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    matched_categories.append((category_id, keyword))
-                    break
-        
-        # 如果有匹配的类别
-        if matched_categories:
-            # 优先考虑标题中出现的关键词
-            title_matches = []
-            for cat_id, keyword in matched_categories:
-                if keyword.lower() in title.lower():
-                    title_matches.append(cat_id)
-            
-            if title_matches:
-                # 使用标题中的第一个匹配类别
-                return title_matches[0]
-            else:
-                # 使用内容中的第一个匹配类别
-                return matched_categories[0][0]
-        
-        # 如果没有匹配到任何类别，返回未分类
-        return "uncategorized"
+        # 每个类别取列表中最靠前的命中词，优先返回该词出现在标题中的类别，没有命中时返回未分类
+        return keyword_matcher(self.category_keywords).categorize(news.get('title'), news.get('content'),
+                                                                  default="uncategorized")
     
     def get_category_name(self, category_id: str) -> str:
         """获取分类名称
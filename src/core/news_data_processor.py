@@ -7,6 +7,7 @@
 """
 
 import logging
+import re
 import time
 from datetime import datetime
 from typing import List, Dict, Set, Tuple, Optional, Any
@@ -14,6 +15,24 @@ from typing import List, Dict, Set, Tuple, Optional, Any
 from src.storage.news_storage import NewsStorage
 from src.collectors.categories import STANDARD_CATEGORIES
 from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.core.keyword_matcher import keyword_matcher
+from src.core.title_lsh import TitleLSHIndex
+from src.storage.article_feature_store import ArticleFeatureStore
+from src.storage.cluster_result_store import ClusterResultStore
+
+# 主题关键词字典 - 按标题分组时用于识别新闻主题
+TITLE_TOPIC_KEYWORDS = {
+    "ai": ["ai", "artificial intelligence", "chatgpt", "openai", "llm", "large language model", "gpt", "机器学习", "人工智能"],
+    "tech": ["technology", "tech", "software", "hardware", "app", "application", "digital", "computer", "internet", "web", "online", "科技", "技术"],
+    "social": ["social", "society", "community", "people", "public", "social media", "facebook", "twitter", "instagram", "tiktok", "社交", "社会"],
+    "politics": ["politics", "government", "election", "president", "policy", "political", "vote", "democracy", "republican", "democrat", "政治", "政府"],
+    "business": ["business", "economy", "market", "stock", "company", "corporation", "finance", "investment", "商业", "经济", "市场", "金融"],
+    "health": ["health", "medical", "medicine", "disease", "virus", "doctor", "hospital", "patient", "healthcare", "健康", "医疗", "疾病"],
+    "environment": ["environment", "climate", "weather", "pollution", "green", "sustainable", "ecology", "wildlife", "nature", "环境", "气候", "生态", "野生动物"],
+    "sports": ["sports", "game", "match", "team", "player", "championship", "tournament", "competition", "体育", "比赛", "选手", "冠军"],
+    "entertainment": ["entertainment", "movie", "film", "music", "celebrity", "star", "actor", "actress", "singer", "娱乐", "电影", "音乐", "明星"],
+    "science": ["science", "research", "study", "discovery", "experiment", "scientist", "laboratory", "科学", "研究", "发现", "实验"]
+}
 
 
 class NewsDataProcessor:
@@ -35,6 +54,8 @@ class NewsDataProcessor:
         self.all_news_items: List[Dict] = []
         self.categorized_news: Dict[str, List[Dict]] = {}
         self.news_groups: List[List[Dict]] = []
+        self._feature_store: Optional[ArticleFeatureStore] = None  # 多特征聚类的文章特征缓存，首次使用时打开
+        self._result_store: Optional[ClusterResultStore] = None  # 多特征聚类的结果缓存，首次使用时打开
         
         # 分类关键词
         self.category_keywords = {
@@ -102,42 +123,11 @@ class NewsDataProcessor:
         if "military" not in self.categorized_news:
             self.categorized_news["military"] = []
         
+        # 每个类别取列表中最靠前的命中词，优先使用该词出现在标题中的类别，没有命中时放入未分类
+        matcher = keyword_matcher(self.category_keywords)
         for news in self.all_news_items:
-            title = news.get('title', '') or ''
-            content = news.get('content', '') or ''
-            text = (title + " " + content).lower()
-            
-            # 初始化分类结果
-            categorized = False
-            matched_categories = []
-            
-            # 遍历所有类别的关键词，收集所有匹配的类别
-            for category_id, keywords in self.category_keywords.items():
-                for keyword in keywords:
-                    if keyword.lower() in text:
-                        matched_categories.append((category_id, keyword))
-                        break
-            
-            # 如果有匹配的类别
-            if matched_categories:
-                # 优先考虑标题中出现的关键词
-                title_matches = []
-                for cat_id, keyword in matched_categories:
-                    if keyword.lower() in title.lower():
-                        title_matches.append(cat_id)
-                
-                if title_matches:
-                    # 使用标题中的第一个匹配类别
-                    self.categorized_news[title_matches[0]].append(news)
-                    categorized = True
-                else:
-                    # 使用内容中的第一个匹配类别
-                    self.categorized_news[matched_categories[0][0]].append(news)
-                    categorized = True
-            
-            # 如果没有匹配到任何类别，放入未分类
-            if not categorized:
-                self.categorized_news["uncategorized"].append(news)
+            category_id = matcher.categorize(news.get('title'), news.get('content'), default="uncategorized")
+            self.categorized_news[category_id].append(news)
         
         # 记录各类别的新闻数量
         for category_id, news_list in self.categorized_news.items():
@@ -238,8 +228,9 @@ class NewsDataProcessor:
             事件组列表，每个事件组为一个字典
         """
         try:
-            # 创建增强型新闻聚类器实例
-            clusterer = EnhancedNewsClusterer()
+            # 创建增强型新闻聚类器实例 (文章特征跨次缓存，只为新文章计算；文章和参数未变化时直接使用上次的结果)
+            clusterer = EnhancedNewsClusterer(feature_store=self._get_feature_store(),
+                                              result_store=self._get_result_store())
             
             # 准备数据
             news_data = []
@@ -263,10 +254,33 @@ class NewsDataProcessor:
             self.logger.error(f"使用增强型新闻聚类器分组时出错: {e}", exc_info=True)
             return []
     
+    def _get_feature_store(self) -> Optional[ArticleFeatureStore]:
+        """数据目录下的文章特征存储；内存数据库 (测试) 不缓存特征"""
+        if self._feature_store is None and isinstance(self.storage, NewsStorage) \
+                and self.storage.supports_concurrent_reads():
+            try:
+                self._feature_store = ArticleFeatureStore(self.storage.data_dir)
+            except Exception as e:
+                self.logger.warning(f"无法打开文章特征存储，将不缓存聚类特征: {e}")
+        return self._feature_store
+    
+    def _get_result_store(self) -> Optional[ClusterResultStore]:
+        """数据目录下的聚类结果存储；内存数据库 (测试) 不缓存结果"""
+        if self._result_store is None and isinstance(self.storage, NewsStorage) \
+                and self.storage.supports_concurrent_reads():
+            try:
+                self._result_store = ClusterResultStore(self.storage.data_dir)
+            except Exception as e:
+                self.logger.warning(f"无法打开聚类结果存储，将不缓存聚类结果: {e}")
+        return self._result_store
+    
     def _auto_group_news_by_title(self, news_items: List[Dict]) -> List[List[Dict]]:
         """
         使用标题相似度方法分组新闻
-        
+
+        先用 TitleLSHIndex (MinHash + LSH) 找出标题字符 shingle 相近的候选对，
+        只对候选对应用下面的关键词/主题/来源规则，避免 n² 次逐对比较。
+
         Args:
             news_items: 要分组的新闻列表
             
@@ -274,54 +288,33 @@ class NewsDataProcessor:
             分组后的新闻列表
         """
         try:
+            start_time = time.time()
             # 使用标题关键词匹配、主题识别和来源区分进行分组
             groups = []
             processed = set()
             
-            # 优化：预处理所有标题，避免重复处理
+            # 预处理所有标题：分词、主题、实体、数字和字符集合只计算一次
             preprocessed_titles = []
-            # 主题关键词字典 - 用于识别新闻主题
-            topic_keywords = {
-                "ai": ["ai", "artificial intelligence", "chatgpt", "openai", "llm", "large language model", "gpt", "机器学习", "人工智能"],
-                "tech": ["technology", "tech", "software", "hardware", "app", "application", "digital", "computer", "internet", "web", "online", "科技", "技术"],
-                "social": ["social", "society", "community", "people", "public", "social media", "facebook", "twitter", "instagram", "tiktok", "社交", "社会"],
-                "politics": ["politics", "government", "election", "president", "policy", "political", "vote", "democracy", "republican", "democrat", "政治", "政府"],
-                "business": ["business", "economy", "market", "stock", "company", "corporation", "finance", "investment", "商业", "经济", "市场", "金融"],
-                "health": ["health", "medical", "medicine", "disease", "virus", "doctor", "hospital", "patient", "healthcare", "健康", "医疗", "疾病"],
-                "environment": ["environment", "climate", "weather", "pollution", "green", "sustainable", "ecology", "wildlife", "nature", "环境", "气候", "生态", "野生动物"],
-                "sports": ["sports", "game", "match", "team", "player", "championship", "tournament", "competition", "体育", "比赛", "选手", "冠军"],
-                "entertainment": ["entertainment", "movie", "film", "music", "celebrity", "star", "actor", "actress", "singer", "娱乐", "电影", "音乐", "明星"],
-                "science": ["science", "research", "study", "discovery", "experiment", "scientist", "laboratory", "科学", "研究", "发现", "实验"]
-            }
-            
+            topic_matcher = keyword_matcher(TITLE_TOPIC_KEYWORDS)
             for news in news_items:
                 title = news.get('title', '').lower()
                 words = set(title.split()) if title else set()
                 
                 # 识别新闻主题
-                topics = set()
-                for topic, keywords in topic_keywords.items():
-                    for keyword in keywords:
-                        if keyword in title:
-                            topics.add(topic)
-                            break
+                topics = set(topic_matcher.scan(title))
                 
-                preprocessed_titles.append((title, words, topics))
+                # 实体名词（大写开头的词，可能是人名、地名、组织名等）和数字（可能是日期、数量等重要信息）
+                entities = {word for word in title.split() if word and word[0].isupper()}
+                numbers = set(re.findall(r'\d+', title))
+                preprocessed_titles.append((title, words, topics, entities, numbers, set(title)))
             
-            import time
-            start_time = time.time()
-            max_processing_time = 60  # 最大处理时间（秒）
+            index = TitleLSHIndex([item[0] for item in preprocessed_titles])
             
             for i, news in enumerate(news_items):
-                # 检查是否超时
-                if time.time() - start_time > max_processing_time:
-                    self.logger.warning(f"自动分组处理时间超过{max_processing_time}秒，提前结束处理")
-                    break
-                    
                 if i in processed:
                     continue
                 
-                title_i, words_i, topics_i = preprocessed_titles[i]
+                title_i, words_i, topics_i, entities_i, numbers_i, chars_i = preprocessed_titles[i]
                 if not title_i:
                     continue
                 
@@ -330,17 +323,18 @@ class NewsDataProcessor:
                 sources = {news.get('source_name', '未知来源')}
                 processed.add(i)
                 
-                # 查找相似新闻，但来源不同的新闻
-                for j, other_news in enumerate(news_items):
-                    if j in processed or i == j:
+                # 在候选新闻中查找相似但来源不同的新闻（候选下标升序，与逐一比较的顺序一致）
+                for j in index.candidates(i).tolist():
+                    if j in processed:
                         continue
                     
                     # 检查来源是否已存在于当前组
+                    other_news = news_items[j]
                     other_source = other_news.get('source_name', '未知来源')
                     if other_source in sources:
                         continue  # 跳过相同来源的新闻
                     
-                    title_j, words_j, topics_j = preprocessed_titles[j]
+                    title_j, words_j, topics_j, entities_j, numbers_j, chars_j = preprocessed_titles[j]
                     if not title_j:
                         continue
                     
@@ -352,28 +346,19 @@ class NewsDataProcessor:
                     common_words = words_i.intersection(words_j)
                     keyword_similarity = len(common_words) / max(len(words_i), 1) if words_i else 0
                     
-                    # 提取实体名词（大写开头的词，可能是人名、地名、组织名等）
-                    entities_i = {word for word in title_i.split() if word and word[0].isupper()}
-                    entities_j = {word for word in title_j.split() if word and word[0].isupper()}
-                    entity_match = bool(entities_i.intersection(entities_j)) if entities_i and entities_j else False
+                    common_entities = entities_i.intersection(entities_j)
+                    entity_match = bool(common_entities) if entities_i and entities_j else False
                     
-                    # 提取数字（可能是日期、数量等重要信息）
-                    import re
-                    numbers_i = set(re.findall(r'\d+', title_i))
-                    numbers_j = set(re.findall(r'\d+', title_j))
                     # 如果两篇新闻都包含数字，但没有共同数字，可能是不同事件
                     if numbers_i and numbers_j and not numbers_i.intersection(numbers_j):
                         # 数字不匹配，降低相似度可能性
                         # 但如果有强实体匹配，仍然继续检查
-                        if not entity_match or len(entities_i.intersection(entities_j)) < 2:
+                        if not entity_match or len(common_entities) < 2:
                             continue
                     
                     # 只有关键词匹配度较高或有共同实体的才进行更复杂的相似度计算
-                    if keyword_similarity > 0.3 or len(common_words) >= 3 or (entity_match and len(entities_i.intersection(entities_j)) >= 2):
-                        # 3. 字符串相似度 - 使用更高效的算法
-                        # 简化版：使用共同字符比例而不是LCS
-                        chars_i = set(title_i)
-                        chars_j = set(title_j)
+                    if keyword_similarity > 0.3 or len(common_words) >= 3 or (entity_match and len(common_entities) >= 2):
+                        # 3. 字符串相似度 - 使用共同字符比例而不是LCS
                         common_chars = len(chars_i.intersection(chars_j))
                         string_similarity = common_chars / max(len(chars_i) + len(chars_j) - common_chars, 1)
                         
@@ -383,7 +368,7 @@ class NewsDataProcessor:
                         # 检查是否包含相同的关键实体（如公司名、人名等）
                         if entity_match:
                             # 根据匹配实体数量调整权重
-                            matched_entities = len(entities_i.intersection(entities_j))
+                            matched_entities = len(common_entities)
                             if matched_entities >= 3:
                                 semantic_similarity += 0.4
                             elif matched_entities >= 2:
@@ -414,7 +399,8 @@ class NewsDataProcessor:
             
             # 记录处理时间
             processing_time = time.time() - start_time
-            self.logger.info(f"自动分组处理完成，耗时 {processing_time:.2f} 秒，处理了 {len(processed)}/{len(news_items)} 条新闻")
+            self.logger.info(f"自动分组处理完成，耗时 {processing_time:.2f} 秒，"
+                             f"比较了 {index.pair_count} 对候选标题，共 {len(news_items)} 条新闻")
             
             self.news_groups = groups
             return groups
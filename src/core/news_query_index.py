@@ -0,0 +1,323 @@
+"""
+核心服务 - 新闻列表内存查询索引
+
+为新闻列表的过滤与排序预先建立索引，使切换分类、搜索、日期窗口或排序方向时
+不必对全部新闻逐条做字符串小写化、时区换算和 Python 排序：
+
+  - 分类 -> 位置列表
+  - 按发布时间 (UTC 微秒整数) 排好序的位置数组，日期窗口用 bisect 截取连续区间
+  - 每个可搜索字段一份预先小写化的语料 (按位置排列的字符串列表)，最近一次搜索的结果被缓存，
+    搜索词不变时切换分类/日期/排序无需重新搜索
+
+"位置" 指文章在建立索引时传入的列表中的下标。每篇文章的派生数据 (时间戳、小写文本)
+按对象缓存，重建索引时未变化的文章直接复用，因此增量变更后的重建也只是 O(n) 的拼接。
+
+每次重建生成一个新的 IndexSnapshot，建成后不再修改 (只会懒加载搜索语料)。
+后台线程可以持有某个快照执行查询，主线程同时重建索引也不会互相干扰；
+返回的位置只对该快照有效，调用方用 `snapshot is index.snapshot` 判断结果是否过期。
+
+内存缓存中的列表行 (NewsListRow) 不携带正文等大字段。搜索这类字段时，
+这些文章的匹配交给构造时传入的 stored_search (通常由数据库执行)，结果按文章 ID 映射回位置。
+
+本模块不依赖 Qt。
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# datetime.min (UTC) 对应的时间戳：没有发布时间的新闻排在最早
+MIN_EPOCH_US = (datetime.min.replace(tzinfo=timezone.utc) - _EPOCH) // _EPOCH.resolution
+
+
+def datetime_to_epoch_us(value: datetime) -> int:
+    """把 datetime 转为 UTC 微秒时间戳 (naive 视为 UTC)，保持与 aware datetime 比较相同的顺序。"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _EPOCH.resolution
+
+
+def publish_time_epoch_us(value: Any) -> Optional[int]:
+    """
+    发布时间的排序键。
+
+    Returns:
+        int: 时间戳；None 表示值无法解析 (调用方通常按最早处理)。
+        值为 None 时返回 MIN_EPOCH_US。
+    """
+    if value is None:
+        return MIN_EPOCH_US
+    if isinstance(value, datetime):
+        return datetime_to_epoch_us(value)
+    try:
+        return datetime_to_epoch_us(datetime.fromisoformat(str(value)))
+    except (ValueError, TypeError):
+        return None
+
+
+def take(values: Sequence[Any], positions: Sequence[int]) -> List[Any]:
+    """按位置批量取值 (itemgetter 在 C 层完成循环，比列表推导式快数倍)。"""
+    if not positions:
+        return []
+    if len(positions) == 1:
+        return [values[positions[0]]]
+    return list(itemgetter(*positions)(values))
+
+
+class _Derived:
+    """单篇文章的派生索引数据 (按对象缓存)。"""
+
+    __slots__ = ('article', 'epoch', 'timed', 'lowered')
+
+    def __init__(self, article):
+        self.article = article
+        publish_ts = getattr(article, 'publish_ts', None)
+        if publish_ts is not None:
+            # 列表行直接保存整数时间戳
+            self.timed = True
+            self.epoch = publish_ts
+        else:
+            publish_time = article.publish_time
+            # 日期过滤只接受真正的 datetime，与 NewsListViewModel._matches_filters 一致
+            self.timed = isinstance(publish_time, datetime)
+            epoch = publish_time_epoch_us(publish_time)
+            self.epoch = MIN_EPOCH_US if epoch is None else epoch
+        self.lowered: Dict[str, str] = {}
+
+    def lowered_field(self, field: str) -> str:
+        text = self.lowered.get(field)
+        if text is None:
+            value = getattr(self.article, field, None)
+            text = "" if value is None else str(value).lower()
+            self.lowered[field] = text
+        return text
+
+
+class IndexSnapshot:
+    """某一版文章列表的查询索引 (只读)。"""
+
+    def __init__(self, records: List[_Derived],
+                 stored_search: Optional[Callable[[str, Tuple[str, ...]], Set[Any]]] = None):
+        self.records = records
+        self._stored_search = stored_search
+        epochs = [record.epoch for record in records]
+        self.epochs = epochs
+        self.negated_epochs = [-epoch for epoch in epochs]
+
+        self.categories = [record.article.category for record in records]
+        self.category_positions: Dict[Any, List[int]] = {}
+        for position, category in enumerate(self.categories):
+            self.category_positions.setdefault(category, []).append(position)
+
+        # 稳定排序：时间相同的文章保持原有顺序，与 list.sort(reverse=...) 的结果一致
+        self.asc_positions = sorted(range(len(records)), key=epochs.__getitem__)
+        self.desc_positions = sorted(range(len(records)), key=epochs.__getitem__, reverse=True)
+        self.asc_epochs = [epochs[position] for position in self.asc_positions]
+        self.untimed = frozenset(position for position, record in enumerate(records) if not record.timed)
+        self._corpora: Dict[str, List[str]] = {}  # 字段 -> 各位置的小写文本，第一次搜索该字段时生成
+        self._last_search: Optional[Tuple[str, Tuple[str, ...], set]] = None
+        self._detached: Dict[str, bool] = {}  # 字段 -> 是否有文章对象不携带该字段
+        self._id_positions: Optional[Dict[Any, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def epochs_for(self, positions: Sequence[int], negate: bool = False) -> List[int]:
+        """批量取时间戳；negate=True 时取负 (降序视图的升序键)。"""
+        return take(self.negated_epochs if negate else self.epochs, positions)
+
+    def corpus(self, field: str) -> List[str]:
+        corpus = self._corpora.get(field)
+        if corpus is None:
+            corpus = [record.lowered_field(field) for record in self.records]
+            self._corpora[field] = corpus
+        return corpus
+
+    def _detached_fields(self, fields: Iterable[str]) -> Tuple[str, ...]:
+        """fields 中需要交给 stored_search 的字段 (有文章对象不携带该属性)。"""
+        if self._stored_search is None:
+            return ()
+        detached = []
+        for field in fields:
+            flag = self._detached.get(field)
+            if flag is None:
+                flag = any(not hasattr(record.article, field) for record in self.records)
+                self._detached[field] = flag
+            if flag:
+                detached.append(field)
+        return tuple(detached)
+
+    def _stored_matches(self, term: str, fields: Tuple[str, ...]) -> set:
+        ids = self._stored_search(term, fields)
+        if self._id_positions is None:
+            self._id_positions = {record.article.id: position for position, record in enumerate(self.records)
+                                  if record.article.id is not None}
+        id_positions = self._id_positions
+        return {id_positions[article_id] for article_id in ids if article_id in id_positions}
+
+    def search(self, term: str, fields: Iterable[str]) -> set:
+        """返回任一字段 (小写) 包含 term 的文章位置集合；term 应已小写。"""
+        fields = tuple(fields)
+        last = self._last_search
+        if last is not None and last[0] == term and last[1] == fields:
+            return last[2]
+        matches = set()
+        for field in fields:
+            matches.update(position for position, text in enumerate(self.corpus(field)) if term in text)
+        detached = self._detached_fields(fields)
+        if detached:
+            matches.update(self._stored_matches(term, detached))
+        self._last_search = (term, fields, matches)
+        return matches
+
+    def filter_by_term(self, positions: Sequence[int], term: str, fields: Iterable[str]) -> List[int]:
+        """只在候选位置中检查搜索词 (候选集已被其他条件缩小时比全量搜索更快)，保持候选顺序。"""
+        fields = tuple(fields)
+        if self._detached_fields(fields):
+            # 不在内存中的字段只能整体查询一次 (结果被缓存)，再按候选过滤
+            matches = self.search(term, fields)
+            return [position for position in positions if position in matches]
+        corpora = [self.corpus(field) for field in fields]
+        if len(corpora) == 1:
+            texts = corpora[0]
+            return [position for position in positions if term in texts[position]]
+        if len(corpora) == 2:
+            first, second = corpora
+            return [position for position in positions if term in first[position] or term in second[position]]
+        return [position for position in positions if any(term in texts[position] for texts in corpora)]
+
+    def time_range(self, start_epoch: int, end_epoch: int, descending: bool = False) -> List[int]:
+        """发布时间在 [start_epoch, end_epoch] 内的位置，按时间排序；不含没有有效发布时间的文章。"""
+        low = bisect_left(self.asc_epochs, start_epoch)
+        high = bisect_right(self.asc_epochs, end_epoch)
+        if descending:
+            count = len(self.asc_epochs)
+            positions = self.desc_positions[count - high:count - low]
+        else:
+            positions = self.asc_positions[low:high]
+        if self.untimed:
+            untimed = self.untimed
+            positions = [position for position in positions if position not in untimed]
+        return positions
+
+    def candidates(self, category: Optional[Any] = None,
+                   date_bounds: Optional[Tuple[datetime, datetime]] = None,
+                   time_order: Optional[str] = None) -> Tuple[List[int], bool]:
+        """
+        按分类和日期过滤 (不含搜索词)，按 time_order 排序。
+
+        Returns:
+            (positions, narrowed): narrowed 表示候选集是否已被条件缩小。
+        """
+        if date_bounds is not None:
+            start, end = (datetime_to_epoch_us(bound) for bound in date_bounds)
+            positions = self.time_range(start, end, descending=(time_order == 'desc'))
+            if time_order is None:
+                positions.sort()
+        elif time_order == 'asc':
+            positions = self.asc_positions
+        elif time_order == 'desc':
+            positions = self.desc_positions
+        elif category is not None:
+            positions = self.category_positions.get(category, [])
+        else:
+            positions = range(len(self.records))
+
+        if category is not None:
+            categories = self.categories
+            positions = [position for position in positions if categories[position] == category]
+        return list(positions), (date_bounds is not None or category is not None)
+
+    def query(self, category: Optional[Any] = None, term: str = "", fields: Iterable[str] = (),
+              date_bounds: Optional[Tuple[datetime, datetime]] = None,
+              time_order: Optional[str] = None) -> List[int]:
+        """
+        返回满足全部条件的文章位置。
+
+        Args:
+            category: 只保留该分类；None 表示不过滤。
+            term: 小写搜索词；空串表示不过滤。
+            fields: 搜索的字段名。
+            date_bounds: (开始, 结束) 含两端；None 表示不过滤日期。
+            time_order: 'asc' / 'desc' 按发布时间排序；None 保持原有顺序。
+        """
+        positions, narrowed = self.candidates(category, date_bounds, time_order)
+        if term:
+            last = self._last_search
+            if narrowed and not (last is not None and last[0] == term and last[1] == tuple(fields)):
+                return self.filter_by_term(positions, term, fields)
+            matches = self.search(term, fields)
+            return [position for position in positions if position in matches]
+        return positions
+
+
+class NewsQueryIndex:
+    """
+    新闻列表的过滤/排序索引。
+
+    用法: 文章列表变化后调用 mark_dirty() (或传入新的列表对象)，下一次 query() 前
+    ensure_built() 会按需重建；query() 返回满足条件的位置列表。
+
+    Args:
+        stored_search: 可选，(小写搜索词, 字段元组) -> 匹配的文章 ID 集合。
+                       用于搜索文章对象本身不携带的字段 (如列表行的 content)，可能在后台线程中调用。
+    """
+
+    def __init__(self, stored_search: Optional[Callable[[str, Tuple[str, ...]], Set[Any]]] = None):
+        self._articles: Optional[Sequence[Any]] = None
+        self._dirty = True
+        self._derived: Dict[int, _Derived] = {}  # id(article) -> _Derived
+        self._stored_search = stored_search
+        self._snapshot = IndexSnapshot([], stored_search)
+
+    @property
+    def snapshot(self) -> IndexSnapshot:
+        """当前版本的索引快照。"""
+        return self._snapshot
+
+    def mark_dirty(self):
+        """文章列表被原地修改后调用。"""
+        self._dirty = True
+
+    def ensure_built(self, articles: Sequence[Any]) -> IndexSnapshot:
+        """若文章列表已变化 (新的列表对象或被标记为脏)，重建索引。返回当前快照。"""
+        if self._dirty or articles is not self._articles or len(articles) != len(self._snapshot):
+            self.rebuild(articles)
+        return self._snapshot
+
+    def rebuild(self, articles: Sequence[Any]):
+        previous = self._derived
+        derived: Dict[int, _Derived] = {}
+        records: List[_Derived] = []
+        for article in articles:
+            record = previous.get(id(article))
+            # 同时比较对象本身：id() 可能被已释放的文章复用
+            if record is None or record.article is not article:
+                record = _Derived(article)
+            derived[id(article)] = record
+            records.append(record)
+
+        self._articles = articles
+        self._derived = derived
+        self._snapshot = IndexSnapshot(records, self._stored_search)
+        self._dirty = False
+
+    # --- 委托给当前快照 ---
+    def epoch_at(self, position: int) -> int:
+        """某位置文章的发布时间戳 (无法解析时为 MIN_EPOCH_US)。"""
+        return self._snapshot.epochs[position]
+
+    def epochs_for(self, positions: Sequence[int], negate: bool = False) -> List[int]:
+        return self._snapshot.epochs_for(positions, negate)
+
+    def search(self, term: str, fields: Iterable[str]) -> set:
+        return self._snapshot.search(term, fields)
+
+    def time_range(self, start_epoch: int, end_epoch: int, descending: bool = False) -> List[int]:
+        return self._snapshot.time_range(start_epoch, end_epoch, descending)
+
+    def query(self, **criteria) -> List[int]:
+        return self._snapshot.query(**criteria)
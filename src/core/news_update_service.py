@@ -20,10 +20,13 @@ from src.models import NewsSource, NewsArticle
 from src.storage.news_storage import NewsStorage
 from src.core.source_manager import SourceManager
 # 导入具体的 Collector 类型
-from src.collectors import RSSCollector, PengpaiCollector # 确保导入
+from src.collectors import RSSCollector # PengpaiCollector 依赖 Selenium，由 CollectorFactory 按需导入
 from src.collectors import CollectorFactory # +++ 添加此导入 +++
+from src.collectors.parser_pool import ParserPool
 from src.collectors.categories import get_category_name # Import category helper
 from src.core.cancellation_flag import CancellationFlag # Import CancellationFlag
+from src.core.refresh_pipeline import RefreshPipeline
+from src.core.progress_aggregator import ProgressAggregator
 
 # --- Custom Exception for Cancellation ---
 class RefreshCancelledError(Exception):
@@ -183,7 +186,9 @@ class NewsUpdateService(QObject):
     # --- Signals ---
     refresh_started = pyqtSignal() # 开始刷新
     # MODIFIED: Include source_name in news_refreshed signal
-    news_refreshed = pyqtSignal(str, list) # 单个源刷新完成，发送 (source_name, news_items list)
+    news_refreshed = pyqtSignal(str, list) # 单个源刷新完成，发送 (source_name, news_items list)；刷新流水线不再使用，保留给旧的连接方
+    articles_stored = pyqtSignal(list) # 刷新流水线写入一个批次后发射 (该批次的链接列表)
+    progress_snapshot = pyqtSignal(dict) # 合并后的进度快照 (刷新或状态检查)，最多每 PROGRESS_PUBLISH_INTERVAL_MS 发射一次
     refresh_complete = pyqtSignal(bool, str) # 所有源刷新完成 (success: bool, message: str)
     source_status_checked = pyqtSignal(dict) # 单个源状态检查完成（成功或失败），附带结果
     sources_status_checked = pyqtSignal(list) # 所有源状态检查完成，附带所有结果列表
@@ -196,14 +201,21 @@ class NewsUpdateService(QObject):
     status_check_started = pyqtSignal()
     status_check_finished = pyqtSignal()
 
+    PROGRESS_PUBLISH_INTERVAL_MS = 100
+
     # --- Initialization ---
-    def __init__(self, storage: NewsStorage, source_manager: SourceManager, parent: Optional[QObject] = None):
+    def __init__(self, storage: NewsStorage, source_manager: SourceManager, parent: Optional[QObject] = None,
+                 parser_pool: Optional[ParserPool] = None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"--- NewsUpdateService.__init__: id(self)={id(self)}, id(self.news_refreshed)={id(self.news_refreshed)} ---") # +++ 新增日志 +++
         self.storage = storage
         self.source_manager = source_manager
-        self.collector_factory = CollectorFactory()
+        # 启用时，采集器只在 I/O 线程下载原始数据，解析交给子进程 (绕开 GIL)
+        self.parser_pool = parser_pool if parser_pool is not None and parser_pool.enabled else None
+        self.collector_factory = CollectorFactory(parser_pool=self.parser_pool)
+        if self.parser_pool:
+            self.logger.info(f"NewsUpdateService 已启用进程池解析 (最大子进程数: {self.parser_pool.max_workers})")
         self.thread_pool = QThreadPool.globalInstance() # Use global Qt thread pool
         self.logger.info(f"NewsUpdateService 使用最大线程数: {self.thread_pool.maxThreadCount()}")
 
@@ -215,6 +227,53 @@ class NewsUpdateService(QObject):
         self._cancel_refresh = CancellationFlag() # Cancellation flag for refresh tasks
         self._cancel_check_status = CancellationFlag() # Cancellation flag for check status tasks
 
+        # --- Progress Aggregation ---
+        # 工作线程只更新聚合器中的计数器，由主线程定时器合并发布，避免逐条跨线程发信号
+        self.refresh_progress = ProgressAggregator()
+        self.status_check_progress = ProgressAggregator()
+        self._published_progress_keys: Dict[str, Any] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_PUBLISH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._publish_progress)
+        self.refresh_complete.connect(self._on_refresh_finished_for_progress)
+        self.status_check_finished.connect(self._on_status_check_finished_for_progress)
+
+    # --- Progress Publishing ---
+    def _start_progress(self, aggregator: ProgressAggregator, sources: List[NewsSource], kind: str):
+        aggregator.start([s.name for s in sources], kind)
+        self._published_progress_keys.pop(kind, None)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @pyqtSlot()
+    def _publish_progress(self):
+        """(定时器槽) 为有变化的聚合器发射一次快照。"""
+        for aggregator in (self.refresh_progress, self.status_check_progress):
+            if aggregator.version == 0:
+                continue
+            snapshot = aggregator.snapshot()
+            key = (aggregator.version, snapshot['items_done'])
+            if self._published_progress_keys.get(snapshot['kind']) == key:
+                continue
+            self._published_progress_keys[snapshot['kind']] = key
+            self.progress_snapshot.emit(snapshot)
+            if snapshot['kind'] == 'refresh' and snapshot['last_finished']:
+                # 兼容旧的逐源进度信号，但同样受定时器节流
+                self.source_refresh_progress.emit(snapshot['last_finished'], snapshot['percent'],
+                                                  snapshot['total_sources'], snapshot['finished_sources'])
+        if not self.refresh_progress.is_active and not self.status_check_progress.is_active:
+            self._progress_timer.stop()
+
+    @pyqtSlot(bool, str)
+    def _on_refresh_finished_for_progress(self, success: bool, message: str):
+        self.refresh_progress.finish()
+        self._publish_progress()
+
+    @pyqtSlot()
+    def _on_status_check_finished_for_progress(self):
+        self.status_check_progress.finish()
+        self._publish_progress()
+
     # --- Cancellation Handling ---
     def _check_if_cancelled(self, flag: CancellationFlag, operation_name: str = "操作") -> bool:
         """Helper to check the cancellation flag and log if cancelled."""
@@ -273,8 +332,11 @@ class NewsUpdateService(QObject):
                 self.logger.debug(f"Data dir for StatusCheckRunnable: {data_dir_for_worker}")
                 self.logger.debug(f"DB name for StatusCheckRunnable: {db_name_for_worker}")
 
+                self._start_progress(self.status_check_progress, sources_to_check_runnable, 'status_check')
+
                 runnable = StatusCheckRunnable(
                     collector_factory=self.collector_factory, 
+                    progress=self.status_check_progress,
                     sources_to_check=sources_to_check_runnable, 
                     cancel_flag=self._cancel_check_status, 
                     source_status_checked_signal=self.source_status_checked, 
@@ -346,17 +408,22 @@ class NewsUpdateService(QObject):
             self.status_message_updated.emit("没有启用的新闻源。")
             return
 
+        self._start_progress(self.refresh_progress, sources_to_refresh, 'refresh')
+
         # Use QRunnable for the background refresh task
         runnable = RefreshRunnable(
             collector_factory=self.collector_factory,
             sources_to_refresh=sources_to_refresh,
             cancel_flag=self._cancel_refresh,
-            news_refreshed_signal=self.news_refreshed, # Pass the modified signal
+            articles_stored_signal=self.articles_stored,
             refresh_complete_signal=self.refresh_complete,
             status_message_updated_signal=self.status_message_updated,
-            source_refresh_progress_signal=self.source_refresh_progress, # +++ PASS THE PROGRESS SIGNAL +++
+            progress=self.refresh_progress,
             error_occurred_signal=self.error_occurred,
-            set_refreshing_flag_callback=self._set_refreshing_flag
+            set_refreshing_flag_callback=self._set_refreshing_flag,
+            # store 阶段在自己的线程里打开独立的 SQLite 连接
+            data_dir=self.storage.data_dir,
+            db_name=os.path.basename(self.storage.db_path)
         )
         self.thread_pool.start(runnable)
 
@@ -367,179 +434,86 @@ class NewsUpdateService(QObject):
         self._refresh_mutex.unlock()
         self.logger.debug(f"刷新标志已设置为: {status}")
 
+    def shutdown(self):
+        """取消进行中的任务并释放解析进程池 (由 AppService.shutdown 调用)。"""
+        self._cancel_refresh.set()
+        self._cancel_check_status.set()
+        if self.parser_pool:
+            self.parser_pool.shutdown(wait=False)
+
 # === QRunnables for Background Tasks ===
 
 class RefreshRunnable(QRunnable):
-    """QRunnable to handle the concurrent fetching of news sources."""
+    """
+    QRunnable：在后台驱动分阶段的刷新流水线 (RefreshPipeline)。
+
+    流水线的回调在其工作线程中被调用，这里把它们转成 Qt 信号发射；
+    跨线程连接的槽会在接收者线程中排队执行。
+    """
     def __init__(self, collector_factory, sources_to_refresh, cancel_flag,
-                 news_refreshed_signal, refresh_complete_signal,
-                 status_message_updated_signal, source_refresh_progress_signal, # +++ ADD progress_signal PARAM +++
+                 articles_stored_signal, refresh_complete_signal,
+                 status_message_updated_signal, progress: ProgressAggregator,
                  error_occurred_signal,
-                 set_refreshing_flag_callback):
+                 set_refreshing_flag_callback,
+                 data_dir: str, db_name: str):
         super().__init__()
         self.logger = logging.getLogger(__name__ + ".RefreshRunnable")
-        self.logger.info(f"--- RefreshRunnable.__init__: id(news_refreshed_signal)={id(news_refreshed_signal)} ---") # +++ 新增日志 +++
         self.collector_factory = collector_factory
         self.sources_to_refresh = sources_to_refresh
         self.cancel_flag = cancel_flag
-        self.news_refreshed = news_refreshed_signal
-        self.source_refresh_progress = source_refresh_progress_signal # +++ STORE the progress signal +++
-        self.logger.info(f"--- RefreshRunnable.__init__: id(self.news_refreshed) AFTER assignment={id(self.news_refreshed)} ---") # +++ 新增日志 +++
+        self.articles_stored = articles_stored_signal
+        self.progress = progress
         self.refresh_complete = refresh_complete_signal
         self.status_message_updated = status_message_updated_signal
         self.error_occurred = error_occurred_signal
         self.set_refreshing_flag = set_refreshing_flag_callback
+        self.data_dir = data_dir
+        self.db_name = db_name
         self.setAutoDelete(True) # Auto delete when done
 
-    def _check_if_cancelled(self, operation_name: str = "操作") -> bool:
-        """Helper to check the cancellation flag and log if cancelled."""
-        if self.cancel_flag.is_set():
-            self.logger.info(f"{operation_name} 已被取消 (来自 RefreshRunnable)。")
-            return True
-        return False
+    def _on_source_done(self, source: NewsSource, item_count: int, error_message: Optional[str]):
+        """流水线回调：单个源抓取完成。进度由聚合器汇总发布，这里只转发错误。"""
+        if error_message:
+            self.error_occurred.emit(source.name, error_message)
 
     @pyqtSlot()
     def run(self):
-        """Executes the refresh logic in a background thread."""
+        """Executes the refresh pipeline in a background thread."""
         self.logger.info(f"RefreshRunnable: 开始执行新闻刷新 for {len(self.sources_to_refresh)} sources...")
         self.status_message_updated.emit(f"正在刷新 {len(self.sources_to_refresh)} 个新闻源...")
 
         success = True
-        all_errors: List[str] = []
-        futures: Dict[Future, NewsSource] = {}
-        total_collected = 0
-
-        # Let's use a slightly simpler logic for now, or make it configurable
-        # For IO bound tasks, more threads can be beneficial.
-        # Max workers should not exceed number of sources for this specific task.
-        num_sources = len(self.sources_to_refresh)
-        # Max 8 workers, but no more than number of sources, and at least 1.
-        max_workers = min(max(1, num_sources), 8) # Limit to 8, or fewer if not many sources.
-
+        final_message = ""
         try:
-            self.logger.info(f"RefreshRunnable: 使用 {max_workers} 个工作线程进行并发获取。")
-
-            # Using ThreadPoolExecutor for managing futures and collecting results
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                self.logger.debug(f"RefreshRunnable: ThreadPoolExecutor created with {max_workers} workers.")
-                for source_config in self.sources_to_refresh:
-                    if self._check_if_cancelled(f"提交任务 for {source_config.name}"):
-                        self.logger.info(f"RefreshRunnable: 取消提交任务 for source: {source_config.name}")
-                        all_errors.append(f"{source_config.name}: Refresh cancelled before submission")
-                        continue
-
-                    collector = self.collector_factory.get_collector(source_config.type)
-                    if collector:
-                        self.logger.debug(f"RefreshRunnable: 提交任务 for source: {source_config.name}")
-                        
-                        # --- 定义 progress_callback ---
-                        def _local_progress_callback(current_item: int, total_items: int):
-                            if self.source_refresh_progress:
-                                # 这里我们可能需要一个总体的进度，而不仅仅是单个源内部的进度。
-                                # 这个回调是给单个collector用的，它报告 (当前条目, 此collector的总条目)
-                                # 我们需要将其转换为相对于所有源的总进度，或者让MainWindow处理单个源的进度。
-                                # 暂时，我们让MainWindow处理单个源的详细进度，如果它想的话。
-                                # 我们先传递源名称，当前项，总项。 MainWindow可以决定如何显示。
-                                # 主进度条的更新在 for future in as_completed(futures) 循环中处理。
-                                # 这个回调主要是为了让collector内部可以报告其更细致的进度。
-                                # self.logger.debug(f"RefreshRunnable: _local_progress_callback for '{source_config.name}': {current_item}/{total_items}")
-                                # 我们在此处不直接发射 self.source_refresh_progress，因为那个是整体进度。
-                                # collector 的 progress_callback 应该影响一个更细粒度的进度展示（如果UI支持）。
-                                # 暂时，由于collector的progress_callback签名是 (int, int)，我们无法直接传递源名称。
-                                # 除非我们修改BaseCollector的progress_callback签名。
-                                # 为简单起见，暂时不从这里发射主进度信号，只将回调传递给collector。
-                                pass
-
-                        # Pass the cancel_checker function directly and the new progress_callback
-                        future = executor.submit(
-                            collector.collect, 
-                            source_config, 
-                            progress_callback=_local_progress_callback, # Pass the new callback
-                            cancel_checker=lambda: self.cancel_flag.is_set()
-                        )
-                        futures[future] = source_config # Map future back to source
-                    else:
-                        error_msg = f"未找到适用于类型 '{source_config.type}' 的收集器 (源: {source_config.name})"
-                        self.logger.error(error_msg)
-                        all_errors.append(f"{source_config.name}: {error_msg}")
-                        # MODIFIED: Emit empty list for sources with no collector
-                        self.logger.info(f"--- RefreshRunnable.run (no collector): id(self.news_refreshed)={id(self.news_refreshed)} ---") # +++ 新增日志 +++
-                        self.news_refreshed.emit(source_config.name, [])
-                        self.error_occurred.emit(source_config.name, error_msg)
-
-
-                self.logger.info(f"RefreshRunnable: 已提交 {len(futures)} 个任务，等待完成...")
-                processed_sources_count = 0
-                total_sources_to_process = len(futures) # Only count those successfully submitted
-
-                for future in as_completed(futures):
-                    source_config = futures[future]
-                    source_name = source_config.name
-                    processed_sources_count += 1
-                    
-                    # Emit progress to main UI or AppService
-                    current_progress_percentage = int((processed_sources_count / total_sources_to_process) * 100) if total_sources_to_process > 0 else 0
-                    if self.source_refresh_progress: # +++ CHECK IF SIGNAL EXISTS +++
-                        self.logger.debug(f"RefreshRunnable: Emitting source_refresh_progress for \'{source_name}\': {current_progress_percentage}%, processed {processed_sources_count}/{total_sources_to_process}")
-                        self.source_refresh_progress.emit(source_name, current_progress_percentage, total_sources_to_process, processed_sources_count)
-                    
-                    self.status_message_updated.emit(f"正在刷新: {source_name} ({processed_sources_count}/{total_sources_to_process})...")
-
-
-                    if self._check_if_cancelled(f"处理结果 for {source_name}"):
-                        self.logger.info(f"RefreshRunnable: 取消处理结果 for source: {source_name}")
-                        all_errors.append(f"{source_name}: Refresh cancelled during processing")
-                        # MODIFIED: Emit empty list for cancelled sources
-                        self.logger.info(f"--- RefreshRunnable.run (cancelled during processing): id(self.news_refreshed)={id(self.news_refreshed)} ---") # +++ 新增日志 +++
-                        self.news_refreshed.emit(source_name, [])
-                        continue
-
-                    try:
-                        # Get the result (list of dicts) or raise exception if task failed
-                        raw_news_items = future.result() 
-                        
-                        if raw_news_items is None: # Collector might return None on certain failures
-                            self.logger.warning(f"RefreshRunnable: '{source_name}' 返回了 None，视为空列表。")
-                            raw_news_items = [] # Treat as empty list
-
-                        self.logger.info(f"RefreshRunnable: '{source_name}' 获取了 {len(raw_news_items)} 条新闻。")
-                        total_collected += len(raw_news_items)
-                        # MODIFIED: Emit signal with source_name and items
-                        self.logger.info(f"--- RefreshRunnable.run (before emit): id(self.news_refreshed)={id(self.news_refreshed)} for source {source_name} ---") # +++ 新增日志 +++
-                        self.news_refreshed.emit(source_name, raw_news_items)
-
-                    except RefreshCancelledError: # Catch specific cancellation from collector
-                        self.logger.info(f"RefreshRunnable: 源 '{source_name}' 的刷新被其收集器内部取消。")
-                        all_errors.append(f"{source_name}: Collector internally cancelled")
-                        self.logger.info(f"--- RefreshRunnable.run (collector cancelled): id(self.news_refreshed)={id(self.news_refreshed)} ---") # +++ 新增日志 +++
-                        self.news_refreshed.emit(source_name, []) # Emit empty for cancelled
-                    except Exception as exc:
-                        error_message = f"RefreshRunnable: 获取源 '{source_name}' 新闻时出错: {exc}"
-                        self.logger.error(error_message, exc_info=True) # Log with traceback
-                        all_errors.append(f"{source_name}: {type(exc).__name__}: {exc}")
-                        # MODIFIED: Emit empty list for failed sources to signal processing completion
-                        self.logger.info(f"--- RefreshRunnable.run (exception during future.result): id(self.news_refreshed)={id(self.news_refreshed)} ---") # +++ 新增日志 +++
-                        self.news_refreshed.emit(source_name, [])
-                        self.error_occurred.emit(source_name, str(exc))
-
-
-        except Exception as e: # Catch errors during executor setup/shutdown
-            self.logger.error(f"RefreshRunnable: 线程池执行期间发生意外错误: {e}", exc_info=True)
+            parser_pool = getattr(self.collector_factory, 'parser_pool', None)
+            pipeline = RefreshPipeline(
+                collector_factory=self.collector_factory,
+                storage_factory=lambda: NewsStorage(data_dir=self.data_dir, db_name=self.db_name),
+                # I/O 并发不超过源数量，最多 8 个线程
+                fetch_workers=min(max(1, len(self.sources_to_refresh)), 8),
+                # 每个 parse 线程同时只等待一个进程池任务，线程数与子进程数一致
+                parse_workers=parser_pool.max_workers if isinstance(parser_pool, ParserPool) else 2,
+                cancel_checker=self.cancel_flag.is_set,
+                on_source_done=self._on_source_done,
+                on_batch_stored=self.articles_stored.emit,
+                progress=self.progress,
+            )
+            summary = pipeline.run(self.sources_to_refresh)
+
+            if summary['cancelled']:
+                success = False
+                final_message = "刷新操作被用户取消。"
+            elif summary['errors']:
+                final_message = f"刷新完成 ({summary['stored']} 条新条目)，部分来源出错: {'; '.join(summary['errors'])}"
+                self.logger.warning(f"RefreshRunnable: 刷新完成，但存在错误: {summary['errors']}")
+            else:
+                final_message = f"刷新完成 ({summary['stored']} 条新条目)。"
+                self.logger.info(f"RefreshRunnable: 所有新闻源刷新成功，共写入 {summary['stored']} 条。")
+        except Exception as e:
+            self.logger.error(f"RefreshRunnable: 刷新流水线执行期间发生意外错误: {e}", exc_info=True)
             success = False
-            all_errors.append(f"并发执行错误: {e}")
-
+            final_message = f"刷新失败: {e}"
         finally:
-            # --- Final Report --- #
-            final_message = f"刷新完成 ({total_collected} 条新条目)。"
-            if not success:
-                 if self.cancel_flag.is_set():
-                     final_message = "刷新操作被用户取消。"
-                 else:
-                     final_message = f"刷新完成，但出现错误: {'; '.join(all_errors)}"
-                     self.logger.warning(f"RefreshRunnable: 刷新完成，但存在错误: {all_errors}")
-            else:
-                 self.logger.info(f"RefreshRunnable: 所有新闻源刷新成功，共获取 {total_collected} 条。")
-
             self.refresh_complete.emit(success, final_message)
             self.status_message_updated.emit(final_message) # Update status bar
 
@@ -556,8 +530,10 @@ class StatusCheckRunnable(QRunnable):
                  source_status_persisted_in_db_signal, # This is NewsUpdateService.source_status_persisted_in_db
                  sources_status_checked_signal, # This is NewsUpdateService.sources_status_checked
                  status_message_updated_signal, set_checking_status_flag_callback,
-                 data_dir: str, db_name: str): # Added data_dir and db_name
+                 data_dir: str, db_name: str, # Added data_dir and db_name
+                 progress: Optional[ProgressAggregator] = None):
         super().__init__()
+        self.progress = progress
         self.collector_factory = collector_factory
         self.sources_to_check: List[NewsSource] = sources_to_check
         self.cancel_flag = cancel_flag
@@ -599,6 +575,8 @@ class StatusCheckRunnable(QRunnable):
             
             collector = self.collector_factory.get_collector(source.type)
             status_result: Dict[str, Any] = {} # Ensure status_result is always a dict
+            if self.progress:
+                self.progress.mark_started(source.name)
 
             current_error_count = source.consecutive_error_count or 0
 
@@ -706,6 +684,9 @@ class StatusCheckRunnable(QRunnable):
                 'consecutive_error_count': current_error_count # Emit current error count
             }
             self.status_signal.emit(final_emit_result)
+            if self.progress:
+                failed = final_emit_result['status'] != 'ok'
+                self.progress.mark_finished(source.name, error=(final_emit_result['error'] or 'error') if failed else None)
 
             processed_count += 1
 
@@ -763,7 +744,7 @@ class StatusCheckRunnable(QRunnable):
                 total_processed += 1
                 progress_percent = int((total_processed / total_sources_to_refresh) * 100)
                 self.source_refresh_progress.emit(source.name, progress_percent, total_sources_to_refresh, total_processed)
-                self.logger.info(f"NewsUpdateService: Emitted source_refresh_progress for '{source.name}': {progress_percent}%, processed {total_processed}/{total_sources_to_refresh}") # ADDED LOG
+                self.logger.debug(f"NewsUpdateService: Emitted source_refresh_progress for '{source.name}': {progress_percent}%, processed {total_processed}/{total_sources_to_refresh}")
 
         except RefreshCancelledError:
             self.logger.info(f"NewsUpdateService: 刷新源 '{source.name}' 被取消 (async)。")
@@ -0,0 +1,151 @@
+"""
+核心服务 - 进度聚合器
+
+刷新 / 状态检查期间，采集器线程只对各自源的计数器做简单赋值 (不加锁、不发信号)；
+发布方 (NewsUpdateService 的 100ms 定时器) 定期读取一次汇总快照并发射一个信号，
+从而避免每条目、每个源都跨线程进入 Qt 事件循环。
+
+每个 SourceProgress 只由处理该源的那个工作线程写入 (单写者)，读取方读到的
+最多是稍旧的值，因此不需要锁。
+"""
+
+import itertools
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# 源的处理状态
+STATE_PENDING = 'pending'
+STATE_RUNNING = 'running'
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+
+
+class SourceProgress:
+    """单个源的进度计数器 (单写者，无锁)。"""
+
+    __slots__ = ('name', 'state', 'items_done', 'items_total', 'started_at', 'finished_at', 'error')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = STATE_PENDING
+        self.items_done = 0
+        self.items_total = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def update(self, current: int, total: int):
+        """采集器的 progress_callback：只记录计数。"""
+        self.items_done = current
+        self.items_total = total
+
+
+class ProgressAggregator:
+    """
+    汇总一次批量操作 (刷新或状态检查) 中所有源的进度。
+
+    Args:
+        clock: 单调时钟函数，便于测试注入。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._sources: Dict[str, SourceProgress] = {}
+        self._kind = ''
+        self._started_at: Optional[float] = None
+        self._finished = False
+        # itertools.count 的 next() 在 CPython 中是原子的，用作变更序号
+        self._ticks = itertools.count(1)
+        self._version = 0
+
+    def start(self, source_names: Iterable[str], kind: str = 'refresh'):
+        """开始一轮新的操作，重置所有计数器。"""
+        self._sources = {name: SourceProgress(name) for name in source_names}
+        self._kind = kind
+        self._started_at = self._clock()
+        self._finished = False
+        self._version = next(self._ticks)
+
+    def finish(self):
+        """标记整轮操作结束 (包括被取消的情况)。未开始过的聚合器忽略此调用。"""
+        if self._started_at is None or self._finished:
+            return
+        self._finished = True
+        self._version = next(self._ticks)
+
+    @property
+    def is_active(self) -> bool:
+        return self._started_at is not None and not self._finished
+
+    @property
+    def version(self) -> int:
+        """源状态每变化一次递增；条目级计数的变化不会改变它。"""
+        return self._version
+
+    def source(self, name: str) -> SourceProgress:
+        """返回某个源的计数器；未登记的源会被补登记。"""
+        progress = self._sources.get(name)
+        if progress is None:
+            progress = SourceProgress(name)
+            self._sources[name] = progress
+        return progress
+
+    def mark_started(self, name: str):
+        progress = self.source(name)
+        progress.state = STATE_RUNNING
+        progress.started_at = self._clock()
+        self._version = next(self._ticks)
+
+    def mark_finished(self, name: str, item_count: Optional[int] = None, error: Optional[str] = None):
+        progress = self.source(name)
+        if item_count is not None:
+            progress.items_done = item_count
+            progress.items_total = max(progress.items_total, item_count)
+        progress.error = error
+        progress.state = STATE_FAILED if error else STATE_DONE
+        progress.finished_at = self._clock()
+        self._version = next(self._ticks)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        生成当前进度的汇总快照。
+
+        Returns:
+            dict: kind, total_sources, finished_sources, failed_sources, running_sources,
+                  items_done, percent, elapsed_seconds, eta_seconds (无法估计时为 None),
+                  finished (整轮是否结束), last_finished (最近完成的源名称),
+                  sources ({name: {state, items_done, items_total, error}})。
+        """
+        now = self._clock()
+        sources = list(self._sources.values())
+        total = len(sources)
+        finished = [p for p in sources if p.state in (STATE_DONE, STATE_FAILED)]
+        failed = sum(1 for p in finished if p.state == STATE_FAILED)
+        running = sum(1 for p in sources if p.state == STATE_RUNNING)
+        elapsed = now - self._started_at if self._started_at is not None else 0.0
+
+        eta = None
+        if self._finished or (total and len(finished) == total):
+            eta = 0.0
+        elif finished and elapsed > 0:
+            eta = elapsed / len(finished) * (total - len(finished))
+
+        last_finished = max(finished, key=lambda p: p.finished_at).name if finished else None
+        return {
+            'kind': self._kind,
+            'total_sources': total,
+            'finished_sources': len(finished),
+            'failed_sources': failed,
+            'running_sources': running,
+            'items_done': sum(p.items_done for p in sources),
+            'percent': int(len(finished) / total * 100) if total else 100,
+            'elapsed_seconds': round(elapsed, 3),
+            'eta_seconds': round(eta, 1) if eta is not None else None,
+            'finished': self._finished,
+            'last_finished': last_finished,
+            'sources': {
+                p.name: {'state': p.state, 'items_done': p.items_done,
+                         'items_total': p.items_total, 'error': p.error}
+                for p in sources
+            },
+        }
@@ -0,0 +1,420 @@
+"""
+核心服务 - 刷新流水线
+
+把一次新闻刷新拆分为显式的阶段：
+
+    fetch → parse → normalize → dedupe → store
+
+采集器配置了解析进程池 (ParserPool) 时，fetch 阶段只下载原始字节 (I/O)，
+parse 阶段再把字节交给进程池解析 (CPU)，两者由各自的线程数独立控制；
+其他采集器 (JSON Feed、澎湃等) 在 fetch 阶段的 collect() 中完成下载和解析，parse 阶段只统一日期。
+
+阶段之间通过有界队列连接：下游处理不过来时上游的 put 会阻塞 (背压)，
+避免大刷新时把所有源的条目同时堆在内存里。每个阶段有自己的并发度和计时指标；
+store 阶段按时间窗口把多个源的条目合并，每个批次只开一次数据库事务。
+
+本模块不依赖 Qt，结果通过回调通知调用方 (RefreshRunnable 再把回调转为 Qt 信号)。
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from dateutil import parser as dateutil_parser
+
+from src.collectors.parser_pool import ParserPool
+from src.models import NewsSource
+from src.storage.news_storage import NewsStorage
+from src.core.progress_aggregator import ProgressAggregator
+
+
+@dataclass
+class RawFeed:
+    """fetch 阶段下载的原始响应体，由 parse 阶段交给采集器的 parse_payload 解析。"""
+    collector: Any
+    payload: bytes
+
+
+# 阶段之间传递的工作单元: (新闻源, 该源的一批条目)；fetch → parse 之间也可能是 (新闻源, RawFeed)
+Chunk = Tuple[NewsSource, Union[List[Dict[str, Any]], RawFeed]]
+
+_SENTINEL = object()
+
+
+@dataclass
+class StageMetrics:
+    """单个流水线阶段的计时与吞吐指标。"""
+    name: str
+    workers: int
+    chunks: int = 0
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0  # 下游队列已满、等待 put 的累计时间 (背压)
+    max_queue_depth: int = 0      # 该阶段输出队列的最大深度
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RefreshPipeline:
+    """
+    分阶段、带背压的刷新流水线。
+
+    Args:
+        collector_factory: 用于按源类型创建采集器的 CollectorFactory。
+        storage_factory: 在 store 线程中创建 NewsStorage 的可调用对象
+                         (SQLite 连接不能跨线程共享，所以由 store 线程自己持有连接)。
+        fetch_workers / parse_workers / normalize_workers: 对应阶段的线程数。
+            dedupe 与 store 固定为单线程 (需要全局去重集合和单一数据库连接)。
+        queue_size: 每条阶段间队列的容量 (以工作单元计)。
+        batch_window: store 阶段合并批次的时间窗口 (秒)。
+        batch_max_items: 单个批次的最大条目数，达到后立即写入。
+        cancel_checker: 返回 True 表示应取消刷新。
+        on_source_done: 回调 (source, item_count, error_message)，每个源抓取完成 (或失败) 时调用。
+        on_batch_stored: 回调 (links)，每个批次成功写入数据库后调用。
+        progress: 可选的 ProgressAggregator；fetch 阶段只更新其中的计数器，由调用方定期发布快照。
+    """
+
+    def __init__(self, collector_factory, storage_factory: Callable[[], NewsStorage],
+                 fetch_workers: int = 8, parse_workers: int = 2, normalize_workers: int = 1,
+                 queue_size: int = 32, batch_window: float = 0.5, batch_max_items: int = 500,
+                 cancel_checker: Optional[Callable[[], bool]] = None,
+                 on_source_done: Optional[Callable[[NewsSource, int, Optional[str]], None]] = None,
+                 on_batch_stored: Optional[Callable[[List[str]], None]] = None,
+                 progress: Optional[ProgressAggregator] = None):
+        self.logger = logging.getLogger('news_analyzer.core.refresh_pipeline')
+        self.collector_factory = collector_factory
+        self.storage_factory = storage_factory
+        self.queue_size = queue_size
+        self.batch_window = batch_window
+        self.batch_max_items = batch_max_items
+        self.cancel_checker = cancel_checker or (lambda: False)
+        self.on_source_done = on_source_done
+        self.on_batch_stored = on_batch_stored
+        self.progress = progress
+
+        self._metrics = {
+            'fetch': StageMetrics('fetch', max(1, fetch_workers)),
+            'parse': StageMetrics('parse', max(1, parse_workers)),
+            'normalize': StageMetrics('normalize', max(1, normalize_workers)),
+            'dedupe': StageMetrics('dedupe', 1),
+            'store': StageMetrics('store', 1),
+        }
+        self._metrics_lock = threading.Lock()
+        self._link_owners: Dict[str, int] = {}  # 链接 -> 已放行该链接的源在 run() 列表中的序号
+        self._source_ranks: Dict[int, int] = {}  # id(源) -> 在 run() 列表中的序号
+        self._stored_links = set()
+        self._storage: Optional[NewsStorage] = None  # 只在 store 线程中创建和使用
+        self._errors: List[str] = []
+        self._stored_count = 0
+        self._batch_count = 0
+
+    # --- Public API ---
+
+    def run(self, sources: List[NewsSource]) -> Dict[str, Any]:
+        """
+        在调用线程中驱动整条流水线，直到所有源处理完毕 (阻塞)。
+
+        Returns:
+            汇总字典: collected (抓取条目数), stored (写入的不同链接数), batches (事务数),
+            errors (错误信息列表), cancelled, stages (各阶段指标)。
+        """
+        started = time.perf_counter()
+        self._source_ranks = {id(source): rank for rank, source in enumerate(sources)}
+        source_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        fetched_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        parsed_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        normalized_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        unique_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        stages = [
+            ('fetch', source_q, fetched_q, self._fetch),
+            ('parse', fetched_q, parsed_q, self._parse),
+            ('normalize', parsed_q, normalized_q, self._normalize),
+            ('dedupe', normalized_q, unique_q, self._dedupe),
+        ]
+        stage_threads: List[Tuple[str, queue.Queue, List[threading.Thread]]] = []
+        for name, in_q, out_q, fn in stages:
+            threads = [
+                threading.Thread(target=self._run_stage, args=(name, in_q, out_q, fn),
+                                 name=f"refresh-{name}-{i}", daemon=True)
+                for i in range(self._metrics[name].workers)
+            ]
+            for t in threads:
+                t.start()
+            stage_threads.append((name, in_q, threads))
+
+        store_thread = threading.Thread(target=self._run_store, args=(unique_q,), name="refresh-store", daemon=True)
+        store_thread.start()
+
+        for source in sources:
+            source_q.put(source)
+
+        # 逐级关闭：上游所有线程结束后，再向下游队列投递对应数量的结束标记
+        for name, in_q, threads in stage_threads:
+            for _ in threads:
+                in_q.put(_SENTINEL)
+            for t in threads:
+                t.join()
+        unique_q.put(_SENTINEL)
+        store_thread.join()
+
+        summary = {
+            'collected': self._metrics['parse'].items_out,
+            'stored': self._stored_count,
+            'batches': self._batch_count,
+            'errors': list(self._errors),
+            'cancelled': bool(self.cancel_checker()),
+            'elapsed_seconds': time.perf_counter() - started,
+            'stages': self.metrics(),
+        }
+        self._log_summary(summary)
+        return summary
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """返回各阶段指标的快照。"""
+        with self._metrics_lock:
+            return {name: m.to_dict() for name, m in self._metrics.items()}
+
+    # --- Stage plumbing ---
+
+    def _put(self, name: str, out_q: queue.Queue, chunk: Chunk):
+        """(内部方法) 向下游队列投递，记录背压等待时间与队列深度。"""
+        wait_started = time.perf_counter()
+        out_q.put(chunk)
+        blocked = time.perf_counter() - wait_started
+        with self._metrics_lock:
+            metrics = self._metrics[name]
+            metrics.blocked_seconds += blocked
+            metrics.max_queue_depth = max(metrics.max_queue_depth, out_q.qsize())
+
+    def _run_stage(self, name: str, in_q: queue.Queue, out_q: queue.Queue, fn: Callable[[Any], Optional[Chunk]]):
+        """(内部方法) 通用阶段工作线程：取出工作单元、处理、投递到下游。"""
+        while True:
+            work = in_q.get()
+            if work is _SENTINEL:
+                return
+            # 取消后继续消费队列 (保证上游不会阻塞)，但不再处理
+            if self.cancel_checker():
+                continue
+            items_in = _item_count(work[1]) if isinstance(work, tuple) else 0
+            busy_started = time.perf_counter()
+            try:
+                result = fn(work)
+            except Exception as e:
+                self.logger.error(f"刷新流水线阶段 '{name}' 处理失败: {e}", exc_info=True)
+                result = None
+            busy = time.perf_counter() - busy_started
+            with self._metrics_lock:
+                metrics = self._metrics[name]
+                metrics.chunks += 1
+                metrics.items_in += items_in
+                metrics.items_out += _item_count(result[1]) if result else 0
+                metrics.busy_seconds += busy
+            if result and result[1]:
+                self._put(name, out_q, result)
+
+    def _run_store(self, in_q: queue.Queue):
+        """(内部方法) store 阶段：按时间窗口/条目上限合并批次，每批一次事务。"""
+        pending: List[Dict[str, Any]] = []
+        window_deadline: Optional[float] = None
+        try:
+            while True:
+                timeout = None if window_deadline is None else max(0.0, window_deadline - time.monotonic())
+                try:
+                    work = in_q.get(timeout=timeout)
+                except queue.Empty:
+                    work = None
+
+                if work is _SENTINEL:
+                    break
+                if work is not None and not self.cancel_checker():
+                    if not pending:
+                        window_deadline = time.monotonic() + self.batch_window
+                    pending.extend(work[1])
+                    with self._metrics_lock:
+                        self._metrics['store'].chunks += 1
+                        self._metrics['store'].items_in += len(work[1])
+
+                window_expired = window_deadline is not None and time.monotonic() >= window_deadline
+                if pending and (window_expired or len(pending) >= self.batch_max_items):
+                    self._flush(pending)
+                    pending = []
+                    window_deadline = None
+
+            if pending and not self.cancel_checker():
+                self._flush(pending)
+        except Exception as e:
+            self.logger.error(f"刷新流水线 store 阶段出错: {e}", exc_info=True)
+            self._errors.append(f"store: {e}")
+            # 继续消费，避免上游阻塞在满队列上
+            while in_q.get() is not _SENTINEL:
+                pass
+        finally:
+            if self._storage is not None:
+                self._storage.close()
+                self._storage = None
+
+    def _flush(self, batch: List[Dict[str, Any]]):
+        """(内部方法) 把一个批次写入数据库 (upsert_articles_batch 内只提交一次)。"""
+        busy_started = time.perf_counter()
+        if self._storage is None:
+            # 第一个批次到达时才打开连接，空刷新不会触碰数据库
+            self._storage = self.storage_factory()
+        written = self._storage.upsert_articles_batch(batch)
+        busy = time.perf_counter() - busy_started
+        links = list(dict.fromkeys(item['link'] for item in batch))
+        with self._metrics_lock:
+            metrics = self._metrics['store']
+            metrics.busy_seconds += busy
+            if written:
+                metrics.items_out += len(batch)
+        if not written:
+            self._errors.append(f"store: 批量写入 {len(batch)} 条失败")
+            return
+        self._stored_links.update(links)
+        self._stored_count = len(self._stored_links)
+        self._batch_count += 1
+        self.logger.debug(f"刷新流水线: 批次 {self._batch_count} 写入 {len(batch)} 条，耗时 {busy * 1000:.1f}ms")
+        if self.on_batch_stored:
+            self.on_batch_stored(links)
+
+    # --- Stages ---
+
+    def _fetch(self, source: NewsSource) -> Optional[Chunk]:
+        """
+        fetch 阶段：配置了 ParserPool 的采集器只下载原始字节 (交给 parse 阶段解析)，
+        其他采集器调用 collect() 直接得到条目。
+        """
+        collector = self.collector_factory.get_collector(source.type)
+        if not collector:
+            error_msg = f"未找到适用于类型 '{source.type}' 的收集器 (源: {source.name})"
+            self.logger.error(error_msg)
+            self._report_source(source, 0, error_msg)
+            return None
+        if self.progress:
+            self.progress.mark_started(source.name)
+            progress_callback = self.progress.source(source.name).update
+        else:
+            progress_callback = lambda current, total: None
+        try:
+            if isinstance(getattr(collector, 'parser_pool', None), ParserPool):
+                payload = collector.fetch_payload(source, cancel_checker=self.cancel_checker)
+                if payload is None:
+                    self._report_source(source, 0, None)
+                    return None
+                return source, RawFeed(collector, payload)
+            items = collector.collect(source, progress_callback=progress_callback,
+                                      cancel_checker=self.cancel_checker) or []
+        except Exception as e:
+            self.logger.error(f"获取源 '{source.name}' 新闻时出错: {e}", exc_info=True)
+            self._report_source(source, 0, f"{type(e).__name__}: {e}")
+            return None
+        self._report_source(source, len(items), None)
+        return source, items
+
+    def _parse(self, chunk: Chunk) -> Optional[Chunk]:
+        """
+        parse 阶段：在采集器的 ParserPool 中解析 fetch 阶段下载的原始字节，
+        并把各种日期表示统一解析为 UTC aware datetime。
+        """
+        source, items = chunk
+        if isinstance(items, RawFeed):
+            try:
+                items = items.collector.parse_payload(items.payload, source) or []
+            except Exception as e:
+                self.logger.error(f"解析源 '{source.name}' 的原始数据时出错: {e}", exc_info=True)
+                self._report_source(source, 0, f"{type(e).__name__}: {e}")
+                return None
+            self._report_source(source, len(items), None)
+        for item in items:
+            item['publish_time'] = RefreshPipeline._resolve_publish_time(item)
+        return source, items
+
+    @staticmethod
+    def _resolve_publish_time(item: Dict[str, Any]) -> Optional[datetime]:
+        value = item.get('publish_time')
+        if not isinstance(value, datetime):
+            date_str = value if isinstance(value, str) and value.strip() else item.get('pub_date')
+            if not isinstance(date_str, str) or not date_str.strip():
+                return None
+            try:
+                value = dateutil_parser.parse(date_str, fuzzy=True)
+            except (ValueError, TypeError, OverflowError):
+                return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def _normalize(chunk: Chunk) -> Chunk:
+        """normalize 阶段：转换为 NewsStorage.upsert_articles_batch 接受的行字典。"""
+        source, items = chunk
+        category = source.category if isinstance(source.category, str) and source.category.strip() else "uncategorized"
+        rows = []
+        for item in items:
+            link = item.get('link')
+            if not link:
+                continue
+            publish_time = item.get('publish_time')
+            rows.append({
+                'title': item.get('title') or '无标题',
+                'content': item.get('content'),
+                'link': link,
+                'source_name': source.name,
+                'source_url': source.url,
+                'publish_time': publish_time.isoformat() if publish_time else None,
+                'category_name': category,
+                'image_url': item.get('image_url'),
+            })
+        return source, rows
+
+    def _dedupe(self, chunk: Chunk) -> Chunk:
+        """
+        dedupe 阶段：同一次刷新中多个源包含同一链接时，保存 run() 列表中最靠前的源的那一份。
+
+        各源的抓取完成顺序取决于线程调度，靠后的源可能先到达：此时先放行它的那一份，
+        靠前的源到达后再放行自己的那一份，store 阶段按链接 upsert 覆盖，最终结果与到达顺序无关。
+        同一个源内重复的链接只保留第一条。
+        """
+        source, rows = chunk
+        rank = self._source_ranks.get(id(source), len(self._source_ranks))
+        unique = []
+        for row in rows:
+            owner = self._link_owners.get(row['link'])
+            if owner is not None and owner <= rank:
+                continue
+            self._link_owners[row['link']] = rank
+            unique.append(row)
+        return source, unique
+
+    # --- Helpers ---
+
+    def _report_source(self, source: NewsSource, count: int, error: Optional[str]):
+        if error:
+            self._errors.append(f"{source.name}: {error}")
+        if self.progress:
+            self.progress.mark_finished(source.name, count, error)
+        if self.on_source_done:
+            self.on_source_done(source, count, error)
+
+    def _log_summary(self, summary: Dict[str, Any]):
+        self.logger.info(
+            f"刷新流水线完成: 抓取 {summary['collected']} 条，写入 {summary['stored']} 条 "
+            f"({summary['batches']} 个事务)，耗时 {summary['elapsed_seconds']:.2f}s"
+        )
+        for name, m in summary['stages'].items():
+            self.logger.info(
+                f"  阶段 {name:<9} workers={m['workers']} chunks={m['chunks']} in={m['items_in']} out={m['items_out']} "
+                f"busy={m['busy_seconds']:.3f}s blocked={m['blocked_seconds']:.3f}s max_queue={m['max_queue_depth']}"
+            )
+
+
+def _item_count(items: Union[List[Dict[str, Any]], RawFeed]) -> int:
+    """工作单元中的条目数 (尚未解析的原始响应体计为 0)。"""
+    return len(items) if isinstance(items, list) else 0
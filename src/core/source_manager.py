@@ -1,7 +1,7 @@
 # src/core/source_manager.py
 import logging
 import json # 导入 json 模块
-from typing import List, Dict, Optional, Any # Added Any
+from typing import List, Dict, Iterable, Optional, Any # Added Any
 from datetime import datetime # 添加 datetime 导入
 # from PySide6.QtCore import QObject, Signal as pyqtSignal, QSettings, Qt # QSettings and Qt might be removable if not used elsewhere
 from PySide6.QtCore import QObject, Signal as pyqtSignal, Qt # QSettings removed
@@ -10,10 +10,50 @@ from PySide6.QtCore import QObject, Signal as pyqtSignal, Qt # QSettings removed
 from src.models import NewsSource
 # 导入预设源获取函数
 from src.collectors.default_sources import get_default_rss_sources
+from src.collectors.categories import get_category_name
 from src.storage.news_storage import NewsStorage # Import NewsStorage
 
 logger = logging.getLogger('news_analyzer.core.source_manager')
 
+
+class SourceLookup:
+    """
+    新闻源查找表的只读快照，供逐篇文章的处理路径使用 (代替每次重建 {name: source} 或线性查找)。
+
+    Attributes:
+        version: 构建时 SourceManager 的查找表版本号。
+        by_name: 来源名称 -> NewsSource (同名时与线性查找一致，取列表中的第一个)。
+        by_id: 来源 ID -> NewsSource。
+        category_names: 分类 ID -> 分类显示名称。
+        source_categories: 来源名称 -> 该来源分类的显示名称。
+
+    构建后不再修改：源发生增删改时 SourceManager 会构建新的快照，
+    因此可以把其中的字典交给后台线程读取。
+    """
+
+    __slots__ = ('version', 'by_name', 'by_id', 'category_names', 'source_categories')
+
+    def __init__(self, sources: Iterable[NewsSource], version: int = 0):
+        self.version = version
+        self.by_name: Dict[str, NewsSource] = {}
+        self.by_id: Dict[int, NewsSource] = {}
+        self.category_names: Dict[str, str] = {}
+        self.source_categories: Dict[str, str] = {}
+        for source in sources:
+            self.by_name.setdefault(source.name, source)
+            if source.id is not None:
+                self.by_id.setdefault(source.id, source)
+            category_id = source.category
+            if category_id not in self.category_names:
+                self.category_names[category_id] = get_category_name(category_id)
+            self.source_categories.setdefault(source.name, self.category_names[category_id])
+
+    def category_id_for(self, source_name: str) -> str:
+        """来源配置的分类 ID，未找到来源或分类为空时返回 "uncategorized"。"""
+        source = self.by_name.get(source_name)
+        category = source.category if source is not None else None
+        return category if isinstance(category, str) and category.strip() else "uncategorized"
+
 class SourceManager(QObject):
     """负责管理新闻源配置的加载、保存和修改。"""
 
@@ -33,6 +73,9 @@ class SourceManager(QObject):
         self.logger = logging.getLogger(__name__) # +++ ADDED THIS LINE +++
         # self.settings = QSettings("NewsAnalyzer", "NewsAggregator") # QSettings might be removed
         self.storage = storage # Store NewsStorage instance
+        # 查找表按需构建并缓存，只在新闻源增删改时失效 (见 get_lookup)
+        self._lookup_version = 0
+        self._lookup: Optional[SourceLookup] = None
         self.news_sources: List[NewsSource] = []
         
         self._load_sources_from_db() # Load sources first
@@ -48,60 +91,39 @@ class SourceManager(QObject):
             logger.debug(f"SourceManager: Successfully loaded {len(self.news_sources)} sources from existing database. Emitting sources_updated.")
             self.sources_updated.emit()
 
-    # 辅助方法用于解析 ISO 时间字符串
-    def _parse_iso_datetime(self, datetime_str: Optional[str], source_name_for_log: str) -> Optional[datetime]:
-        """安全地将 ISO 格式字符串解析为 datetime 对象"""
-        if not datetime_str:
-            return None
-        try:
-            # Handle both string datetimes and already converted datetimes from DB (sqlite3.Row might auto-convert some)
-            if isinstance(datetime_str, datetime):
-                return datetime_str
-            return datetime.fromisoformat(str(datetime_str).replace('Z', '+00:00'))
-        except (ValueError, TypeError) as e: # Added TypeError
-            logger.warning(f"SourceManager: 无法解析源 '{source_name_for_log}' 的 datetime: {datetime_str} ({type(datetime_str)}). Error: {e}")
-            return None
+    @property
+    def news_sources(self) -> List[NewsSource]:
+        return self._news_sources
+
+    @news_sources.setter
+    def news_sources(self, sources: List[NewsSource]):
+        self._news_sources = sources
+        self._invalidate_lookup()
+
+    @property
+    def lookup_version(self) -> int:
+        """查找表版本号，每次新闻源增删改后递增。"""
+        return self._lookup_version
+
+    def _invalidate_lookup(self):
+        self._lookup_version += 1
+        self._lookup = None
+
+    def get_lookup(self) -> SourceLookup:
+        """返回当前新闻源的查找表 (名称/ID -> 源，分类 ID -> 显示名)；源未变化时复用上次构建的结果。"""
+        lookup = self._lookup
+        if lookup is None:
+            version = self._lookup_version
+            lookup = SourceLookup(list(self._news_sources), version)
+            if version == self._lookup_version: # 构建期间列表未被修改才缓存
+                self._lookup = lookup
+        return lookup
 
+    # 辅助方法用于解析 ISO 时间字符串
     def _create_news_source_from_dict(self, source_dict: Dict[str, Any]) -> Optional[NewsSource]:
         """Helper to create NewsSource object from a dictionary (typically from DB)."""
-        if not source_dict or not source_dict.get('name') or not source_dict.get('type'):
-            logger.warning(f"SourceManager: Invalid source data for object creation: {source_dict}")
-            return None
-        
-        custom_config_str = source_dict.get('custom_config')
-        deserialized_custom_config = {}
-        if custom_config_str and isinstance(custom_config_str, str):
-            try:
-                deserialized_custom_config = json.loads(custom_config_str)
-            except json.JSONDecodeError:
-                logger.error(f"Failed to deserialize custom_config for source '{source_dict.get('name')}': {custom_config_str}")
-        elif isinstance(custom_config_str, dict): # If it's already a dict (e.g. from tests)
-            deserialized_custom_config = custom_config_str
-            
-        # Fields like status, last_error, error_count, consecutive_error_count, notes, is_user_added
-        # are not in the news_sources table in the DB.
-        # They will be initialized to defaults in NewsSource dataclass or managed in memory.
-        # For loading, we primarily care about what's in the DB.
-        return NewsSource(
-            id=source_dict.get('id'),
-            name=source_dict['name'],
-            type=source_dict['type'],
-            url=source_dict.get('url'),
-            category=source_dict.get('category_name', '未分类'), # DB stores as category_name
-            enabled=bool(source_dict.get('is_enabled', True)),
-            custom_config=deserialized_custom_config,
-            last_checked_time=self._parse_iso_datetime(source_dict.get('last_checked_time'), source_dict.get('name', 'UnknownSource')),
-            # Fields not in DB will get dataclass defaults:
-            # is_user_added, last_update, error_count, last_error, status, notes, consecutive_error_count
-            # --- CORRECTED: Load fields previously missed from DB dict ---
-            status=source_dict.get('status', 'unchecked'),  # Load status, default to 'unchecked' if missing
-            last_error=source_dict.get('last_error'),      # Load last_error
-            consecutive_error_count=int(source_dict.get('consecutive_error_count', 0)), # Load consecutive_error_count, default 0
-            # notes=source_dict.get('notes'), # Load notes if/when added to DB schema
-            # is_user_added needs separate logic later based on defaults
-            # error_count might be redundant if consecutive_error_count exists? Or maybe total? Keep default for now.
-            # last_update seems related to fetching articles, not source status check. Keep default.
-        )
+        # 转换逻辑放在 NewsSource 上，以便无界面的刷新进程 (不加载 Qt) 也能复用
+        return NewsSource.from_storage_dict(source_dict)
 
     def _load_sources_from_db(self):
         """从数据库加载所有新闻源的配置。"""
@@ -184,11 +206,8 @@ class SourceManager(QObject):
                                       last_error: Optional[str], 
                                       last_checked_time: datetime):
         """Updates the status of a specific source in the memory cache and emits sources_updated."""
-        found_source = None
-        for src in self.news_sources:
-            if src.id == source_id:
-                found_source = src
-                break
+        # 只修改状态字段，不影响查找表
+        found_source = self.get_lookup().by_id.get(source_id)
         
         if found_source:
             self.logger.debug(f"SourceManager: update_source_status_in_cache for ID {source_id} ('{found_source.name}'). Incoming status: '{status}', last_error: '{last_error}', last_checked: {last_checked_time}")
@@ -213,7 +232,7 @@ class SourceManager(QObject):
             return None
 
         # Check for duplicates by name before adding to DB
-        if any(s.name == source.name for s in self.news_sources):
+        if source.name in self.get_lookup().by_name:
             logger.warning(f"SourceManager: Source with name '{source.name}' already exists. Add operation cancelled.")
             # Optionally, could update if it's an attempt to re-add a default.
             # For user-added, this prevents duplicates.
@@ -231,6 +250,7 @@ class SourceManager(QObject):
             if new_id is not None:
                 source.id = new_id # Update the model with the ID from DB
                 self.news_sources.append(source) # Add to memory list only on success
+                self._invalidate_lookup()
                 
                 if not _is_default_addition: # Avoid multiple sorts/emits if called from _ensure_defaults
                     self.news_sources.sort(key=lambda s: (s.type, s.name))
@@ -258,6 +278,7 @@ class SourceManager(QObject):
                 success = self.storage.delete_news_source(source_to_remove.id)
                 if success:
                     self.news_sources.remove(source_to_remove)
+                    self._invalidate_lookup()
                     self.sources_updated.emit()
                     logger.info(f"SourceManager: Successfully removed source '{source_name}' (ID: {source_to_remove.id}).")
                 else:
@@ -267,6 +288,7 @@ class SourceManager(QObject):
         elif source_to_remove:
             logger.warning(f"SourceManager: Source '{source_name}' found in memory but has no ID. Cannot remove from DB. Removing from memory only.")
             self.news_sources.remove(source_to_remove) # Remove from memory if it has no ID (should not happen with DB backend)
+            self._invalidate_lookup()
             self.sources_updated.emit()
         else:
             logger.warning(f"SourceManager: Source with name '{source_name}' not found for removal.")
@@ -385,6 +407,7 @@ class SourceManager(QObject):
                 if not has_changed:
                     logger.debug(f"SourceManager: No actual changes for source '{source_name}'. Update skipped.")
                     return
+                self._invalidate_lookup() # 名称或分类可能已变化
 
                 # Now prepare the dictionary for storage
                 storage_dict = source_to_update.to_storage_dict()
@@ -416,19 +439,16 @@ class SourceManager(QObject):
 
     def get_source_by_name(self, name: str) -> Optional[NewsSource]:
         """按名称获取新闻源。"""
-        for source in self.news_sources:
-            if source.name == name:
-                return source
-        return None
+        return self.get_lookup().by_name.get(name)
 
     def get_source_by_id(self, source_id: int) -> Optional[NewsSource]:
         """按 ID 获取新闻源。"""
         if source_id is None: # 防御性检查
             self.logger.warning("SourceManager.get_source_by_id called with None ID.")
             return None
-        for source in self.news_sources:
-            if source.id == source_id:
-                return source
+        source = self.get_lookup().by_id.get(source_id)
+        if source is not None:
+            return source
         self.logger.warning(f"SourceManager.get_source_by_id: Source with ID {source_id} not found in cache.")
         return None
 
@@ -444,6 +464,7 @@ class SourceManager(QObject):
                     self.logger.error(f"Error converting DB data to NewsSource: {data}. Error: {e}")
         except Exception as e:
             self.logger.error(f"Failed to load sources from storage: {e}")
+        self._invalidate_lookup()
 
     # --- 添加数据库更新方法 ---
     def update_source_in_db(self, source_name: str, update_data: Dict) -> bool:
@@ -0,0 +1,118 @@
+"""
+核心服务 - 聚类与关键词提取共用的中英文分词和哈希向量化
+
+sklearn 的默认分词按空白和标点切分，没有空格的中文句子整句成为一个词：词表巨大却几乎没有共享的词，
+聚类既慢又不准。这里统一分词规则，供 NewsClusterer、EnhancedNewsClusterer、IncrementalEventClusterer
+和它们的关键词提取使用:
+
+  - 英文和数字: 小写后按 [a-z0-9]+ 切分，去掉英文停用词和单个字符
+  - 中文: 安装了 jieba 时用词典分词 (segmenter='jieba')，否则用相邻两字 (segmenter='bigram')；
+    两种方式都去掉中文停用词，bigram 方式还会在 "的"、语气词处断开，不产生跨越它们的两字组合
+  - segmenter='auto' (默认) 在 jieba 可用时用 jieba，否则用 bigram
+
+hashing_vectorizer() 用上述分词构造 HashingVectorizer：词直接哈希到固定维数，不需要拟合词表，
+词频矩阵可以跨次缓存 (见 article_features.py)；需要 TF-IDF 时用 tfidf_from_counts() 按当前文章集合
+选出最常见的词并计算 IDF。
+"""
+
+from __future__ import annotations  # sparse.csr_matrix 注解不在定义时求值，避免提前导入 scipy
+
+import re
+from functools import lru_cache, partial
+from typing import Callable, List, Optional
+
+from src.utils.lazy_import import lazy_attr, lazy_module
+
+np = lazy_module('numpy')
+sparse = lazy_module('scipy.sparse')
+HashingVectorizer = lazy_attr('sklearn.feature_extraction.text', 'HashingVectorizer')
+TfidfTransformer = lazy_attr('sklearn.feature_extraction.text', 'TfidfTransformer')
+jieba_lcut = lazy_attr('jieba', 'lcut')  # 可选依赖
+
+SEGMENTERS = ('auto', 'bigram', 'jieba')
+HASHING_FEATURES = 2 ** 20  # 稀疏矩阵的列数，维数大只是减少哈希冲突
+
+ENGLISH_STOPWORDS = frozenset("""
+a about above after again against all also am amid an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having he
+her here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours yourself yourselves
+says said say new news via per
+""".split())
+
+CHINESE_STOPWORDS = frozenset("""
+的 了 在 是 和 与 或 有 被 将 把 从 到 对 为 也 都 就 而 及 等 之 其 这 那 着 我 你 他 她 它 吗 呢 吧 啊
+我们 你们 他们 她们 它们 这个 那个 一个 这些 那些 没有 可以 已经 因为 所以 但是 就是 还是 以及 进行 表示
+目前 其中 如果 虽然 不是 什么 自己 这样 一些 通过 同时 对于 关于 由于 此外 并且 或者 而且 之后 之前 以来
+为了 记者 报道
+""".split())
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+|[㐀-䶿一-鿿]+')
+_CJK_BREAK_RE = re.compile('[的吗呢吧啊]')  # bigram 方式在这些字处断开
+
+
+@lru_cache(maxsize=None)
+def resolve_segmenter(segmenter: str = 'auto') -> str:
+    """'auto' -> 'jieba' (已安装) 或 'bigram'；其他取值原样返回。"""
+    if segmenter not in SEGMENTERS:
+        raise ValueError(f"未知的中文分词方式: {segmenter}，可选 {SEGMENTERS}")
+    if segmenter == 'auto':
+        return 'jieba' if jieba_lcut.available() else 'bigram'
+    return segmenter
+
+
+def tokenize(text: Optional[str], segmenter: str = 'auto') -> List[str]:
+    """文本 -> 词列表 (保留重复和出现顺序)。"""
+    mode = resolve_segmenter(segmenter)
+    tokens: List[str] = []
+    for match in _TOKEN_RE.finditer((text or '').lower()):
+        token = match.group()
+        if token[0] < '㐀':
+            if len(token) > 1 and token not in ENGLISH_STOPWORDS:
+                tokens.append(token)
+        elif mode == 'jieba':
+            tokens.extend(word for word in jieba_lcut(token) if word not in CHINESE_STOPWORDS)
+        else:
+            for run in _CJK_BREAK_RE.split(token):
+                if len(run) == 1:
+                    if run not in CHINESE_STOPWORDS:
+                        tokens.append(run)
+                else:
+                    tokens.extend(bigram for bigram in (run[i:i + 2] for i in range(len(run) - 1))
+                                  if bigram not in CHINESE_STOPWORDS)
+    return tokens
+
+
+def keywords(text: Optional[str], count: int = 5, segmenter: str = 'auto') -> List[str]:
+    """文本中前 count 个不重复的词 (至少两个字符)，用作标题关键词。"""
+    return [token for token in dict.fromkeys(tokenize(text, segmenter)) if len(token) > 1][:count]
+
+
+def analyzer(segmenter: str = 'auto') -> Callable[[str], List[str]]:
+    """可作为 sklearn 向量化器 analyzer 参数的分词函数。"""
+    return partial(tokenize, segmenter=resolve_segmenter(segmenter))
+
+
+def hashing_vectorizer(n_features: int = HASHING_FEATURES, segmenter: str = 'auto') -> HashingVectorizer:
+    """输出原始词频 (不归一化、不取反号) 的 HashingVectorizer。"""
+    return HashingVectorizer(n_features=n_features, analyzer=analyzer(segmenter), alternate_sign=False, norm=None)
+
+
+def most_frequent_columns(counts: sparse.csr_matrix, max_features: int) -> sparse.csr_matrix:
+    """只保留全体文章中总词频最高的 max_features 列 (与 TfidfVectorizer 的 max_features 相同)。"""
+    totals = np.asarray(counts.sum(axis=0)).ravel()
+    present = np.flatnonzero(totals)
+    if len(present) > max_features:
+        # 词频相同时保留列号较小的，结果与输入顺序无关
+        order = np.lexsort((present, -totals[present]))
+        present = np.sort(present[order[:max_features]])
+    return counts[:, present]
+
+
+def tfidf_from_counts(counts: sparse.csr_matrix, max_features: Optional[int] = None) -> sparse.csr_matrix:
+    """哈希词频 -> 行 L2 归一化的 TF-IDF (IDF 按传入的文章集合计算)。"""
+    if max_features:
+        counts = most_frequent_columns(counts, max_features)
+    return TfidfTransformer().fit_transform(counts)
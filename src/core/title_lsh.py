@@ -0,0 +1,142 @@
+"""
+核心服务 - 标题 MinHash / LSH 候选对索引
+
+按标题自动分组 (NewsDataProcessor._auto_group_news_by_title、NewsSimilarityPanel._auto_group_news)
+原来把每个标题和其他所有标题逐一比较，n 篇新闻需要 n²/2 次规则计算，几万条标题就要几分钟。
+这里先用 MinHash + LSH 分段找出可能相似的候选对，分组规则只在候选对上计算:
+
+  - 标题转小写后切成字符 shingle (含中日韩文字的标题用 2 字，其余用 3 字)，不跨越空格，
+    也不依赖空格分词，没有空格的中文标题同样适用
+  - 每个 shingle 编号后用 num_perm 个随机线性哈希 (a·x + b) mod p 求最小值，得到 MinHash 签名
+  - 签名分成 bands 段，每段 rows 个值；两个标题只要有一段完全相同即成为候选对。
+    shingle 集合 Jaccard 相似度为 s 的一对被选中的概率为 1 - (1 - s^rows)^bands
+
+候选对是近似的：shingle 相似度很低却仍满足分组规则的标题对可能漏掉 (默认 64 段 × 3 行时，
+s = 0.3 的一对被选中的概率约 83%，s ≥ 0.45 时超过 99.7%)。numpy / scipy 在首次调用时才导入。
+"""
+
+from __future__ import annotations  # np.ndarray 注解不在定义时求值，避免提前导入 numpy
+
+import re
+from typing import Dict, List, Sequence, Set
+
+from src.utils.lazy_import import lazy_module
+
+np = lazy_module('numpy')
+sparse = lazy_module('scipy.sparse')
+
+MERSENNE_PRIME = (1 << 31) - 1  # a·x + b 在 int64 内不会溢出
+DEFAULT_BANDS = 64
+DEFAULT_ROWS = 3
+DEFAULT_SEED = 1
+BAND_KEY_MULTIPLIER = 0x9E3779B97F4A7C15
+
+_CJK_RE = re.compile(r'[぀-ヿ㐀-䶿一-鿿가-힯]')
+
+
+def title_shingles(title: str) -> Set[str]:
+    """
+    标题的字符 shingle 集合 (空标题返回空集合)。
+
+    shingle 不跨越空格，调换词序不改变集合；比 shingle 短的词整体作为一个 shingle。
+    """
+    text = (title or '').lower()
+    size = 2 if _CJK_RE.search(text) else 3
+    shingles = set()
+    for token in text.split():
+        if len(token) <= size:
+            shingles.add(token)
+        else:
+            shingles.update(token[i:i + size] for i in range(len(token) - size + 1))
+    return shingles
+
+
+class TitleLSHIndex:
+    """
+    标题的 MinHash / LSH 候选索引。
+
+    用法:
+        index = TitleLSHIndex(titles)
+        for j in index.candidates(i):   # 升序，不含 i 本身
+            ...
+    """
+
+    def __init__(self, titles: Sequence[str], bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS,
+                 seed: int = DEFAULT_SEED):
+        """
+        Args:
+            titles: 标题列表，下标即候选结果中的编号。
+            bands: LSH 分段数，越大召回率越高、候选对越多。
+            rows: 每段的签名值个数，越大候选越严格。
+        """
+        if bands < 1 or rows < 1:
+            raise ValueError(f"bands 和 rows 必须为正整数: bands={bands}, rows={rows}")
+        self.bands = bands
+        self.rows = rows
+        self.size = len(titles)
+        signatures = self._signatures([title_shingles(title) for title in titles], bands * rows, seed)
+        self._neighbours = self._collide(signatures)
+
+    @property
+    def pair_count(self) -> int:
+        """候选对 (无序) 的数量。"""
+        return int(self._neighbours.nnz // 2)
+
+    def candidates(self, i: int) -> np.ndarray:
+        """与第 i 个标题至少在一段签名上相同的其他标题下标 (升序)。"""
+        start, stop = self._neighbours.indptr[i], self._neighbours.indptr[i + 1]
+        return self._neighbours.indices[start:stop]
+
+    @staticmethod
+    def _signatures(shingle_sets: List[Set[str]], num_perm: int, seed: int) -> np.ndarray:
+        """每个标题的 MinHash 签名 (n×num_perm)，没有 shingle 的标题整行为 -1。"""
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        ids: List[int] = []
+        for shingles in shingle_sets:
+            ids.extend(vocabulary.setdefault(shingle, len(vocabulary)) for shingle in sorted(shingles))
+            indptr.append(len(ids))
+        ids = np.asarray(ids, dtype=np.int64)
+        starts = np.asarray(indptr[:-1], dtype=np.int64)
+        filled = np.diff(np.asarray(indptr, dtype=np.int64)) > 0
+
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        vocabulary_ids = np.arange(len(vocabulary), dtype=np.int64)
+        signatures = np.full((len(shingle_sets), num_perm), -1, dtype=np.int64)
+        if not len(ids):
+            return signatures
+        for k in range(num_perm):
+            # 先对词表中的每个 shingle 求哈希值，再按标题分段取最小值
+            hashed = (a[k] * vocabulary_ids + b[k]) % MERSENNE_PRIME
+            signatures[filled, k] = np.minimum.reduceat(hashed[ids], starts[filled])
+        return signatures
+
+    def _collide(self, signatures: np.ndarray) -> sparse.csr_matrix:
+        """按段分桶，返回候选邻接矩阵 (对称，不含对角线，每行下标升序)。"""
+        n_samples = len(signatures)
+        filled = np.flatnonzero(signatures[:, 0] >= 0)
+        items, buckets = [], []
+        n_buckets = 0
+        for band in range(self.bands):
+            # 段内的 rows 个签名值合成一个 64 位键 (偶尔的哈希碰撞只会多出几个候选对)
+            keys = np.zeros(len(filled), dtype=np.uint64)
+            for value in signatures[filled, band * self.rows:(band + 1) * self.rows].T:
+                keys = keys * np.uint64(BAND_KEY_MULTIPLIER) + value.astype(np.uint64)
+            _, labels, counts = np.unique(keys, return_inverse=True, return_counts=True)
+            shared = counts[labels] > 1  # 只有一个成员的桶不产生候选对
+            items.append(filled[shared])
+            buckets.append(labels[shared] + n_buckets)
+            n_buckets += len(counts)
+        items = np.concatenate(items) if items else np.empty(0, dtype=np.int64)
+        buckets = np.concatenate(buckets) if buckets else np.empty(0, dtype=np.int64)
+        membership = sparse.csr_matrix((np.ones(len(items), dtype=np.int32), (items, buckets)),
+                                       shape=(n_samples, max(n_buckets, 1)))
+        shared = (membership @ membership.T).tocoo()
+        off_diagonal = shared.row != shared.col
+        neighbours = sparse.csr_matrix((np.ones(int(off_diagonal.sum()), dtype=np.int8),
+                                        (shared.row[off_diagonal], shared.col[off_diagonal])),
+                                       shape=(n_samples, n_samples))
+        neighbours.sort_indices()
+        return neighbours
@@ -6,15 +6,34 @@
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 import json
+import logging
+import sys
+
+logger = logging.getLogger('news_analyzer.models')
+
+
+def _parse_storage_datetime(value: Any, source_name_for_log: str) -> Optional[datetime]:
+    """安全地将数据库中的 ISO 格式字符串解析为 datetime 对象"""
+    if not value:
+        return None
+    try:
+        # sqlite3.Row 可能已经自动转换为 datetime
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except (ValueError, TypeError) as e:
+        logger.warning(f"无法解析源 '{source_name_for_log}' 的 datetime: {value} ({type(value)}). Error: {e}")
+        return None
+
 
 @dataclass
 class NewsSource:
     """新闻源数据模型"""
     name: str
-    type: str  # 例如 'rss', 'pengpai'
+    type: str  # 例如 'rss', 'pengpai', 'json'
     id: Optional[int] = None # Database primary key
     url: Optional[str] = None # 对于非URL源（如澎湃），可以为None
     category: str = "未分类"
@@ -45,6 +64,38 @@ class NewsSource:
             "custom_config": json.dumps(self.custom_config) if self.custom_config is not None else None
         }
 
+    @classmethod
+    def from_storage_dict(cls, source_dict: Dict[str, Any]) -> Optional['NewsSource']:
+        """Creates a NewsSource from a NewsStorage row dict (inverse of to_storage_dict). Returns None if invalid."""
+        if not source_dict or not source_dict.get('name') or not source_dict.get('type'):
+            logger.warning(f"Invalid source data for object creation: {source_dict}")
+            return None
+
+        custom_config = source_dict.get('custom_config')
+        deserialized_custom_config = {}
+        if custom_config and isinstance(custom_config, str):
+            try:
+                deserialized_custom_config = json.loads(custom_config)
+            except json.JSONDecodeError:
+                logger.error(f"Failed to deserialize custom_config for source '{source_dict.get('name')}': {custom_config}")
+        elif isinstance(custom_config, dict): # If it's already a dict (e.g. from tests)
+            deserialized_custom_config = custom_config
+
+        # is_user_added, last_update, error_count, notes 不在 news_sources 表中，使用 dataclass 默认值
+        return cls(
+            id=source_dict.get('id'),
+            name=source_dict['name'],
+            type=source_dict['type'],
+            url=source_dict.get('url'),
+            category=source_dict.get('category_name', '未分类'), # DB stores as category_name
+            enabled=bool(source_dict.get('is_enabled', True)),
+            custom_config=deserialized_custom_config,
+            last_checked_time=_parse_storage_datetime(source_dict.get('last_checked_time'), source_dict['name']),
+            status=source_dict.get('status', 'unchecked'),
+            last_error=source_dict.get('last_error'),
+            consecutive_error_count=int(source_dict.get('consecutive_error_count', 0)),
+        )
+
 @dataclass
 class NewsArticle:
     """新闻文章数据模型"""
@@ -98,6 +149,99 @@ class NewsItem(NewsArticle):
     is_new: bool = False # 标记是否为本次刷新中新增
     is_read: bool = False # 标记用户是否已阅读
 
+class NewsListRow:
+    """
+    新闻列表行 - 内存缓存中使用的精简新闻记录
+
+    只保存列表显示、过滤和排序需要的字段：来源和分类字符串被 intern (大量文章共享同一对象)，
+    发布时间保存为 UTC 微秒整数，不含 content / summary / raw_data 等大字段。
+    需要完整内容时 (详情、预览、LLM 分析) 通过 AppService.get_full_article 从数据库按需加载。
+    """
+
+    __slots__ = ('id', 'title', 'link', 'source_name', 'category', 'publish_ts', 'is_read', 'is_new')
+
+    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, title: str, link: str, source_name: str, id: Optional[int] = None,
+                 category: Optional[str] = "未分类", publish_ts: Optional[int] = None,
+                 is_read: bool = False, is_new: bool = False):
+        self.id = id
+        self.title = title
+        self.link = link
+        self.source_name = sys.intern(source_name) if isinstance(source_name, str) else source_name
+        self.category = sys.intern(category) if isinstance(category, str) else category
+        self.publish_ts = publish_ts  # UTC 微秒时间戳，None 表示没有发布时间
+        self.is_read = is_read
+        self.is_new = is_new
+
+    @staticmethod
+    def timestamp_from_datetime(value: Optional[datetime]) -> Optional[int]:
+        """datetime -> UTC 微秒时间戳 (naive 视为 UTC)。"""
+        if not isinstance(value, datetime):
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - NewsListRow._EPOCH) // timedelta(microseconds=1)
+
+    @property
+    def publish_time(self) -> Optional[datetime]:
+        """发布时间 (UTC aware datetime)，按需由时间戳生成。"""
+        if self.publish_ts is None:
+            return None
+        return NewsListRow._EPOCH + timedelta(microseconds=self.publish_ts)
+
+    @classmethod
+    def from_article(cls, article: NewsArticle) -> 'NewsListRow':
+        """从完整的 NewsArticle 生成列表行。"""
+        return cls(
+            id=article.id,
+            title=article.title,
+            link=article.link,
+            source_name=article.source_name,
+            category=article.category,
+            publish_ts=cls.timestamp_from_datetime(article.publish_time),
+            is_read=article.is_read,
+            is_new=getattr(article, 'is_new', False),
+        )
+
+    @classmethod
+    def from_storage_dict(cls, row: Dict[str, Any], category: Optional[str] = None) -> Optional['NewsListRow']:
+        """
+        从 NewsStorage 的文章字典生成列表行，链接为空时返回 None。
+
+        带时区的发布时间换算为 UTC；不带时区的视为本地时间 (与 AppService._parse_datetime 一致)；
+        无法用 ISO 格式解析的字符串得到 publish_ts=None，由调用方决定是否用更宽松的解析器补充。
+        """
+        link = row.get('link')
+        if not link:
+            return None
+        publish_time = row.get('publish_time')
+        if isinstance(publish_time, str):
+            try:
+                publish_time = datetime.fromisoformat(publish_time.replace('Z', '+00:00'))
+            except ValueError:
+                publish_time = None
+        if isinstance(publish_time, datetime):
+            publish_time = publish_time.astimezone(timezone.utc)  # naive 的 astimezone 按本地时间解释
+        return cls(
+            id=row.get('id'),
+            title=(row.get('title') or '无标题').strip(),
+            link=link,
+            source_name=row.get('source_name', '未知来源'),
+            category=category if category is not None else row.get('category', '未分类'),
+            publish_ts=cls.timestamp_from_datetime(publish_time),
+            is_read=bool(row.get('is_read', False)),
+        )
+
+    def to_article(self) -> NewsArticle:
+        """生成只含列表字段的 NewsArticle (数据库中找不到完整记录时的退路)。"""
+        return NewsArticle(id=self.id, title=self.title, link=self.link, source_name=self.source_name,
+                           publish_time=self.publish_time, category=self.category, is_read=self.is_read)
+
+    def __repr__(self) -> str:
+        return f"NewsListRow(id={self.id!r}, title={self.title!r}, source_name={self.source_name!r})"
+
+
 @dataclass
 class ChatMessage:
     """聊天消息数据模型"""
@@ -0,0 +1,154 @@
+"""
+文章聚类特征的持久化存储 - 使用独立的 SQLite 文件
+
+EnhancedNewsClusterer 每次聚类都要为全部文章重新计算标题/内容词频、LDA 主题分布和实体集合。
+ArticleFeatureStore 按文章 ID 保存这些特征 (连同内容哈希)，下次聚类时只为新增或内容变化的文章计算。
+特征的编码与失效规则见 src/core/article_features.py，这里只负责读写。
+
+表结构:
+  - feature_meta:     键值对 (特征版本等)
+  - feature_models:   主题模型 (pickle)、模型编号及训练时的文档数
+  - article_features: 文章 ID -> 内容哈希、标题/内容词频 (稀疏行)、主题分布、实体集合
+
+数据保存在数据目录下的 article_features.db 中，删除该文件只会让下次聚类重新计算特征。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feature_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS feature_models (
+    name TEXT PRIMARY KEY,
+    model_id INTEGER NOT NULL,
+    doc_count INTEGER NOT NULL,
+    blob BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_features (
+    article_id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    title_terms BLOB,
+    content_terms BLOB,
+    topic_model INTEGER,
+    topic BLOB,
+    entity_method TEXT,
+    entities TEXT
+);
+"""
+
+_COLUMNS = ("article_id", "content_hash", "title_terms", "content_terms", "topic_model", "topic",
+            "entity_method", "entities")
+
+# SQLite 单条语句的参数个数上限较低，按 ID 查询时分批
+_ID_BATCH = 500
+
+
+class ArticleFeatureStore:
+    """文章聚类特征的 SQLite 存储。"""
+
+    DB_FILE_NAME = "article_features.db"
+
+    def __init__(self, data_dir: str, db_name: Optional[str] = None):
+        """
+        Args:
+            data_dir: 数据目录 (通常与 NewsStorage.data_dir 相同)。
+            db_name: 数据库文件名，":memory:" 表示内存数据库 (测试用)。
+        """
+        self.logger = logging.getLogger('news_analyzer.storage.article_feature_store')
+        self.lock = threading.RLock()
+        if db_name == ":memory:":
+            self.db_path = ":memory:"
+        else:
+            os.makedirs(data_dir, exist_ok=True)
+            self.db_path = os.path.join(data_dir, db_name or self.DB_FILE_NAME)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.logger.debug(f"文章特征存储已打开: {self.db_path}")
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    # --- 元数据 ---
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM feature_meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row['value']) if row else default
+
+    def set_meta(self, key: str, value: Any):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO feature_meta (key, value) VALUES (?, ?)",
+                              (key, json.dumps(value)))
+
+    # --- 模型 ---
+
+    def load_model(self, name: str) -> Optional[Dict[str, Any]]:
+        """返回 {'model_id', 'doc_count', 'blob'}，没有保存过时返回 None。"""
+        with self.lock:
+            row = self.conn.execute("SELECT model_id, doc_count, blob FROM feature_models WHERE name = ?",
+                                    (name,)).fetchone()
+        return dict(row) if row else None
+
+    def save_model(self, name: str, model_id: int, doc_count: int, blob: bytes):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO feature_models (name, model_id, doc_count, blob) "
+                              "VALUES (?, ?, ?, ?)", (name, model_id, doc_count, sqlite3.Binary(blob)))
+
+    # --- 文章特征 ---
+
+    def load_features(self, article_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """按 ID 读取特征行 (不存在的 ID 不出现在结果中)。"""
+        article_ids = list(article_ids)
+        rows: Dict[int, Dict[str, Any]] = {}
+        with self.lock:
+            for start in range(0, len(article_ids), _ID_BATCH):
+                batch = article_ids[start:start + _ID_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for row in self.conn.execute(f"SELECT * FROM article_features WHERE article_id IN ({placeholders})",
+                                             batch):
+                    rows[row['article_id']] = dict(row)
+        return rows
+
+    def save_features(self, rows: List[Dict[str, Any]]):
+        """写入特征行 (覆盖同 ID 的旧行)，行中缺少的列写入 NULL。"""
+        if not rows:
+            return
+        with self.lock:
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        f"INSERT OR REPLACE INTO article_features ({', '.join(_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                        [tuple(row.get(column) for column in _COLUMNS) for row in rows])
+            except sqlite3.Error as e:
+                self.logger.error(f"保存文章特征失败: {e}", exc_info=True)
+                raise
+
+    def delete_features(self, article_ids: Iterable[int]):
+        with self.lock, self.conn:
+            self.conn.executemany("DELETE FROM article_features WHERE article_id = ?",
+                                  [(article_id,) for article_id in article_ids])
+
+    def feature_count(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM article_features").fetchone()[0]
+
+    def clear(self):
+        """删除全部特征和模型 (下次聚类时重新计算)。"""
+        with self.lock, self.conn:
+            for table in ("feature_meta", "feature_models", "article_features"):
+                self.conn.execute(f"DELETE FROM {table}")
@@ -0,0 +1,116 @@
+"""
+多特征聚类结果的持久化存储 - 使用独立的 SQLite 文件
+
+EnhancedNewsClusterer.cluster() 的结果按 "参数指纹 + 输入指纹" 保存在数据目录下的 cluster_results.db 中，
+再次对同一批文章、同一组参数聚类时直接读出 (见 src/core/cluster_results.py)；删除该文件只会让下次重新聚类。
+
+表结构:
+  - cluster_runs: 一次聚类的参数指纹、输入指纹、文章数、{文章 ID: 文章指纹} JSON 和事件列表 JSON
+
+只保留最近的若干次 (save_run 的 keep 参数)。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cluster_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    params_key TEXT NOT NULL,
+    input_key TEXT NOT NULL,
+    article_count INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    articles TEXT NOT NULL,
+    events TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cluster_runs_params ON cluster_runs (params_key, article_count);
+"""
+
+
+class ClusterResultStore:
+    """多特征聚类结果的 SQLite 存储。"""
+
+    DB_FILE_NAME = "cluster_results.db"
+
+    def __init__(self, data_dir: str, db_name: Optional[str] = None):
+        """
+        Args:
+            data_dir: 数据目录 (通常与 NewsStorage.data_dir 相同)。
+            db_name: 数据库文件名，":memory:" 表示内存数据库 (测试用)。
+        """
+        self.logger = logging.getLogger('news_analyzer.storage.cluster_result_store')
+        self.lock = threading.RLock()
+        if db_name == ":memory:":
+            self.db_path = ":memory:"
+        else:
+            os.makedirs(data_dir, exist_ok=True)
+            self.db_path = os.path.join(data_dir, db_name or self.DB_FILE_NAME)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.logger.debug(f"聚类结果存储已打开: {self.db_path}")
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    @staticmethod
+    def _run(row: sqlite3.Row) -> Dict[str, Any]:
+        """数据库行 -> {'run_id', 'articles': {文章 ID: 文章指纹}, 'events': [...]}。"""
+        return {'run_id': row['run_id'],
+                'articles': {int(article_id): digest for article_id, digest in json.loads(row['articles']).items()},
+                'events': json.loads(row['events'])}
+
+    def find_run(self, params_key: str, input_key: str) -> Optional[Dict[str, Any]]:
+        """参数和输入都相同的最近一次聚类，没有时返回 None。"""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM cluster_runs WHERE params_key = ? AND input_key = ? "
+                                    "ORDER BY run_id DESC LIMIT 1", (params_key, input_key)).fetchone()
+        return self._run(row) if row else None
+
+    def smaller_runs(self, params_key: str, article_count: int) -> Iterator[Dict[str, Any]]:
+        """参数相同、文章数少于 article_count 的聚类，文章数多的在前 (逐个解析，调用方找到可用的即可停止)。"""
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM cluster_runs WHERE params_key = ? AND article_count < ? "
+                                     "ORDER BY article_count DESC, run_id DESC",
+                                     (params_key, article_count)).fetchall()
+        for row in rows:
+            yield self._run(row)
+
+    def save_run(self, params_key: str, input_key: str, articles: Dict[int, str], events: List[Dict[str, Any]],
+                 keep: int):
+        """保存一次聚类 (替换参数和输入都相同的旧结果)，只保留最近的 keep 次。"""
+        with self.lock:
+            try:
+                with self.conn:
+                    self.conn.execute("DELETE FROM cluster_runs WHERE params_key = ? AND input_key = ?",
+                                      (params_key, input_key))
+                    self.conn.execute(
+                        "INSERT INTO cluster_runs (params_key, input_key, article_count, created_at, articles, events) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (params_key, input_key, len(articles), time.time(),
+                         json.dumps(articles), json.dumps(events, ensure_ascii=False)))
+                    self.conn.execute("DELETE FROM cluster_runs WHERE run_id NOT IN "
+                                      "(SELECT run_id FROM cluster_runs ORDER BY run_id DESC LIMIT ?)", (keep,))
+            except sqlite3.Error as e:
+                self.logger.error(f"保存聚类结果失败: {e}", exc_info=True)
+                raise
+
+    def run_count(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM cluster_runs").fetchone()[0]
+
+    def clear(self):
+        """删除全部聚类结果 (下次聚类时重新计算)。"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM cluster_runs")
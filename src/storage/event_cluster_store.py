@@ -0,0 +1,168 @@
+"""
+增量事件聚类的持久化存储 - 使用独立的 SQLite 文件
+
+IncrementalEventClusterer 的状态 (词的文档频率、事件质心、文章到事件的分配) 保存在
+数据目录下的 event_clusters.db 中，与新闻数据库分开：打开分类面板时直接读出上次的事件，
+不必重新聚类；状态损坏或需要重建时删除该文件即可，不影响新闻数据。
+
+表结构:
+  - cluster_meta:        键值对 (文档总数等)
+  - cluster_terms:       词 -> 文档频率
+  - cluster_events:      事件 (标题、摘要、分类、时间范围、质心 JSON)
+  - cluster_assignments: 文章 ID -> 事件 ID，以及列表显示所需的字段和词频 JSON
+
+连接可以在多个线程中使用 (后台聚类写入、界面线程读取)，所有操作由同一把锁串行化。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cluster_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS cluster_terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cluster_events (
+    event_id TEXT PRIMARY KEY,
+    title TEXT,
+    summary TEXT,
+    category TEXT,
+    first_time INTEGER,
+    last_time INTEGER,
+    centroid TEXT
+);
+CREATE TABLE IF NOT EXISTS cluster_assignments (
+    article_id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    title TEXT,
+    source_name TEXT,
+    link TEXT,
+    publish_time INTEGER,
+    terms TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_cluster_assignments_event ON cluster_assignments (event_id);
+"""
+
+
+class EventClusterStore:
+    """增量事件聚类状态的 SQLite 存储。"""
+
+    DB_FILE_NAME = "event_clusters.db"
+
+    def __init__(self, data_dir: str, db_name: Optional[str] = None):
+        """
+        Args:
+            data_dir: 数据目录 (通常与 NewsStorage.data_dir 相同)。
+            db_name: 数据库文件名，":memory:" 表示内存数据库 (测试用)。
+        """
+        self.logger = logging.getLogger('news_analyzer.storage.event_cluster_store')
+        self.lock = threading.RLock()
+        if db_name == ":memory:":
+            self.db_path = ":memory:"
+        else:
+            os.makedirs(data_dir, exist_ok=True)
+            self.db_path = os.path.join(data_dir, db_name or self.DB_FILE_NAME)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.logger.debug(f"事件聚类存储已打开: {self.db_path}")
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    # --- 读取 ---
+
+    def load(self) -> Dict[str, Any]:
+        """
+        读出全部状态。
+
+        Returns:
+            dict: {'meta': {key: value}, 'terms': {term: df},
+                   'events': [事件行字典 (centroid 已解析)], 'assignments': [分配行字典 (terms 已解析)]}
+        """
+        with self.lock:
+            meta = {row['key']: json.loads(row['value']) for row in self.conn.execute("SELECT * FROM cluster_meta")}
+            terms = dict(self.conn.execute("SELECT term, df FROM cluster_terms").fetchall())
+            events = [dict(row) for row in self.conn.execute("SELECT * FROM cluster_events")]
+            assignments = [dict(row) for row in
+                           self.conn.execute("SELECT * FROM cluster_assignments ORDER BY article_id")]
+        for event in events:
+            event['centroid'] = json.loads(event['centroid'] or '{}')
+        for assignment in assignments:
+            assignment['terms'] = json.loads(assignment['terms'] or '{}')
+        return {'meta': meta, 'terms': terms, 'events': events, 'assignments': assignments}
+
+    def assigned_article_ids(self) -> set:
+        with self.lock:
+            return {row[0] for row in self.conn.execute("SELECT article_id FROM cluster_assignments")}
+
+    # --- 写入 ---
+
+    def save(self, meta: Dict[str, Any], terms: Dict[str, int], events: Iterable[Dict[str, Any]],
+             assignments: Iterable[Dict[str, Any]], removed_event_ids: Iterable[str] = (),
+             removed_article_ids: Iterable[int] = ()):
+        """
+        在一个事务中写入变化的部分 (覆盖同键的旧行)。
+
+        Args:
+            meta: 需要更新的键值对。
+            terms: 文档频率有变化的词。
+            events: 新增或变化的事件 (centroid 为 dict)。
+            assignments: 新增或变化的分配 (terms 为 dict)。
+            removed_event_ids: 被合并或删除的事件。
+            removed_article_ids: 不再参与聚类的文章。
+        """
+        with self.lock:
+            try:
+                with self.conn:
+                    self.conn.executemany("INSERT OR REPLACE INTO cluster_meta (key, value) VALUES (?, ?)",
+                                          [(key, json.dumps(value)) for key, value in meta.items()])
+                    self.conn.executemany("INSERT OR REPLACE INTO cluster_terms (term, df) VALUES (?, ?)",
+                                          list(terms.items()))
+                    self.conn.executemany("DELETE FROM cluster_events WHERE event_id = ?",
+                                          [(event_id,) for event_id in removed_event_ids])
+                    self.conn.executemany("DELETE FROM cluster_assignments WHERE article_id = ?",
+                                          [(article_id,) for article_id in removed_article_ids])
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO cluster_events (event_id, title, summary, category, first_time, "
+                        "last_time, centroid) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [self._event_row(event) for event in events])
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO cluster_assignments (article_id, event_id, title, source_name, "
+                        "link, publish_time, terms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [self._assignment_row(assignment) for assignment in assignments])
+            except sqlite3.Error as e:
+                self.logger.error(f"保存事件聚类状态失败: {e}", exc_info=True)
+                raise
+
+    def clear(self):
+        """删除全部状态 (下次打开时重新聚类)。"""
+        with self.lock, self.conn:
+            for table in ("cluster_meta", "cluster_terms", "cluster_events", "cluster_assignments"):
+                self.conn.execute(f"DELETE FROM {table}")
+
+    @staticmethod
+    def _event_row(event: Dict[str, Any]) -> Tuple:
+        return (event['event_id'], event.get('title'), event.get('summary'), event.get('category'),
+                event.get('first_time'), event.get('last_time'),
+                json.dumps(event.get('centroid') or {}, ensure_ascii=False))
+
+    @staticmethod
+    def _assignment_row(assignment: Dict[str, Any]) -> Tuple:
+        return (assignment['article_id'], assignment['event_id'], assignment.get('title'),
+                assignment.get('source_name'), assignment.get('link'), assignment.get('publish_time'),
+                json.dumps(assignment.get('terms') or {}, ensure_ascii=False))
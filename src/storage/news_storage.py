@@ -10,6 +10,7 @@ import logging
 import shutil
 import sqlite3
 import threading
+from contextlib import contextmanager
 from typing import List, Dict, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 from src.models import NewsArticle # Commented out, will handle data as dicts for now
@@ -26,6 +27,16 @@ def convert_datetime_to_iso(obj):
     return obj
 
 
+def _py_lower(value):
+    """SQL 函数 py_lower：按 Python str.lower() 转小写 (SQLite 内置的 LOWER 只处理 ASCII 字母)。"""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _register_sql_functions(conn: sqlite3.Connection):
+    """在连接上注册查询用到的 Python 函数 (每个连接都要单独注册)。"""
+    conn.create_function("py_lower", 1, _py_lower, deterministic=True)
+
+
 class NewsStorage:
     """新闻数据存储类 - 使用 SQLite"""
 
@@ -159,8 +170,13 @@ class NewsStorage:
         """连接到 SQLite 数据库并设置 cursor"""
         try:
             self.conn = sqlite3.connect(self.db_path)
+            self._owner_thread_id = threading.get_ident() # self.conn 只能在创建它的线程中使用
             self.conn.row_factory = sqlite3.Row # Access columns by name
+            _register_sql_functions(self.conn)
             self.conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+            if self.db_path != ":memory:":
+                # WAL: 无界面刷新进程写入时，GUI 进程仍可并发读取同一个数据库
+                self.conn.execute("PRAGMA journal_mode = WAL;")
             self.cursor = self.conn.cursor()
             self.logger.debug(f"成功连接到 SQLite 数据库: {self.db_path}")
         except sqlite3.Error as e:
@@ -535,6 +551,106 @@ class NewsStorage:
         # self.logger.debug(f"get_articles_by_links: 返回 {len(articles_dicts)} 个文章字典。") # 减少日志冗余
         return articles_dicts
 
+    @contextmanager
+    def _read_connection(self):
+        """
+        只读查询使用的连接。
+
+        在创建 self.conn 的线程中直接复用主连接；在其他线程 (例如后台搜索) 中
+        临时打开一个只读连接 (WAL 模式下与主连接的读写互不阻塞)。内存数据库无法跨线程访问。
+        """
+        if threading.get_ident() == getattr(self, '_owner_thread_id', None):
+            with self.lock:
+                yield self.conn
+            return
+        if self.db_path == ":memory:":
+            raise sqlite3.ProgrammingError("内存数据库不能在其他线程中读取")
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        _register_sql_functions(conn)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # 列表显示所需的列；按发布时间倒序 (id 作为并列时的稳定次序)，分页结果不会重叠或遗漏
+    _HEADLINE_QUERY = ("SELECT id, title, link, source_name, publish_time, category_name, is_read FROM articles "
+                       "ORDER BY publish_time DESC, id DESC LIMIT ? OFFSET ?")
+
+    def supports_concurrent_reads(self) -> bool:
+        """是否可以在其他线程中读取 (文件数据库可以，内存数据库不行)。"""
+        return self.db_path != ":memory:"
+
+    def get_article_headlines(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """按发布时间倒序返回一页文章的列表字段 (不含正文)。可以在任意线程调用。"""
+        try:
+            with self._read_connection() as conn:
+                rows = conn.execute(self._HEADLINE_QUERY, (limit, offset)).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"读取文章标题页失败 (offset={offset}, limit={limit}): {e}", exc_info=True)
+            return []
+        return [self._article_from_row(row) for row in rows]
+
+    def iter_article_headlines(self, offset: int = 0, page_sizes: Optional[List[int]] = None,
+                               page_size: int = 5000):
+        """
+        从 offset 开始按发布时间倒序逐页产出文章的列表字段，直到读完。可以在其他线程中调用。
+
+        整个遍历使用同一条查询 (同一个读快照)，遍历期间其他连接写入的文章不会造成重复或遗漏。
+
+        Args:
+            offset: 跳过最新的多少篇 (已经同步加载的部分)。
+            page_sizes: 可选，前几页各自的大小 (例如逐页增大)；用完后每页 page_size 篇。
+        """
+        sizes = list(page_sizes or [])
+        with self._read_connection() as conn:
+            cursor = conn.execute(self._HEADLINE_QUERY, (-1, offset))
+            while True:
+                rows = cursor.fetchmany(sizes.pop(0) if sizes else page_size)
+                if not rows:
+                    return
+                yield [self._article_from_row(row) for row in rows]
+
+    def get_articles_by_ids(self, article_ids: List[int]) -> List[Dict[str, Any]]:
+        """按 ID 批量返回完整文章 (含正文)，顺序不保证。可以在任意线程调用 (例如后台预取详情)。"""
+        ids = [article_id for article_id in article_ids if article_id is not None]
+        if not ids:
+            return []
+        rows = []
+        try:
+            with self._read_connection() as conn:
+                # SQLite 默认最多 999 个参数，分批查询
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(conn.execute(f"SELECT * FROM articles WHERE id IN ({placeholders})", chunk).fetchall())
+        except sqlite3.Error as e:
+            self.logger.error(f"按 ID 批量读取文章失败 ({len(ids)} 篇): {e}", exc_info=True)
+            return []
+        return [article for article in (self._article_from_row(row) for row in rows) if article]
+
+    def search_article_ids(self, term: str, fields: List[str]) -> set:
+        """
+        返回任一字段 (小写) 包含 term 的文章 ID 集合，供只在内存中保存列表字段的缓存搜索正文。
+        可以在任意线程调用。字段用 py_lower (Python 的 str.lower) 转小写，非 ASCII 字母的大小写规则与内存索引一致。
+
+        Args:
+            term: 搜索词 (应已小写)。
+            fields: 搜索的列名，只接受 title / content / summary / source_name / category_name。
+        """
+        columns = [field for field in fields if field in ("title", "content", "summary", "source_name", "category_name")]
+        if not term or not columns:
+            return set()
+        # instr 做精确的子串匹配，无需转义 LIKE 的通配符
+        where = " OR ".join(f"instr(py_lower({column}), ?) > 0" for column in columns)
+        try:
+            with self._read_connection() as conn:
+                rows = conn.execute(f"SELECT id FROM articles WHERE {where}", [term] * len(columns)).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"按字段 {columns} 搜索文章失败: {e}", exc_info=True)
+            return set()
+        return {row[0] for row in rows}
+
     def get_all_articles(self, 
                          limit: Optional[int] = None, 
                          offset: Optional[int] = None,
@@ -577,7 +693,7 @@ class NewsStorage:
             for field in search_fields:
                 # Basic validation for field names to prevent injection, though not strictly necessary with param queries
                 if field in ["title", "content", "source_name", "category_name"]: # Whitelist fields
-                    search_clauses.append(f"LOWER({field}) LIKE LOWER(?)")
+                    search_clauses.append(f"py_lower({field}) LIKE py_lower(?)")
                     params.append(f"%{search_term}%")
             if search_clauses:
                 conditions.append(f"({' OR '.join(search_clauses)})")
@@ -666,7 +782,7 @@ class NewsStorage:
             search_clauses = []
             for field in search_fields:
                 if field in ["title", "content", "source_name", "category_name"]: # Whitelist fields
-                    search_clauses.append(f"LOWER({field}) LIKE LOWER(?)")
+                    search_clauses.append(f"py_lower({field}) LIKE py_lower(?)")
                     params.append(f"%{search_term}%")
             if search_clauses:
                 conditions.append(f"({' OR '.join(search_clauses)})")
@@ -19,7 +19,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
                              QTreeWidget, QTreeWidgetItem, QMenu, QHeaderView,
                              QComboBox, QProgressBar, QDialog, QFileDialog,
                              QGroupBox, QCheckBox, QLineEdit)
-from PySide6.QtCore import Qt, Signal, QSize, QPoint, Slot
+from PySide6.QtCore import Qt, Signal, QSize, QPoint, Slot, QThreadPool
 from PySide6.QtGui import QIcon, QFont, QAction, QCursor, QColor
 
 from src.models import NewsArticle
@@ -27,6 +27,8 @@ from src.llm.llm_service import LLMService
 from src.llm.prompt_manager import PromptManager
 from src.storage.news_storage import NewsStorage
 from src.core.news_clusterer import NewsClusterer
+from src.core.incremental_clusterer import IncrementalEventClusterer, EventClusteringWorker
+from src.storage.event_cluster_store import EventClusterStore
 from src.core.event_analyzer import EventAnalyzer
 from src.collectors.categories import STANDARD_CATEGORIES
 from src.ui.components.analysis_visualizer import AnalysisVisualizer
@@ -68,6 +70,12 @@ class ClassificationPanel(QWidget):
         
         # 初始化聚类器和分析器
         self.clusterer = NewsClusterer()
+        # 事件聚类结果持久化在 event_clusters.db 中，打开面板时直接显示，新文章在后台增量聚类
+        self.incremental_clusterer: Optional[IncrementalEventClusterer] = None
+        self._cluster_pool = QThreadPool(self)
+        self._cluster_pool.setMaxThreadCount(1)
+        self._clustering = False
+        self._pending_article_ids: List[Any] = []
         self.event_analyzer = EventAnalyzer(llm_service=self.llm_service, prompt_manager=self.prompt_manager)
         
         # 初始化数据
@@ -367,48 +375,111 @@ class ClassificationPanel(QWidget):
         layout.addLayout(status_layout)
     
     def _load_news_data(self):
-        """加载新闻数据并进行聚类"""
+        """显示已保存的事件聚类结果，并在后台为尚未聚类的文章执行增量聚类"""
         if not self.storage:
             self.logger.error("存储服务不可用，无法加载新闻数据")
             self.status_label.setText("错误: 存储服务不可用")
             return
         
         try:
-            self.status_label.setText("正在加载新闻数据...")
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(10)
-            
-            # 从存储加载新闻
-            news_items = self.storage.get_all_news()
-            self.all_news_items = [item.to_dict() for item in news_items]
-            
-            self.progress_bar.setValue(30)
-            self.status_label.setText(f"已加载 {len(self.all_news_items)} 条新闻，正在聚类...")
-            
-            # 进行聚类
-            self.events = self.clusterer.cluster(self.all_news_items)
-            
-            self.progress_bar.setValue(70)
-            self.status_label.setText("正在按类别组织事件...")
-            
-            # 按类别组织事件
-            self._categorize_events()
-            
-            self.progress_bar.setValue(90)
-            
-            # 更新UI
-            self._update_event_list()
-            self._update_stance_tags()
-            
-            self.progress_bar.setValue(100)
-            self.status_label.setText(f"已完成，共 {len(self.events)} 个事件")
-            self.progress_bar.setVisible(False)
+            if self.incremental_clusterer is None:
+                # 内存数据库 (测试) 对应内存中的聚类状态
+                store = EventClusterStore(self.storage.data_dir,
+                                          ":memory:" if not self.storage.supports_concurrent_reads() else None)
+                self.incremental_clusterer = IncrementalEventClusterer(
+                    store=store, categorize=self.clusterer._categorize_news,
+                    summarize=self.clusterer._generate_summary)
+            
+            # 上次的结果立即显示，不必等待聚类
+            self.events = self.incremental_clusterer.event_dicts()
+            self._show_events()
+            self._start_clustering(None)
             
         except Exception as e:
             self.logger.error(f"加载新闻数据时出错: {e}", exc_info=True)
             self.status_label.setText(f"错误: {str(e)}")
             self.progress_bar.setVisible(False)
     
+    def on_news_cache_delta(self, added_ids: list, updated_ids: list, removed_ids: list):
+        """新闻缓存变化时增量更新事件：新增文章在后台聚类，删除的文章从事件中移除"""
+        if not self.incremental_clusterer:
+            return
+        if removed_ids:
+            self.incremental_clusterer.remove_articles(removed_ids)
+            if not added_ids:
+                self.events = self.incremental_clusterer.event_dicts()
+                self._show_events()
+        if added_ids:
+            self._start_clustering(list(added_ids))
+    
+    def _start_clustering(self, article_ids: Optional[List[Any]]):
+        """启动后台增量聚类；article_ids 为 None 时检查全部文章。已有任务在运行时排队到其结束后"""
+        if self._clustering:
+            if article_ids is None:
+                self._pending_article_ids = None
+            elif self._pending_article_ids is not None:
+                self._pending_article_ids.extend(article_ids)
+            return
+        
+        worker = EventClusteringWorker(self.storage, self.incremental_clusterer, article_ids)
+        worker.signals.finished.connect(self._on_clustering_finished)
+        worker.signals.error.connect(self._on_clustering_error)
+        self._clustering = True
+        self.progress_bar.setRange(0, 0)  # 不确定进度
+        self.progress_bar.setVisible(True)
+        self.status_label.setText(f"共 {len(self.events)} 个事件，正在聚类新文章...")
+        if self.storage.supports_concurrent_reads():
+            self._cluster_pool.start(worker)
+        else:
+            # 内存数据库无法在其他线程读取，直接在当前线程执行
+            worker.run()
+    
+    @Slot(list, dict)
+    def _on_clustering_finished(self, events: list, stats: dict):
+        """后台聚类完成，刷新事件列表"""
+        self._clustering = False
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        self.events = events
+        self._show_events()
+        added = stats.get('assigned', 0) + stats.get('created', 0)
+        if added:
+            self.status_label.setText(f"已完成，新聚类 {added} 篇文章，共 {len(self.events)} 个事件")
+        self._run_pending_clustering()
+    
+    @Slot(str)
+    def _on_clustering_error(self, message: str):
+        self._clustering = False
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        self.status_label.setText(f"错误: {message}")
+        self._run_pending_clustering()
+    
+    def _run_pending_clustering(self):
+        pending = self._pending_article_ids
+        self._pending_article_ids = []
+        if pending is None or pending:
+            self._start_clustering(pending)
+    
+    def _show_events(self):
+        """按类别组织事件并更新列表"""
+        self._categorize_events()
+        self._update_event_list()
+        self._update_stance_tags()
+        self.status_label.setText(f"已完成，共 {len(self.events)} 个事件")
+    
+    def _load_report_contents(self, event: Dict):
+        """事件的报道只保存了列表字段，选中时按 ID 从数据库读取正文"""
+        missing = [report['id'] for report in event.get("reports", [])
+                   if 'content' not in report and report.get('id') is not None]
+        if not missing:
+            return
+        contents = {article['id']: article.get('content') or '' for article in
+                    self.storage.get_articles_by_ids(missing)}
+        for report in event["reports"]:
+            if report.get('id') in contents:
+                report['content'] = contents[report['id']]
+    
     def _categorize_events(self):
         """按类别组织事件"""
         self.categorized_events = {}
@@ -521,6 +592,7 @@ class ClassificationPanel(QWidget):
                 break
         
         if self.current_event:
+            self._load_report_contents(self.current_event)
             self.analyze_button.setEnabled(True)
             self._update_event_details()
             self._update_media_list()
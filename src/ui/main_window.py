@@ -625,6 +625,7 @@ if __name__ == '__main__':
     class MockAppService:
         def __init__(self):
             self.news_cache_updated = pyqtSignal(list)
+            self.news_cache_delta = pyqtSignal(list, list, list)
             self.sources_updated = pyqtSignal()
             self.refresh_started = pyqtSignal()
             self.refresh_complete = pyqtSignal(bool, str)
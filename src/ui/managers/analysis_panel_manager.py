@@ -16,7 +16,9 @@ from PySide6.QtGui import QAction
 from src.core.app_service import AppService
 from src.models import NewsArticle
 from src.llm.processors import analyze_text, digitize_importance, digitize_stance
-from src.ui.views.analysis_visualizer import AnalysisVisualizer
+from src.utils.lazy_import import lazy_attr
+# 可视化组件依赖 matplotlib (导入约 0.7s)，只在打开分析对话框时才需要
+AnalysisVisualizer = lazy_attr('src.ui.views.analysis_visualizer', 'AnalysisVisualizer')
 # from src.ui.viewmodels.analysis_viewmodel import AnalysisViewModel # REMOVED - Seems unused
 from src.core.analysis_service import AnalysisService
 from src.ui.views.prompt_manager_widget import PromptManagerWidget
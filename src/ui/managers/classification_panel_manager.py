@@ -34,6 +34,7 @@ class ClassificationPanelManager(QObject):
         
         # 如果面板已存在，关闭它
         if self.classification_panel and self.classification_panel.isVisible():
+            self._disconnect_panel()
             self.classification_panel.close()
             self.classification_panel = None
         
@@ -50,6 +51,8 @@ class ClassificationPanelManager(QObject):
             self.classification_panel.analysis_completed.connect(self._on_analysis_completed)
             self.classification_panel.status_message.connect(self._on_status_message)
             self.classification_panel.token_usage_updated.connect(self._on_token_usage_updated)
+            # 刷新得到的新文章交给面板增量聚类
+            self.app_service.news_cache_delta.connect(self.classification_panel.on_news_cache_delta)
             
             # 显示面板
             self.classification_panel.show()
@@ -58,6 +61,12 @@ class ClassificationPanelManager(QObject):
             self.logger.error(f"创建信息分类与整理核查面板时出错: {e}", exc_info=True)
             QMessageBox.critical(self.window, "错误", f"无法创建信息分类与整理核查面板: {e}")
     
+    def _disconnect_panel(self):
+        try:
+            self.app_service.news_cache_delta.disconnect(self.classification_panel.on_news_cache_delta)
+        except (RuntimeError, TypeError):
+            pass
+    
     @Slot(dict)
     def _on_analysis_completed(self, result: dict):
         """处理分析完成事件
@@ -12,6 +12,7 @@ from functools import partial
 # --- ADDED: Import NewsArticle directly for runtime --- 
 from src.models import NewsArticle
 from src.ui.viewmodels.llm_settings_viewmodel import LLMSettingsViewModel # ADDED IMPORT
+from src.utils.lazy_import import lazy_attr
 
 # Import dialog classes (adjust paths as necessary)
 # Need to ensure these dialogs exist and are importable
@@ -63,12 +64,8 @@ except ImportError:
     NewsDetailDialog = None
     logging.getLogger(__name__).warning("NewsDetailDialog not found, news detail dialog disabled.")
 
-try:
-    from src.ui.managers.integrated_panel_manager import IntegratedPanelManager
-except ImportError as e:
-    IntegratedPanelManager = None
-    logging.getLogger(__name__).error(f"IntegratedPanelManager导入失败: {e}")
-    logging.getLogger(__name__).warning("整合分析面板功能已禁用。")
+# 整合分析面板依赖 scikit-learn 和 matplotlib (导入约 2 秒)，首次打开面板时才导入
+IntegratedPanelManager = lazy_attr('src.ui.managers.integrated_panel_manager', 'IntegratedPanelManager')
 
 # --- Import Settings Dialog ---
 try:
@@ -332,7 +329,7 @@ class DialogManager:
     def open_integrated_panel(self):
         """打开整合后的新闻分析与整合面板（包含相似度分析、重要程度和立场分析等功能）"""
         self.logger.debug("Attempting to open Integrated Analysis panel...")
-        if not IntegratedPanelManager:
+        if not IntegratedPanelManager.available():
              self.show_error_message("整合分析面板组件未找到或加载失败。")
              return
         try:
@@ -79,6 +79,7 @@ class StatusBarManager:
         if self.progress_bar:
             self.progress_bar.setVisible(False)
             self.progress_bar.setValue(0) # Reset value when hidden
+            self.progress_bar.setToolTip("")
             self.logger.debug("Progress bar hidden.")
         else:
              self.logger.error("Progress bar not initialized. Cannot hide.")
@@ -98,6 +99,27 @@ class StatusBarManager:
         else:
              self.logger.error("Progress bar not initialized. Cannot update.")
 
+    def show_progress_snapshot(self, snapshot: dict):
+        """Renders a coalesced refresh snapshot (see ProgressAggregator.snapshot): totals, ETA and per-source state."""
+        if snapshot.get('kind') != 'refresh' or snapshot.get('finished'):
+            return
+        finished, total = snapshot['finished_sources'], snapshot['total_sources']
+        self.update_progress(finished, total)
+        message = f"正在刷新: {finished}/{total} 个源，已获取 {snapshot['items_done']} 条"
+        if snapshot.get('failed_sources'):
+            message += f"，失败 {snapshot['failed_sources']} 个"
+        if snapshot.get('eta_seconds') is not None:
+            message += f"，预计剩余 {snapshot['eta_seconds']:.0f} 秒"
+        sources = snapshot.get('sources', {})
+        running = [name for name, state in sources.items() if state['state'] == 'running']
+        if running:
+            message += f" | 进行中: {', '.join(running[:3])}" + (f" 等 {len(running)} 个" if len(running) > 3 else "")
+        self.show_message(message)
+        if self.progress_bar:
+            self.progress_bar.setToolTip("\n".join(
+                f"{name}: {state['state']}, {state['items_done']} 条" + (f" ({state['error']})" if state['error'] else "")
+                for name, state in sources.items()))
+
     # --- End Progress Bar Methods ---
 
     def connect_signals(self, app_service: 'AppService'):
@@ -113,7 +135,11 @@ class StatusBarManager:
             if hasattr(app_service, 'refresh_started'):
                 app_service.refresh_started.connect(self.show_progress)
                 self.logger.debug("Connected app_service.refresh_started to show_progress.")
-            if hasattr(app_service, 'refresh_progress'):
+            if hasattr(app_service, 'refresh_progress_snapshot'):
+                # The snapshot carries the same source counts as refresh_progress plus items, ETA and per-source state
+                app_service.refresh_progress_snapshot.connect(self.show_progress_snapshot)
+                self.logger.debug("Connected app_service.refresh_progress_snapshot to show_progress_snapshot.")
+            elif hasattr(app_service, 'refresh_progress'):
                 app_service.refresh_progress.connect(self.update_progress)
                 self.logger.debug("Connected app_service.refresh_progress to update_progress.")
             if hasattr(app_service, 'refresh_complete'):
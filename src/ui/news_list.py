@@ -2,9 +2,10 @@ import logging
 import json
 import os
 import html # 导入 html 模块
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import re
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QListWidget,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QListWidget, QListView,
                            QListWidgetItem, QLabel, QTextBrowser,
                            QSplitter, QHBoxLayout, QPushButton,
                            QCheckBox, QSlider, QLineEdit, QDateEdit,
@@ -16,17 +17,61 @@ from PySide6.QtCore import Signal as pyqtSignal, Qt, QDate, Slot as pyqtSlot, QT
 from PySide6.QtGui import (QFont, QIntValidator, QPalette, QColor, QTextDocument, QFontMetrics,
                          QPainter, QTextOption, QAbstractTextDocumentLayout) # Use PySide6
 
-from src.models import NewsArticle # Use absolute import from src
+from src.models import NewsArticle, NewsListRow # Use absolute import from src
 from .ui_utils import setup_news_list_widget, setup_preview_browser # 导入新的辅助函数
-from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel # Use absolute import
+from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel, NewsListModel, render_news_item_html # Use absolute import
 from .delegates.calendar_delegate import CalendarItemDelegate # <-- Import the new delegate
 # --- 自定义 Delegate 用于绘制富文本 ---
 class NewsItemDelegate(QStyledItemDelegate):
-    """用于在 QListWidget 中绘制包含富文本的项"""
-    RichTextRole = Qt.UserRole + 1 # 自定义角色存储富文本
+    """
+    绘制新闻列表项：两行富文本 (标题 + 来源/日期)。
 
-    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: int):
+    所有行等高 (配合 QListView.setUniformItemSizes)，视图只需为可见行调用 paint，
+    不必为每一行解析 HTML 来计算高度。标题按可用宽度省略为一行；排版好的
+    QTextDocument 按 (新闻, 宽度, 已读标记, 字体) 缓存，滚动回来时直接复用。
+    """
+    RichTextRole = NewsListModel.RichTextRole # 兼容旧代码，角色由模型提供
+    MAX_CACHED_DOCUMENTS = 512 # 约为几屏的行数
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._documents: "OrderedDict[tuple, tuple]" = OrderedDict() # key -> (article, QTextDocument)
+        self._row_heights: dict = {} # font.key() -> 行高
+
+    def clear_cache(self):
+        """丢弃缓存的排版 (例如切换主题或字体后)"""
+        self._documents.clear()
+        self._row_heights.clear()
+
+    def _document_for(self, article: NewsArticle, option: QStyleOptionViewItem) -> QTextDocument:
+        width = max(option.rect.width() - 10, 20) # 减去一些边距
+        starred = getattr(article, 'is_new', False) and not getattr(article, 'is_read', False)
+        key = (id(article), width, starred, option.font.key())
+        cached = self._documents.get(key)
+        # 同时比较对象本身：id() 可能被已释放的文章复用
+        if cached is not None and cached[0] is article:
+            self._documents.move_to_end(key)
+            return cached[1]
+
+        doc = QTextDocument()
+        doc.setDefaultFont(option.font) # 使用 item 的字体
+        # 标题省略为单行，保证行高固定
+        title_width = width - 2 * int(doc.documentMargin()) - QFontMetrics(option.font).horizontalAdvance("* ")
+        title = QFontMetrics(option.font).elidedText(article.title or '无标题', Qt.ElideRight, max(title_width, 0))
+        doc.setHtml(render_news_item_html(article, title))
+        doc.setTextWidth(width)
+
+        self._documents[key] = (article, doc)
+        if len(self._documents) > self.MAX_CACHED_DOCUMENTS:
+            self._documents.popitem(last=False)
+        return doc
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
         self.initStyleOption(option, index) # 初始化选项，获取默认样式
+        article = index.data(Qt.UserRole)
+        if not isinstance(article, (NewsArticle, NewsListRow)):
+            super().paint(painter, option, index)
+            return
         painter.save()
 
         # --- Draw default background/frame first --- 
@@ -39,48 +84,31 @@ class NewsItemDelegate(QStyledItemDelegate):
             painter.fillRect(option.rect, highlight_color)
 
         # --- Now draw the rich text over the background --- 
-        rich_text = index.data(self.RichTextRole)
-
-        if rich_text:
-            # 设置 painter 的画笔颜色，基于调色板
-            text_color = option.palette.color(QPalette.HighlightedText if option.state & QStyle.State_Selected else QPalette.Text)
-            painter.setPen(text_color)
-
-            # 设置文本选项
-            text_option = QTextOption()
-            text_option.setWrapMode(QTextOption.WordWrap)
-            text_option.setAlignment(Qt.AlignLeft | Qt.AlignTop) # 顶部对齐
-
-            # 创建 QTextDocument 并设置内容
-            doc = QTextDocument()
-            doc.setHtml(rich_text)
-            doc.setTextWidth(option.rect.width() - 10) # 减去一些边距
-            doc.setDefaultFont(option.font) # 使用 item 的字体
-
-            # 计算绘制区域 (在背景内稍微缩进 - reverted padding)
-            text_rect = option.rect.adjusted(5, 3, -5, -3) # 左右各5px, 上下各3px 边距
-
-            # 设置 painter 状态并绘制
-            painter.translate(text_rect.topLeft())
-            painter.setClipRect(text_rect.translated(-text_rect.topLeft())) # 限制绘制区域
-            ctx = QAbstractTextDocumentLayout.PaintContext()
-            ctx.palette.setColor(QPalette.Text, text_color)
-
-            doc.documentLayout().draw(painter, ctx) # 使用上下文绘制
+        text_color = option.palette.color(QPalette.HighlightedText if option.state & QStyle.State_Selected else QPalette.Text)
+        painter.setPen(text_color)
+        doc = self._document_for(article, option)
+
+        # 计算绘制区域 (在背景内稍微缩进)
+        text_rect = option.rect.adjusted(5, 3, -5, -3) # 左右各5px, 上下各3px 边距
+        painter.translate(text_rect.topLeft())
+        painter.setClipRect(text_rect.translated(-text_rect.topLeft())) # 限制绘制区域
+        ctx = QAbstractTextDocumentLayout.PaintContext()
+        ctx.palette.setColor(QPalette.Text, text_color)
+        doc.documentLayout().draw(painter, ctx) # 使用上下文绘制
 
         painter.restore()
 
-    def sizeHint(self, option: QStyleOptionViewItem, index: int) -> QSize:
-        # 计算尺寸提示
-        rich_text = index.data(self.RichTextRole)
-        if rich_text:
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        # 行高只取决于字体：用一条示例新闻排版一次后缓存
+        font_key = option.font.key()
+        height = self._row_heights.get(font_key)
+        if height is None:
             doc = QTextDocument()
-            doc.setHtml(rich_text)
-            doc.setTextWidth(option.rect.width() - 10) # 与 paint 中一致
             doc.setDefaultFont(option.font)
-            # 返回文档的理想高度 + 垂直边距 (reverted margin)
-            return QSize(int(doc.idealWidth()), int(doc.size().height()) + 6) # 6 = 3px top + 3px bottom margin
-        return super().sizeHint(option, index) # Fallback
+            doc.setHtml(render_news_item_html(NewsArticle(title="标题", link="", source_name="来源")))
+            height = int(doc.size().height()) + 6 # 6 = 3px top + 3px bottom margin
+            self._row_heights[font_key] = height
+        return QSize(max(option.rect.width(), 0), height)
 
 
 # --- End Delegate ---
@@ -93,6 +121,8 @@ class NewsListPanel(QWidget):
     news_updated = pyqtSignal(object)
     item_double_clicked_signal = pyqtSignal(object) # 新增双击信号
 
+    MAX_PREVIEW_DOCUMENTS = 16 # 缓存的预览排版数量 (最近查看的文章及其附近预取的文章)
+
     def __init__(self, view_model: NewsListViewModel, parent=None): # 修改为接收 ViewModel
         super().__init__(parent)
         self.logger = logging.getLogger('news_analyzer.ui.news_list')
@@ -107,6 +137,8 @@ class NewsListPanel(QWidget):
         # self.original_news = [] # 由 ViewModel 管理
 
         # self.read_news_ids = set() # 不再需要，状态由 ViewModel 管理
+        self._preview_documents: "OrderedDict[object, tuple]" = OrderedDict() # 文章 ID -> (html, 字体, QTextDocument)
+        self._pending_preview_ids: list = [] # 预取完成、等待空闲时排版的文章 ID
         self._init_ui()
 
     # 移除历史记录文件相关常量和方法，这些将由 AppService 和 Storage 处理
@@ -118,7 +150,8 @@ class NewsListPanel(QWidget):
 
         # --- 连接 ViewModel 信号 ---
         self.view_model.news_list_changed.connect(self._on_news_list_changed)
-        self.view_model.read_status_changed.connect(self._update_item_read_status) # 连接已读状态变化信号
+        self.view_model.details_prefetched.connect(self._on_details_prefetched)
+        # 已读状态变化由模型的 dataChanged 直接通知视图重绘对应行
 
         layout = QVBoxLayout(self)
         layout.setSpacing(10) # 增加主布局间距
@@ -298,14 +331,17 @@ class NewsListPanel(QWidget):
         layout.addWidget(splitter, stretch=1) # Allow splitter to take remaining space
 
         # 使用辅助函数配置新闻列表
-        self.news_list = QListWidget()
+        # 模型/视图：QListView 直接读取 ViewModel 的过滤视图，只为可见行绘制
+        self.news_list = QListView()
+        self.news_list.setModel(self.view_model.get_model())
         self.news_list.setItemDelegate(self.delegate) # 设置自定义 Delegate
+        self.news_list.setUniformItemSizes(True) # 行高固定，布局时无需逐行计算 sizeHint
         self.news_list.setObjectName("newsListWidget") # 确保 objectName 设置正确
         self.news_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) # Explicitly set policy
         self.news_list.setMinimumHeight(50) # *** Add minimum height ***
         setup_news_list_widget(self.news_list) # 调用辅助函数
-        self.news_list.itemClicked.connect(self._on_item_clicked) # 恢复单击信号连接，用于更新预览
-        self.news_list.itemDoubleClicked.connect(self._on_item_double_clicked) # 连接双击信号，用于弹出详情
+        self.news_list.clicked.connect(self._on_item_clicked) # 恢复单击信号连接，用于更新预览
+        self.news_list.doubleClicked.connect(self._on_item_double_clicked) # 连接双击信号，用于弹出详情
         splitter.addWidget(self.news_list)
 
         # 使用辅助函数配置预览浏览器
@@ -383,17 +419,8 @@ class NewsListPanel(QWidget):
         self._do_populate_and_update(current_list_from_vm)
 
     def _do_populate_and_update(self, news_list: list):
-        """用新的新闻列表数据实际更新UI。"""
-        self.logger.info(f"NewsListPanel._do_populate_and_update: Called with news_list of length {len(news_list)}.") # ADDED
-        # self.current_news = news_list # 状态由 ViewModel 管理
-        self.news_list.clear()
-        # self.logger.debug(f"Updating list with {len(news_list)} items.") # 旧的日志，被上面的替换了
-        self._populate_list_widget(news_list)
-        # Force widget update 
-        if hasattr(self, 'news_list_widget') and self.news_list_widget:
-            self.news_list_widget.update() # Request a repaint
-            self.logger.debug("Requested news_list_widget repaint after population.")
-
+        """更新状态栏并转发列表变化。列表行本身由模型增量通知视图，这里无需重建。"""
+        self.logger.debug(f"NewsListPanel._do_populate_and_update: list now has {len(news_list)} articles.")
         # 更新状态标签
         status_text = f"显示 {len(news_list)} 条新闻"
         if hasattr(self, 'status_label'): # Check if status_label exists
@@ -401,61 +428,6 @@ class NewsListPanel(QWidget):
 
         # Emit signal that news has been updated (potentially useful for other components)
         self.news_updated.emit(news_list) # 发射更新后的列表
-        self.logger.debug("_do_populate_and_update 完成, 列表已更新")
-
-    def _populate_list_widget(self, news_list: list):
-        """用给定的新闻列表填充 QListWidget"""
-        self.news_list.clear()
-        self.logger.info(f"_populate_list_widget: 列表已清空，准备填充 {len(news_list)} 条新闻") # Changed to INFO
-        self.logger.debug(f"_populate_list_widget: 准备填充 {len(news_list)} 条新闻到列表")
-        items_added_count = 0 # Counter for added items
-        self.news_list.blockSignals(True) # Block signals during population
-        for news in news_list:
-            if not isinstance(news, NewsArticle): continue
-
-            # --- 获取状态和数据 ---
-            is_new = getattr(news, 'is_new', False)
-            is_read = getattr(news, 'is_read', False)
-            title = news.title or '无标题'
-            source = news.source_name or '未知来源'
-            publish_time = news.publish_time
-            display_date = publish_time.strftime('%Y-%m-%d %H:%M') if publish_time else "未知日期"
-
-            # --- 构建富文本内容 ---
-            # 对标题和来源日期进行 HTML 转义，防止特殊字符干扰富文本解析
-            escaped_title = html.escape(title)
-            escaped_source_date = html.escape(f"[{source}] {display_date}")
-
-            # 使用 HTML/富文本格式创建两行文本
-            # 第一行：标题 (正常大小，如果未读且是新的，可以考虑加粗或其他标记)
-            # 第二行：来源和日期 (稍小字体，灰色)
-            # star_prefix = "<b>* </b>" if is_new and not is_read else "" # Example: Bold star
-            star_prefix = "* " if is_new and not is_read else ""
-            # 使用 <p> 标签来强制换行，并为第二行设置样式
-            # 注意：Delegate 会处理绘制
-            rich_text = f"""
-            <p style="margin:0; padding:0;">{html.escape(star_prefix)}{escaped_title}</p>
-            <p style="margin:0; padding:0; font-size:9pt;">{escaped_source_date}</p>
-            """
-
-            # --- 创建 QListWidgetItem ---
-            item = QListWidgetItem()
-            # 不再需要设置文本或 Widget，Delegate 会处理绘制
-            # item.setText(f"{title} - [{source}]") # 可以设置一个纯文本供 Delegate 回退或工具提示
-
-            # --- 存储数据 ---
-            item.setData(Qt.UserRole, news) # 存储 NewsArticle 对象
-            item.setData(NewsItemDelegate.RichTextRole, rich_text) # 存储富文本供 Delegate 使用
-
-            # --- 添加 Item 到列表 ---
-            self.news_list.addItem(item)
-
-            # --- 移除设置已读样式的代码，Delegate 会处理 ---
-            items_added_count += 1
-        self.news_list.blockSignals(False) # Unblock signals
-        self.logger.info(f"_populate_list_widget: 循环结束，尝试添加了 {items_added_count} 个项目")
-        self.logger.info(f"_populate_list_widget: QListWidget 实际包含 {self.news_list.count()} 个项目")
-        self.logger.debug(f"QListWidget 添加项目完成: {len(news_list)} 条")
 
     # 移除 _apply_date_filter 方法
     # def _apply_date_filter(self): ...
@@ -603,63 +575,47 @@ class NewsListPanel(QWidget):
         self.view_model.filter_by_date_range(start_date, end_date)
 
     def _sort_by_date(self):
-        """按日期排序新闻列表"""
-        # 需要排序的数据来自 ViewModel
-        news_to_sort = list(self.view_model.newsList) # 获取当前显示的列表副本
-        if not news_to_sort: return
-        # sorted_news = self.current_news.copy() # Removed
+        """按日期排序新闻列表 (由 ViewModel 排序，模型随之刷新)"""
+        if not self.view_model.newsList: return
         try:
             reverse_order = self.sort_order.isChecked()
-            def get_date(news_item):
-                # Handle potential None publish_time for sorting
-                if not news_item.publish_time:
-                    self.logger.debug(f"新闻项缺少发布时间: {news_item.title[:30]}...") # 添加调试日志
-                    return datetime.min
-                
-                # 处理时区问题：确保所有日期时间对象都是naive或aware的
-                pub_time = news_item.publish_time
-                if hasattr(pub_time, 'tzinfo') and pub_time.tzinfo is not None:
-                    # 如果是aware datetime，转换为naive datetime
-                    # 通过替换tzinfo为None来移除时区信息
-                    return pub_time.replace(tzinfo=None)
-                return pub_time
-                
-            # 添加更详细的日志记录
-            self.logger.info(f"开始对 {len(news_to_sort)} 条新闻进行排序，排序方向: {'降序' if reverse_order else '升序'}")
-            news_to_sort.sort(key=get_date, reverse=reverse_order)
-            # self.current_news = sorted_news # Removed
-            # 直接更新列表显示，不修改 ViewModel 的内部顺序（除非 ViewModel 提供排序方法）
-            self._populate_list_widget(news_to_sort)
+            order = Qt.DescendingOrder if reverse_order else Qt.AscendingOrder
+            self.view_model.sort_news('publish_time', order)
             order_text = "降序" if reverse_order else "升序"
-            self.status_label.setText(f"已按日期{order_text}排列 {len(news_to_sort)} 条新闻")
-            self.logger.info(f"新闻排序完成: {len(news_to_sort)} 条新闻已按日期{order_text}排列")
+            count = len(self.view_model.newsList)
+            self.status_label.setText(f"已按日期{order_text}排列 {count} 条新闻")
+            self.logger.info(f"新闻排序完成: {count} 条新闻已按日期{order_text}排列")
         except Exception as e:
             self.status_label.setText(f"排序失败: {str(e)}")
             self.logger.error(f"新闻排序失败: {str(e)}", exc_info=True) # 添加exc_info=True以记录完整堆栈
 
-    def _on_item_clicked(self, item):
+    def _on_item_clicked(self, index):
         """处理列表项单击事件 - 更新预览并通知 ViewModel"""
-        news_article: NewsArticle = item.data(Qt.UserRole)
-        if not news_article or not isinstance(news_article, NewsArticle):
+        row_article = index.data(Qt.UserRole)
+        if not row_article or not isinstance(row_article, (NewsArticle, NewsListRow)):
             self.logger.warning("单击事件：列表项数据不是有效的 NewsArticle 对象")
             return
+        news_article = self.view_model.get_full_article(row_article) # 列表行不含正文，按需加载完整文章
         # 添加日志：确认即将发射信号
         title = news_article.title if news_article.title else "N/A"
         self.logger.info(f"NewsListPanel._on_item_clicked: Emitting item_selected for: {title[:30]}...")
         self.item_selected.emit(news_article) # 发射信号给 MainWindow
         self._update_preview(news_article)
         # 显式设置当前项为选中状态
-        self.news_list.setCurrentItem(item) # <--- 添加这行
+        self.news_list.setCurrentIndex(index)
         # 通知 ViewModel 选中项已更改
         self.view_model.select_news(news_article)
+        # 后台预取附近的文章，用户上下切换时可以直接显示
+        self.view_model.prefetch_around(index.row())
 
 
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """处理列表项双击事件 - 更新选中并触发主窗口行为"""
-        news_article: NewsArticle = item.data(Qt.UserRole)
-        if not news_article or not isinstance(news_article, NewsArticle):
+        row_article = index.data(Qt.UserRole)
+        if not row_article or not isinstance(row_article, (NewsArticle, NewsListRow)):
             self.logger.warning("双击事件：列表项数据不是有效的 NewsArticle 对象")
             return
+        news_article = self.view_model.get_full_article(row_article)
         # --- 标记为已读 ---
         link = news_article.link
         if link:
@@ -675,67 +631,46 @@ class NewsListPanel(QWidget):
         self.item_double_clicked_signal.emit(news_article)
 
     def _update_preview(self, news_article: NewsArticle):
-        """更新新闻预览"""
-        title = news_article.title or '无标题'
-        source = news_article.source_name or '未知来源'
-        date = news_article.publish_time.strftime('%Y-%m-%d %H:%M:%S') if news_article.publish_time else "未知日期"
-        content_display = news_article.content
-        summary_display = news_article.summary
-        if not content_display and summary_display:
-             description = f"<p><i>(仅摘要)</i></p>{summary_display}"
-        elif content_display:
-             description = content_display
-        else:
-             description = '无内容'
-        link = news_article.link or ''
-        html = f"""
-        <h2>{title}</h2>
-        <p><strong>来源:</strong> {source} | <strong>日期:</strong> {date}</p>
-        <hr>
-        <p>{description}</p>
-        """
-        if link: html += f'<p><a href="{link}" target="_blank">阅读原文</a></p>'
-        self.preview.setHtml(html)
-
-    @pyqtSlot(str, bool) # 修改槽签名以接收 is_read
-    def _update_item_read_status(self, news_link: str, is_read: bool):
-        """更新列表中特定新闻项的已读状态和显示"""
-        """处理 ViewModel 的 read_status_changed 信号，请求更新单个列表项"""
-        self.logger.debug(f"尝试更新链接 {news_link} 的已读状态为 {is_read}，请求重绘")
-        found = False
-        for index in range(self.news_list.count()): # Use 'index' for clarity
-            item = self.news_list.item(index)
-            if not item: continue
-
-            news_data: NewsArticle = item.data(Qt.UserRole)
-            if news_data and news_data.link == news_link:
-                self.logger.debug(f"找到匹配项于索引 {index}，请求更新。")
-                found = True
-                # 更新富文本数据以反映星号变化
-                is_new = getattr(news_data, 'is_new', False)
-                title = news_data.title or '无标题'
-                source = news_data.source_name or '未知来源'
-                publish_time = news_data.publish_time
-                display_date = publish_time.strftime('%Y-%m-%d %H:%M') if publish_time else "未知日期"
-                escaped_title = html.escape(title)
-                escaped_source_date = html.escape(f"[{source}] {display_date}")
-                star_prefix = "* " if is_new and not is_read else "" # is_read 是函数参数
-                rich_text = f"""
-                <p style="margin:0; padding:0;">{html.escape(star_prefix)}{escaped_title}</p>
-                <p style="margin:0; padding:0; font-size:9pt;">{escaped_source_date}</p>
-                """
-                item.setData(NewsItemDelegate.RichTextRole, rich_text) # 更新存储的富文本
-
-                # 请求 QListWidget 重绘该项
-                # 获取该项的 QModelIndex
-                model_index = self.news_list.indexFromItem(item)
-                if model_index.isValid():
-                    self.news_list.update(model_index) # 请求更新特定索引
-                    self.logger.debug(f"已请求更新索引 {model_index.row()}")
-                else:
-                     self.logger.warning(f"无法获取索引 {index} 的有效 QModelIndex 进行更新")
-                break # 找到后退出循环
-        if not found: # 使用 if not found 保持一致性
-            self.logger.warning(f"未在列表中找到链接为 {news_link} 的新闻项进行状态更新")
-
-    # _record_browsing_history 方法已移除，逻辑移至 AppService
\ No newline at end of file
+        """更新新闻预览 (HTML 和排版好的 QTextDocument 都会缓存，切换回看过或预取过的文章时直接复用)"""
+        html = self.view_model.get_preview_html(news_article)
+        if news_article.id is None:
+            self.preview.setHtml(html)
+            return
+        self.preview.setDocument(self._preview_document(news_article.id, html))
+
+    def _preview_document(self, article_id, html: str) -> QTextDocument:
+        font = self.preview.font()
+        cached = self._preview_documents.get(article_id)
+        if cached is not None and cached[0] == html and cached[1] == font.key():
+            self._preview_documents.move_to_end(article_id)
+            return cached[2]
+
+        doc = QTextDocument(self) # 由面板持有，预览框切换文档时不会删除它
+        doc.setDefaultFont(font)
+        doc.setHtml(html)
+        doc.setTextWidth(self.preview.viewport().width()) # 提前按预览框宽度排版
+        self._preview_documents[article_id] = (html, font.key(), doc)
+        while len(self._preview_documents) > self.MAX_PREVIEW_DOCUMENTS:
+            _, (_, _, old_doc) = self._preview_documents.popitem(last=False)
+            if old_doc is not self.preview.document():
+                old_doc.deleteLater()
+        return doc
+
+    @pyqtSlot(list)
+    def _on_details_prefetched(self, article_ids: list):
+        """预取完成后，在空闲时逐篇预先排版 (每次事件循环只处理一篇，不阻塞界面)"""
+        was_idle = not self._pending_preview_ids
+        self._pending_preview_ids = list(article_ids)[:self.MAX_PREVIEW_DOCUMENTS // 2]
+        if was_idle and self._pending_preview_ids:
+            QTimer.singleShot(0, self._build_next_preview_document)
+
+    def _build_next_preview_document(self):
+        if not self._pending_preview_ids:
+            return
+        article_id = self._pending_preview_ids.pop(0)
+        if article_id not in self._preview_documents:
+            html = self.view_model.cached_preview_html(article_id)
+            if html is not None:
+                self._preview_document(article_id, html)
+        if self._pending_preview_ids:
+            QTimer.singleShot(0, self._build_next_preview_document)
@@ -22,6 +22,7 @@ from src.models import NewsArticle
 from src.llm.llm_service import LLMService
 from src.storage.news_storage import NewsStorage
 from src.core.app_service import AppService
+from src.core.title_lsh import TitleLSHIndex
 
 
 class NewsSimilarityPanel(QDialog):
@@ -358,6 +359,10 @@ class NewsSimilarityPanel(QDialog):
             
             # 这里使用简单的标题关键词匹配作为示例
             # 实际应用中应该使用LLM或其他算法进行更准确的分组
+            # 标题只分词一次；用 MinHash/LSH 索引找出候选新闻，只在候选中比较共同关键词
+            titles = [news.get('title', '').lower() for news in self.all_news_items]
+            title_words = [set(title.split()) for title in titles]
+            index = TitleLSHIndex(titles)
             groups = []
             processed = set()
             
@@ -365,31 +370,25 @@ class NewsSimilarityPanel(QDialog):
                 if i in processed:
                     continue
                 
-                title_i = news.get('title', '').lower()
-                if not title_i:
+                if not titles[i]:
                     continue
                 
                 # 创建新组
                 group = [news]
                 processed.add(i)
+                words_i = title_words[i]
                 
                 # 查找相似新闻
-                for j, other_news in enumerate(self.all_news_items):
-                    if j in processed or i == j:
-                        continue
-                    
-                    title_j = other_news.get('title', '').lower()
-                    if not title_j:
+                for j in index.candidates(i).tolist():
+                    if j in processed or not titles[j]:
                         continue
                     
                     # 简单相似度：共同关键词数量
-                    words_i = set(title_i.split())
-                    words_j = set(title_j.split())
-                    common_words = words_i.intersection(words_j)
+                    common_words = words_i.intersection(title_words[j])
                     
                     # 如果共同关键词超过阈值，认为是相似新闻
                     if len(common_words) >= 2 and len(common_words) / len(words_i) > 0.3:
-                        group.append(other_news)
+                        group.append(self.all_news_items[j])
                         processed.add(j)
                 
                 if len(group) > 1:  # 只保留有多条新闻的组
@@ -1,7 +1,7 @@
 """
 UI 工具函数和辅助类
 """
-from PySide6.QtWidgets import QPushButton, QSizePolicy, QFrame, QComboBox, QListWidget, QTextBrowser, QLabel, QFormLayout, QWidget, QAbstractItemView # Use PySide6
+from PySide6.QtWidgets import QPushButton, QSizePolicy, QFrame, QComboBox, QListWidget, QListView, QTextBrowser, QLabel, QFormLayout, QWidget, QAbstractItemView # Use PySide6
 from PySide6.QtGui import QIcon, QPalette, QColor # Use PySide6
 from PySide6.QtCore import Qt, QSize # Use PySide6
 
@@ -146,12 +146,12 @@ def setup_list_widget(list_widget: QListWidget, object_name: str = None, selecti
     # list_widget.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
 
 
-def setup_news_list_widget(list_widget: QListWidget):
+def setup_news_list_widget(list_widget: QListView):
     """
-    配置新闻列表 QListWidget 的特定样式和行为。
+    配置新闻列表视图的特定样式和行为。
 
     Args:
-        list_widget: 要配置的 QListWidget 实例。
+        list_widget: 要配置的 QListView (或 QListWidget) 实例。
     """
     list_widget.setObjectName("newsListWidget")
     list_widget.setAlternatingRowColors(False)
@@ -1,13 +1,166 @@
+import html
 import logging
-from typing import List, Optional, Dict, Any # 确保导入 List, Optional
-from PySide6.QtCore import QObject, Signal as pyqtSignal, Slot as pyqtSlot, Qt, QTimer # Use PySide6, alias Signal/Slot
+import re
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Dict, Any, Tuple # 确保导入 List, Optional
+from PySide6.QtCore import QObject, Signal as pyqtSignal, Slot as pyqtSlot, Qt, QTimer, QAbstractListModel, QModelIndex # Use PySide6, alias Signal/Slot
 from datetime import datetime, timedelta, date, timezone # 导入 datetime, timedelta, date, timezone
 from PySide6.QtGui import QColor # For example color usage if needed
 
 # 导入模型和核心服务
-from src.models import NewsArticle
+from src.models import NewsArticle, NewsListRow
 from src.core.app_service import AppService # 确保 AppService 被导入
 from src.core.history_service import HistoryService # Import HistoryService
+from src.core.news_query_index import NewsQueryIndex, MIN_EPOCH_US, publish_time_epoch_us, take
+from src.ui.viewmodels.news_search_executor import NewsSearchExecutor
+
+class _Descending:
+    """排序键包装：反转比较方向，使降序视图也能用 bisect (要求升序) 定位。"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+
+def render_news_item_html(article: NewsArticle, title: Optional[str] = None) -> str:
+    """
+    生成新闻列表项的两行富文本：标题 (新且未读时带 "* " 前缀) + [来源] 日期。
+
+    Args:
+        article: 要显示的新闻。
+        title: 替代显示的标题 (例如已按宽度省略的标题)，None 表示使用原标题。
+    """
+    if title is None:
+        title = article.title or '无标题'
+    source = article.source_name or '未知来源'
+    publish_time = article.publish_time
+    display_date = publish_time.strftime('%Y-%m-%d %H:%M') if publish_time else "未知日期"
+    star_prefix = "* " if getattr(article, 'is_new', False) and not getattr(article, 'is_read', False) else ""
+    return (f'<p style="margin:0; padding:0;">{html.escape(star_prefix)}{html.escape(title)}</p>'
+            f'<p style="margin:0; padding:0; font-size:9pt;">{html.escape(f"[{source}] {display_date}")}</p>')
+
+
+# 预览中不需要、且会拖慢 QTextBrowser 排版或带来安全隐患的内容
+_UNSAFE_BLOCKS = re.compile(r'<(script|style|iframe|object|embed|noscript|form)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_UNSAFE_TAGS = re.compile(r'</?(script|style|iframe|object|embed|noscript|form|link|meta|input|button)\b[^>]*>', re.IGNORECASE)
+_HTML_COMMENTS = re.compile(r'<!--.*?-->', re.DOTALL)
+_EVENT_ATTRIBUTES = re.compile(r'\s+on[a-z]+\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE)
+PREVIEW_HTML = 'preview' # ArticleDetailCache 中预览 HTML 的类型名
+
+
+def sanitize_article_html(text: str) -> str:
+    """去掉正文 HTML 中的脚本、样式、内嵌框架、注释和事件属性 (只保留用于显示的标记)。"""
+    if not text or '<' not in text:
+        return text
+    text = _HTML_COMMENTS.sub('', text)
+    text = _UNSAFE_BLOCKS.sub('', text)
+    text = _UNSAFE_TAGS.sub('', text)
+    return _EVENT_ATTRIBUTES.sub('', text)
+
+
+def render_news_preview_html(article: NewsArticle) -> str:
+    """
+    生成新闻列表下方预览区的 HTML (标题、来源与日期、正文或摘要、原文链接)。
+
+    只依赖文章本身，可以在后台线程中预先生成 (见 AppService.prefetch_article_details)。
+    """
+    title = html.escape(article.title or '无标题')
+    source = html.escape(article.source_name or '未知来源')
+    date = article.publish_time.strftime('%Y-%m-%d %H:%M:%S') if article.publish_time else "未知日期"
+    content_display = article.content
+    summary_display = article.summary
+    if not content_display and summary_display:
+        description = f"<p><i>(仅摘要)</i></p>{sanitize_article_html(summary_display)}"
+    elif content_display:
+        description = sanitize_article_html(content_display)
+    else:
+        description = '无内容'
+    link = article.link or ''
+    preview_html = f"""
+        <h2>{title}</h2>
+        <p><strong>来源:</strong> {source} | <strong>日期:</strong> {date}</p>
+        <hr>
+        <p>{description}</p>
+        """
+    if link:
+        preview_html += f'<p><a href="{html.escape(link, quote=True)}" target="_blank">阅读原文</a></p>'
+    return preview_html
+
+
+class NewsListModel(QAbstractListModel):
+    """
+    新闻列表的 Qt 模型，直接以 NewsListViewModel 的过滤视图 (_filtered_news) 为数据源。
+
+    模型本身不复制数据，也不预先生成任何显示内容：富文本只在视图请求
+    (即该行可见并被绘制) 时才生成。ViewModel 在修改过滤视图时通过
+    insert_row / remove_row / refresh_row / reset_rows 通知视图做增量更新。
+    """
+    RichTextRole = Qt.UserRole + 1 # 两行富文本 (见 render_news_item_html)
+
+    def __init__(self, rows: Optional[List[NewsArticle]] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[NewsArticle] = rows if rows is not None else []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+
+        article = self._rows[index.row()]
+        if role == Qt.UserRole:
+            return article
+        elif role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return article.title or '无标题'
+        elif role == self.RichTextRole:
+            return render_news_item_html(article)
+        return None
+
+    def article_at(self, row: int) -> Optional[NewsArticle]:
+        """返回指定行的新闻，越界时返回 None。"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def reset_rows(self, rows: List[NewsArticle]):
+        """整体替换数据源 (全量重建视图后调用)。"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def insert_row(self, row: int, article: NewsArticle):
+        """在数据源 (与 ViewModel 共享的列表) 的 row 处插入一篇新闻，并通知视图。"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, article)
+        self.endInsertRows()
+
+    def append_rows(self, articles: List[NewsArticle]):
+        """在数据源末尾追加一批新闻 (一次插入通知)。"""
+        if not articles:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(articles) - 1)
+        self._rows.extend(articles)
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        """从数据源中移除 row 处的新闻，并通知视图。"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def refresh_row(self, row: int):
+        """某行新闻的显示状态 (例如已读) 发生变化，请求视图重绘该行。"""
+        if 0 <= row < len(self._rows):
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, self.RichTextRole])
+
 
 class NewsListViewModel(QObject):
     """
@@ -16,13 +169,22 @@ class NewsListViewModel(QObject):
     管理新闻数据的获取、过滤和状态，并通知视图更新。
     """
 
+    # 文章总数达到该值时，搜索改为防抖 + 后台执行；更小的缓存直接同步过滤
+    ASYNC_SEARCH_THRESHOLD = 20000
+
     # --- 信号 ---
-    # 当需要显示的新闻列表更新时发射
+    # 当需要显示的新闻列表更新时发射 (后台搜索时可能先为前 N 条结果发射一次，再为完整结果发射一次)
     news_list_changed = pyqtSignal()
     # 当选中的新闻项发生变化时发射
     selected_news_changed = pyqtSignal()
     # 当已读状态需要更新时发射 (可以传递 link 或整个 article)
     read_status_changed = pyqtSignal(str, bool) # 发射新闻链接和状态
+    # 后台预取完成：这些文章的正文和预览 HTML 已在缓存中 (视图可以趁空闲预先排版)
+    details_prefetched = pyqtSignal(list)
+
+    PREFETCH_NEIGHBOURS = 3 # 选中项前后各预取几篇
+    PREFETCH_TOP = 10 # 列表变化 (刷新、切换过滤条件) 后预取列表顶部几篇
+    PREFETCH_TOP_DELAY_MS = 300 # 刷新期间列表频繁变化，停顿这么久之后才预取顶部
 
     def __init__(self, app_service: AppService, parent: Optional[QObject] = None):
         """
@@ -32,12 +194,8 @@ class NewsListViewModel(QObject):
             app_service (AppService): 应用程序核心服务实例。
             parent (Optional[QObject]): 父对象，用于 Qt 对象树管理。
         """
-        print("DEBUG_PRINT: NewsListViewModel.__init__ entered", flush=True) # ADDED DEBUG PRINT
         super().__init__(parent)
-        # --- Use root logger directly ---
-        self.logger = logging.getLogger() # Get root logger
-        self.logger.info(f"NewsListViewModel now using root logger. Effective level: {logging.getLevelName(self.logger.getEffectiveLevel())}")
-        # --- End use root logger ---
+        self.logger = logging.getLogger('news_analyzer.ui.viewmodels.news_list_viewmodel')
         self._app_service = app_service
         self._history_service = self._app_service.history_service # Get HistoryService from AppService
         if not self._history_service:
@@ -47,6 +205,17 @@ class NewsListViewModel(QObject):
 
         self._all_news: List[NewsArticle] = [] # Store all loaded articles
         self._filtered_news: List[NewsArticle] = [] # Store currently filtered/sorted articles
+        self._model = NewsListModel(self._filtered_news, parent=self) # 供 QListView 使用，与 _filtered_news 共享同一个列表
+        # 增量合并所需的索引: _filtered_keys 与 _filtered_news 一一对应，按视图顺序单调递增 (供 bisect)
+        self._filtered_keys: List[Any] = []
+        self._news_by_id: Dict[Any, NewsArticle] = {} # 文章 ID -> _all_news 中的文章
+        self._all_positions: Dict[Any, int] = {} # 文章 ID -> 在 _all_news 中的下标
+        self._keys_sortable = True # 最近一次全量排序是否成功；失败时增量更新退化为全量重建
+        # 分类/时间/搜索索引，_all_news 变化后标记为脏并按需重建；列表行不含正文，正文搜索交给数据库
+        self._query_index = NewsQueryIndex(stored_search=self._app_service.search_stored_articles)
+        self._search_executor = NewsSearchExecutor(lambda: self._query_index.ensure_built(self._all_news), parent=self)
+        self._search_executor.partial_ready.connect(self._on_search_results)
+        self._search_executor.results_ready.connect(self._on_search_results)
         self._current_category: str = "所有"
         self._current_search_term: str = ""
         self._current_search_fields: List[str] = ["title", "content"]
@@ -56,14 +225,21 @@ class NewsListViewModel(QObject):
         self._current_days_filter: Optional[int] = None # 默认不过滤天数
         self._start_date_filter: Optional[datetime] = None # 新增：开始日期过滤器
         self._end_date_filter: Optional[datetime] = None   # 新增：结束日期过滤器
+        self._top_prefetch_timer = QTimer(self)
+        self._top_prefetch_timer.setSingleShot(True)
+        self._top_prefetch_timer.setInterval(self.PREFETCH_TOP_DELAY_MS)
+        self._top_prefetch_timer.timeout.connect(self._prefetch_top)
         self._connect_signals()
         self.logger.info("NewsListViewModel initialized.")
 
     def _connect_signals(self):
         """连接必要的信号"""
-        print("DEBUG_PRINT: NewsListViewModel._connect_signals entered", flush=True) # ADDED DEBUG PRINT
         # 连接 AppService 的 news_cache_updated 信号 (更新后的缓存)
         self._app_service.news_cache_updated.connect(self._handle_app_news_refreshed)
+        # 刷新期间的增量更新 (新增/更新/移除的文章 ID)
+        self._app_service.news_cache_delta.connect(self._handle_news_cache_delta)
+        self._app_service.details_prefetched.connect(self.details_prefetched)
+        self.news_list_changed.connect(self._top_prefetch_timer.start)
         # 移除 AppService.read_status_changed 连接
         # self._app_service.read_status_changed.connect(self._handle_read_status_changed)
         self.logger.debug("ViewModel signals connected to AppService.")
@@ -74,6 +250,10 @@ class NewsListViewModel(QObject):
         """获取当前过滤和排序后的新闻列表"""
         return self._filtered_news
 
+    def get_model(self) -> NewsListModel:
+        """返回绑定到当前过滤视图的列表模型"""
+        return self._model
+
     # --- 公共方法/槽 ---
     @pyqtSlot(str)
     def filter_by_category(self, category: str):
@@ -112,9 +292,18 @@ class NewsListViewModel(QObject):
             self._current_search_fields = ["title", "content"] # 默认或错误处理
 
         self.logger.debug(f"Searching news with term '{self._current_search_term}' in mapped fields {self._current_search_fields}") # 修正缩进
+        if self._current_search_term and len(self._all_news) >= self.ASYNC_SEARCH_THRESHOLD:
+            # 大缓存: 防抖后在后台查询，结果通过 _on_search_results 分批写回
+            self._search_executor.submit(self._query_criteria())
+            return
         self._apply_filters_and_sort()
         self.news_list_changed.emit()
 
+    @property
+    def isSearchPending(self) -> bool:
+        """是否有尚未完成的后台搜索 (此时 newsList 可能只是部分结果或旧结果)"""
+        return self._search_executor.is_pending
+
     @pyqtSlot()
     def clear_search(self):
         """清除搜索条件并更新列表"""
@@ -159,6 +348,41 @@ class NewsListViewModel(QObject):
         self._apply_filters_and_sort()
         self.news_list_changed.emit()
 
+    def get_full_article(self, article: Optional[Any]) -> Optional[NewsArticle]:
+        """列表中的文章 (可能是不含正文的 NewsListRow) -> 完整的 NewsArticle，用于预览和详情。"""
+        return self._app_service.get_full_article(article)
+
+    def get_preview_html(self, article: NewsArticle) -> str:
+        """预览区的 HTML：优先使用后台预先生成的版本，否则现在生成并缓存。"""
+        detail_cache = self._app_service.detail_cache
+        preview_html = detail_cache.get_html(article.id, PREVIEW_HTML) if article.id is not None else None
+        if preview_html is None:
+            preview_html = render_news_preview_html(article)
+            if article.id is not None:
+                detail_cache.put_html(article.id, PREVIEW_HTML, preview_html)
+        return preview_html
+
+    def cached_preview_html(self, article_id: Any) -> Optional[str]:
+        """已生成的预览 HTML，没有时返回 None (不会生成)。"""
+        return self._app_service.detail_cache.get_html(article_id, PREVIEW_HTML)
+
+    def prefetch_around(self, row: int):
+        """在后台预取过滤视图中第 row 行前后各 PREFETCH_NEIGHBOURS 篇文章的正文和预览 HTML (近的优先)。"""
+        count = len(self._filtered_news)
+        if not 0 <= row < count:
+            return
+        rows = [row]
+        for distance in range(1, self.PREFETCH_NEIGHBOURS + 1):
+            rows.extend(r for r in (row + distance, row - distance) if 0 <= r < count)
+        self._prefetch([self._filtered_news[r].id for r in rows], replace=True)
+
+    def _prefetch_top(self):
+        self._prefetch([news.id for news in self._filtered_news[:self.PREFETCH_TOP]], replace=False)
+
+    def _prefetch(self, article_ids: List[Any], replace: bool):
+        self._app_service.prefetch_article_details(article_ids, {PREVIEW_HTML: render_news_preview_html},
+                                                   replace=replace)
+
     @pyqtSlot(NewsArticle)
     def select_news(self, article: Optional[NewsArticle]):
         """处理新闻项的选择"""
@@ -194,10 +418,11 @@ class NewsListViewModel(QObject):
                 break # 假设 link 是唯一的
 
         item_found_in_filtered = False
-        for item in self._filtered_news:
+        for row, item in enumerate(self._filtered_news):
             if item.link == link:
                 item.is_read = True
                 item_found_in_filtered = True
+                self._model.refresh_row(row)
                 self.logger.debug(f"Updated is_read=True for item in _filtered_news: {link}")
                 break # 假设 link 是唯一的
 
@@ -216,168 +441,199 @@ class NewsListViewModel(QObject):
         return self._history_service.is_read(link)
 
     # --- 私有方法 ---
-    def _apply_filters_and_sort(self):
-        """应用当前的过滤器和排序规则"""
-        self.logger.info(f"_apply_filters_and_sort: Starting. Current category: '{self._current_category}', Search: '{self._current_search_term}', Days: {self._current_days_filter}, Start: {self._start_date_filter}, End: {self._end_date_filter}") # MODIFIED for more info
-        self.logger.info(f"_apply_filters_and_sort: Initial self._all_news count: {len(self._all_news)}.") # ADDED
-        
-        # 从 self._all_news 的副本开始过滤，而不是从 AppService 获取或依赖参数
-        self.logger.debug(f"  Total articles for filtering (from self._all_news): {len(self._all_news)}")
-        if not self._all_news: # 如果 _all_news 本身是空的，则直接设置空结果并返回
-            self.logger.info("_all_news is empty, no filtering to apply.")
-            self._filtered_news = []
-            return
-
-        filtered = list(self._all_news) # 使用 list(self._all_news) 创建副本
+    def _date_bounds(self) -> Optional[Tuple[datetime, datetime]]:
+        """当前日期过滤条件对应的 UTC 时间区间 (含两端)；没有日期过滤时返回 None。"""
+        if self._current_days_filter is not None:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=self._current_days_filter)
+            return cutoff_date, datetime.max.replace(tzinfo=timezone.utc)
+        if self._start_date_filter and self._end_date_filter:
+            # Start of the start day / end of the end day in UTC
+            start_dt_aware = datetime.combine(self._start_date_filter, datetime.min.time()).replace(tzinfo=timezone.utc)
+            end_dt_aware = datetime.combine(self._end_date_filter, datetime.max.time()).replace(tzinfo=timezone.utc)
+            return start_dt_aware, end_dt_aware
+        return None
 
+    def _matches_filters(self, news: NewsArticle, date_bounds: Optional[Tuple[datetime, datetime]]) -> bool:
+        """判断单条新闻是否满足当前的分类、搜索和日期过滤条件 (搜索只检查文章对象携带的字段，见 _needs_stored_search)"""
         # 1. 按分类过滤
-        if self._current_category != "所有":
-            self.logger.debug(f"Filtering by category '{self._current_category}'. News count before: {len(filtered)}")
-            filtered = [news for news in filtered if news.category == self._current_category]
-            self.logger.debug(f"News count after category filtering: {len(filtered)}")
-            if not filtered:
-                self.logger.warning(f"Category filter '{self._current_category}' resulted in an empty list.")
-
-        # 2. 按搜索词过滤
+        if self._current_category != "所有" and news.category != self._current_category:
+            return False
+
+        # 2. 按搜索词过滤 (任一字段包含即可)
         if self._current_search_term:
             term = self._current_search_term
-            fields = self._current_search_fields
-            self.logger.debug(f"Applying search filter: term='{term}', fields={fields}. News count before: {len(filtered)}")
-            original_count_search = len(filtered)
-            new_filtered_search = []
-            for news in filtered: # 修正 for 循环语法
-                found = False
-                for field in fields:
-                    if hasattr(news, field):
-                        value = getattr(news, field)
-                        if value is not None:
-                            try:
-                                value_lower = str(value).lower() # 确保字符串转换和转小写
-                                self.logger.debug(f"  Checking article '{news.link[:30]}...' field '{field}': term='{term}' in value='{value_lower[:100]}...'?") # 记录比较细节
-                                if term in value_lower:
-                                    self.logger.debug(f"    Found term '{term}' in field '{field}' for article '{news.link[:30]}...'")
-                                    found = True
-                                    break # 在一个字段找到即可
-                            except Exception as e:
-                                self.logger.warning(f"  Error processing field '{field}' for article '{news.link[:30]}...': {e}")
-                if found:
-                    new_filtered_search.append(news)
-            filtered = new_filtered_search
-            self.logger.debug(f"News count after search filtering: {len(filtered)} (was {original_count_search})")
-
-        # 3. 按日期范围过滤 (新增)
-        if self._current_days_filter is not None:
-            self.logger.debug(f"Applying days filter: last {self._current_days_filter} days.")
-            # Use timezone-aware UTC time for comparison
-            now_utc = datetime.now(timezone.utc) # Use imported timezone class
-            cutoff_date = now_utc - timedelta(days=self._current_days_filter)
-            original_count = len(filtered)
-            # Refactor list comprehension to a standard loop for clarity and correct filtering
-            temp_filtered_days = []
-            for news_item in filtered: # Use a different loop variable name
-                if news_item.publish_time is not None and isinstance(news_item.publish_time, datetime):
-                    # Make publish_time timezone-aware (assume UTC if naive, convert otherwise)
-                    if news_item.publish_time.tzinfo is None:
-                        publish_time_aware = news_item.publish_time.replace(tzinfo=timezone.utc) # Use imported timezone
-                        # self.logger.warning(f"Naive datetime encountered for {news_item.link}. Assuming UTC.") # Optional: Log assumption
-                    else:
-                        publish_time_aware = news_item.publish_time.astimezone(timezone.utc) # Use imported timezone
-
-                    if publish_time_aware >= cutoff_date:
-                        temp_filtered_days.append(news_item) # Keep the item if date is within range
-                # else: Skip items without valid datetime
-            filtered = temp_filtered_days # Assign the newly filtered list back
-# Removed incorrect/redundant code block from previous diff attempts
-            # Removed stray closing bracket from previous list comprehension attempt
-            self.logger.debug(f"Filtered by date: {original_count} -> {len(filtered)}")
-
-
-        # 3b. 按指定日期范围过滤 (如果设置了)
-        elif self._start_date_filter and self._end_date_filter:
-            self.logger.debug(f"Applying date range filter: {self._start_date_filter.strftime('%Y-%m-%d')} to {self._end_date_filter.strftime('%Y-%m-%d')}")
-
-            # Convert start/end date (which are date objects) to UTC-aware datetime objects
-            # Start of the start day in UTC
-            start_dt_aware = datetime.combine(self._start_date_filter, datetime.min.time()).replace(tzinfo=timezone.utc)
-            # End of the end day in UTC
-            end_dt_aware = datetime.combine(self._end_date_filter, datetime.max.time()).replace(tzinfo=timezone.utc)
+            found = False
+            for field in self._current_search_fields:
+                value = getattr(news, field, None)
+                if value is None:
+                    continue
+                try:
+                    if term in str(value).lower():
+                        found = True
+                        break
+                except Exception as e:
+                    self.logger.warning(f"  Error processing field '{field}' for article '{news.link[:30]}...': {e}")
+            if not found:
+                return False
+
+        # 3. 按日期过滤 (最近 N 天或指定日期范围)；没有有效发布时间的新闻被排除
+        if date_bounds is not None:
+            if not isinstance(news.publish_time, datetime):
+                return False
+            # Assume naive datetimes are UTC, convert aware ones to UTC
+            if news.publish_time.tzinfo is None:
+                publish_time_aware = news.publish_time.replace(tzinfo=timezone.utc)
+            else:
+                publish_time_aware = news.publish_time.astimezone(timezone.utc)
+            if not date_bounds[0] <= publish_time_aware <= date_bounds[1]:
+                return False
+        return True
+
+    def _needs_stored_search(self, articles: List[NewsArticle]) -> bool:
+        """当前搜索是否涉及这些文章对象不携带的字段 (_matches_filters 无法判断，需由 NewsQueryIndex 交给数据库)"""
+        if not self._current_search_term:
+            return False
+        return any(not hasattr(article, field) for field in self._current_search_fields for article in articles)
+
+    def _sort_key(self, article: NewsArticle):
+        """当前排序列的排序键 (发布时间统一为 UTC 微秒时间戳，None 排在最早)"""
+        value = getattr(article, self._sort_column, None)
+
+        if self._sort_column == 'publish_time':
+            epoch = publish_time_epoch_us(value)
+            if epoch is None:
+                self.logger.warning(f"Could not parse date string '{value}' for sorting, using min date.")
+                return MIN_EPOCH_US
+            return epoch
+
+        # Provide a default sort value for None in other columns (e.g., empty string)
+        return "" if value is None else value
+
+    def _view_key(self, article: NewsArticle):
+        """_filtered_keys 中使用的键：降序时包装为 _Descending，使键序列始终升序"""
+        key = self._sort_key(article)
+        if self._sort_order != Qt.DescendingOrder:
+            return key
+        # 时间戳是整数，取负即可反转顺序，无需包装对象
+        return -key if self._sort_column == 'publish_time' else _Descending(key)
 
-            self.logger.debug(f"Aware date range: {start_dt_aware} to {end_dt_aware}") # Log aware range
-
-            original_count = len(filtered)
-            new_filtered = []
-            for news in filtered:
-                # self.logger.debug(f"Filtering news item: Link={news.link}, Publish Time={news.publish_time} (Type: {type(news.publish_time)}), Start Date={start_dt} (Type: {type(start_dt)}), End Date={end_dt} (Type: {type(end_dt)})")
-                if news.publish_time is not None and isinstance(news.publish_time, datetime):
-                    # Ensure news.publish_time is UTC-aware for comparison
-                    publish_time_aware = news.publish_time
-                    if publish_time_aware.tzinfo is None:
-                        # Assume naive times are UTC (or log a warning)
-                        publish_time_aware = publish_time_aware.replace(tzinfo=timezone.utc)
-                        # self.logger.warning(f"Naive datetime encountered for {news.link}. Assuming UTC for date range filter.")
-                    else:
-                        # Convert to UTC if it's aware but not UTC
-                        publish_time_aware = publish_time_aware.astimezone(timezone.utc)
-
-                    # Compare aware datetimes
-                    if start_dt_aware <= publish_time_aware <= end_dt_aware:
-                        new_filtered.append(news)
-                # else: Log skipped item?
-                #     self.logger.debug(f"Skipping item {news.link} due to invalid publish_time for date range filter.")
-
-            filtered = new_filtered
-            self.logger.debug(f"Filtered by specific date range: {original_count} -> {len(filtered)}")
+    def _apply_filters_and_sort(self):
+        """应用当前的过滤器和排序规则 (全量重建过滤后的视图)"""
+        # 每次输入/切换过滤条件都会调用，只在 DEBUG 级别记录
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"_apply_filters_and_sort: Starting. Current category: '{self._current_category}', Search: '{self._current_search_term}', Days: {self._current_days_filter}, Start: {self._start_date_filter}, End: {self._end_date_filter}, all_news: {len(self._all_news)}")
+        self._search_executor.cancel() # 同步结果取代任何未完成的后台搜索
 
-        self.logger.debug(f"Filters applied. Filtered news count: {len(filtered)}")
+        if not self._all_news: # 如果 _all_news 本身是空的，则直接设置空结果并返回
+            self.logger.debug("_all_news is empty, no filtering to apply.")
+            self._filtered_news = []
+            self._filtered_keys = []
+            self._keys_sortable = True
+            self._model.reset_rows(self._filtered_news)
+            return
+
+        # 1-3. 分类、搜索、日期过滤通过索引完成；按发布时间排序时索引直接给出有序结果
+        snapshot = self._query_index.ensure_built(self._all_news)
+        self._install_positions(snapshot.query(**self._query_criteria()))
+        self.logger.debug(f"_apply_filters_and_sort: Finished. Final self._filtered_news count: {len(self._filtered_news)}.")
 
-        # 4. 排序
+    def _query_criteria(self) -> Dict[str, Any]:
+        """当前过滤与排序条件，对应 NewsQueryIndex.query 的参数"""
         reverse_order = (self._sort_order == Qt.DescendingOrder)
-        try:
-            def sort_key(article: NewsArticle):
-                value = getattr(article, self._sort_column, None)
-
-                if self._sort_column == 'publish_time':
-                    dt_value = None
-                    if value is None:
-                        # Use timezone-aware min datetime for consistent comparison
-                        return datetime.min.replace(tzinfo=timezone.utc)
-
-                    if isinstance(value, datetime):
-                        dt_value = value
-                    else: # Attempt to parse if not datetime
-                        try:
-                            # Try parsing ISO format first
-                            dt_value = datetime.fromisoformat(str(value))
-                        except (ValueError, TypeError):
-                            # Add fallback parsing if needed, or log warning
-                            self.logger.warning(f"Could not parse date string '{value}' for sorting, using min date.")
-                            # Use timezone-aware min datetime
-                            return datetime.min.replace(tzinfo=timezone.utc)
-
-                    # Ensure the datetime is timezone-aware (UTC)
-                    if dt_value.tzinfo is None:
-                        # Assume naive datetimes are UTC
-                        return dt_value.replace(tzinfo=timezone.utc)
-                    else:
-                        # Convert aware datetimes to UTC
-                        return dt_value.astimezone(timezone.utc)
-
-                # Handle non-datetime columns
-                elif value is None:
-                    # Provide a default sort value for None in other columns (e.g., empty string)
-                    return ""
-                else:
-                    # Return original value for other types
-                    return value
-            filtered.sort(key=sort_key, reverse=reverse_order)
-            self.logger.debug(f"Sorted news by '{self._sort_column}' {'descending' if reverse_order else 'ascending'}.")
-        except TypeError as e:
-            self.logger.error(f"Sorting failed for column '{self._sort_column}'. Inconsistent data types might exist. Error: {e}", exc_info=True)
-        except Exception as e:
-            self.logger.error(f"Unexpected error during sorting: {e}", exc_info=True)
+        return {
+            'category': None if self._current_category == "所有" else self._current_category,
+            'term': self._current_search_term,
+            'fields': tuple(self._current_search_fields),
+            'date_bounds': self._date_bounds(),
+            'time_order': ('desc' if reverse_order else 'asc') if self._sort_column == 'publish_time' else None,
+        }
+
+    def _install_positions(self, positions: List[int]):
+        """把索引 (当前快照) 的查询结果写入过滤视图，必要时排序，并重置模型"""
+        reverse_order = (self._sort_order == Qt.DescendingOrder)
+        filtered = take(self._all_news, positions)
+        self.logger.debug(f"Filters applied. Filtered news count: {len(filtered)}")
+        if not filtered and self._current_category != "所有":
+            self.logger.warning(f"Category filter '{self._current_category}' resulted in an empty list.")
+
+        # 4. 排序 (按发布时间时已由索引完成)
+        if self._sort_column == 'publish_time':
+            self._keys_sortable = True
+            self._filtered_keys = self._query_index.epochs_for(positions, negate=reverse_order)
+        else:
+            self._keys_sortable = False
+            try:
+                filtered.sort(key=self._sort_key, reverse=reverse_order)
+                self._keys_sortable = True
+                self.logger.debug(f"Sorted news by '{self._sort_column}' {'descending' if reverse_order else 'ascending'}.")
+            except TypeError as e:
+                self.logger.error(f"Sorting failed for column '{self._sort_column}'. Inconsistent data types might exist. Error: {e}", exc_info=True)
+            except Exception as e:
+                self.logger.error(f"Unexpected error during sorting: {e}", exc_info=True)
+            self._filtered_keys = [self._view_key(news) for news in filtered] if self._keys_sortable else []
 
         self._filtered_news = filtered
-        self.logger.info(f"_apply_filters_and_sort: Finished. Final self._filtered_news count: {len(self._filtered_news)}.") # ADDED
+        self._model.reset_rows(self._filtered_news)
+
+    @pyqtSlot(list)
+    def _on_search_results(self, positions: list):
+        """后台搜索的部分或完整结果 (位置相对于当前索引快照)"""
+        self._install_positions(positions)
+        self.news_list_changed.emit()
+
+    def _reindex_all_news(self):
+        """重建 _all_news 的 ID 索引 (整体替换或移除文章后调用)"""
+        self._query_index.mark_dirty()
+        self._news_by_id = {}
+        self._all_positions = {}
+        for position, news in enumerate(self._all_news):
+            if news.id is not None:
+                self._news_by_id[news.id] = news
+                self._all_positions[news.id] = position
+
+    def _remove_from_view(self, article: NewsArticle) -> bool:
+        """从过滤后的视图中移除该文章对象 (按身份匹配)，返回是否确实移除"""
+        key = self._view_key(article)
+        index = bisect_left(self._filtered_keys, key)
+        # 键相同的文章可能有多个，在相等区间内按身份查找
+        while index < len(self._filtered_news) and not key < self._filtered_keys[index]:
+            if self._filtered_news[index] is article:
+                break
+            index += 1
+        else:
+            # 键可能在插入后发生过变化 (例如按已读状态排序时被标记已读)，退化为线性查找
+            index = next((i for i, news in enumerate(self._filtered_news) if news is article), None)
+            if index is None:
+                return False
+        del self._filtered_keys[index]
+        self._model.remove_row(index) # 同时从共享的 _filtered_news 中删除
+        return True
+
+    def _insert_into_view(self, article: NewsArticle):
+        """按当前排序把文章插入过滤后的视图 (相同键排在已有文章之后，与稳定排序一致)"""
+        key = self._view_key(article)
+        index = bisect_right(self._filtered_keys, key)
+        self._filtered_keys.insert(index, key)
+        self._model.insert_row(index, article) # 同时插入共享的 _filtered_news
+
+    def _try_append_tail(self, inserted: List[NewsArticle]) -> Optional[bool]:
+        """
+        若满足过滤条件的新文章按当前排序全部排在视图末尾，则一次性追加。
+
+        Returns:
+            None 表示不能整体追加 (调用方改用逐条插入或全量重建)；否则返回视图是否变化。
+        """
+        date_bounds = self._date_bounds()
+        matching = [article for article in inserted if self._matches_filters(article, date_bounds)]
+        if not matching:
+            return False
+        keys = [self._view_key(article) for article in matching]
+        order = sorted(range(len(matching)), key=keys.__getitem__) # 稳定排序，与全量排序结果一致
+        if self._filtered_keys and keys[order[0]] < self._filtered_keys[-1]:
+            return None
+        self._filtered_keys.extend(take(keys, order))
+        self._model.append_rows(take(matching, order)) # 同时追加到共享的 _filtered_news
+        return True
 
     # --- 信号处理槽 ---
     @pyqtSlot(str, bool)
@@ -389,13 +645,89 @@ class NewsListViewModel(QObject):
     @pyqtSlot(list) # 添加槽装饰器
     def _handle_app_news_refreshed(self, news_articles_data: list): # 重命名参数以示清晰
         """当AppService的缓存更新时调用，用新的完整列表更新ViewModel。"""
-        print("DEBUG_PRINT: NewsListViewModel._handle_app_news_refreshed entered", flush=True) # ADDED DEBUG PRINT
-        self.logger.info(f"NewsListViewModel._handle_app_news_refreshed: Received {len(news_articles_data)} articles from AppService.") # MODIFIED log
         # 假设 news_articles_data 已经是 NewsArticle 对象列表
         self._all_news = news_articles_data # 直接用 AppService 的完整缓存替换
-        self.logger.info(f"NewsListViewModel._handle_app_news_refreshed: self._all_news updated, count: {len(self._all_news)}.") # MODIFIED: Added log
+        self._reindex_all_news()
 
         self._apply_filters_and_sort() # 应用当前过滤器和排序
-        self.logger.info(f"NewsListViewModel._handle_app_news_refreshed: After _apply_filters_and_sort, self._filtered_news count: {len(self._filtered_news)}.") # MODIFIED: Added log
         self.news_list_changed.emit() # 通知视图更新
-        self.logger.info(f"NewsListViewModel._handle_app_news_refreshed: news_list_changed signal emitted.") # MODIFIED: Added log after emit
\ No newline at end of file
+        self.logger.info(f"NewsListViewModel: 已用 {len(self._all_news)} 条新闻重建列表，过滤后 {len(self._filtered_news)} 条。")
+
+    @pyqtSlot(list, list, list)
+    def _handle_news_cache_delta(self, added_ids: list, updated_ids: list, removed_ids: list):
+        """
+        把 AppService 的缓存增量合并进当前视图。
+
+        每篇变化的文章通过二分查找在已排序的过滤视图中定位 (O(k log n))，
+        而不是重新过滤并排序全部新闻；只有视图确实变化时才发射 news_list_changed。
+        """
+        if not (added_ids or updated_ids or removed_ids):
+            return
+
+        incoming = self._app_service.get_cached_articles(list(added_ids) + list(updated_ids))
+        removed_ids = [article_id for article_id in removed_ids if article_id in self._news_by_id]
+        outgoing = [self._news_by_id[article_id] for article_id in removed_ids]
+        inserted = []
+
+        # 1. 更新 _all_news 及其索引
+        if removed_ids:
+            removed_set = set(removed_ids)
+            self._all_news = [news for news in self._all_news if news.id not in removed_set]
+            self._reindex_all_news()
+        for article in incoming:
+            previous = self._news_by_id.get(article.id)
+            if previous is article:
+                continue
+            if previous is not None:
+                self._all_news[self._all_positions[article.id]] = article
+                outgoing.append(previous)
+            else:
+                self._all_positions[article.id] = len(self._all_news)
+                self._all_news.append(article)
+            self._news_by_id[article.id] = article
+            inserted.append(article)
+        if inserted:
+            self._query_index.mark_dirty()
+
+        change_count = len(outgoing) + len(inserted)
+        if not change_count:
+            return
+
+        # 2. 合并进过滤后的视图
+        # 后台分页加载的旧文章通常整体排在当前视图末尾，一次追加即可，不必重建视图 (也不会重置滚动位置和选中项)
+        if not outgoing and self._keys_sortable and not self._current_search_term:
+            try:
+                appended = self._try_append_tail(inserted)
+            except TypeError as e:
+                self.logger.warning(f"Tail append failed for sort column '{self._sort_column}': {e}")
+                appended = None
+            if appended is not None:
+                if appended:
+                    self.news_list_changed.emit()
+                return
+
+        # 变化量较大或键不可比较时全量重建更划算；
+        # 搜索字段不在列表行上 (如正文) 时只有索引能通过 stored_search 判断新文章是否匹配，同样全量重建
+        if not self._keys_sortable or change_count * 16 > len(self._filtered_news) \
+                or self._needs_stored_search(inserted):
+            self._apply_filters_and_sort()
+            self.news_list_changed.emit()
+            return
+
+        view_changed = False
+        try:
+            date_bounds = self._date_bounds()
+            for article in outgoing:
+                view_changed = self._remove_from_view(article) or view_changed
+            for article in inserted:
+                if self._matches_filters(article, date_bounds):
+                    self._insert_into_view(article)
+                    view_changed = True
+        except TypeError as e:
+            self.logger.warning(f"Incremental merge failed for sort column '{self._sort_column}', rebuilding view: {e}")
+            self._apply_filters_and_sort()
+            view_changed = True
+
+        self.logger.debug(f"NewsListViewModel: merged delta +{len(added_ids)} ~{len(updated_ids)} -{len(removed_ids)}, view size {len(self._filtered_news)}.")
+        if view_changed:
+            self.news_list_changed.emit()
@@ -0,0 +1,186 @@
+"""
+新闻列表的后台搜索执行器
+
+搜索框每次输入都会调用 NewsListViewModel.search_news；在大缓存上直接在主线程
+过滤会卡住界面。NewsSearchExecutor 负责:
+
+  - 防抖: 连续输入时只在停顿 debounce_ms 之后才真正开始查询
+  - 取消: 新的查询开始时，取消仍在运行的上一次查询 (工作线程分块检查取消标志)
+  - 流式结果: 先发射排序后前 first_batch 条匹配 (partial_ready)，完整结果随后发射 (results_ready)
+
+查询在 NewsQueryIndex 的某个快照上执行。若查询期间索引被重建 (例如刷新合并了新文章)，
+结果中的位置已失效，执行器会丢弃结果并在新快照上重新查询。
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal as pyqtSignal, Slot as pyqtSlot
+
+from src.core.cancellation_flag import CancellationFlag
+from src.core.news_query_index import IndexSnapshot
+
+
+class SearchRunnable(QRunnable):
+    """在工作线程中对一个索引快照执行一次搜索。"""
+
+    class WorkerSignals(QObject):
+        partial_ready = pyqtSignal(int, object, list)  # generation, snapshot, positions
+        finished = pyqtSignal(int, object, list)       # generation, snapshot, positions
+        failed = pyqtSignal(int, str)
+
+    def __init__(self, generation: int, snapshot: IndexSnapshot, criteria: Dict[str, Any],
+                 cancel_flag: CancellationFlag, first_batch: int, chunk_size: int):
+        super().__init__()
+        self.logger = logging.getLogger('news_analyzer.ui.viewmodels.news_search_executor')
+        self.signals = SearchRunnable.WorkerSignals()
+        self.generation = generation
+        self.snapshot = snapshot
+        self.criteria = criteria
+        self.cancel_flag = cancel_flag
+        self.first_batch = first_batch
+        self.chunk_size = chunk_size
+
+    def run(self):
+        try:
+            criteria = self.criteria
+            positions, _ = self.snapshot.candidates(criteria.get('category'), criteria.get('date_bounds'),
+                                                    criteria.get('time_order'))
+            term = criteria.get('term')
+            if term:
+                positions = self._match_in_chunks(positions, term, criteria.get('fields', ()))
+                if positions is None:
+                    return  # 已取消
+            if self.cancel_flag.is_set():
+                return
+            self.signals.finished.emit(self.generation, self.snapshot, positions)
+        except Exception as e:
+            self.logger.error(f"后台搜索失败: {e}", exc_info=True)
+            self.signals.failed.emit(self.generation, str(e))
+
+    def _match_in_chunks(self, positions: List[int], term: str, fields) -> Optional[List[int]]:
+        """按候选顺序分块匹配，凑够 first_batch 条时先发射一次部分结果；取消时返回 None。"""
+        matches: List[int] = []
+        partial_sent = self.first_batch <= 0
+        for start in range(0, len(positions), self.chunk_size):
+            if self.cancel_flag.is_set():
+                return None
+            matches.extend(self.snapshot.filter_by_term(positions[start:start + self.chunk_size], term, fields))
+            if not partial_sent and len(matches) >= self.first_batch and start + self.chunk_size < len(positions):
+                self.signals.partial_ready.emit(self.generation, self.snapshot, matches[:self.first_batch])
+                partial_sent = True
+        return matches
+
+
+class NewsSearchExecutor(QObject):
+    """
+    防抖 + 可取消的后台搜索。
+
+    Args:
+        prepare: 在主线程调用，确保索引是最新的并返回当前快照
+                 (通常为 lambda: index.ensure_built(all_news))。
+        debounce_ms: 最后一次 submit 之后等待多久才开始查询。
+        first_batch: 部分结果的条数。
+        chunk_size: 工作线程每处理多少候选检查一次取消标志。
+    """
+
+    partial_ready = pyqtSignal(list)   # 排序后的前 N 个位置 (相对 current_snapshot)
+    results_ready = pyqtSignal(list)   # 完整结果的位置
+    search_failed = pyqtSignal(str)
+
+    def __init__(self, prepare: Callable[[], IndexSnapshot], debounce_ms: int = 250,
+                 first_batch: int = 50, chunk_size: int = 8192, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('news_analyzer.ui.viewmodels.news_search_executor')
+        self._prepare = prepare
+        self._first_batch = first_batch
+        self._chunk_size = chunk_size
+        self._criteria: Optional[Dict[str, Any]] = None
+        self._generation = 0
+        self._cancel_flag: Optional[CancellationFlag] = None
+        self._running = False
+        self.current_snapshot: Optional[IndexSnapshot] = None
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._start)
+
+        # 单线程池：被取消的查询很快退出，不会与新查询争抢 CPU
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    @property
+    def is_pending(self) -> bool:
+        """是否有尚未完成 (等待防抖或正在执行) 的查询。"""
+        return self._debounce_timer.isActive() or self._running
+
+    def submit(self, criteria: Dict[str, Any]):
+        """提交新的查询条件 (NewsQueryIndex.query 的参数)，取消之前未完成的查询并重新计时。"""
+        self._cancel_running()
+        self._criteria = dict(criteria)
+        self._debounce_timer.start()
+
+    def cancel(self):
+        """放弃所有未完成的查询 (例如被同步的全量过滤取代时)。"""
+        self._debounce_timer.stop()
+        self._cancel_running()
+        self._criteria = None
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """等待工作线程空闲 (测试和退出时使用)。"""
+        return self._pool.waitForDone(msecs)
+
+    def _cancel_running(self):
+        if self._cancel_flag is not None:
+            self._cancel_flag.set()
+            self._cancel_flag = None
+        self._running = False
+        self._generation += 1  # 之前的结果即使已发出也会被忽略
+
+    @pyqtSlot()
+    def _start(self):
+        if self._criteria is None:
+            return
+        self._cancel_running()
+        snapshot = self._prepare()
+        self._cancel_flag = CancellationFlag()
+        self._running = True
+        runnable = SearchRunnable(self._generation, snapshot, self._criteria, self._cancel_flag,
+                                  self._first_batch, self._chunk_size)
+        runnable.signals.partial_ready.connect(self._on_partial_ready)
+        runnable.signals.finished.connect(self._on_finished)
+        runnable.signals.failed.connect(self._on_failed)
+        self._pool.start(runnable)
+
+    def _is_current(self, generation: int, snapshot: IndexSnapshot) -> bool:
+        if generation != self._generation:
+            return False
+        if snapshot is not self._prepare():
+            # 查询期间索引已重建，位置失效，在新快照上重新查询
+            self.logger.debug("搜索期间索引已更新，重新执行查询。")
+            self._start()
+            return False
+        return True
+
+    @pyqtSlot(int, object, list)
+    def _on_partial_ready(self, generation: int, snapshot: IndexSnapshot, positions: list):
+        if self._is_current(generation, snapshot):
+            self.current_snapshot = snapshot
+            self.partial_ready.emit(positions)
+
+    @pyqtSlot(int, object, list)
+    def _on_finished(self, generation: int, snapshot: IndexSnapshot, positions: list):
+        if self._is_current(generation, snapshot):
+            self._running = False
+            self._cancel_flag = None
+            self._criteria = None
+            self.current_snapshot = snapshot
+            self.results_ready.emit(positions)
+
+    @pyqtSlot(int, str)
+    def _on_failed(self, generation: int, message: str):
+        if generation == self._generation:
+            self._running = False
+            self._cancel_flag = None
+            self.search_failed.emit(message)
@@ -126,7 +126,8 @@ class MainWindow(QMainWindow):
         # --- Trigger initial news load AFTER signals are connected ---
         self.logger.info("Triggering initial news load from AppService...")
         try:
-            self.app_service._load_initial_news() # This triggers ViewModel update and signal
+            # 先显示最新的一页标题，更早的新闻在后台分页加载并逐步合并进列表
+            self.app_service.load_initial_news_progressive() # This triggers ViewModel update and signal
             self.logger.info("Initial news load triggered successfully.")
 
             # --- ADDED: Explicitly trigger UI update via timer AFTER initial load ---
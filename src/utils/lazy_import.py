@@ -0,0 +1,89 @@
+"""
+延迟导入工具
+
+scikit-learn、matplotlib、Selenium 等依赖导入一次要几百毫秒到一秒以上，但只有执行聚类、
+打开分析面板或采集澎湃新闻时才需要。这里的代理对象在首次真正使用时才导入目标模块:
+
+    np = lazy_module('numpy')                                        # 访问属性时导入
+    DBSCAN = lazy_attr('sklearn.cluster', 'DBSCAN')                  # 调用或访问属性时导入
+    if not Panel.available(): ...                                     # 检查可选组件能否导入
+
+模块级类型注解会在定义函数时求值并触发导入，使用代理的模块应当 `from __future__ import annotations`。
+"""
+
+import importlib
+import logging
+from typing import Any
+
+
+class LazyModule:
+    """模块代理：第一次访问属性时 importlib.import_module(name)。"""
+
+    __slots__ = ('_lazy_name', '_lazy_module')
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_lazy_name', name)
+        object.__setattr__(self, '_lazy_module', None)
+
+    def _load(self):
+        module = self._lazy_module
+        if module is None:
+            module = importlib.import_module(self._lazy_name)
+            object.__setattr__(self, '_lazy_module', module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "已导入" if self._lazy_module is not None else "未导入"
+        return f"<LazyModule {self._lazy_name!r} ({state})>"
+
+
+class LazyAttribute:
+    """模块属性 (通常是类或函数) 的代理：调用或访问属性时才导入所在模块。"""
+
+    __slots__ = ('_lazy_module', '_lazy_attr', '_lazy_target')
+
+    def __init__(self, module: str, attr: str):
+        object.__setattr__(self, '_lazy_module', module)
+        object.__setattr__(self, '_lazy_attr', attr)
+        object.__setattr__(self, '_lazy_target', None)
+
+    def resolve(self) -> Any:
+        """导入并返回目标对象；导入失败时抛出 ImportError。"""
+        target = self._lazy_target
+        if target is None:
+            target = getattr(importlib.import_module(self._lazy_module), self._lazy_attr)
+            object.__setattr__(self, '_lazy_target', target)
+        return target
+
+    def available(self) -> bool:
+        """目标能否导入 (失败时记录错误日志并返回 False)。"""
+        try:
+            self.resolve()
+            return True
+        except (ImportError, AttributeError) as e:
+            logging.getLogger('news_analyzer.utils.lazy_import').error(
+                f"导入 {self._lazy_module}.{self._lazy_attr} 失败: {e}")
+            return False
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "已导入" if self._lazy_target is not None else "未导入"
+        return f"<LazyAttribute {self._lazy_module}.{self._lazy_attr} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """返回模块 name 的延迟导入代理。"""
+    return LazyModule(name)
+
+
+def lazy_attr(module: str, attr: str) -> LazyAttribute:
+    """返回 module.attr 的延迟导入代理。"""
+    return LazyAttribute(module, attr)
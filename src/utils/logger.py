@@ -1,9 +1,14 @@
 # src/utils/logger.py
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 # from logging.handlers import RotatingFileHandler # 移除旧的导入
-from logging.handlers import TimedRotatingFileHandler # 导入新的 Handler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler # 导入新的 Handler
+from typing import Callable, Dict, Optional
 
 # 确定日志目录
 # 假设此文件位于 src/utils/logger.py
@@ -16,15 +21,92 @@ log_file = os.path.join(log_dir, 'news_analyzer.log')
 # 全局日志记录器名称
 LOGGER_NAME = "news_analyzer"
 
-def setup_logging(log_level: int = logging.INFO, backup_count: int = 7, when: str = 'D', interval: int = 1) -> logging.Logger:
+# 逐条目输出日志的模块: logger 名称前缀 -> 每个调用位置每秒最多输出的条数 (仅限 WARNING 以下)
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "news_analyzer.core.app_service": 20,
+    "news_analyzer.core.refresh_worker": 20,
+    "news_analyzer.collectors": 20,
+    "news_analyzer.ui.viewmodels": 20,
+}
+
+# 当前运行的队列监听器 (setup_logging 使用异步输出时)
+_queue_listener: Optional[QueueListener] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    按调用位置限制日志频率的过滤器。
+
+    对 logger 名称匹配 limits 中某个前缀的记录，同一调用位置 (logger 名称 + 文件 + 行号)
+    在每个 period 秒的窗口内最多放行 limit 条；超出的记录被丢弃并计数，
+    下一个窗口放行的第一条记录末尾会附上被省略的条数。WARNING 及以上级别的记录总是放行。
+
+    Args:
+        limits: logger 名称前缀 -> 每个窗口的条数上限 (取最长匹配的前缀)。
+        period: 窗口长度 (秒)。
+        clock: 时间函数 (测试时可替换)。
+    """
+
+    def __init__(self, limits: Dict[str, float], period: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.limits = dict(limits)
+        self.period = period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit_by_name: Dict[str, Optional[float]] = {}
+        self._windows: Dict[tuple, list] = {}  # 调用位置 -> [窗口开始时间, 已放行条数, 已省略条数]
+
+    def _limit_for(self, name: str) -> Optional[float]:
+        limit = self._limit_by_name.get(name, -1)
+        if limit == -1:
+            matches = [prefix for prefix in self.limits if name == prefix or name.startswith(prefix + ".")]
+            limit = self.limits[max(matches, key=len)] if matches else None
+            self._limit_by_name[name] = limit
+        return limit
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        limit = self._limit_for(record.name)
+        if limit is None:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        now = self._clock()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < limit:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.getMessage()} (同一位置另有 {suppressed} 条日志已省略)"
+            record.args = None
+        return True
+
+
+def setup_logging(log_level: int = logging.INFO, backup_count: int = 7, when: str = 'D', interval: int = 1,
+                  log_path: Optional[str] = None, use_queue: bool = True,
+                  rate_limits: Optional[Dict[str, float]] = None) -> logging.Logger:
     """
     配置全局日志记录器。
 
+    默认情况下，记录日志的线程只把记录放入队列 (QueueHandler)，格式化和写文件/控制台
+    由 QueueListener 的后台线程完成，慢速磁盘不会拖慢刷新等热点路径。
+    逐条目输出日志的模块会按调用位置限流 (见 RateLimitFilter)。
+
     Args:
         log_level: 日志记录级别 (例如 logging.DEBUG, logging.INFO).
         backup_count: 保留的备份日志文件数量.
         when: 轮转间隔类型 ('S', 'M', 'H', 'D', 'W0'-'W6', 'midnight'). 默认为 'D' (天).
         interval: 轮转间隔数量. 默认为 1.
+        log_path: 日志文件路径. 默认为项目 logs 目录下的 news_analyzer.log.
+        use_queue: 是否通过队列在后台线程输出. 为 False 时在调用线程中同步输出.
+        rate_limits: logger 名称前缀 -> 每秒每个调用位置的条数上限. 默认为 DEFAULT_RATE_LIMITS, 传入 {} 关闭限流.
 
     Returns:
         配置好的 Logger 对象.
@@ -32,15 +114,19 @@ def setup_logging(log_level: int = logging.INFO, backup_count: int = 7, when: st
     logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(log_level)
 
-    # 防止重复添加 handlers
+    # 防止重复添加 handlers (并停止上一次配置的监听线程)
+    stop_logging()
     if logger.hasHandlers():
-        logger.handlers.clear()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
 
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    path = log_path or log_file
 
     # 文件处理器 (按时间滚动日志)
     file_handler = TimedRotatingFileHandler(
-        log_file,
+        path,
         when=when,         # 按天轮转
         interval=interval, # 每天轮转一次
         backupCount=backup_count, # 保留 7 个备份文件 (7 天)
@@ -48,17 +134,40 @@ def setup_logging(log_level: int = logging.INFO, backup_count: int = 7, when: st
         utc=False          # 使用本地时间
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # 控制台处理器
     stream_handler = logging.StreamHandler(sys.stdout) # 输出到标准输出
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+
+    rate_filter = RateLimitFilter(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+    if use_queue:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(rate_filter)  # 在入队前丢弃被限流的记录
+        logger.addHandler(queue_handler)
+        _queue_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+        _queue_listener.start()
+    else:
+        for handler in (file_handler, stream_handler):
+            handler.addFilter(rate_filter)
+            logger.addHandler(handler)
 
     # 更新日志消息以反映时间轮转
-    logger.info(f"日志系统已初始化。日志级别: {logging.getLevelName(log_level)}, 日志文件: {log_file}, 按时间轮转 (when='{when}', interval={interval}, backupCount={backup_count})")
+    logger.info(f"日志系统已初始化。日志级别: {logging.getLevelName(log_level)}, 日志文件: {path}, 按时间轮转 (when='{when}', interval={interval}, backupCount={backup_count}), 异步输出: {use_queue}")
     return logger
 
+def stop_logging():
+    """停止后台日志线程并写出队列中剩余的记录 (程序退出时自动调用)。"""
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+atexit.register(stop_logging)
+
 def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
     """
     获取指定名称的日志记录器。如果未设置，则返回根日志记录器。
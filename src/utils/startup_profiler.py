@@ -0,0 +1,191 @@
+"""
+启动耗时分析 (main.py --profile-startup)
+
+启用后记录两类数据:
+  - 模块导入: 通过 sys.meta_path 上的计时查找器包装每个模块的 exec_module，
+    得到每个模块的累计耗时 (含其导入的子模块) 与自身耗时。
+  - 初始化阶段: 通过 span(name, kind) 记录的代码段耗时，例如容器创建的各个服务 (kind='service')；
+    以及 mark(name) 标记的启动阶段 (kind='stage'，耗时为距上一个标记的时间)。
+
+未启用时 span() 是空的上下文管理器、mark() 直接返回，对正常启动没有影响。
+"""
+
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+_active: Optional["StartupProfiler"] = None
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """包装真实的 loader，只对 exec_module 计时；执行前把模块的 loader 恢复为原对象。"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        spec = module.__spec__
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, '__loader__', None) is self:
+            module.__loader__ = self._loader
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """委托给 sys.meta_path 上的其他查找器，并把找到的 loader 换成 _TimingLoader。"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimingLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """收集模块导入耗时和初始化阶段耗时，并生成报告。"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports: Dict[str, Dict[str, float]] = {}  # 模块名 -> {'cumulative': 秒, 'self': 秒}
+        self.spans: List[Dict[str, Any]] = []
+        self._stack: List[List[Any]] = []  # [模块名, 开始时间, 子模块耗时]
+        self._last_mark = self.started
+        self._finder = _TimingFinder(self)
+        self._thread_id = threading.get_ident()
+
+    def install(self):
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _enter_import(self, name: str):
+        if threading.get_ident() == self._thread_id:  # 只统计主线程的导入，避免后台线程打乱嵌套关系
+            self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_import(self, name: str):
+        if threading.get_ident() != self._thread_id or not self._stack or self._stack[-1][0] != name:
+            return
+        _, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        self.imports[name] = {'cumulative': cumulative, 'self': cumulative - children}
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    @contextmanager
+    def span(self, name: str, kind: str = 'stage'):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append({'name': name, 'kind': kind, 'offset': started - self.started,
+                               'seconds': time.perf_counter() - started})
+
+    def mark(self, name: str):
+        """记录一个启动阶段：从上一个标记 (或启用分析) 到现在。"""
+        now = time.perf_counter()
+        self.spans.append({'name': name, 'kind': 'stage', 'offset': self._last_mark - self.started,
+                           'seconds': now - self._last_mark})
+        self._last_mark = now
+
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """返回按耗时排序的报告字典 (秒)。"""
+        by_cumulative = sorted(self.imports.items(), key=lambda kv: kv[1]['cumulative'], reverse=True)
+        by_self = sorted(self.imports.items(), key=lambda kv: kv[1]['self'], reverse=True)
+        # 按顶层包汇总自身耗时，便于看出是哪个第三方库拖慢了启动
+        packages: Dict[str, float] = {}
+        for name, times in self.imports.items():
+            package = name.split('.')[0]
+            packages[package] = packages.get(package, 0.0) + times['self']
+        return {
+            'total_seconds': round(time.perf_counter() - self.started, 3),
+            'modules_imported': len(self.imports),
+            'import_seconds': round(sum(t['self'] for t in self.imports.values()), 3),
+            'top_cumulative': [{'module': n, **{k: round(v, 4) for k, v in t.items()}} for n, t in by_cumulative[:top]],
+            'top_self': [{'module': n, **{k: round(v, 4) for k, v in t.items()}} for n, t in by_self[:top]],
+            'packages': {p: round(s, 4) for p, s in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]},
+            'spans': [{**s, 'offset': round(s['offset'], 4), 'seconds': round(s['seconds'], 4)} for s in self.spans],
+        }
+
+    def format_report(self, top: int = 25) -> str:
+        """返回便于阅读的文本报告。"""
+        data = self.report(top)
+        lines = [f"启动耗时分析: 总计 {data['total_seconds']:.3f}s, "
+                 f"导入 {data['modules_imported']} 个模块共 {data['import_seconds']:.3f}s"]
+        lines.append("  -- 初始化阶段 --")
+        for s in data['spans']:
+            lines.append(f"  {s['kind']:<8} {s['name']:<32} {s['seconds'] * 1000:8.1f} ms  (起点 {s['offset'] * 1000:.0f} ms)")
+        lines.append("  -- 导入耗时最多的模块 (累计 / 自身) --")
+        for m in data['top_cumulative']:
+            lines.append(f"  {m['module']:<56} {m['cumulative'] * 1000:8.1f} ms / {m['self'] * 1000:7.1f} ms")
+        lines.append("  -- 按顶层包汇总的导入自身耗时 --")
+        for package, seconds in data['packages'].items():
+            lines.append(f"  {package:<32} {seconds * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+    def write_json(self, path: str, top: int = 50):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(top), f, ensure_ascii=False, indent=2)
+
+
+def enable() -> StartupProfiler:
+    """启用启动分析并安装导入计时钩子 (应在导入其他项目模块之前调用)。"""
+    global _active
+    if _active is None:
+        _active = StartupProfiler()
+        _active.install()
+    return _active
+
+
+def disable():
+    """移除导入计时钩子 (已收集的数据仍可通过 active() 取得)。"""
+    if _active is not None:
+        _active.uninstall()
+
+
+def active() -> Optional[StartupProfiler]:
+    """当前启用的分析器；未启用时返回 None。"""
+    return _active
+
+
+@contextmanager
+def span(name: str, kind: str = 'stage'):
+    """记录一段初始化代码的耗时；未启用分析时不做任何事。"""
+    if _active is None:
+        yield
+    else:
+        with _active.span(name, kind):
+            yield
+
+
+def mark(name: str):
+    """标记一个启动阶段的结束；未启用分析时不做任何事。"""
+    if _active is not None:
+        _active.mark(name)
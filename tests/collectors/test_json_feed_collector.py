@@ -9,14 +9,16 @@ import requests
 # 如果 PYTHONPATH 没有设置，可能需要调整导入路径
 try:
     from src.models import NewsSource
-    from src.collectors.json_feed_collector import JSONFeedCollector
+    from src.collectors.json_feed_collector import JSONFeedCollector, iter_json_feed_items
+    from src.collectors.collector_factory import CollectorFactory
 except ImportError:
     # 如果直接运行测试脚本，可能需要添加 src 到 sys.path
     import sys
     import os
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
     from src.models import NewsSource
-    from src.collectors.json_feed_collector import JSONFeedCollector
+    from src.collectors.json_feed_collector import JSONFeedCollector, iter_json_feed_items
+    from src.collectors.collector_factory import CollectorFactory
 
 # --- Mock 数据 ---
 
@@ -92,6 +94,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
     def setUp(self):
         """设置测试环境"""
+        JSONFeedCollector.clear_validator_cache()
         self.collector = JSONFeedCollector()
         self.test_source = NewsSource(name="Test JSON Source", type="json", url="http://test.com/feed.json", category="Test", enabled=True) # Added type, removed id, fixed is_enabled typo
         # Mock time.strftime to return a fixed value
@@ -103,20 +106,21 @@ class TestJSONFeedCollector(unittest.TestCase):
         """清理测试环境"""
         self.patcher.stop()
 
-    def _create_mock_response(self, status_code=200, json_data=None, text_data=None, raise_for_status_error=None):
+    def _create_mock_response(self, status_code=200, json_data=None, text_data=None, raise_for_status_error=None, headers=None):
         """辅助函数创建 Mock Response 对象"""
         mock_resp = MagicMock(spec=requests.Response)
         mock_resp.status_code = status_code
         mock_resp.url = self.test_source.url
+        mock_resp.headers = headers or {}
 
+        # 收集器以流式方式读取原始字节并用 orjson 解码
         if json_data is not None:
-            mock_resp.json.return_value = json_data
-            # 同时设置 text 以防 json 解析失败时记录日志
-            mock_resp.text = json.dumps(json_data)
+            body = json.dumps(json_data).encode('utf-8')
         elif text_data is not None:
-            mock_resp.text = text_data
-            # 如果提供了 text_data，模拟 json() 抛出异常
-            mock_resp.json.side_effect = json.JSONDecodeError("Expecting value", "doc", 0)
+            body = text_data.encode('utf-8')
+        else:
+            body = b''
+        mock_resp.iter_content.side_effect = lambda chunk_size=1: iter([body[i:i + chunk_size] for i in range(0, len(body), chunk_size)])
 
         if raise_for_status_error:
             mock_resp.raise_for_status.side_effect = raise_for_status_error
@@ -137,7 +141,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(len(results), 4) # item-4 只有 id，但当前实现允许无链接条目，所以包含在内
 
@@ -161,7 +165,7 @@ class TestJSONFeedCollector(unittest.TestCase):
         self.assertEqual(item1['publish_time'], expected_date_item1)
         self.assertEqual(item1['source_name'], self.test_source.name)
         self.assertEqual(item1['collected_at'], "2024-01-01 12:00:00")
-        self.assertIn('"id": "item-1"', item1['raw_data'])
+        self.assertEqual(json.loads(item1['raw_data']), VALID_FEED_DATA['items'][0])
 
         # 验证第二个 item (使用 external_url, 无日期)
         item2 = results[1]
@@ -195,7 +199,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
 
     @patch('src.collectors.json_feed_collector.requests.Session.get')
@@ -206,7 +210,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
 
     @patch('src.collectors.json_feed_collector.requests.Session.get')
@@ -217,7 +221,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
 
     @patch('src.collectors.json_feed_collector.requests.Session.get')
@@ -228,7 +232,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
 
     @patch('src.collectors.json_feed_collector.requests.Session.get')
@@ -240,7 +244,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
         # 可以添加日志检查，确认记录了错误
 
@@ -251,7 +255,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
         # 可以添加日志检查，确认记录了超时错误
 
@@ -262,7 +266,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         self.assertEqual(len(results), 0)
         # 可以添加日志检查，确认记录了网络错误
 
@@ -275,7 +279,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(len(results), 0)
         # 可以添加日志检查，确认记录了 HTTP 错误
@@ -288,7 +292,7 @@ class TestJSONFeedCollector(unittest.TestCase):
 
         results = self.collector.collect(self.test_source)
 
-        mock_get.assert_called_once_with(self.test_source.url, timeout=20)
+        mock_get.assert_called_once_with(self.test_source.url, timeout=20, stream=True)
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(len(results), 0)
         # 可以添加日志检查，确认记录了 HTTP 错误
@@ -393,5 +397,76 @@ class TestJSONFeedCollector(unittest.TestCase):
             self.assertIsNone(self.collector._parse_date(None))
 
 
+    @patch('src.collectors.json_feed_collector.requests.Session.get')
+    def test_collect_conditional_get(self, mock_get):
+        """测试保存 ETag/Last-Modified 并在下次请求时发送条件请求头，304 时返回空列表"""
+        first = self._create_mock_response(status_code=200, json_data=VALID_FEED_DATA,
+                                           headers={'ETag': '"abc"', 'Last-Modified': 'Thu, 26 Oct 2023 10:00:00 GMT'})
+        not_modified = self._create_mock_response(status_code=304)
+        mock_get.side_effect = [first, not_modified]
+
+        self.assertEqual(len(self.collector.collect(self.test_source)), 4)
+        results = JSONFeedCollector().collect(self.test_source)
+
+        self.assertEqual(results, [])
+        mock_get.assert_called_with(self.test_source.url, timeout=20, stream=True, headers={
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Thu, 26 Oct 2023 10:00:00 GMT',
+        })
+        not_modified.raise_for_status.assert_not_called()
+
+    @patch('src.collectors.json_feed_collector.requests.Session.get')
+    def test_collect_respects_max_items(self, mock_get):
+        """测试 custom_config 中的 max_items 上限"""
+        mock_get.return_value = self._create_mock_response(status_code=200, json_data=VALID_FEED_DATA)
+        self.test_source.custom_config = {'max_items': 2}
+
+        results = self.collector.collect(self.test_source)
+
+        self.assertEqual([r['title'] for r in results], ["First Item Title", "Second Item Title"])
+
+    @patch('src.collectors.json_feed_collector.requests.Session.get')
+    def test_collect_truncated_by_max_bytes(self, mock_get):
+        """测试超过字节上限时只解析截断点之前的完整条目"""
+        mock_get.return_value = self._create_mock_response(status_code=200, json_data=VALID_FEED_DATA)
+        body = json.dumps(VALID_FEED_DATA).encode('utf-8')
+        cut = body.index(b'"item-3-no-title"')
+        self.test_source.custom_config = {'max_bytes': cut}
+
+        results = self.collector.collect(self.test_source)
+
+        self.assertEqual([r['link'] for r in results],
+                         ["https://example.org/item-1", "https://external.example.com/item-2"])
+
+    @patch('src.collectors.json_feed_collector.requests.Session.get')
+    def test_collect_large_untruncated_feed_decodes_whole_document(self, mock_get):
+        """测试未截断的大 Feed 仍一次性解码，而不是逐条扫描"""
+        feed = dict(VALID_FEED_DATA)
+        feed['items'] = [{"id": f"big-{i}", "title": "x" * 1024, "url": f"https://example.org/big-{i}"}
+                         for i in range(1500)]
+        mock_get.return_value = self._create_mock_response(status_code=200, json_data=feed)
+        self.test_source.custom_config = {'max_items': 2000}
+
+        with patch.object(JSONFeedCollector, '_decode_incremental', side_effect=AssertionError) as incremental:
+            results = self.collector.collect(self.test_source)
+
+        incremental.assert_not_called()
+        self.assertEqual(len(results), 1500)
+
+    def test_iter_json_feed_items_matches_full_decode(self):
+        """测试逐条解析 items 与一次性解码结果一致 (包括字符串中的括号与转义)"""
+        feed = dict(VALID_FEED_DATA)
+        feed['items'] = VALID_FEED_DATA['items'] + [{"id": "x", "title": "含有 ] 和 \\\" 以及 , 的标题"}, "not a dict"]
+        payload = json.dumps(feed, ensure_ascii=False).encode('utf-8')
+        keys = set()
+
+        self.assertEqual(list(iter_json_feed_items(payload, keys)), feed['items'])
+        self.assertTrue({'version', 'items', 'title'} <= keys)
+
+    def test_factory_registers_json_collector(self):
+        """测试 CollectorFactory 可以创建 JSON Feed 收集器"""
+        self.assertIsInstance(CollectorFactory().get_collector('json'), JSONFeedCollector)
+
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from src.models import NewsSource
+from src.collectors.rss_collector import RSSCollector
+from src.collectors.parser_pool import ParserPool, parse_rss_payload
+
+SAMPLE_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Feed</title>
+    <item>
+      <title>First</title>
+      <link>https://example.com/1</link>
+      <description>Summary one</description>
+      <pubDate>Thu, 26 Oct 2023 10:00:00 +0000</pubDate>
+    </item>
+    <item>
+      <title>Duplicate</title>
+      <link>https://example.com/1</link>
+      <description>Same link again</description>
+    </item>
+    <item>
+      <title>Second</title>
+      <link>https://example.com/2</link>
+      <description>Summary two</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def test_parse_rss_payload_dedupes_and_converts_dates():
+    items, cpu_seconds, pid = parse_rss_payload(SAMPLE_RSS, "Test Source")
+
+    assert [item[1] for item in items] == ["https://example.com/1", "https://example.com/2"]
+    assert items[0][0] == "First"
+    assert items[0][4] == datetime(2023, 10, 26, 10, 0, tzinfo=timezone.utc).timestamp()
+    assert items[1][4] is None
+    assert cpu_seconds >= 0
+    assert isinstance(pid, int)
+
+
+def test_item_from_tuple_builds_standard_dict():
+    ts = datetime(2023, 10, 26, 10, 0, tzinfo=timezone.utc).timestamp()
+    item = ParserPool.item_from_tuple(("T", "https://e.com/x", "S", "C", ts, None), "Src", "科技")
+
+    assert item['source_name'] == "Src"
+    assert item['category'] == "科技"
+    assert item['publish_time'] == datetime(2023, 10, 26, 10, 0, tzinfo=timezone.utc)
+    assert item['raw_data'] == {}
+
+
+def test_parser_pool_round_trip_in_subprocess():
+    pool = ParserPool(max_workers=1)
+    try:
+        items = pool.parse_rss(SAMPLE_RSS, "Test Source", "未分类")
+    finally:
+        pool.shutdown()
+
+    assert [item['link'] for item in items] == ["https://example.com/1", "https://example.com/2"]
+    stats = pool.stats()
+    assert stats['parsed_payloads'] == 1
+    assert stats['fallback_count'] == 0
+
+
+def test_parser_pool_falls_back_when_pool_is_broken():
+    pool = ParserPool(max_workers=1)
+    broken_executor = MagicMock()
+    broken_executor.submit.side_effect = RuntimeError("cannot schedule new futures")
+    pool._executor = broken_executor
+
+    items = pool.parse_rss(SAMPLE_RSS, "Test Source", "未分类")
+
+    assert len(items) == 2
+    assert pool.stats()['fallback_count'] == 1
+    assert pool._executor is None
+
+
+@patch('src.collectors.rss_collector.requests.get')
+def test_rss_collector_delegates_parsing_to_pool(mock_get):
+    response = MagicMock()
+    response.content = SAMPLE_RSS
+    mock_get.return_value = response
+
+    pool = MagicMock()
+    pool.parse_rss.return_value = [{'link': 'https://example.com/1'}]
+    collector = RSSCollector()
+    collector.parser_pool = pool
+    progress = MagicMock()
+
+    source = NewsSource(name="Test Source", type="rss", url="https://example.com/feed", category="科技")
+    result = collector.collect(source, progress_callback=progress)
+
+    pool.parse_rss.assert_called_once_with(SAMPLE_RSS, "Test Source", "科技")
+    assert result == [{'link': 'https://example.com/1'}]
+    progress.assert_called_with(1, 1)
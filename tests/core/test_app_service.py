@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from src.core.app_service import AppService
+from src.core.source_manager import SourceLookup
 
 # ---- Fixtures ----
 @pytest.fixture
@@ -92,4 +93,99 @@ def test_dependency_none_behavior():
     try:
         app_service._load_initial_news()
     except Exception as e:
-        pytest.fail(f"history_service 为 None 时抛异常: {e}") 
\ No newline at end of file
+        pytest.fail(f"history_service 为 None 时抛异常: {e}") 
+
+def test_handle_articles_stored_merges_batch(mock_dependencies, qtbot):
+    """测试刷新流水线写入的批次被合并进缓存，并且只通知一次 UI"""
+    mock_dependencies['storage'].get_articles_by_links.return_value = [
+        {'id': 1, 'title': '新闻A', 'link': 'a', 'source_name': '源1'},
+        {'id': 2, 'title': '新闻B', 'link': 'b', 'source_name': '源2', 'is_read': True},
+    ]
+    source = MagicMock()
+    source.name = '源1'
+    source.category = 'technology'
+    mock_dependencies['source_manager'].get_lookup.return_value = SourceLookup([source])
+    app_service = AppService(**mock_dependencies)
+
+    with qtbot.waitSignal(app_service.news_cache_delta, timeout=1000) as blocker:
+        app_service._handle_articles_stored(['a', 'b'])
+
+    assert blocker.args == [[1, 2], [], []]
+    assert [(article.link, article.is_read) for article in app_service.get_cached_articles([1, 2])] == \
+        [('a', False), ('b', True)]
+    mock_dependencies['history_service'].is_read.assert_not_called()
+    mock_dependencies['storage'].get_articles_by_links.assert_called_once_with(['a', 'b'])
+
+    # 同一批链接再次写入时报告为更新 (按持久的链接索引原位替换)
+    with qtbot.waitSignal(app_service.news_cache_delta, timeout=1000) as blocker:
+        app_service._handle_articles_stored(['a', 'b'])
+    assert blocker.args == [[], [1, 2], []]
+    assert [article.link for article in app_service.news_cache] == ['a', 'b']
+    assert app_service._index_by_link == {'a': 0, 'b': 1}
+
+
+def test_cache_holds_list_rows_and_hydrates_full_article(mock_dependencies):
+    """缓存只保存不含正文的列表行；选中时从数据库加载完整文章"""
+    from src.models import NewsArticle, NewsListRow
+    storage = mock_dependencies['storage']
+    storage.get_all_articles.return_value = [
+        {'id': 1, 'title': ' 新闻A ', 'link': 'a', 'source_name': '源1', 'publish_time': '2024-01-02T03:04:05+00:00',
+         'is_read': True},
+    ]
+    storage.get_article_by_id.return_value = {
+        'id': 1, 'title': '新闻A', 'link': 'a', 'source_name': '源1', 'content': '正文',
+        'publish_time': '2024-01-02T03:04:05+00:00',
+    }
+    source = MagicMock()
+    source.name = '源1'
+    source.category = 'technology'
+    mock_dependencies['source_manager'].get_lookup.return_value = SourceLookup([source])
+    app_service = AppService(**mock_dependencies)
+
+    app_service._load_initial_news()
+
+    storage.get_all_articles.assert_called_once_with(with_content=False)
+    mock_dependencies['history_service'].is_read.assert_not_called()  # 已读状态来自同一次查询
+    row = app_service.news_cache[0]
+    assert isinstance(row, NewsListRow)
+    assert (row.title, row.is_read, not hasattr(row, 'content')) == ('新闻A', True, True)
+    assert row.publish_time.isoformat() == '2024-01-02T03:04:05+00:00'
+
+    app_service.set_selected_news(row)
+    full = app_service.selected_article
+    assert isinstance(full, NewsArticle)
+    assert (full.content, full.category, full.is_read) == ('正文', row.category, True)
+    # 同一篇文章再次加载时复用已选中的完整文章
+    assert app_service.get_full_article(row) is full
+    storage.get_article_by_id.assert_called_once_with(1)
+
+
+def test_progressive_initial_load_streams_older_pages(mock_dependencies, qtbot, tmp_path):
+    """渐进式加载：先同步交出最新一页，其余页在后台读取并以增量信号合并"""
+    from datetime import datetime, timedelta, timezone
+    from src.storage.news_storage import NewsStorage
+    storage = NewsStorage(data_dir=str(tmp_path), db_name="progressive.db")
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    storage.upsert_articles_batch([
+        {'title': f"新闻{i}", 'link': f"l{i}", 'source_name': '源1', 'content': "正文" * 50,
+         'publish_time': (base + timedelta(minutes=i)).isoformat(), 'is_read': int(i % 7 == 0)}
+        for i in range(1000)
+    ])
+    mock_dependencies['storage'] = storage
+    mock_dependencies['source_manager'].get_lookup.return_value = SourceLookup([])
+    app_service = AppService(**mock_dependencies)
+    first_pages, deltas = [], []
+    app_service.news_cache_updated.connect(lambda rows: first_pages.append([row.link for row in rows]))
+    app_service.news_cache_delta.connect(lambda added, updated, removed: deltas.append(len(added)))
+
+    with qtbot.waitSignal(app_service.initial_load_finished, timeout=5000) as blocker:
+        metrics = app_service.load_initial_news_progressive(first_page=100, max_page_size=300)
+        assert first_pages == [[f"l{i}" for i in range(999, 899, -1)]]
+        assert metrics['time_to_first_row_ms'] >= 0 and metrics['first_page'] == 100
+
+    assert deltas == [200, 300, 300, 100]  # 逐页翻倍直到页大小上限
+    assert blocker.args[0]['total'] == 1000
+    assert [row.link for row in app_service.news_cache] == [f"l{i}" for i in range(999, -1, -1)]
+    assert [row.is_read for row in app_service.news_cache[:8]] == [i % 7 == 0 for i in range(999, 991, -1)]
+    mock_dependencies['history_service'].is_read.assert_not_called()
+    storage.close()
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.app_service import AppService
+from src.core.article_detail_cache import ArticleDetailCache, estimate_article_bytes
+from src.core.source_manager import SourceLookup
+from src.models import NewsArticle, NewsListRow
+from src.storage.news_storage import NewsStorage
+
+
+def _article(article_id, content="正文"):
+    return NewsArticle(id=article_id, title=f"新闻{article_id}", link=f"l{article_id}", source_name="源1",
+                       content=content)
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    articles = [_article(i, "正" * 1000) for i in range(3)]
+    size = estimate_article_bytes(articles[0])
+    cache = ArticleDetailCache(max_bytes=size * 2 + 10)
+    cache.put(articles[0])
+    cache.put(articles[1])
+    assert cache.get(0) is articles[0]  # 0 变为最近使用，1 成为最旧
+
+    cache.put(articles[2])
+    assert (0 in cache, 1 in cache, 2 in cache) == (True, False, True)
+    assert cache.total_bytes == size * 2
+    assert cache.stats()['evictions'] == 1
+
+    # HTML 计入大小，超出上限时同样触发淘汰
+    cache.put_html(2, 'preview', "<p>" + "x" * 2000 + "</p>")
+    assert cache.get_html(2, 'preview').startswith("<p>") and 0 not in cache
+    cache.put_html(99, 'preview', "<p>未缓存的文章</p>")
+    assert 99 not in cache
+
+    assert cache.discard([2, 5]) == 1
+    assert len(cache) == 0 and cache.total_bytes == 0
+    cache.put(_article(None))
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def app_service(tmp_path):
+    storage = NewsStorage(data_dir=str(tmp_path), db_name="details.db")
+    storage.upsert_articles_batch([
+        {'title': f"新闻{i}", 'link': f"l{i}", 'source_name': '源1', 'content': f"<script>x()</script>正文{i}",
+         'publish_time': '2024-01-02T03:04:05+00:00'}
+        for i in range(20)
+    ])
+    source_manager = MagicMock()
+    source_manager.get_lookup.return_value = SourceLookup([])
+    deps = {name: MagicMock() for name in ('config_provider', 'llm_config_manager', 'llm_service',
+                                            'news_update_service', 'analysis_service', 'history_service')}
+    service = AppService(storage=storage, source_manager=source_manager, **deps)
+    yield service
+    service.wait_for_prefetch(5000)
+    storage.close()
+
+
+def test_prefetched_details_are_served_from_cache(app_service, qtbot):
+    """后台预取的正文和 HTML 进入缓存，之后加载完整文章不再查询数据库"""
+    rows = [NewsListRow.from_storage_dict(item) for item in app_service.storage.get_article_headlines(20)]
+    ids = [row.id for row in rows[:5]]
+
+    with qtbot.waitSignal(app_service.details_prefetched, timeout=5000) as blocker:
+        assert app_service.prefetch_article_details(ids + [ids[0], None], {'preview': lambda a: f"<h2>{a.title}</h2>"})
+    assert blocker.args == [ids]
+    assert app_service.detail_cache.get_html(ids[1], 'preview') == f"<h2>{rows[1].title}</h2>"
+
+    app_service.storage.get_article_by_id = MagicMock(side_effect=AssertionError("不应查询数据库"))
+    rows[1].is_read = True
+    full = app_service.get_full_article(rows[1])
+    assert (full.id, full.content, full.is_read) == (rows[1].id, f"<script>x()</script>正文{rows[1].link[1:]}", True)
+
+    # 已预取的文章不会重复读取；刷新更新的文章从详情缓存中移除
+    with qtbot.assertNotEmitted(app_service.details_prefetched, wait=200):
+        app_service.prefetch_article_details(ids, {'preview': lambda a: ""})
+        app_service.wait_for_prefetch(5000)
+    app_service._replace_cache(list(rows))
+    app_service._merge_articles_into_cache([rows[1]], "刷新")
+    assert rows[1].id not in app_service.detail_cache and rows[2].id in app_service.detail_cache
@@ -0,0 +1,115 @@
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core import article_features
+from src.core.article_features import ArticleFeatureCache, decode_sparse_rows, encode_sparse_row
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.storage.article_feature_store import ArticleFeatureStore
+
+WORDS = ("Beijing Shanghai Huawei chip launch summit economy growth policy market stocks typhoon earthquake "
+         "rescue final champion film vaccine hospital school research robot battery export").split()
+
+
+def _news(count, seed=0):
+    rng = random.Random(seed)
+    return [{'id': k, 'clean_title': " ".join(rng.sample(WORDS, 4)),
+             'clean_content': " ".join(rng.choice(WORDS) for _ in range(30))} for k in range(count)]
+
+
+def _entities(news_list):
+    return [{word for word in news['clean_title'].split() if word[0].isupper()} for news in news_list]
+
+
+@pytest.fixture
+def store():
+    store = ArticleFeatureStore("", ":memory:")
+    yield store
+    store.close()
+
+
+def test_sparse_rows_round_trip():
+    blobs = [encode_sparse_row([3, 7], [1.0, 2.5]), encode_sparse_row([], []), encode_sparse_row([0], [4.0])]
+    matrix = decode_sparse_rows(blobs, 10)
+    assert matrix.shape == (3, 10)
+    assert matrix.toarray()[0, [3, 7]].tolist() == [1.0, 2.5] and matrix[1].nnz == 0 and matrix[2, 0] == 4.0
+
+
+def test_features_are_reused_across_instances(store):
+    news_list = _news(40)
+    extract = MagicMock(side_effect=_entities)
+    first = ArticleFeatureCache(store, n_topics=5).features(news_list, extract, 'simple')
+    assert first.computed == 40 and extract.call_count == 1
+
+    second = ArticleFeatureCache(store, n_topics=5).features(news_list, extract, 'simple')
+    assert second.computed == 0 and extract.call_count == 1
+    assert (first.title_counts != second.title_counts).nnz == 0
+    assert (first.content_counts != second.content_counts).nnz == 0
+    assert np.allclose(first.topics, second.topics, atol=1e-6)
+    assert second.entities == [sorted(entities) for entities in _entities(news_list)]
+
+
+def test_only_new_or_changed_articles_are_featurized(store):
+    news_list = _news(40)
+    cache = ArticleFeatureCache(store, n_topics=5)
+    cache.features(news_list, _entities, 'simple')
+
+    news_list[3] = dict(news_list[3], clean_title="Huawei chip launch")
+    news_list.append({'id': 'not-an-int', 'clean_title': "Typhoon rescue", 'clean_content': ""})
+    extract = MagicMock(side_effect=_entities)
+    features = cache.features(news_list, extract, 'simple')
+    assert features.computed == 2
+    assert [news['id'] for news in extract.call_args.args[0]] == [3, 'not-an-int']
+    assert features.entities[3] == ["Huawei"]
+    assert store.feature_count() == 40  # 没有整数 ID 的文章不写入
+
+    # 实体提取方式变化时只重新提取实体
+    features = cache.features(news_list, _entities, 'llm')
+    assert features.computed == 1
+
+
+def test_topic_model_is_refit_when_corpus_grows(store):
+    cache = ArticleFeatureCache(store, n_topics=5)
+    cache.features(_news(20), _entities, 'simple')
+    assert cache.topic_model_id == 1
+
+    cache.features(_news(40), _entities, 'simple')
+    assert cache.topic_model_id == 1
+    restored = ArticleFeatureCache(store, n_topics=5)
+    features = restored.features(_news(41), _entities, 'simple')
+    assert restored.topic_model_id == 2 and features.topics.shape == (41, 5)
+    assert store.load_model('lda')['doc_count'] == 41
+
+
+def test_feature_version_change_clears_store(store):
+    ArticleFeatureCache(store, n_topics=5).features(_news(10), _entities, 'simple')
+    with patch.object(article_features, 'FEATURE_VERSION', article_features.FEATURE_VERSION + 1):
+        ArticleFeatureCache(store, n_topics=5)
+    assert store.feature_count() == 0 and store.load_model('lda') is None
+
+
+def test_clusterer_with_feature_store_skips_cached_articles(store):
+    rng = random.Random(3)
+    news_list = []
+    for event in range(8):
+        words = rng.sample(WORDS, 4)
+        started = datetime(2024, 1, 1) + timedelta(days=event * 2)
+        for report in range(4):
+            news_list.append({'id': len(news_list), 'title': " ".join(rng.sample(words, 3) + [str(100 + event)]),
+                              'content': ". ".join(" ".join(rng.choice(words) for _ in range(4)) for _ in range(6)),
+                              'source_name': f"S{report}", 'publish_time': started + timedelta(minutes=report * 30),
+                              'event': event})
+
+    def groups(events):
+        return sorted(sorted(report['event'] for report in event['reports']) for event in events)
+
+    events = EnhancedNewsClusterer(feature_store=store).cluster(news_list)
+    assert groups(events) == sorted([e] * 4 for e in range(8))
+
+    clusterer = EnhancedNewsClusterer(feature_store=store)
+    with patch.object(EnhancedNewsClusterer, '_simple_entities', side_effect=AssertionError("不应重新提取")):
+        assert groups(clusterer.cluster(news_list)) == groups(events)
+    assert clusterer.lda_model is not None
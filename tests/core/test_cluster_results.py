@@ -0,0 +1,112 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.clustering_suite import make_corpus
+from src.core.cluster_results import ClusterResultCache, article_fingerprint
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.storage.cluster_result_store import ClusterResultStore
+
+
+@pytest.fixture
+def store():
+    store = ClusterResultStore("", ":memory:")
+    yield store
+    store.close()
+
+
+def _outline(events):
+    return [(event['event_id'], event['title'], event['category'], sorted(event['sources']),
+             [report['id'] for report in event['reports']], event['publish_time']) for event in events]
+
+
+def _cluster(store, news_list, **params):
+    """聚类一次，返回 (事件, 每次实际聚类的文章 ID 列表)。"""
+    clusterer = EnhancedNewsClusterer(result_store=store)
+    if params:
+        clusterer.set_clustering_params(**params)
+    calls = []
+    original = clusterer._cluster_events
+
+    def record(processed_news):
+        calls.append([news['id'] for news in processed_news])
+        return original(processed_news)
+
+    with patch.object(clusterer, '_cluster_events', side_effect=record):
+        events = clusterer.cluster(news_list)
+    return events, calls
+
+
+def test_unchanged_input_reuses_saved_events_across_instances(store):
+    news_list = make_corpus(80, seed=3)
+    first, calls = _cluster(store, news_list)
+    assert len(calls) == 1 and store.run_count() == 1
+
+    second, calls = _cluster(store, list(reversed(news_list)))
+    assert calls == []
+    assert _outline(second) == _outline(first)
+    assert all(report is not news for event in second for report in event['reports'] for news in news_list)
+    assert all('clean_title' in report for event in second for report in event['reports'])
+
+
+def test_parameter_or_content_changes_recluster(store):
+    news_list = make_corpus(60, seed=4)
+    _cluster(store, news_list)
+
+    _, calls = _cluster(store, news_list, eps=0.3)
+    assert len(calls) == 1
+    _, calls = _cluster(store, news_list, fine_workers=2)
+    assert calls == []  # 并行方式不影响结果
+
+    changed = [dict(news) for news in news_list]
+    changed[5]['title'] += " update"
+    _, calls = _cluster(store, changed)
+    assert len(calls) == 1
+
+
+def test_new_articles_only_recluster_nearby_events(store):
+    news_list = make_corpus(120, seed=5)
+    old, late = news_list[:100], news_list[100:]
+    window = timedelta(days=EnhancedNewsClusterer().time_window)
+    late = [dict(news, publish_time=news['publish_time'] + timedelta(days=60)) for news in late]
+    previous, _ = _cluster(store, old)
+
+    events, calls = _cluster(store, old + late)
+    assert len(calls) == 1
+    reclustered = set(calls[0])
+    assert {news['id'] for news in late} <= reclustered
+    earliest = min(news['publish_time'] for news in late) - window
+    kept = [event for event in previous if max(report['publish_time'] for report in event['reports']) < earliest]
+    assert kept and not reclustered & {report['id'] for event in kept for report in event['reports']}
+    assert sorted(report['id'] for event in events for report in event['reports']) == list(range(120))
+    assert {tuple(report['id'] for report in event['reports']) for event in kept} <= \
+        {tuple(report['id'] for report in event['reports']) for event in events}
+    assert len({event['event_id'] for event in events}) == len(events)
+
+    # 合并后的结果也已保存
+    again, calls = _cluster(store, old + late)
+    assert calls == [] and _outline(again) == _outline(events)
+
+
+def test_superset_overlapping_old_events_reclusters_everything(store):
+    news_list = make_corpus(100, seed=6)
+    _cluster(store, news_list[::2])
+    _, calls = _cluster(store, news_list)
+    assert len(calls) == 1 and len(calls[0]) == 100
+
+
+def test_articles_without_unique_ids_are_not_cached(store):
+    news_list = [dict(news, id=None) for news in make_corpus(20, seed=7)]
+    _cluster(store, news_list)
+    assert store.run_count() == 0
+
+
+def test_store_keeps_only_recent_runs(store):
+    cache = ClusterResultCache(store, max_runs=2)
+    news_list = make_corpus(10, seed=8)
+    for k in range(3):
+        key = cache.key(news_list[:k + 5], {'eps': 0.4})
+        cache.save(key, [{'event_id': 'event_0', 'title': 't', 'reports': news_list[:k + 5]}])
+    assert store.run_count() == 2
+    assert article_fingerprint(news_list[0]) != article_fingerprint(dict(news_list[0], source_name='other'))
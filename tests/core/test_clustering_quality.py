@@ -0,0 +1,50 @@
+import json
+import logging
+import os
+from collections import Counter
+
+import pytest
+
+from benchmarks.clustering_suite import CLUSTERERS, group_labels, make_corpus, score
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks', 'baselines', 'clustering_quality.json')
+
+with open(BASELINE_PATH, encoding='utf-8') as f:
+    BASELINE = json.load(f)
+
+
+def test_corpus_mixes_languages_duplicates_and_time_spread():
+    news_list = make_corpus(500, seed=1)
+    assert [news['id'] for news in news_list] == list(range(500))
+    assert set(Counter(news['language'] for news in news_list)) == {'zh', 'en'}
+    assert news_list == sorted(news_list, key=lambda news: news['publish_time'])
+    assert (news_list[-1]['publish_time'] - news_list[0]['publish_time']).days >= 20
+
+    by_id = {news['id']: news for news in news_list}
+    duplicates = [news for news in news_list if news['duplicate_of'] is not None]
+    assert 20 <= len(duplicates) <= 80
+    assert all(by_id[news['duplicate_of']]['event'] == news['event'] for news in duplicates)
+    assert any(by_id[news['duplicate_of']]['title'] == news['title'] for news in duplicates)
+    assert make_corpus(500, seed=1) == news_list
+
+
+def test_group_labels_keep_ungrouped_articles_apart():
+    news_list = [{'id': k, 'event': k // 2, 'duplicate_of': None} for k in range(4)]
+    labels = group_labels([[0, 1], [3]], news_list)
+    assert labels[:2] == [0, 0] and labels[3] == 1 and labels[2] not in (0, 1)
+    assert score(news_list, group_labels([[0, 1], [2, 3]], news_list))['ari'] == 1.0
+
+
+@pytest.mark.parametrize("name", sorted(BASELINE['regression']['scores']))
+def test_clustering_quality_does_not_regress(name):
+    regression = BASELINE['regression']
+    corpus = BASELINE['corpus']
+    news_list = make_corpus(regression['size'], corpus['per_event'], corpus['duplicate_rate'], seed=corpus['seed'])
+    logging.disable(logging.CRITICAL)
+    try:
+        quality = score(news_list, group_labels(CLUSTERERS[name](news_list), news_list))
+    finally:
+        logging.disable(logging.NOTSET)
+    expected = regression['scores'][name]
+    assert quality['ari'] >= expected['ari'] - regression['tolerance'], quality
+    assert quality['nmi'] >= expected['nmi'] - regression['tolerance'], quality
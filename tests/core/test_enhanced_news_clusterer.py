@@ -0,0 +1,82 @@
+import random
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from scipy import sparse
+
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+
+WORDS = ("北京 上海 深圳 华为 芯片 发布 会议 经济 增长 政策 市场 股市 科技 公司 政府 宣布 台风 地震 救援 比赛 "
+         "冠军 球队 电影 票房 疫苗 医院 教育 学校 研究 发现 人工智能 新能源 汽车 出口").split()
+
+
+@pytest.fixture
+def event_news():
+    """12 个事件，每个 4 篇报道 (共享关键词、编号和相近的发布时间)"""
+    rng = random.Random(3)
+    news_list = []
+    for event in range(12):
+        words = rng.sample(WORDS, 4)
+        started = datetime(2024, 1, 1) + timedelta(days=event * 2)
+        for report in range(4):
+            news_list.append({
+                'title': " ".join(rng.sample(words, 3) + [str(100 + event)]),
+                'content': "，".join(" ".join(rng.choice(words) for _ in range(4)) for _ in range(6)),
+                'source_name': f"来源{report}", 'publish_time': started + timedelta(minutes=report * 30),
+                'event': event,
+            })
+    rng.shuffle(news_list)
+    return news_list
+
+
+def _groups(events):
+    return sorted(sorted(report['event'] for report in event['reports']) for event in events)
+
+
+@pytest.mark.parametrize("mode", ["dense", "sparse"])
+def test_cluster_recovers_events(event_news, mode):
+    clusterer = EnhancedNewsClusterer()
+    clusterer.set_clustering_params(mode=mode, n_neighbors=5)
+    events = clusterer.cluster(event_news)
+    assert _groups(events) == sorted([e] * 4 for e in range(12))
+    assert all(len(event['sources']) == 4 for event in events)
+
+
+def test_auto_mode_switches_to_sparse_graph(event_news):
+    clusterer = EnhancedNewsClusterer()
+    clusterer.set_clustering_params(n_neighbors=5)
+    with patch.object(clusterer, '_build_similarity_graph', wraps=clusterer._build_similarity_graph) as build:
+        clusterer.sparse_min_samples = len(event_news) + 1
+        clusterer.cluster(event_news)
+        assert build.call_count == 0
+        clusterer.sparse_min_samples = len(event_news)
+        clusterer.cluster(event_news)
+        assert build.call_count == 1
+
+    graph = clusterer._build_similarity_graph(clusterer._extract_sparse_features(clusterer._preprocess_news(event_news)))
+    assert sparse.issparse(graph) and (graph != graph.T).nnz == 0 and graph.diagonal().sum() == 0
+    assert graph.nnz <= len(event_news) * 5 * 4 * 2  # 每种特征最多 k 个近邻
+
+    with pytest.raises(ValueError):
+        clusterer.set_clustering_params(mode="hdbscan")
+
+
+@pytest.mark.parametrize("mode, backend", [("dense", "thread"), ("sparse", "thread"), ("sparse", "process")])
+def test_parallel_fine_clustering_matches_sequential(event_news, mode, backend, caplog):
+    def run(**params):
+        clusterer = EnhancedNewsClusterer()
+        clusterer.set_clustering_params(mode=mode, n_neighbors=5, **params)
+        return [(event['title'], [(report['event'], report['source_name']) for report in event['reports']])
+                for event in clusterer.cluster(event_news)]
+
+    sequential = run()
+    with caplog.at_level('DEBUG', logger='news_analyzer.core.enhanced_news_clusterer'):
+        assert run(fine_workers=2, fine_backend=backend) == sequential
+    assert f"{backend} × 2" in caplog.text
+    assert caplog.text.count("细分组: 粗分类簇") >= 12  # 逐簇耗时
+
+
+def test_unknown_fine_backend_is_rejected():
+    with pytest.raises(ValueError):
+        EnhancedNewsClusterer().set_clustering_params(fine_backend='gpu')
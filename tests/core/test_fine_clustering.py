@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from src.core.fine_clustering import SharedSimilarity, chunk_clusters, fine_cluster_chunk, representative_index
+
+
+def _similarity():
+    """两组互相相似的新闻 (0-2, 3-4) 和一篇孤立的新闻 (5)"""
+    similarity = np.full((6, 6), 0.1)
+    similarity[np.ix_([0, 1, 2], [0, 1, 2])] = 0.9
+    similarity[np.ix_([3, 4], [3, 4])] = 0.8
+    similarity[0, 2] = similarity[2, 0] = 0.7
+    np.fill_diagonal(similarity, 1.0)
+    return similarity
+
+
+def test_chunks_are_filled_largest_first():
+    clusters = [[0, 1], [2, 3, 4, 5, 6], [7, 8, 9], [10, 11]]
+    assert chunk_clusters(clusters, max_articles=5) == [[1], [2, 0], [3]]
+    assert chunk_clusters([], max_articles=5) == []
+
+
+def test_representative_is_most_similar_to_the_rest():
+    assert representative_index([2, 0, 1], _similarity()) == 1
+    assert representative_index([2, 0, 1], sparse.csr_matrix(_similarity())) == 1
+
+
+class _IndexRecorder(np.ndarray):
+    """记录每次索引得到的子数组形状。"""
+    shapes = []
+
+    def __getitem__(self, key):
+        result = super().__getitem__(key)
+        _IndexRecorder.shapes.append(np.shape(result))
+        return result
+
+
+def test_dense_representative_only_extracts_the_cluster_block():
+    _IndexRecorder.shapes = []
+    similarity = _similarity().view(_IndexRecorder)
+    assert representative_index([2, 0, 1], similarity) == 1
+    assert _IndexRecorder.shapes == [(3, 3)]  # 没有先复制 3 个整行 (3×6)
+
+
+@pytest.mark.parametrize("as_sparse", [False, True])
+def test_memory_mapped_similarity_gives_same_results(tmp_path, as_sparse):
+    similarity = sparse.csr_matrix(_similarity()) if as_sparse else _similarity()
+    shared = SharedSimilarity.dump(similarity, str(tmp_path))
+    loaded = shared.load()
+    values = loaded.data if as_sparse else loaded
+    assert not values.flags.owndata and not values.flags.writeable  # 只读映射的视图，没有复制
+
+    chunk = [[0, 1, 2, 3, 4, 5], [3, 4]]
+    expected = fine_cluster_chunk(similarity, chunk, eps=0.5, min_samples=2)
+    results = fine_cluster_chunk(shared, chunk, eps=0.5, min_samples=2)
+    assert [result[:2] for result in results] == [result[:2] for result in expected]
+    assert results[0][:2] == ([0, 0, 0, 1, 1, -1], {0: 1, 1: 3})
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.headless_refresh import HeadlessRefreshWorker, collect_runtime_metrics
+from src.storage.news_storage import NewsStorage
+
+
+@pytest.fixture
+def db_location(tmp_path):
+    data_dir, db_name = str(tmp_path), "headless_test.db"
+    storage = NewsStorage(data_dir=data_dir, db_name=db_name)
+    storage.add_news_source({'name': 'a', 'type': 'rss', 'url': 'https://a.example.com/feed', 'category_name': 'tech'})
+    storage.add_news_source({'name': 'b', 'type': 'rss', 'url': 'https://b.example.com/feed'})
+    storage.add_news_source({'name': 'off', 'type': 'rss', 'url': 'https://off.example.com/feed', 'is_enabled': False})
+    storage.close()
+    return data_dir, db_name
+
+
+def _make_factory():
+    def get_collector(source_type):
+        collector = MagicMock()
+        collector.collect.side_effect = lambda source, **kwargs: [
+            {'title': f'{source.name} 1', 'link': f'https://{source.name}/1', 'pub_date': '2024-01-02 09:30:00'},
+        ]
+        return collector
+
+    factory = MagicMock()
+    factory.get_collector.side_effect = get_collector
+    return factory
+
+
+def test_run_once_refreshes_enabled_sources(db_location):
+    data_dir, db_name = db_location
+    worker = HeadlessRefreshWorker(data_dir=data_dir, db_name=db_name, collector_factory=_make_factory())
+
+    summary = worker.run_once()
+
+    assert summary['sources'] == 2
+    assert summary['stored'] == 2
+    assert worker.progress.snapshot()['finished'] is True
+    storage = NewsStorage(data_dir=data_dir, db_name=db_name)
+    rows = storage.get_articles_by_links(['https://a/1', 'https://b/1', 'https://off/1'])
+    storage.close()
+    assert sorted(row['link'] for row in rows) == ['https://a/1', 'https://b/1']
+
+
+def test_source_filter(db_location):
+    data_dir, db_name = db_location
+    worker = HeadlessRefreshWorker(data_dir=data_dir, db_name=db_name,
+                                   collector_factory=_make_factory(), source_names=['b', 'missing'])
+
+    assert [source.name for source in worker.load_sources()] == ['b']
+    assert worker.run_once()['stored'] == 1
+
+
+def test_runtime_metrics_shape():
+    metrics = collect_runtime_metrics(0.0)
+    assert metrics['startup_seconds'] > 0
+    assert set(metrics) == {'startup_seconds', 'peak_rss_mb', 'qt_loaded'}
+
+
+def test_headless_import_chain_does_not_load_qt():
+    code = (
+        "import sys\n"
+        "import src.core.headless_refresh, src.collectors\n"
+        "assert not any(m.startswith('PySide6') for m in sys.modules), 'PySide6 was imported'\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    assert result.returncode == 0, result.stderr
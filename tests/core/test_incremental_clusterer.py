@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.incremental_clusterer import (EventClusteringWorker, IncrementalEventClusterer, cluster_terms)
+from src.storage.event_cluster_store import EventClusterStore
+from src.storage.news_storage import NewsStorage
+
+BASE = datetime(2024, 3, 1, 8, tzinfo=timezone.utc)
+
+# (标题, 正文, 事件编号, 相对 BASE 的小时数)
+ARTICLES = [
+    ("Apple unveils iPhone 16 with faster chip", "Apple unveiled the iPhone 16 at its September event in Cupertino.", 0, 0),
+    ("Fed holds interest rates steady as inflation cools", "The Federal Reserve kept interest rates unchanged.", 1, 1),
+    ("Apple iPhone 16 launch: faster chip and new camera", "Apple iPhone 16 launch event featured a faster chip.", 0, 2),
+    ("台风海葵登陆福建沿海", "台风海葵今晨登陆福建沿海，多地停课停运。", 2, 3),
+    ("Fed keeps interest rates steady, inflation cools", "Interest rates held steady by the Fed as inflation cools.", 1, 4),
+    ("台风海葵登陆福建 多地停课", "受台风海葵影响，福建沿海多地停课停运。", 2, 5),
+]
+
+
+def _news(index, hours_offset=0):
+    title, content, _, hours = ARTICLES[index]
+    return {'id': index + 1, 'title': title, 'content': content, 'source_name': f"来源{index}",
+            'link': f"https://example.com/{index}", 'publish_time': BASE + timedelta(hours=hours + hours_offset)}
+
+
+def _groups(clusterer):
+    by_event = {}
+    for article_id, article in clusterer.assignments.items():
+        by_event.setdefault(article.event_id, []).append(article_id)
+    return sorted(sorted(ids) for ids in by_event.values())
+
+
+EXPECTED_GROUPS = [[1, 3], [2, 5], [4, 6]]
+
+
+def test_cluster_terms_split_english_words_and_chinese_bigrams():
+    assert cluster_terms("The Fed holds rates, a 2024 vote") == ["fed", "holds", "rates", "2024", "vote"]
+    assert cluster_terms("台风登陆") == ["台风", "风登", "登陆"]
+    assert cluster_terms(None) == []
+
+
+def test_articles_join_similar_events_and_skip_known_ids():
+    clusterer = IncrementalEventClusterer()
+
+    stats = clusterer.add_articles([_news(i) for i in range(len(ARTICLES))])
+    assert stats == {'assigned': 3, 'created': 3, 'skipped': 0}
+    assert _groups(clusterer) == EXPECTED_GROUPS
+    # 每篇文章只与倒排索引中的候选事件比较
+    assert clusterer.candidates_scored <= len(ARTICLES)
+
+    assert clusterer.add_articles([_news(0), {'title': "无 ID"}]) == {'assigned': 0, 'created': 0, 'skipped': 2}
+
+    events = clusterer.event_dicts()
+    assert [len(event['reports']) for event in events] == [2, 2, 2]
+    report = events[0]['reports'][0]
+    assert set(report) == {'id', 'title', 'source_name', 'link', 'publish_time'}
+    assert report['publish_time'].tzinfo is not None
+
+
+def test_articles_outside_time_window_start_new_event():
+    clusterer = IncrementalEventClusterer(window_days=1)
+    clusterer.add_articles([_news(0)])
+    late = dict(_news(2, hours_offset=72), id=99)
+
+    assert clusterer.add_articles([late]) == {'assigned': 0, 'created': 1, 'skipped': 0}
+
+
+def test_state_is_restored_from_store(tmp_path):
+    store = EventClusterStore(str(tmp_path))
+    clusterer = IncrementalEventClusterer(store=store, categorize=lambda news: 'technology')
+    clusterer.add_articles([_news(i) for i in range(4)])
+    store.close()
+
+    restored = IncrementalEventClusterer(store=EventClusterStore(str(tmp_path)))
+    assert restored.event_dicts() == clusterer.event_dicts()
+    assert restored.doc_count == 4
+
+    # 恢复后新文章继续并入已有事件
+    assert restored.add_articles([_news(4), _news(5)]) == {'assigned': 2, 'created': 0, 'skipped': 0}
+    assert _groups(restored) == EXPECTED_GROUPS
+
+
+def test_consolidate_merges_split_events_and_archives_old_ones():
+    clusterer = IncrementalEventClusterer(similarity_threshold=0.99, merge_threshold=0.3, window_days=1)
+    clusterer.add_articles([_news(i) for i in range(len(ARTICLES))])
+    assert len(clusterer.events) == len(ARTICLES)
+
+    stats = clusterer.consolidate()
+    assert stats['merged'] == 3 and _groups(clusterer) == EXPECTED_GROUPS
+
+    clusterer.add_articles([dict(_news(0, hours_offset=24 * 5), id=100)])
+    stats = clusterer.consolidate()
+    assert stats == {'merged': 0, 'archived': 3, 'active': 1}
+
+
+def test_removed_articles_leave_their_events(tmp_path):
+    clusterer = IncrementalEventClusterer(store=EventClusterStore(str(tmp_path)))
+    clusterer.add_articles([_news(i) for i in range(len(ARTICLES))])
+
+    clusterer.remove_articles([1, 3, 2, 12345])
+    assert _groups(clusterer) == [[4, 6], [5]]
+
+    restored = IncrementalEventClusterer(store=EventClusterStore(str(tmp_path)))
+    assert _groups(restored) == [[4, 6], [5]]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = NewsStorage(data_dir=str(tmp_path), db_name="events.db")
+    storage.upsert_articles_batch([dict(_news(i), publish_time=_news(i)['publish_time'].isoformat(), id=None)
+                                   for i in range(len(ARTICLES))])
+    yield storage
+    storage.close()
+
+
+def test_worker_clusters_only_unassigned_articles(storage, qtbot):
+    clusterer = IncrementalEventClusterer(store=EventClusterStore(storage.data_dir))
+    worker = EventClusteringWorker(storage, clusterer)
+    with qtbot.waitSignal(worker.signals.finished, timeout=5000) as blocker:
+        worker.run()
+    events, stats = blocker.args
+    assert stats['assigned'] + stats['created'] == len(ARTICLES)
+    assert sorted(len(event['reports']) for event in events) == [2, 2, 2]
+
+    worker = EventClusteringWorker(storage, clusterer)
+    with qtbot.waitSignal(worker.signals.finished, timeout=5000) as blocker:
+        worker.run()
+    assert blocker.args[1] == {'assigned': 0, 'created': 0, 'skipped': 0}
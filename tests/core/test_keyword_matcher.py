@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.core.keyword_matcher import TITLE_WEIGHT, KeywordMatcher, keyword_matcher
+from src.core.news_clusterer import NewsClusterer
+from src.core.news_data_processor import TITLE_TOPIC_KEYWORDS
+
+
+def naive_categorize(category_keywords, title, content, default):
+    """原来的规则: 逐个类别、逐个关键词在拼接后的小写文本中查找。"""
+    title, content = title or '', content or ''
+    text = (title + " " + content).lower()
+    matched = []
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in text:
+                matched.append((category, keyword))
+                break
+    for category, keyword in matched:
+        if keyword.lower() in title.lower():
+            return category
+    return matched[0][0] if matched else default
+
+
+def random_text(rng, keywords, length):
+    filler = "的了在是和有新闻报道今日表示据悉 abcxyz"
+    pieces = []
+    while sum(map(len, pieces)) < length:
+        pieces.append(rng.choice(keywords) if rng.random() < 0.15 else rng.choice(filler))
+    return "".join(pieces)
+
+
+@pytest.mark.parametrize("category_keywords", [
+    NewsClusterer().category_keywords,
+    EnhancedNewsClusterer().category_keywords,
+    TITLE_TOPIC_KEYWORDS,
+], ids=["news_clusterer", "enhanced", "title_topics"])
+def test_categorize_matches_naive_rule(category_keywords):
+    # 不含空格的关键词：拼接文本中不会跨越标题和正文
+    keywords = [keyword for words in category_keywords.values() for keyword in words if ' ' not in keyword]
+    matcher = KeywordMatcher(category_keywords)
+    rng = random.Random(0)
+    for _ in range(2000):
+        title, content = random_text(rng, keywords, 12), random_text(rng, keywords, 80)
+        if rng.random() < 0.3:
+            title = title.upper()
+        assert matcher.categorize(title, content, 'none') == naive_categorize(category_keywords, title, content, 'none')
+
+
+def test_overlapping_and_prefix_keywords_are_all_found():
+    matcher = KeywordMatcher({'economy': ['经济增长', '经济'], 'growth': ['增长率'], 'ai': ['ai'], 'say': ['said']})
+    in_title, in_body = matcher.find('经济增长率', 'He SAID so')
+    assert in_title == {'经济增长': [0], '经济': [0], '增长率': [2]}
+    assert in_body == {'said': [3], 'ai': [4]}
+
+
+def test_scan_reports_positions_and_weighted_score():
+    matcher = KeywordMatcher({'tech': ['chip', 'ai'], 'sports': ['match']})
+    hits = matcher.scan('AI chip', 'chip makers. chip match')
+    assert list(hits) == ['tech', 'sports']
+    tech = hits['tech']
+    assert [(hit.keyword, hit.title_positions, hit.body_positions) for hit in tech.hits] == \
+        [('chip', [3], [0, 13]), ('ai', [0], [])]
+    assert tech.in_title and not hits['sports'].in_title
+    assert tech.score == TITLE_WEIGHT * 2 + 2
+    assert hits['sports'].score == 1
+
+
+def test_title_hit_takes_priority_over_earlier_category():
+    matcher = KeywordMatcher({'politics': ['政府'], 'military': ['军事']})
+    assert matcher.categorize('军事演习', '政府表示') == 'military'
+    assert matcher.categorize('今日新闻', '政府表示，军事演习') == 'politics'
+    assert matcher.categorize(None, None, default='general') == 'general'
+
+
+def test_enhanced_culture_keywords_take_priority():
+    clusterer = EnhancedNewsClusterer()
+    assert clusterer._categorize_news({'title': '政府会议', 'content': '教皇出席'}) == 'culture'
+    assert clusterer._categorize_news({'title': '', 'content': ''}) == 'general'
+
+
+def test_matcher_is_cached_per_keyword_table():
+    table = {'tech': ['chip']}
+    assert keyword_matcher(table) is keyword_matcher({'tech': ['chip']})
+    table['tech'].append('ai')
+    assert keyword_matcher(table).categorize('ai', '') == 'tech'
@@ -0,0 +1,105 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.news_query_index import NewsQueryIndex, publish_time_epoch_us
+from src.models import NewsArticle, NewsListRow
+
+CATEGORIES = ["科技", "财经", "体育", None]
+WORDS = ["Alpha", "beta", "人工智能", "市场", "Gamma", "比赛"]
+
+
+def _articles(count, seed=7):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    articles = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            publish_time = None
+        elif roll < 0.1:
+            publish_time = (base + timedelta(hours=rng.randint(0, 500))).replace(tzinfo=None)  # naive
+        else:
+            publish_time = base + timedelta(hours=rng.randint(0, 500))
+        articles.append(NewsArticle(
+            title=" ".join(rng.sample(WORDS, 2)), link=f"link{i}", source_name="源",
+            content=None if rng.random() < 0.1 else " ".join(rng.sample(WORDS, 3)),
+            category=rng.choice(CATEGORIES), publish_time=publish_time,
+        ))
+    return articles
+
+
+def _brute_force(articles, category, term, fields, date_bounds, time_order):
+    def keep(article):
+        if category is not None and article.category != category:
+            return False
+        if term and not any(term in str(getattr(article, f)).lower() for f in fields if getattr(article, f) is not None):
+            return False
+        if date_bounds is not None:
+            if not isinstance(article.publish_time, datetime):
+                return False
+            value = article.publish_time if article.publish_time.tzinfo else article.publish_time.replace(tzinfo=timezone.utc)
+            if not date_bounds[0] <= value <= date_bounds[1]:
+                return False
+        return True
+
+    positions = [i for i, article in enumerate(articles) if keep(article)]
+    if time_order:
+        positions.sort(key=lambda i: publish_time_epoch_us(articles[i].publish_time), reverse=(time_order == 'desc'))
+    return positions
+
+
+@pytest.mark.parametrize("category", [None, "科技"])
+@pytest.mark.parametrize("term,fields", [("", ()), ("alpha", ("title",)), ("市场", ("title", "content"))])
+@pytest.mark.parametrize("with_dates", [False, True])
+@pytest.mark.parametrize("time_order", [None, "asc", "desc"])
+def test_query_matches_linear_filter_and_stable_sort(category, term, fields, with_dates, time_order):
+    articles = _articles(500)
+    index = NewsQueryIndex()
+    index.ensure_built(articles)
+    date_bounds = None
+    if with_dates:
+        date_bounds = (datetime(2024, 1, 5, tzinfo=timezone.utc), datetime(2024, 1, 12, tzinfo=timezone.utc))
+
+    result = index.query(category=category, term=term, fields=fields, date_bounds=date_bounds, time_order=time_order)
+
+    assert result == _brute_force(articles, category, term, fields, date_bounds, time_order)
+
+
+def test_rebuild_after_in_place_change_reuses_unchanged_articles():
+    articles = _articles(50)
+    index = NewsQueryIndex()
+    index.ensure_built(articles)
+    assert index.search("alpha", ["title"])
+    record = index._derived[id(articles[0])]
+
+    articles.append(NewsArticle(title="独一无二", link="new", source_name="源", category="科技"))
+    index.mark_dirty()
+    index.ensure_built(articles)
+
+    assert index._derived[id(articles[0])] is record
+    assert index.query(term="独一无二", fields=["title"]) == [50]
+
+
+def test_list_rows_use_stored_search_for_missing_fields():
+    articles = _articles(200)
+    for i, article in enumerate(articles):
+        article.id = i
+    rows = [NewsListRow.from_article(article) for article in articles]
+    stored_calls = []
+
+    def stored_search(term, fields):
+        stored_calls.append((term, fields))
+        return {a.id for a in articles if any(getattr(a, f) and term in getattr(a, f).lower() for f in fields)}
+
+    index = NewsQueryIndex(stored_search=stored_search)
+    index.ensure_built(rows)
+    date_bounds = (datetime(2024, 1, 5, tzinfo=timezone.utc), datetime(2024, 1, 12, tzinfo=timezone.utc))
+    for criteria in ({'term': "市场", 'fields': ("title", "content"), 'time_order': 'desc'},
+                     {'term': "alpha", 'fields': ("content",), 'category': "科技", 'date_bounds': date_bounds}):
+        expected = _brute_force(articles, criteria.get('category'), criteria['term'], criteria['fields'],
+                                criteria.get('date_bounds'), criteria.get('time_order'))
+        assert index.query(**criteria) == expected
+    # 只有列表行不携带的字段交给 stored_search
+    assert stored_calls == [("市场", ("content",)), ("alpha", ("content",))]
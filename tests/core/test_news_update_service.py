@@ -49,4 +49,29 @@ def test_cancel_refresh_no_op(mock_dependencies):
     try:
         service.cancel_refresh()
     except Exception as e:
-        pytest.fail(f"cancel_refresh 未刷新时抛异常: {e}") 
\ No newline at end of file
+        pytest.fail(f"cancel_refresh 未刷新时抛异常: {e}") 
+
+def test_progress_snapshots_are_coalesced(mock_dependencies, qtbot):
+    """
+    测试多次计数器更新在一个发布周期内只产生一次快照信号。
+    """
+    service = NewsUpdateService(**mock_dependencies)
+    source_a, source_b = MagicMock(), MagicMock()
+    source_a.name, source_b.name = 'a', 'b'
+    snapshots = []
+    service.progress_snapshot.connect(snapshots.append)
+
+    service._start_progress(service.refresh_progress, [source_a, source_b], 'refresh')
+    for i in range(100):
+        service.refresh_progress.source('a').update(i, 100)
+    service.refresh_progress.mark_finished('a', 100)
+    service._publish_progress()
+    service._publish_progress()  # 没有新变化，不应再次发射
+
+    assert len(snapshots) == 1
+    assert snapshots[0]['finished_sources'] == 1
+    assert snapshots[0]['items_done'] == 100
+
+    service._on_refresh_finished_for_progress(True, "done")
+    assert snapshots[-1]['finished'] is True
+    assert not service._progress_timer.isActive()
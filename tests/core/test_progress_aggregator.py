@@ -0,0 +1,73 @@
+import pytest
+
+from src.core.progress_aggregator import ProgressAggregator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_snapshot_totals_and_eta(clock):
+    aggregator = ProgressAggregator(clock=clock)
+    aggregator.start(['a', 'b', 'c', 'd'], 'refresh')
+
+    aggregator.mark_started('a')
+    aggregator.source('a').update(5, 10)
+    clock.now += 2
+    aggregator.mark_finished('a', 10)
+    aggregator.mark_started('b')
+    aggregator.source('b').update(3, 20)
+
+    snapshot = aggregator.snapshot()
+    assert snapshot['kind'] == 'refresh'
+    assert snapshot['total_sources'] == 4
+    assert snapshot['finished_sources'] == 1
+    assert snapshot['running_sources'] == 1
+    assert snapshot['items_done'] == 13
+    assert snapshot['percent'] == 25
+    assert snapshot['eta_seconds'] == 6.0  # 2 秒完成 1 个源，剩余 3 个
+    assert snapshot['last_finished'] == 'a'
+    assert snapshot['sources']['b'] == {'state': 'running', 'items_done': 3, 'items_total': 20, 'error': None}
+
+
+def test_failed_sources_and_finish(clock):
+    aggregator = ProgressAggregator(clock=clock)
+    aggregator.start(['a', 'b'], 'status_check')
+    aggregator.mark_finished('a', error='timeout')
+
+    assert aggregator.is_active
+    aggregator.finish()
+
+    snapshot = aggregator.snapshot()
+    assert snapshot['failed_sources'] == 1
+    assert snapshot['finished'] is True
+    assert snapshot['eta_seconds'] == 0.0
+    assert not aggregator.is_active
+
+
+def test_item_counters_do_not_bump_version(clock):
+    aggregator = ProgressAggregator(clock=clock)
+    aggregator.start(['a'])
+    version = aggregator.version
+
+    aggregator.source('a').update(1, 2)
+    assert aggregator.version == version
+
+    aggregator.mark_started('a')
+    assert aggregator.version > version
+
+
+def test_finish_without_start_is_ignored(clock):
+    aggregator = ProgressAggregator(clock=clock)
+    aggregator.finish()
+    assert aggregator.version == 0
+    assert not aggregator.is_active
@@ -0,0 +1,236 @@
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.collectors.parser_pool import ParserPool
+from src.models import NewsSource
+from src.storage.news_storage import NewsStorage
+from src.core.refresh_pipeline import RefreshPipeline
+
+
+def _make_source(name, category="technology"):
+    return NewsSource(name=name, type="rss", url=f"https://{name}.example.com/feed", category=category)
+
+
+def _make_factory(items_by_source, fail_sources=()):
+    def get_collector(source_type):
+        collector = MagicMock()
+
+        def collect(source, **kwargs):
+            if source.name in fail_sources:
+                raise RuntimeError("boom")
+            return [dict(item) for item in items_by_source.get(source.name, [])]
+
+        collector.collect.side_effect = collect
+        return collector
+
+    factory = MagicMock()
+    factory.get_collector.side_effect = get_collector
+    return factory
+
+
+@pytest.fixture
+def db_location(tmp_path):
+    return str(tmp_path), "pipeline_test.db"
+
+
+def _storage_factory(db_location):
+    data_dir, db_name = db_location
+    return lambda: NewsStorage(data_dir=data_dir, db_name=db_name)
+
+
+def test_pipeline_stores_all_sources_in_batches(db_location):
+    items = {
+        "a": [
+            {'title': 'A1', 'link': 'https://a/1', 'publish_time': datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)},
+            {'title': 'A2', 'link': 'https://a/2', 'pub_date': '2024-01-02 09:30:00'},
+        ],
+        "b": [
+            {'title': 'B1', 'link': 'https://b/1', 'publish_time': '2024-01-03T10:00:00+08:00'},
+            {'title': 'shared', 'link': 'https://a/1'},  # 与 a 源重复的链接
+            {'title': 'no link', 'link': None},
+        ],
+    }
+    stored_batches = []
+    done_sources = []
+    pipeline = RefreshPipeline(
+        collector_factory=_make_factory(items),
+        storage_factory=_storage_factory(db_location),
+        batch_window=5.0,
+        on_source_done=lambda source, count, error: done_sources.append((source.name, count, error)),
+        on_batch_stored=stored_batches.append,
+    )
+
+    summary = pipeline.run([_make_source("a"), _make_source("b")])
+
+    assert summary['collected'] == 5
+    assert summary['stored'] == 3
+    assert summary['batches'] == 1  # 两个源合并为一次事务
+    assert sorted(done_sources) == [("a", 2, None), ("b", 3, None)]
+    assert sorted(stored_batches[0]) == ['https://a/1', 'https://a/2', 'https://b/1']
+
+    storage = _storage_factory(db_location)()
+    rows = {row['link']: row for row in storage.get_articles_by_links(stored_batches[0])}
+    storage.close()
+    assert rows['https://a/2']['publish_time'] == datetime(2024, 1, 2, 9, 30, tzinfo=timezone.utc)
+    assert rows['https://b/1']['publish_time'] == datetime(2024, 1, 3, 2, 0, tzinfo=timezone.utc)
+    assert rows['https://a/1']['category_name'] == "technology"
+    assert rows['https://a/1']['source_url'] == "https://a.example.com/feed"
+
+
+def test_duplicate_link_keeps_earliest_source_even_when_it_arrives_last(db_location):
+    items = {
+        "a": [{'title': 'from a', 'link': 'https://a/1'}],
+        "b": [{'title': 'from b', 'link': 'https://a/1'}, {'title': 'B1', 'link': 'https://b/1'}],
+    }
+    b_stored = threading.Event()
+    factory = _make_factory(items)
+    collect_for = factory.get_collector.side_effect
+
+    def get_collector(source_type):
+        collector = collect_for(source_type)
+        collect = collector.collect.side_effect
+
+        def delayed(source, **kwargs):
+            if source.name == "a":
+                assert b_stored.wait(5)  # 让靠后的源 b 先写入
+            return collect(source, **kwargs)
+
+        collector.collect.side_effect = delayed
+        return collector
+
+    factory.get_collector.side_effect = get_collector
+    stored_batches = []
+
+    def on_batch_stored(links):
+        stored_batches.append(links)
+        b_stored.set()
+
+    pipeline = RefreshPipeline(collector_factory=factory, storage_factory=_storage_factory(db_location),
+                               batch_window=0.01, on_batch_stored=on_batch_stored)
+    summary = pipeline.run([_make_source("a"), _make_source("b")])
+
+    assert sorted(stored_batches[0]) == ['https://a/1', 'https://b/1']
+    assert stored_batches[1:] == [['https://a/1']]
+    assert summary['stored'] == 2
+    storage = _storage_factory(db_location)()
+    row = storage.get_articles_by_links(['https://a/1'])[0]
+    storage.close()
+    assert (row['title'], row['source_url']) == ("from a", "https://a.example.com/feed")
+
+
+class _PayloadCollector:
+    """配置了 ParserPool 的采集器替身：记录下载和解析分别在哪个线程执行。"""
+
+    def __init__(self, calls, fail_parse=()):
+        self.parser_pool = ParserPool(max_workers=1)  # 不会真正启动子进程
+        self.calls = calls
+        self.fail_parse = fail_parse
+
+    def collect(self, source, **kwargs):
+        raise AssertionError("配置了 ParserPool 时不应调用 collect")
+
+    def fetch_payload(self, source, cancel_checker=None):
+        self.calls.append(('fetch', source.name, threading.current_thread().name))
+        return f"{source.name}:1,{source.name}:2".encode()
+
+    def parse_payload(self, payload, source):
+        self.calls.append(('parse', source.name, threading.current_thread().name))
+        if source.name in self.fail_parse:
+            raise ValueError("bad feed")
+        return [{'title': key, 'link': f"https://{key.replace(':', '/')}", 'pub_date': '2024-01-01 08:00:00'}
+                for key in payload.decode().split(',')]
+
+
+def test_pipeline_parses_downloaded_payloads_in_parse_stage(db_location):
+    calls, done_sources, stored_batches = [], [], []
+    factory = MagicMock()
+    factory.get_collector.side_effect = lambda source_type: _PayloadCollector(calls, fail_parse=("bad",))
+    pipeline = RefreshPipeline(
+        collector_factory=factory,
+        storage_factory=_storage_factory(db_location),
+        batch_window=0.01,
+        on_source_done=lambda source, count, error: done_sources.append((source.name, count, error)),
+        on_batch_stored=stored_batches.append,
+    )
+
+    summary = pipeline.run([_make_source("a"), _make_source("bad")])
+
+    assert sorted((stage, name) for stage, name, _ in calls) == \
+        [('fetch', 'a'), ('fetch', 'bad'), ('parse', 'a'), ('parse', 'bad')]
+    assert all(thread.startswith(f"refresh-{stage}-") for stage, _, thread in calls)
+    assert sorted(done_sources) == [("a", 2, None), ("bad", 0, "ValueError: bad feed")]
+    assert summary['collected'] == 2 and summary['stored'] == 2
+    assert summary['stages']['parse']['items_out'] == 2
+    storage = _storage_factory(db_location)()
+    row = storage.get_articles_by_links(['https://a/1'])[0]
+    storage.close()
+    assert row['publish_time'] == datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def test_pipeline_flushes_when_batch_is_full(db_location):
+    items = {"a": [{'title': f'A{i}', 'link': f'https://a/{i}'} for i in range(5)]}
+    stored_batches = []
+    pipeline = RefreshPipeline(
+        collector_factory=_make_factory(items),
+        storage_factory=_storage_factory(db_location),
+        batch_window=5.0,
+        batch_max_items=2,
+        on_batch_stored=stored_batches.append,
+    )
+
+    summary = pipeline.run([_make_source("a")])
+
+    # 5 条全部来自同一个工作单元，达到上限后整块写入
+    assert summary['stored'] == 5
+    assert sum(len(batch) for batch in stored_batches) == 5
+
+
+def test_pipeline_reports_collector_errors(db_location):
+    done_sources = []
+    pipeline = RefreshPipeline(
+        collector_factory=_make_factory({"ok": [{'title': 'x', 'link': 'https://ok/1'}]}, fail_sources=("bad",)),
+        storage_factory=_storage_factory(db_location),
+        batch_window=0.01,
+        on_source_done=lambda source, count, error: done_sources.append((source.name, error)),
+    )
+
+    summary = pipeline.run([_make_source("ok"), _make_source("bad")])
+
+    assert summary['stored'] == 1
+    assert any(name == "bad" and "boom" in error for name, error in done_sources if error)
+    assert any(error.startswith("bad:") for error in summary['errors'])
+
+
+def test_pipeline_cancel_stops_storing(db_location):
+    cancel = threading.Event()
+    cancel.set()
+    stored_batches = []
+    pipeline = RefreshPipeline(
+        collector_factory=_make_factory({"a": [{'title': 'x', 'link': 'https://a/1'}]}),
+        storage_factory=_storage_factory(db_location),
+        cancel_checker=cancel.is_set,
+        on_batch_stored=stored_batches.append,
+    )
+
+    summary = pipeline.run([_make_source("a")])
+
+    assert summary['cancelled'] is True
+    assert summary['stored'] == 0
+    assert stored_batches == []
+
+
+def test_pipeline_metrics_cover_every_stage(db_location):
+    pipeline = RefreshPipeline(
+        collector_factory=_make_factory({"a": [{'title': 'x', 'link': 'https://a/1'}]}),
+        storage_factory=_storage_factory(db_location),
+        batch_window=0.01,
+    )
+
+    summary = pipeline.run([_make_source("a")])
+
+    assert list(summary['stages']) == ['fetch', 'parse', 'normalize', 'dedupe', 'store']
+    assert summary['stages']['fetch']['items_out'] == 1 and summary['collected'] == 1
+    assert summary['stages']['store']['items_out'] == 1
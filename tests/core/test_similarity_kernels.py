@@ -0,0 +1,108 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.core.enhanced_news_clusterer import EnhancedNewsClusterer
+from src.core.similarity_kernels import (cosine_similarity_matrix, epoch_seconds, gaussian_time_similarity,
+                                         jaccard_similarity_matrix)
+from src.core.text_tokenizer import tokenize
+
+
+def _pairwise(items, similarity):
+    """逐对计算的参考实现 (旧代码的做法)"""
+    n = len(items)
+    matrix = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            matrix[i, j] = 1.0 if i == j else similarity(items[i], items[j])
+    return matrix
+
+
+def test_time_kernel_matches_pairwise_gaussian_decay():
+    base = datetime(2024, 3, 1, 8, 0)
+    times = [base + timedelta(hours=h * 7.5, microseconds=h) for h in range(12)]
+    window = 3
+
+    expected = _pairwise(times, lambda a, b: math.exp(-(abs((a - b).total_seconds()) / 86400) ** 2 / (2 * window ** 2)))
+    np.testing.assert_allclose(gaussian_time_similarity(epoch_seconds(times), window), expected, rtol=1e-12)
+
+    aware = [t.replace(tzinfo=timezone(timedelta(hours=8))) for t in times]
+    np.testing.assert_allclose(gaussian_time_similarity(epoch_seconds(aware), window), expected, rtol=1e-12)
+
+
+def test_cosine_kernel_matches_pairwise_and_handles_zero_rows():
+    rng = np.random.default_rng(0)
+    vectors = rng.dirichlet(np.ones(5), size=8)
+    vectors[3] = 0
+
+    def cosine(a, b):
+        norm = np.linalg.norm(a) * np.linalg.norm(b)
+        return float(a @ b / norm) if norm else 0.0
+
+    np.testing.assert_allclose(cosine_similarity_matrix(vectors), _pairwise(list(vectors), cosine), atol=1e-12)
+
+
+def test_jaccard_kernel_matches_pairwise_sets():
+    token_sets = [["北京", "上海", "北京"], ["上海", "广州"], [], ["深圳"], ["北京", "上海", "广州", "深圳"], [""]]
+
+    def jaccard(a, b):
+        union = len(set(a) | set(b))
+        return len(set(a) & set(b)) / union if union else 0.0
+
+    np.testing.assert_allclose(jaccard_similarity_matrix(token_sets), _pairwise(token_sets, jaccard))
+    assert jaccard_similarity_matrix([]).shape == (0, 0)
+
+
+@pytest.mark.parametrize("title, content", [
+    ("华为发布新款芯片 2024", "华为今天在深圳发布了新款芯片，性能提升 30%。"),
+    ("Apple unveils new iPhone", "Apple CEO Tim Cook said the iPhone 16 ships in 2024."),
+])
+def test_simple_entities_use_capitalized_words_and_tokenizer_terms(title, content):
+    news = {'clean_title': title, 'clean_content': content}
+    if any(c.isascii() and c.isalpha() for c in title + content):
+        expected = {w for w in (title.split() + content.split()) if w[0].isupper()}
+    else:
+        expected = {token for token in tokenize(f"{title} {content}") if token[0] >= '㐀'}
+        assert {"华为", "芯片", "深圳"} <= expected
+    expected |= {"2024", "30"} if "30" in content else {"16", "2024"}
+    assert EnhancedNewsClusterer._simple_entities(news) == expected
+
+
+def test_jaccard_kernel_blocks_match_single_pass():
+    rng = np.random.default_rng(1)
+    token_sets = [[f"t{k}" for k in rng.integers(0, 30, size=rng.integers(0, 8))] for _ in range(25)]
+    np.testing.assert_array_equal(jaccard_similarity_matrix(token_sets, block_size=4),
+                                  jaccard_similarity_matrix(token_sets))
+
+
+def test_top_k_neighbours_and_paired_kernels_match_dense_matrices():
+    from scipy import sparse
+    from src.core.similarity_kernels import (cosine_rows, incidence_matrix, jaccard_rows, paired_cosine,
+                                             paired_gaussian_time, paired_jaccard, top_k_neighbours, unique_pairs)
+    rng = np.random.default_rng(2)
+    vectors = rng.random((30, 6))
+    vectors /= np.linalg.norm(vectors, axis=1)[:, None]
+    dense = cosine_similarity_matrix(vectors)
+
+    sources, targets = top_k_neighbours(cosine_rows(vectors), 30, 4, block_size=7)
+    for i in range(30):
+        expected = set(np.argsort(-np.where(np.arange(30) == i, -np.inf, dense[i]))[:4])
+        assert set(targets[sources == i]) == expected
+
+    left, right = unique_pairs(sources, targets, 30)
+    assert np.all(left < right) and len(set(zip(left, right))) == len(left)
+    np.testing.assert_allclose(paired_cosine(vectors, left, right), dense[left, right])
+    np.testing.assert_allclose(paired_cosine(sparse.csr_matrix(vectors), left, right), dense[left, right])
+
+    token_sets = [[f"t{k}" for k in rng.integers(0, 40, size=rng.integers(0, 6))] for _ in range(30)]
+    jaccard = jaccard_similarity_matrix(token_sets)
+    incidence = incidence_matrix(token_sets)
+    np.testing.assert_allclose(paired_jaccard(incidence, left, right), jaccard[left, right])
+    sources, targets = top_k_neighbours(jaccard_rows(incidence), 30, 3)
+    assert np.all(jaccard[sources, targets] > 0)  # 没有交集的新闻不作为近邻
+
+    seconds = rng.random(30) * 86400 * 10
+    np.testing.assert_allclose(paired_gaussian_time(seconds, left, right, 3),
+                               gaussian_time_similarity(seconds, 3)[left, right])
@@ -191,6 +191,35 @@ def test_get_source_by_name(source_manager, mock_storage):
     assert notfound is None
 
 
+def test_lookup_is_cached_until_sources_change(source_manager, mock_storage):
+    """
+    测试查找表在新闻源未变化时复用，增删改 (包括改名和改分类) 后重建。
+    """
+    mock_storage.add_news_source.side_effect = [1, 2]
+    source_manager.add_source(NewsSource(name='源A', type='rss', url='http://a.com', category='technology'))
+    source_manager.add_source(NewsSource(name='源B', type='rss', url='http://b.com', category='no_such_category'))
+
+    lookup = source_manager.get_lookup()
+    assert source_manager.get_lookup() is lookup
+    assert lookup.by_id[2].name == '源B'
+    assert lookup.source_categories == {'源A': '科技新闻', '源B': '未分类'}
+    assert (lookup.category_id_for('源A'), lookup.category_id_for('不存在')) == ('technology', 'uncategorized')
+
+    # 只更新状态不影响查找表
+    source_manager.update_source_status_in_cache(1, 'ok', None, datetime.now(timezone.utc))
+    assert source_manager.get_lookup() is lookup
+
+    version = source_manager.lookup_version
+    source_manager.update_source('源A', {'name': '源C', 'category': 'business'})
+    assert source_manager.lookup_version > version
+    assert source_manager.get_source_by_name('源A') is None
+    assert source_manager.get_lookup().source_categories['源C'] == '商业金融'
+
+    source_manager.remove_source('源B')
+    assert source_manager.get_source_by_id(2) is None
+    assert list(source_manager.get_lookup().by_name) == ['源C']
+
+
 def test_update_nonexistent_source(source_manager, mock_storage):
     """
     测试更新不存在的新闻源不抛异常，且不调用 storage.update_news_source。
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from src.core import text_tokenizer
+from src.core.news_clusterer import NewsClusterer
+from src.core.text_tokenizer import (hashing_vectorizer, keywords, most_frequent_columns, resolve_segmenter,
+                                     tfidf_from_counts, tokenize)
+
+
+def test_english_words_drop_stopwords_and_single_characters():
+    assert tokenize("The Fed says it will hold rates at 5.5% in 2024", 'bigram') == ["fed", "hold", "rates", "2024"]
+    assert tokenize(None, 'bigram') == []
+
+
+def test_chinese_bigrams_skip_stopwords_and_particles():
+    assert tokenize("台风登陆", 'bigram') == ["台风", "风登", "登陆"]
+    # "的" 处断开，不产生 "国的"、"的经"；"我们" 是停用词
+    assert tokenize("我们中国的经济", 'bigram') == ["们中", "中国", "经济"]
+    assert tokenize("华为发布Mate 70手机", 'bigram') == ["华为", "为发", "发布", "mate", "70", "手机"]
+
+
+def test_jieba_segmenter_is_used_when_available():
+    lcut = MagicMock(side_effect=lambda text: ["台风", "在", "福建", "登陆"])
+    with patch.object(text_tokenizer, 'jieba_lcut', lcut):
+        assert tokenize("台风在福建登陆", 'jieba') == ["台风", "福建", "登陆"]
+
+        resolve_segmenter.cache_clear()
+        try:
+            lcut.available.return_value = False
+            assert resolve_segmenter('auto') == 'bigram'
+            resolve_segmenter.cache_clear()
+            lcut.available.return_value = True
+            assert resolve_segmenter('auto') == 'jieba'
+        finally:
+            resolve_segmenter.cache_clear()
+    with pytest.raises(ValueError):
+        resolve_segmenter('thulac')
+
+
+def test_keywords_are_unique_and_limited():
+    assert keywords("Apple Apple unveils iPhone at Apple event in Cupertino today", segmenter='bigram') == \
+        ["apple", "unveils", "iphone", "event", "cupertino"]
+
+
+def test_chinese_sentences_share_terms_after_hashing():
+    counts = hashing_vectorizer(segmenter='bigram').transform(["台风海葵登陆福建沿海", "台风海葵今晨登陆福建", "央行宣布下调利率"])
+    assert counts.shape == (3, text_tokenizer.HASHING_FEATURES)
+    tfidf = tfidf_from_counts(counts)
+    similarity = (tfidf @ tfidf.T).toarray()
+    assert similarity[0, 1] > 0.5 and similarity[0, 2] == 0
+    assert np.allclose(similarity.diagonal(), 1.0)
+
+
+def test_most_frequent_columns_keeps_top_terms():
+    counts = sparse.csr_matrix(np.array([[3, 0, 1, 0], [1, 0, 1, 2], [0, 0, 1, 0]], dtype=float))
+    assert most_frequent_columns(counts, 2).toarray().tolist() == [[3, 1], [1, 1], [0, 1]]
+    assert most_frequent_columns(counts, 10).shape == (3, 3)  # 全为 0 的列不保留
+
+
+def test_news_clusterer_groups_unspaced_chinese_reports():
+    news_list = [
+        {'title': "台风海葵登陆福建沿海", 'content': "台风海葵今晨登陆福建沿海，多地停课停运。", 'source_name': "新华网"},
+        {'title': "台风海葵今晨登陆福建", 'content': "受台风海葵影响，福建沿海多地停课停运。", 'source_name': "人民网"},
+        {'title': "央行宣布下调存款准备金率", 'content': "央行宣布下调金融机构存款准备金率。", 'source_name': "新华网"},
+    ]
+    events = NewsClusterer().cluster(news_list)
+    assert [sorted(report['source_name'] for report in event['reports']) for event in events] == [["人民网", "新华网"]]
+    assert "台风" in events[0]['keywords']
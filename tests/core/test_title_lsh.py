@@ -0,0 +1,106 @@
+import random
+import string
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.news_data_processor import NewsDataProcessor
+from src.core.title_lsh import TitleLSHIndex, title_shingles
+
+# 带标注的标题: (标题, 来源, 事件编号)，None 表示不与其他标题成组
+LABELLED_TITLES = [
+    ("Apple unveils new iPhone 16 with faster chip at September event", "Reuters", 0),
+    ("Fed holds interest rates steady as inflation cools", "Bloomberg", 1),
+    ("Apple unveils iPhone 16 with a faster chip at its September event", "BBC", 0),
+    ("Magnitude 6.8 earthquake strikes off the coast of Japan", "AP", 2),
+    ("Local bakery wins award for best sourdough bread", "Local News", None),
+    ("Federal Reserve holds interest rates steady as inflation cools again", "CNN", 1),
+    ("Strong magnitude 6.8 earthquake strikes off the coast of northern Japan", "Reuters", 2),
+    ("Tesla recalls 120000 vehicles over faulty seat belt warning", "CNBC", 3),
+    ("Scientists discover new species of frog in the Amazon rainforest", "Nature", None),
+    ("Tesla recalls 120000 vehicles in US over faulty seat belt warning", "AP", 3),
+    ("The Fed holds interest rates steady while inflation cools", "Reuters", 1),
+    ("Apple unveils new iPhone 16 with faster chip at September event", "Reuters", None),  # 同一来源的重复不入组
+    ("华为 发布 新款 折叠屏 手机 搭载 自研 麒麟 芯片", "新华网", 4),
+    ("台风 海葵 登陆 福建 沿海 多地 停课 停运", "人民网", 5),
+    ("华为 正式 发布 新款 折叠屏 手机 搭载 自研 麒麟 芯片", "澎湃新闻", 4),
+    ("台风 海葵 今晨 登陆 福建 沿海 多地 停课 停运", "新京报", 5),
+    ("上海 举办 国际 电影节 开幕式", "新华网", None),
+    ("华为新款折叠屏手机搭载自研麒麟芯片", "环球时报", None),  # 没有空格，按词比较时只有一个词
+    ("", "AP", None),
+]
+
+
+class ExhaustiveIndex:
+    """逐一比较的参考实现：每个标题的候选是其他所有标题。"""
+
+    def __init__(self, titles, **kwargs):
+        self.size = len(titles)
+        self.pair_count = self.size * (self.size - 1) // 2
+
+    def candidates(self, i):
+        return np.delete(np.arange(self.size), i)
+
+
+def _labelled_news():
+    return [{'id': str(k), 'title': title, 'source_name': source} for k, (title, source, _) in enumerate(LABELLED_TITLES)]
+
+
+def _group_ids(groups):
+    return sorted(sorted(news['id'] for news in group) for group in groups)
+
+
+def test_shingles_ignore_word_order_and_support_chinese():
+    assert title_shingles("Fed holds rates") == title_shingles("rates  HOLDS fed")
+    assert title_shingles("Fed holds rates") == {"fed", "hol", "old", "lds", "rat", "ate", "tes"}
+    assert title_shingles("华为发布芯片") == {"华为", "为发", "发布", "布芯", "芯片"}
+    assert title_shingles("") == set() and title_shingles(None) == set()
+
+
+def test_index_candidates_are_symmetric_sorted_and_exclude_self():
+    titles = [news['title'] for news in _labelled_news()]
+    index = TitleLSHIndex(titles)
+
+    for i in range(len(titles)):
+        candidates = index.candidates(i).tolist()
+        assert i not in candidates and candidates == sorted(candidates)
+        assert all(i in index.candidates(j).tolist() for j in candidates)
+    assert index.candidates(len(titles) - 1).tolist() == []  # 空标题没有候选
+    assert 0 < index.pair_count < len(titles) * (len(titles) - 1) // 2
+    assert 11 in index.candidates(0).tolist()  # 完全相同的标题必然碰撞
+    assert 17 in index.candidates(12).tolist()  # 没有空格的中文标题按字符 shingle 同样能找到
+
+    with pytest.raises(ValueError):
+        TitleLSHIndex(titles, bands=0)
+
+
+def test_group_by_title_matches_labels_and_exhaustive_method():
+    expected = _group_ids(
+        [[news for news, (_, _, event) in zip(_labelled_news(), LABELLED_TITLES) if event == label]
+         for label in range(6)])
+
+    processor = NewsDataProcessor(MagicMock())
+    lsh_groups = processor.auto_group_news(_labelled_news())
+    with patch('src.core.news_data_processor.TitleLSHIndex', ExhaustiveIndex):
+        exhaustive_groups = processor.auto_group_news(_labelled_news())
+
+    assert _group_ids(lsh_groups) == _group_ids(exhaustive_groups) == expected
+    assert processor.news_groups is exhaustive_groups
+
+
+def test_group_by_title_scales_without_exhaustive_comparison():
+    # 5000 条各不相同的标题 + 两条重复：候选对远少于 n²/2，重复标题仍然成组
+    rng = random.Random(0)
+    titles = [" ".join("".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(6)) for _ in range(5000)]
+    news_items = [{'id': str(k), 'title': title, 'source_name': f"S{k}"} for k, title in enumerate(titles)]
+    news_items.append({'id': 'dup', 'title': titles[1234], 'source_name': "Other"})
+
+    processor = NewsDataProcessor(MagicMock())
+    indexes = []
+    with patch('src.core.news_data_processor.TitleLSHIndex',
+               side_effect=lambda titles: indexes.append(TitleLSHIndex(titles)) or indexes[-1]):
+        groups = processor.auto_group_news(news_items)
+
+    assert _group_ids(groups) == [['1234', 'dup']]
+    assert indexes[0].pair_count < 5000
@@ -73,6 +73,42 @@ class TestNewsStorage:
         assert "http://example.com/1" in links_in_results
         assert "http://example.com/2" in links_in_results
 
+    def test_search_article_ids_matches_content_from_any_thread(self, tmp_path):
+        """正文搜索返回匹配的 ID；文件数据库可以在其他线程 (后台搜索) 中查询"""
+        import threading
+        storage = NewsStorage(data_dir=str(tmp_path), db_name="search.db")
+        first = storage.upsert_article({"title": "A", "link": "l1", "source_name": "s", "content": "OpenAI 发布新模型"})
+        storage.upsert_article({"title": "B", "link": "l2", "source_name": "s", "content": "股市 100% 上涨"})
+
+        assert storage.search_article_ids("openai", ["content"]) == {first}
+        assert storage.search_article_ids("100%", ["content", "title"]) == {first + 1}
+        assert storage.search_article_ids("openai", ["raw_data"]) == set()
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(storage.search_article_ids("模型", ["content"])))
+        thread.start()
+        thread.join()
+        assert results == [{first}]
+        storage.close()
+
+    def test_search_article_ids_lowercases_non_ascii_like_python(self, tmp_path):
+        """非 ASCII 字母 (带重音的拉丁字母、西里尔字母、全角字母) 与内存索引一样按 str.lower() 匹配"""
+        import threading
+        storage = NewsStorage(data_dir=str(tmp_path), db_name="search.db")
+        first = storage.upsert_article({"title": "ÉCOLE", "link": "l1", "source_name": "s", "content": "Привет МИР"})
+        second = storage.upsert_article({"title": "B", "link": "l2", "source_name": "s", "content": "ＡＢＣ 指数"})
+
+        assert storage.search_article_ids("école", ["title"]) == {first}
+        assert storage.search_article_ids("мир", ["content"]) == {first}
+        assert storage.search_article_ids("ａｂｃ", ["content"]) == {second}
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(storage.search_article_ids("привет", ["content"])))
+        thread.start()
+        thread.join()
+        assert results == [{first}]
+        storage.close()
+
     def test_close(self, storage):
         """测试关闭资源功能"""
         # 调用实际的 close 方法
@@ -167,17 +167,18 @@ def test_e2e_main_flow(main_window, qtbot, app_service_mock):
 
     # 6. 模拟点击新闻
     # NewsListPanel should be populated by now from news_list_changed signals
-    qtbot.waitUntil(lambda: news_list_panel.news_list.count() > 0, timeout=3000)
-    if news_list_panel.news_list.count() > 0:
-        item_to_click_news = news_list_panel.news_list.item(0)
-        if item_to_click_news:
+    news_list_model = news_list_panel.news_list.model()
+    qtbot.waitUntil(lambda: news_list_model.rowCount() > 0, timeout=3000)
+    if news_list_model.rowCount() > 0:
+        item_to_click_news = news_list_model.index(0, 0)
+        if item_to_click_news.isValid():
             # Ensure NewsListViewModel's internal list is what we expect after search or category filter
             # This might be tricky if filters are very effective and newsList becomes empty
             if main_window.news_list_view_model.newsList:
                 expected_title = main_window.news_list_view_model.newsList[0].title
                 with qtbot.waitSignal(app_service_mock.selected_news_changed, timeout=2000, raising=True,
                                       check_params_cb=lambda article_param: isinstance(article_param, NewsArticle) and article_param.title == expected_title if article_param else False) as blocker_select_news: # params is NewsArticle or None
-                    qtbot.mouseClick(news_list_panel.news_list.viewport(), Qt.LeftButton, pos=news_list_panel.news_list.visualItemRect(item_to_click_news).center())
+                    qtbot.mouseClick(news_list_panel.news_list.viewport(), Qt.LeftButton, pos=news_list_panel.news_list.visualRect(item_to_click_news).center())
                 print(f"Select news signal: {blocker_select_news.args}") # args[0] will be the NewsArticle
             else:
                 print("WARN: NewsListViewModel.newsList is empty before trying to click news item.")
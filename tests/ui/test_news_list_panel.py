@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QStyleOptionViewItem
+
+from src.core.article_detail_cache import ArticleDetailCache
+from src.models import NewsArticle
+from src.ui.news_list import NewsListPanel
+from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel
+
+
+def _news(i):
+    return NewsArticle(id=i, title=f"新闻{i} " + "很长的标题" * 20, link=f"link{i}", source_name="源",
+                       publish_time=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i))
+
+
+@pytest.fixture
+def panel(qtbot):
+    app_service = MagicMock()
+    app_service.history_service.is_read.return_value = False
+    app_service.get_full_article.side_effect = lambda article: article
+    app_service.detail_cache = ArticleDetailCache()
+    view_model = NewsListViewModel(app_service=app_service)
+    panel = NewsListPanel(view_model)
+    qtbot.addWidget(panel)
+    view_model._handle_app_news_refreshed([_news(i) for i in range(2000)])
+    return panel
+
+
+def test_list_view_is_backed_by_viewmodel(panel, qtbot):
+    model = panel.news_list.model()
+    assert model is panel.view_model.get_model()
+    assert model.rowCount() == 2000
+    assert panel.status_label.text() == "显示 2000 条新闻"
+
+    index = model.index(3, 0)
+    with qtbot.waitSignal(panel.item_selected, timeout=1000) as blocker:
+        panel._on_item_clicked(index)
+    assert blocker.args[0] is panel.view_model.newsList[3]
+    panel.view_model._app_service.get_full_article.assert_called_with(panel.view_model.newsList[3])
+
+
+def test_delegate_uses_fixed_row_height_and_caches_layout(panel):
+    delegate = panel.delegate
+    model = panel.news_list.model()
+    option = QStyleOptionViewItem()
+    option.initFrom(panel.news_list)
+    option.rect.setWidth(300)
+
+    heights = {delegate.sizeHint(option, model.index(row, 0)).height() for row in (0, 1, 1999)}
+    assert len(heights) == 1  # 长标题被省略为一行，行高不随内容变化
+
+    article = model.index(0, 0).data(Qt.UserRole)
+    article.is_new = True
+    document = delegate._document_for(article, option)
+    assert delegate._document_for(article, option) is document
+    article.is_read = True
+    assert delegate._document_for(article, option) is not document
+
+
+def test_preview_documents_are_reused_and_neighbours_prefetched(panel):
+    model = panel.view_model.get_model()
+    app_service = panel.view_model._app_service
+    for article in panel.view_model.newsList[:10]:
+        app_service.detail_cache.put(article)
+
+    panel._on_item_clicked(model.index(5, 0))
+    first_document = panel.preview.document()
+    assert panel.view_model.newsList[5].title in first_document.toPlainText()
+    prefetched = app_service.prefetch_article_details.call_args.args[0]
+    assert prefetched[:3] == [panel.view_model.newsList[r].id for r in (5, 6, 4)]
+
+    panel._on_item_clicked(model.index(6, 0))
+    assert panel.preview.document() is not first_document
+    panel._on_item_clicked(model.index(5, 0))
+    assert panel.preview.document() is first_document
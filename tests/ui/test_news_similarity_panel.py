@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.ui.news_similarity_panel import NewsSimilarityPanel
+
+TITLES = [
+    "Apple unveils new iPhone 16 at September event",
+    "Fed holds interest rates steady as inflation cools",
+    "Apple unveils iPhone 16 at its September event",
+    "Local bakery wins award for best sourdough bread",
+    "Federal Reserve holds interest rates steady",
+    "台风 海葵 登陆 福建 沿海",
+    "台风 海葵 今晨 登陆 福建",
+    "",
+]
+
+
+class ExhaustiveIndex:
+    """逐一比较的参考实现：每个标题的候选是其他所有标题。"""
+
+    def __init__(self, titles, **kwargs):
+        self.size = len(titles)
+
+    def candidates(self, i):
+        return np.delete(np.arange(self.size), i)
+
+
+@pytest.fixture
+def panel(qtbot):
+    app_service = MagicMock()
+    app_service.storage.get_all_articles.return_value = [
+        {'id': str(k), 'title': title, 'source_name': f"来源{k}"} for k, title in enumerate(TITLES)]
+    with patch('src.ui.news_similarity_panel.QMessageBox'):
+        panel = NewsSimilarityPanel(app_service)
+        qtbot.addWidget(panel)
+        yield panel
+
+
+def _group_ids(groups):
+    return sorted(sorted(news['id'] for news in group) for group in groups)
+
+
+def test_auto_group_matches_exhaustive_comparison(panel):
+    panel._auto_group_news()
+    lsh_groups = panel.news_groups
+    with patch('src.ui.news_similarity_panel.TitleLSHIndex', ExhaustiveIndex):
+        panel._auto_group_news()
+
+    assert _group_ids(lsh_groups) == _group_ids(panel.news_groups) == [['0', '2'], ['1', '4'], ['5', '6']]
+    assert "组 3 (2 条新闻)" in panel.result_edit.toPlainText()
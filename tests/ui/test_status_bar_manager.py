@@ -0,0 +1,54 @@
+import pytest
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QMainWindow
+
+from src.core.progress_aggregator import ProgressAggregator
+from src.ui.managers.status_bar_manager import StatusBarManager
+
+
+class _AppService(QObject):
+    status_message_updated = Signal(str)
+    refresh_started = Signal()
+    refresh_progress = Signal(int, int)
+    refresh_progress_snapshot = Signal(dict)
+    refresh_complete = Signal(bool, str)
+
+
+@pytest.fixture
+def manager(qtbot):
+    window = QMainWindow()
+    qtbot.addWidget(window)
+    return StatusBarManager(window)
+
+
+def test_refresh_snapshot_shows_totals_running_sources_and_eta(manager):
+    now = [0.0]
+    aggregator = ProgressAggregator(clock=lambda: now[0])
+    aggregator.start(['a', 'b', 'c'], 'refresh')
+    aggregator.mark_started('a')
+    aggregator.mark_started('b')
+    aggregator.source('a').update(40, 40)
+    aggregator.mark_finished('a', 40)
+    now[0] = 10.0
+
+    app_service = _AppService()
+    manager.connect_signals(app_service)
+    app_service.refresh_started.emit()
+    app_service.refresh_progress_snapshot.emit(aggregator.snapshot())
+
+    assert (manager.progress_bar.value(), manager.progress_bar.maximum()) == (1, 3)
+    message = manager.status_bar.currentMessage()
+    assert "1/3 个源" in message and "已获取 40 条" in message and "预计剩余 20 秒" in message
+    assert "进行中: b" in message
+    assert "b: running" in manager.progress_bar.toolTip()
+
+    app_service.refresh_complete.emit(True, "")
+    assert not manager.progress_bar.isVisible() and manager.progress_bar.toolTip() == ""
+
+
+def test_status_check_snapshots_are_ignored(manager):
+    aggregator = ProgressAggregator()
+    aggregator.start(['a'], 'status_check')
+    manager.show_message("Ready")
+    manager.show_progress_snapshot(aggregator.snapshot())
+    assert manager.status_bar.currentMessage() == "Ready"
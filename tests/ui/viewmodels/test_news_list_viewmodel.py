@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 from PySide6.QtCore import Qt
 
-from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel
+from src.ui.viewmodels.news_list_viewmodel import NewsListViewModel, render_news_preview_html
 from src.models import NewsItem
 
 # ---- Fixtures ----
@@ -194,4 +194,207 @@ def mark_as_read(self, link: str):
     """标记指定链接的新闻为已读，并更新内部状态"""
     if self._history_service is None:
         self.logger.warning("HistoryService is None, mark_as_read 跳过")
-        return 
\ No newline at end of file
+        return 
+
+def _dated_news(article_id, minutes, category="科技"):
+    from datetime import datetime, timedelta, timezone
+    return NewsItem(id=article_id, title=f"新闻{article_id}", link=f"link{article_id}", source_name="源",
+                    category=category, publish_time=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes))
+
+
+def test_news_cache_delta_matches_full_rebuild(mock_app_service, qtbot):
+    """测试增量合并 (新增/更新/移除) 的结果与全量过滤排序一致"""
+    cache = {i: _dated_news(i, i * 7 % 400, "科技" if i % 3 else "财经") for i in range(200)}
+    mock_app_service.get_cached_articles.side_effect = lambda ids: [cache[i] for i in ids if i in cache]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(list(cache.values()))
+    vm.filter_by_category("科技")
+
+    added = [200, 201]
+    cache[200] = _dated_news(200, 1000)
+    cache[201] = _dated_news(201, 5, "财经")
+    updated = [1, 2]
+    cache[1] = _dated_news(1, 999)          # 移到最前
+    cache[2] = _dated_news(2, 3, "财经")     # 移出当前分类
+    removed = [4, 5]
+    for article_id in removed:
+        del cache[article_id]
+
+    with qtbot.waitSignal(vm.news_list_changed, timeout=1000):
+        vm._handle_news_cache_delta(added, updated, removed)
+
+    expected = NewsListViewModel(app_service=mock_app_service)
+    expected._handle_app_news_refreshed(list(cache.values()))
+    expected.filter_by_category("科技")
+    assert [n.link for n in vm.newsList] == [n.link for n in expected.newsList]
+    assert vm.newsList[0].link == "link200"
+    assert sorted(n.id for n in vm._all_news) == sorted(cache)
+
+
+def test_news_cache_delta_outside_filter_does_not_notify(mock_app_service, qtbot):
+    """测试不影响当前视图的增量不会触发列表刷新"""
+    cache = {i: _dated_news(i, i) for i in range(100)}
+    mock_app_service.get_cached_articles.side_effect = lambda ids: [cache[i] for i in ids if i in cache]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(list(cache.values()))
+    vm.filter_by_category("科技")
+
+    cache[100] = _dated_news(100, 50, "财经")
+    with qtbot.assertNotEmitted(vm.news_list_changed):
+        vm._handle_news_cache_delta([100], [], [])
+    assert len(vm.newsList) == 100
+
+
+def test_news_cache_delta_content_only_match_during_search(mock_app_service, qtbot):
+    """测试搜索正文时，只在正文 (列表行不携带) 中匹配的新文章也会出现在增量合并后的视图中"""
+    from src.models import NewsListRow
+    contents = {i: f"包含关键词 needle 的正文{i}" for i in range(101)}
+    cache = {i: NewsListRow.from_article(_dated_news(i, i)) for i in range(101)}
+    mock_app_service.get_cached_articles.side_effect = lambda ids: [cache[i] for i in ids if i in cache]
+    mock_app_service.search_stored_articles.side_effect = \
+        lambda term, fields: {i for i, text in contents.items() if term in text.lower()}
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed([cache[i] for i in range(100)])
+    vm.search_news("needle", "标题和内容")
+    assert len(vm.newsList) == 100
+
+    with qtbot.waitSignal(vm.news_list_changed, timeout=1000):
+        vm._handle_news_cache_delta([100], [], [])
+
+    assert len(vm.newsList) == 101 and vm.newsList[0].link == "link100"
+
+
+def test_model_tracks_delta_with_row_inserts(mock_app_service, qtbot):
+    """测试增量合并通过 rowsInserted/rowsRemoved 通知模型，而不是重置整个模型"""
+    cache = {i: _dated_news(i, i) for i in range(100)}
+    mock_app_service.get_cached_articles.side_effect = lambda ids: [cache[i] for i in ids if i in cache]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(list(cache.values()))
+    model = vm.get_model()
+    resets, inserted, removed = [], [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    cache[100] = _dated_news(100, 1000)
+    del cache[50]
+    vm._handle_news_cache_delta([100], [], [50])
+
+    assert resets == []
+    assert inserted == [(0, 0)]
+    assert len(removed) == 1
+    assert model.rowCount() == len(vm.newsList) == 100
+    assert model.index(0, 0).data(Qt.UserRole) is vm.newsList[0]
+    assert [model.index(row, 0).data(Qt.UserRole).link for row in range(model.rowCount())] == [n.link for n in vm.newsList]
+
+
+def test_older_page_is_appended_in_one_insert(mock_app_service, qtbot):
+    """测试后台加载的一页旧文章整体追加到视图末尾 (一次 rowsInserted，不重置模型)，结果与全量重建一致"""
+    cache = {i: _dated_news(i, i, "科技" if i % 2 else "财经") for i in range(500, 600)}
+    mock_app_service.get_cached_articles.side_effect = lambda ids: [cache[i] for i in ids if i in cache]
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(list(cache.values()))
+    vm.filter_by_category("科技")
+    model = vm.get_model()
+    resets, inserted = [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    older = list(range(499, 99, -1))
+    for i in older:
+        cache[i] = _dated_news(i, i, "科技" if i % 2 else "财经")
+    with qtbot.waitSignal(vm.news_list_changed, timeout=1000):
+        vm._handle_news_cache_delta(older, [], [])
+
+    assert resets == []
+    assert inserted == [(50, 249)]
+    expected = NewsListViewModel(app_service=mock_app_service)
+    expected._handle_app_news_refreshed(list(cache.values()))
+    expected.filter_by_category("科技")
+    assert [n.link for n in vm.newsList] == [n.link for n in expected.newsList]
+
+
+def test_model_renders_rich_text_on_demand_and_refreshes_read_rows(mock_app_service, qtbot):
+    """测试富文本按需生成，标记已读时只发射对应行的 dataChanged"""
+    articles = [_dated_news(i, i) for i in range(3)]
+    for article in articles:
+        article.is_new = True
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(articles)
+    model = vm.get_model()
+
+    assert model.index(0, 0).data(model.RichTextRole).startswith('<p style="margin:0; padding:0;">* ')
+    changed_rows = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: changed_rows.append(top_left.row()))
+
+    vm.mark_as_read(vm.newsList[1].link)
+
+    assert changed_rows == [1]
+    assert "* " not in model.index(1, 0).data(model.RichTextRole)
+
+
+def test_large_cache_search_is_debounced_and_streams_first_results(mock_app_service, qtbot):
+    """测试大缓存上的搜索: 连续输入只执行最后一次，先发射前 N 条再发射完整结果"""
+    articles = [_dated_news(i, i, "科技") for i in range(3000)]
+    for article in articles[::3]:
+        article.title += " match"
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm.ASYNC_SEARCH_THRESHOLD = 1000
+    vm._search_executor._chunk_size = 100
+    vm._handle_app_news_refreshed(articles)
+    sizes = []
+    vm.news_list_changed.connect(lambda: sizes.append(len(vm.newsList)))
+
+    vm.search_news("mat", "仅标题")
+    vm.search_news("matc", "仅标题")
+    vm.search_news("match", "仅标题")
+    assert vm.isSearchPending
+    assert sizes == []  # 防抖期间不在主线程过滤
+
+    qtbot.waitUntil(lambda: not vm.isSearchPending, timeout=3000)
+    vm._search_executor.wait_for_done()
+
+    assert sizes == [50, 1000]
+    assert [n.link for n in vm.newsList] == [n.link for n in sorted(articles[::3], key=lambda n: n.publish_time, reverse=True)]
+
+
+def test_sync_filter_change_cancels_pending_search(mock_app_service, qtbot):
+    """测试搜索尚未完成时切换分类，同步结果不会被过期的后台结果覆盖"""
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm.ASYNC_SEARCH_THRESHOLD = 10
+    vm._handle_app_news_refreshed([_dated_news(i, i, "科技" if i % 2 else "财经") for i in range(100)])
+
+    vm.search_news("新闻1", "仅标题")
+    vm.filter_by_category("财经")
+    assert not vm.isSearchPending
+    qtbot.wait(400)
+
+    assert vm.newsList and all(n.category == "财经" and "新闻1" in n.title for n in vm.newsList)
+
+
+def test_prefetch_around_orders_neighbours_by_distance(mock_app_service):
+    """测试选中项附近的预取：近的优先，不越过列表边界"""
+    articles = [_dated_news(i, i) for i in range(10)]
+    for i, article in enumerate(articles):
+        article.id = i
+    vm = NewsListViewModel(app_service=mock_app_service)
+    vm._handle_app_news_refreshed(articles)
+    ids = [n.id for n in vm.newsList]
+
+    vm.prefetch_around(1)
+
+    requested, renderers = mock_app_service.prefetch_article_details.call_args.args
+    assert requested == [ids[r] for r in (1, 2, 0, 3, 4)]
+    assert mock_app_service.prefetch_article_details.call_args.kwargs == {'replace': True}
+    assert list(renderers) == ['preview']
+
+
+def test_preview_html_is_escaped_and_sanitized():
+    """测试预览 HTML：标题转义，正文去掉脚本和事件属性"""
+    article = NewsItem(title="<b>标题</b>", link='https://example.com/?a=1&b="2"', source_name="源1",
+                       content='<p onclick="steal()">正文</p><script>alert(1)</script><!-- 注释 -->', publish_time=None)
+    preview_html = render_news_preview_html(article)
+    assert "&lt;b&gt;标题&lt;/b&gt;" in preview_html
+    assert "<p>正文</p>" in preview_html
+    assert "script" not in preview_html and "onclick" not in preview_html and "注释" not in preview_html
+    assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in preview_html
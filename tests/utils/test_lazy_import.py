@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from src.utils.lazy_import import lazy_attr, lazy_module
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_lazy_module_imports_on_first_attribute_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = lazy_module("colorsys")
+    assert "colorsys" not in sys.modules
+    assert "未导入" in repr(colorsys)
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+    assert "已导入" in repr(colorsys)
+
+
+def test_lazy_attr_resolves_on_call_and_reports_unavailable_targets():
+    ordered_dict = lazy_attr("collections", "OrderedDict")
+    assert list(ordered_dict(a=1)) == ["a"]
+    assert ordered_dict.resolve() is __import__("collections").OrderedDict
+    assert ordered_dict.fromkeys("ab") == {"a": None, "b": None}
+
+    assert lazy_attr("collections", "OrderedDict").available()
+    assert not lazy_attr("src.utils.no_such_module", "Thing").available()
+    assert not lazy_attr("collections", "NoSuchThing").available()
+
+
+def test_startup_path_does_not_import_heavy_dependencies():
+    # 在独立进程中检查：导入容器和主窗口用到的管理器不应加载聚类/绘图/浏览器自动化依赖
+    code = textwrap.dedent("""
+        import sys
+        import src.containers
+        import src.core.app_service
+        import src.core.news_update_service
+        import src.core.enhanced_news_clusterer
+        import src.ui.managers.dialog_manager
+        import src.ui.managers.analysis_panel_manager
+        print("heavy:" + ",".join(m for m in ("sklearn", "matplotlib", "selenium", "numpy") if m in sys.modules))
+    """)
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True,
+                            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"}, timeout=120)
+    assert result.returncode == 0, result.stderr
+    loaded = [line for line in result.stdout.splitlines() if line.startswith("heavy:")]
+    assert loaded == ["heavy:"]
@@ -0,0 +1,51 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from src.utils import logger as log_setup
+from src.utils.logger import RateLimitFilter
+
+
+def make_record(name, level=logging.INFO, lineno=10, msg="条目已处理"):
+    return logging.LogRecord(name, level, "module.py", lineno, msg, None, None)
+
+
+def test_rate_limit_filter_suppresses_per_call_site_and_reports_count():
+    now = [0.0]
+    rate_filter = RateLimitFilter({"news_analyzer.core": 2}, period=1.0, clock=lambda: now[0])
+
+    passed = [rate_filter.filter(make_record("news_analyzer.core.app_service")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+
+    # 其他调用位置、WARNING 级别以及未配置的模块不受影响
+    assert rate_filter.filter(make_record("news_analyzer.core.app_service", lineno=11))
+    assert rate_filter.filter(make_record("news_analyzer.core.app_service", level=logging.WARNING))
+    assert all(rate_filter.filter(make_record("news_analyzer.storage")) for _ in range(5))
+
+    now[0] = 1.5
+    record = make_record("news_analyzer.core.app_service")
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "条目已处理 (同一位置另有 3 条日志已省略)"
+
+
+@pytest.fixture
+def restore_logging():
+    yield
+    log_setup.stop_logging()
+    root = logging.getLogger(log_setup.LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def test_setup_logging_writes_through_background_listener(tmp_path, restore_logging):
+    log_path = tmp_path / "app.log"
+    logger = log_setup.setup_logging(log_level=logging.INFO, log_path=str(log_path))
+
+    assert [type(h) for h in logger.handlers] == [QueueHandler]
+    logging.getLogger("news_analyzer.core.app_service").info("刷新完成: 12 条")
+    log_setup.stop_logging()  # 写出队列中剩余的记录
+
+    content = log_path.read_text(encoding="utf-8")
+    assert "news_analyzer.core.app_service - INFO - 刷新完成: 12 条" in content
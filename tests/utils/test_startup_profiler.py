@@ -0,0 +1,50 @@
+import json
+import sys
+
+import pytest
+
+from src.utils import startup_profiler
+from src.utils.startup_profiler import StartupProfiler
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_active", None)
+    yield startup_profiler.enable()
+    startup_profiler.disable()
+
+
+def test_profiler_times_imports_and_restores_loader(profiler, monkeypatch):
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+    import json.tool
+
+    assert "json.tool" in profiler.imports
+    times = profiler.imports["json.tool"]
+    assert times["cumulative"] >= times["self"] >= 0
+    # 模块上不应残留计时 loader
+    assert json.tool.__loader__.__class__.__name__ != "_TimingLoader"
+    assert json.tool.__spec__.loader.__class__.__name__ != "_TimingLoader"
+
+
+def test_spans_marks_and_report(profiler, tmp_path):
+    with startup_profiler.span("NewsStorage", kind="service"):
+        pass
+    startup_profiler.mark("创建服务")
+
+    report = profiler.report()
+    assert [(s["name"], s["kind"]) for s in report["spans"]] == [("NewsStorage", "service"), ("创建服务", "stage")]
+    assert "创建服务" in profiler.format_report()
+
+    path = tmp_path / "startup_profile.json"
+    profiler.write_json(str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["spans"][1]["name"] == "创建服务"
+
+
+def test_span_and_mark_are_noops_when_disabled(monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_active", None)
+    with startup_profiler.span("AppService", kind="service"):
+        pass
+    startup_profiler.mark("导入模块")
+    assert startup_profiler.active() is None
+    assert not any(isinstance(f, startup_profiler._TimingFinder) for f in sys.meta_path)
+    assert isinstance(StartupProfiler().report()["spans"], list)